@@ -0,0 +1,43 @@
+-- V1017: Admin Event Outbox
+-- Creates the transactional outbox used to publish admin events to Redis streams
+-- Applied to: Admin database only
+-- Features: Atomic event + business writes, batched relay, at-least-once delivery
+
+-- ============================================================================
+-- EVENT_OUTBOX TABLE (Transactional Outbox)
+-- ============================================================================
+
+CREATE TABLE admin.event_outbox (
+    -- Core Identity
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,  -- Publish order
+    event_id UUID NOT NULL,                     -- Row in admin.events
+    aggregate_id UUID NOT NULL,                 -- Used to shard relays per aggregate
+    
+    -- Stream Entry
+    stream_name VARCHAR(100) NOT NULL,          -- Redis stream; copied to events.queue_name
+    partition_key VARCHAR(100),
+    payload BYTEA NOT NULL,                     -- Encoded stream entry, published as-is
+    
+    -- Relay Tracking
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    published_at TIMESTAMPTZ,                   -- NULL until relayed to Redis
+    message_id VARCHAR(100)                     -- Redis stream entry ID
+);
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+
+-- Relay claims: unpublished rows in insert order
+CREATE INDEX idx_event_outbox_unpublished ON admin.event_outbox(id) WHERE published_at IS NULL;
+
+-- Retention purge of relayed rows
+CREATE INDEX idx_event_outbox_published_at ON admin.event_outbox(published_at) WHERE published_at IS NOT NULL;
+
+-- ============================================================================
+-- COMMENTS FOR DOCUMENTATION
+-- ============================================================================
+
+COMMENT ON TABLE admin.event_outbox IS 'Events written in the same transaction as the business change, relayed to Redis streams after commit';
+COMMENT ON COLUMN admin.event_outbox.payload IS 'Pre-encoded stream entry (compact wire format or JSON fields)';
+COMMENT ON COLUMN admin.event_outbox.published_at IS 'Set by the outbox relay once the entry is appended to its stream';
@@ -0,0 +1,106 @@
+"""Subscription condition evaluation benchmark.
+
+Evaluates realistic subscription condition trees against event payloads
+and reports evaluations per second for compiled predicates, for the async
+``ConditionMatcher.matches`` API, and for routing through
+``EventActionMatcher`` with many subscriptions.
+
+Usage:
+    python benchmarks/condition_matcher_benchmark.py --iterations 200000
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+from neo_commons.platform.actions.infrastructure.matchers import (
+    ConditionMatcher,
+    EventActionMatcher,
+    compile_condition,
+)
+
+CONDITIONS = {
+    "simple": {"user_type": "premium"},
+    "comparison": {"age": {"$gte": 18, "$lt": 65}, "country": {"$in": ["DE", "FR", "US", "GB"]}},
+    "nested": {
+        "$and": [
+            {"user.profile.tier": {"$in": ["gold", "platinum"]}},
+            {"$or": [{"order.total": {"$gt": 500}}, {"order.items": {"$gte": 10}}]},
+            {"$not": {"user.flags.fraud": True}},
+        ]
+    },
+    "regex": {"email": {"$regex": r"@(example|acme)\.com$"}, "verified": {"$exists": True}},
+}
+
+EVENT_DATA = {
+    "user_type": "premium",
+    "age": 34,
+    "country": "DE",
+    "email": "jane@acme.com",
+    "verified": True,
+    "user": {"profile": {"tier": "gold"}, "flags": {"fraud": False}},
+    "order": {"total": 120.5, "items": 12},
+}
+
+
+def bench_compiled(conditions: dict, iterations: int) -> float:
+    predicate = compile_condition(conditions)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        predicate(EVENT_DATA)
+    return iterations / (time.perf_counter() - started)
+
+
+async def bench_async(conditions: dict, iterations: int) -> float:
+    matcher = ConditionMatcher()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await matcher.matches(conditions, EVENT_DATA)
+    return iterations / (time.perf_counter() - started)
+
+
+def bench_routing(subscriptions: int, iterations: int) -> float:
+    """Route events through an index of ``subscriptions`` conditional subscriptions."""
+    actions = [
+        SimpleNamespace(id=uuid4(), is_active=True, is_healthy=True, priority="normal")
+        for _ in range(subscriptions)
+    ]
+    names = list(CONDITIONS)
+    subs = [
+        SimpleNamespace(
+            id=uuid4(),
+            action_id=action.id,
+            event_patterns=[f"service{i % 50}.*.created"],
+            conditions=CONDITIONS[names[i % len(names)]],
+        )
+        for i, action in enumerate(actions)
+    ]
+    matcher = EventActionMatcher()
+    matcher.load(subs, actions)
+
+    started = time.perf_counter()
+    for i in range(iterations):
+        matcher.match_actions(f"service{i % 50}.orders.created", EVENT_DATA)
+    return iterations / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200000)
+    parser.add_argument("--subscriptions", type=int, nargs="+", default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    for name, conditions in CONDITIONS.items():
+        compiled = bench_compiled(conditions, args.iterations)
+        awaited = await bench_async(conditions, args.iterations)
+        print(f"{name:<11} compiled={compiled:12,.0f}/s  async matches={awaited:12,.0f}/s")
+
+    for subscriptions in args.subscriptions:
+        rate = bench_routing(subscriptions, max(1000, args.iterations // 100))
+        print(f"routing subscriptions={subscriptions:>6}  {rate:10,.0f} events/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,176 @@
+"""Middleware stack per-request overhead benchmark.
+
+Drives a minimal ASGI app directly (no server, no HTTP parsing) through the
+production middleware stack (error handling, security, structured logging,
+performance, rate limiting) and reports the per-request overhead of:
+
+- ``basehttp``: each middleware behind its own ``BaseHTTPMiddleware`` layer,
+  the way the stack used to run
+- ``stacked``: each middleware as its own pure-ASGI layer
+- ``combined``: all middlewares as stages of one ``CombinedMiddleware``
+
+Logging is set to WARNING so the numbers measure the middleware, not the
+log handlers.
+
+Usage:
+    python benchmarks/middleware_stack_benchmark.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+from starlette.types import ASGIApp
+
+from neo_commons.infrastructure.middleware import (
+    ASGIMiddleware,
+    CombinedMiddleware,
+    ErrorHandlingMiddleware,
+    HTTPRequestContext,
+    PerformanceMiddleware,
+    RateLimitMiddleware,
+    SecurityMiddleware,
+    StructuredLoggingMiddleware,
+)
+
+
+class BaseHTTPStage(BaseHTTPMiddleware):
+    """Runs one middleware's hooks inside a ``BaseHTTPMiddleware`` layer."""
+
+    def __init__(self, app: ASGIApp, stage: ASGIMiddleware):
+        super().__init__(app)
+        self.stage = stage
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        stage = self.stage
+        ctx = HTTPRequestContext(request.scope, request.receive)
+        if not stage.applies(ctx):
+            return await call_next(request)
+        await stage.on_request(ctx)
+        try:
+            response = await call_next(request)
+        except Exception as exc:
+            ctx.error = exc
+            response = await stage.on_error(ctx, exc)
+            if response is None:
+                raise
+        ctx.status_code = response.status_code
+        ctx.response_time = ctx.elapsed()
+        ctx.response_started = True
+        stage.on_response_start(ctx, response.headers)
+        await stage.on_complete(ctx)
+        return response
+
+
+def build_stages() -> List[ASGIMiddleware]:
+    """Production stack stages, outermost first."""
+    return [
+        ErrorHandlingMiddleware(None),
+        SecurityMiddleware(None),
+        StructuredLoggingMiddleware(None),
+        PerformanceMiddleware(None, cache_flush_interval=3600),
+        RateLimitMiddleware(None, default_rate_limit="100000000/minute", enable_burst_protection=False),
+    ]
+
+
+def build_app(variant: str) -> ASGIApp:
+    async def item(request: Request) -> JSONResponse:
+        return JSONResponse({"id": request.path_params["item_id"]})
+
+    app: ASGIApp = Starlette(routes=[Route("/items/{item_id}", item)])
+    if variant == "bare":
+        return app
+    stages = build_stages()
+    if variant == "combined":
+        return CombinedMiddleware(app, stages)
+    for stage in reversed(stages):
+        if variant == "basehttp":
+            app = BaseHTTPStage(app, stage)
+        else:
+            stage.app = app
+            app = stage
+    return app
+
+
+def make_scope(i: int) -> Dict[str, Any]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": f"/items/{i}",
+        "raw_path": f"/items/{i}".encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"user-agent", b"bench/1.0"), (b"accept", b"application/json")],
+        "client": ("10.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+
+async def run(app: ASGIApp, requests: int) -> Optional[float]:
+    """Best-of-3 microseconds per request, or None when a request failed."""
+    request_message = {"type": "http.request", "body": b"", "more_body": False}
+
+    async def receive() -> Dict[str, Any]:
+        return request_message
+
+    status: List[int] = []
+
+    async def send(message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    # Warm up caches and lazily built state
+    for i in range(min(requests, 500)):
+        await app(make_scope(i), receive, send)
+    if any(code != 200 for code in status):
+        return None
+
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for i in range(requests):
+            await app(make_scope(i), receive, send)
+        best = min(best, (time.perf_counter() - started) / requests * 1e6)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    async def bench() -> None:
+        results = {}
+        for variant in ("bare", "basehttp", "stacked", "combined"):
+            results[variant] = await run(build_app(variant), args.requests)
+            if results[variant] is None:
+                print(f"{variant}: requests failed")
+                return
+
+        bare = results["bare"]
+        print(f"{'bare app':<24} {bare:8.1f} us/request")
+        for variant in ("basehttp", "stacked", "combined"):
+            overhead = results[variant] - bare
+            print(f"{variant:<24} {results[variant]:8.1f} us/request  "
+                  f"{overhead:8.1f} us overhead")
+        speedup = (results["basehttp"] - bare) / max(results["combined"] - bare, 1e-9)
+        print(f"combined overhead is {speedup:.1f}x lower than basehttp")
+
+    asyncio.run(bench())
+
+
+if __name__ == "__main__":
+    main()
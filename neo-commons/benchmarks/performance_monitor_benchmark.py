@@ -0,0 +1,106 @@
+"""Performance monitor overhead benchmark.
+
+Measures the per-call overhead the ``@critical_performance`` (and the
+sampled lower-level) decorators add to a trivial sync and async function,
+and checks that memory stays flat however many calls are recorded. Exits
+non-zero when the critical sync overhead exceeds ``--budget-us``.
+
+Usage:
+    python benchmarks/performance_monitor_benchmark.py --calls 200000 --budget-us 1.0
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+from neo_commons.infrastructure.monitoring import (
+    PerformanceMonitor,
+    critical_performance,
+    low_performance,
+    medium_performance,
+    set_performance_monitor,
+)
+
+
+def time_sync(func: Callable[[int], int], calls: int) -> float:
+    """Best-of-5 nanoseconds per call."""
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter_ns()
+        for i in range(calls):
+            func(i)
+        best = min(best, (time.perf_counter_ns() - started) / calls)
+    return best
+
+
+def time_async(func: Callable, calls: int) -> float:
+    async def loop() -> float:
+        best = float("inf")
+        for _ in range(5):
+            started = time.perf_counter_ns()
+            for i in range(calls):
+                await func(i)
+            best = min(best, (time.perf_counter_ns() - started) / calls)
+        return best
+
+    return asyncio.run(loop())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000)
+    parser.add_argument("--budget-us", type=float, default=1.0)
+    args = parser.parse_args()
+
+    monitor = PerformanceMonitor()
+    set_performance_monitor(monitor)
+
+    def bare(x: int) -> int:
+        return x
+
+    async def bare_async(x: int) -> int:
+        return x
+
+    critical = critical_performance("bench.critical")(bare)
+    medium = medium_performance("bench.medium")(bare)
+    low = low_performance("bench.low")(bare)
+    critical_async = critical_performance("bench.critical_async")(bare_async)
+
+    baseline = time_sync(bare, args.calls)
+    baseline_async = time_async(bare_async, args.calls)
+    rows = [
+        ("critical sync", time_sync(critical, args.calls) - baseline),
+        ("medium sync (sampled)", time_sync(medium, args.calls) - baseline),
+        ("low sync (sampled)", time_sync(low, args.calls) - baseline),
+        ("critical async", time_async(critical_async, args.calls) - baseline_async),
+    ]
+    print(f"{'bare function':<24} {baseline:8.0f} ns/call")
+    for name, overhead in rows:
+        print(f"{name:<24} {overhead:8.0f} ns/call overhead")
+
+    # Memory must not grow with the number of recorded calls
+    tracemalloc.start()
+    critical(0)
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(args.calls):
+        critical(i)
+    growth = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(f"memory growth after {args.calls} more calls: {growth / 1024:.1f} KiB")
+
+    stats = monitor.get_stats("bench.critical")
+    print(f"bench.critical p50={stats.p50_time_ms * 1e6:.0f} ns p99={stats.p99_time_ms * 1e6:.0f} ns "
+          f"p999={stats.p999_time_ms * 1e6:.0f} ns calls={stats.call_count}")
+
+    critical_overhead = rows[0][1]
+    if critical_overhead > args.budget_us * 1000:
+        print(f"FAIL: critical overhead {critical_overhead:.0f} ns exceeds {args.budget_us} us budget")
+        sys.exit(1)
+    print(f"OK: critical overhead within {args.budget_us} us budget")
+
+
+if __name__ == "__main__":
+    main()
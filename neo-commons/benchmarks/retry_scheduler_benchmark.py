@@ -0,0 +1,79 @@
+"""Retry scheduler memory benchmark.
+
+Schedules a large number of far-future retries with the in-memory
+``RetryScheduler`` (one sleeping task per retry) and with the Redis-backed
+``DurableRetryScheduler``, and reports the Python heap growth of each.
+
+Usage:
+    python benchmarks/retry_scheduler_benchmark.py --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from uuid import uuid4
+
+import redis.asyncio as redis
+
+from neo_commons.platform.actions.infrastructure.retry import (
+    BackoffType,
+    DurableRetryScheduler,
+    RetryPolicy,
+    RetryScheduler,
+)
+
+POLICY = RetryPolicy(
+    max_retries=3,
+    backoff_type=BackoffType.FIXED,
+    initial_delay_ms=3600000,
+    max_delay_ms=3600000,
+)
+
+
+async def retry_callback(payload: dict) -> None:
+    pass
+
+
+async def measure(scheduler, retries: int) -> None:
+    """Schedule ``retries`` retries and print heap growth and throughput."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+
+    for i in range(retries):
+        await scheduler.schedule_retry(f"execution-{i}", POLICY, 1, retry_callback, payload={"seq": i})
+
+    elapsed = time.perf_counter() - started
+    growth = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    print(
+        f"{type(scheduler).__name__:<22} retries={retries}  "
+        f"heap={growth / 1e6:8.1f} MB  ({growth / retries:7.0f} B/retry)  "
+        f"rate={retries / elapsed:9.0f}/s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--retries", type=int, default=100000)
+    args = parser.parse_args()
+
+    in_memory = RetryScheduler()
+    await measure(in_memory, args.retries)
+    await in_memory.shutdown()
+
+    client = redis.from_url(args.redis_url)
+    durable = DurableRetryScheduler(client, key_prefix=f"bench:retries:{uuid4().hex[:8]}")
+    durable.register_handler("bench", retry_callback)
+    await measure(durable, args.retries)
+    print(f"{'':<22} pending in redis={await durable.count_scheduled()}")
+
+    await client.delete(durable.schedule_key, durable.payload_key)
+    await client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
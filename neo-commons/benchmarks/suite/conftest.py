@@ -0,0 +1,149 @@
+"""Fixtures of the pytest-benchmark suite.
+
+Run from ``neo-commons`` (needs the ``bench`` extra)::
+
+    python -m pytest benchmarks/suite -o addopts="" \\
+        --benchmark-json=.benchmarks/$(git rev-parse --short HEAD).json
+
+Compare against an earlier run and fail on a >10% median regression::
+
+    python -m pytest benchmarks/suite -o addopts="" \\
+        --benchmark-compare=.benchmarks/<baseline>.json --benchmark-compare-fail=median:10%
+
+Redis-backed benchmarks use fakeredis unless ``NEO_BENCH_REDIS_URL`` points
+at a server (use a scratch database; keys are created under ``bench:`` and
+removed afterwards). Pagination benchmarks use an in-memory table unless
+``NEO_BENCH_POSTGRES_DSN`` is set.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+import pytest
+
+from stand_ins import AsyncpgTable, InMemoryTable
+
+# The standalone benchmark scripts share their fixtures with the suite
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+REDIS_URL_ENV = "NEO_BENCH_REDIS_URL"
+POSTGRES_DSN_ENV = "NEO_BENCH_POSTGRES_DSN"
+
+# Awaits per benchmark round of an async operation; keeps loop entry cost out of the numbers
+ASYNC_BATCH = 100
+PAGINATION_ROWS = 10000
+
+
+def pytest_configure(config):
+    # Benchmarks measure the code paths, not the log handlers
+    logging.disable(logging.WARNING)
+
+
+def pytest_benchmark_update_machine_info(config, machine_info):
+    machine_info["neo_backends"] = {
+        "redis": "server" if os.environ.get(REDIS_URL_ENV) else "fakeredis",
+        "postgres": "server" if os.environ.get(POSTGRES_DSN_ENV) else "in-memory",
+    }
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    # Background tasks started by the code under test (e.g. the loop monitor)
+    pending = asyncio.all_tasks(loop)
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    asyncio.set_event_loop(None)
+    loop.close()
+
+
+@pytest.fixture
+def run_async(benchmark, loop):
+    """Benchmark an async operation, awaited ``batch`` times per round.
+
+    Reported times are per round; ``extra_info["ops_per_round"]`` gives the
+    divisor for per-operation figures.
+    """
+    def run(operation: Callable[[], Awaitable[Any]], batch: int = ASYNC_BATCH) -> Any:
+        async def round_():
+            for _ in range(batch):
+                await operation()
+
+        benchmark.extra_info["ops_per_round"] = batch
+        return benchmark(lambda: loop.run_until_complete(round_()))
+
+    return run
+
+
+@pytest.fixture
+def redis_client(loop):
+    url = os.environ.get(REDIS_URL_ENV)
+    if url:
+        redis = pytest.importorskip("redis.asyncio")
+        client = redis.from_url(url)
+    else:
+        fakeredis = pytest.importorskip("fakeredis.aioredis")
+        client = fakeredis.FakeRedis()
+
+    yield client
+
+    async def cleanup():
+        keys = [key async for key in client.scan_iter("bench:*")]
+        if keys:
+            await client.delete(*keys)
+        await client.aclose()
+
+    loop.run_until_complete(cleanup())
+
+
+@pytest.fixture
+def bench_key():
+    """Unique key prefix of one benchmark (under ``bench:``)."""
+    return f"bench:{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def pagination_table(loop):
+    """Table of ``PAGINATION_ROWS`` rows with ``id``, ``name`` and ``created_at``."""
+    dsn = os.environ.get(POSTGRES_DSN_ENV)
+    if not dsn:
+        yield InMemoryTable([
+            {"id": i, "name": f"item-{i}", "status": "active", "created_at": None}
+            for i in range(1, PAGINATION_ROWS + 1)
+        ])
+        return
+
+    asyncpg = pytest.importorskip("asyncpg")
+    schema = f"bench_{uuid4().hex[:8]}"
+
+    async def setup():
+        pool = await asyncpg.create_pool(dsn, min_size=1, max_size=4)
+        await pool.execute(f"CREATE SCHEMA {schema}")
+        await pool.execute(
+            f"CREATE TABLE {schema}.items (id bigint PRIMARY KEY, name text NOT NULL, "
+            f"status text NOT NULL, created_at timestamptz NOT NULL DEFAULT now())"
+        )
+        await pool.execute(
+            f"INSERT INTO {schema}.items (id, name, status) "
+            f"SELECT i, 'item-' || i, 'active' FROM generate_series(1, {PAGINATION_ROWS}) AS i"
+        )
+        await pool.execute(f"ANALYZE {schema}.items")
+        return pool
+
+    pool = loop.run_until_complete(setup())
+    yield AsyncpgTable(pool, schema)
+
+    async def teardown():
+        await pool.execute(f"DROP SCHEMA {schema} CASCADE")
+        await pool.close()
+
+    loop.run_until_complete(teardown())
@@ -0,0 +1,115 @@
+"""In-memory stand-ins for the services the benchmarked code talks to.
+
+They return canned data without I/O, so a benchmark measures the library's
+own work (decoding, query building, row mapping, bookkeeping). Set
+``NEO_BENCH_REDIS_URL`` / ``NEO_BENCH_POSTGRES_DSN`` to run the Redis and
+pagination benchmarks against real servers instead.
+"""
+
+import bisect
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+
+class InMemoryCache:
+    """Dict-backed cache with the ``Cache`` protocol's async API."""
+
+    def __init__(self):
+        self.data: Dict[str, Any] = {}
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        self.data[key] = value
+        return True
+
+    async def delete(self, key: str) -> bool:
+        return self.data.pop(key, None) is not None
+
+    async def exists(self, key: str) -> bool:
+        return key in self.data
+
+
+class CannedConnection:
+    """asyncpg-like connection answering every fetch with the same rows."""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+
+    async def fetch(self, query: str, *args: Any) -> List[Dict[str, Any]]:
+        return self.rows
+
+    async def fetchrow(self, query: str, *args: Any) -> Optional[Dict[str, Any]]:
+        return self.rows[0] if self.rows else None
+
+    async def fetchval(self, query: str, *args: Any) -> Any:
+        return next(iter(self.rows[0].values())) if self.rows else None
+
+
+class CannedDatabaseService:
+    """Database service / connection manager handing out a ``CannedConnection``."""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.connection = CannedConnection(rows)
+
+    @asynccontextmanager
+    async def get_connection(self, connection_name: str):
+        yield self.connection
+
+    async def execute_fetchrow(
+        self, connection_name: str, query: str, *args: Any
+    ) -> Optional[Dict[str, Any]]:
+        return await self.connection.fetchrow(query, *args)
+
+
+class InMemoryTable:
+    """``DatabaseRepository`` stand-in serving LIMIT/OFFSET and keyset pages of a row list.
+
+    Understands the statements ``PaginatedRepositoryMixin`` and
+    ``CursorPaginatedRepositoryMixin`` build: the trailing parameters are
+    ``LIMIT``/``OFFSET`` (offset pages) or an optional ``id >`` cursor
+    followed by ``LIMIT`` (keyset pages); count queries return the row count.
+    Rows must be sorted by ``id``.
+    """
+
+    schema = "bench"
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self._ids = [row["id"] for row in rows]
+
+    async def fetch_all(self, query: str, params: List[Any]) -> List[Dict[str, Any]]:
+        if " OFFSET $" in query:
+            limit, offset = params[-2:]
+            return self.rows[offset:offset + limit]
+        limit = params[-1]
+        if " > $" in query:
+            start = bisect.bisect_right(self._ids, params[-2])
+            return self.rows[start:start + limit]
+        return self.rows[:limit]
+
+    async def fetch_one(self, query: str, params: List[Any]) -> Optional[Dict[str, Any]]:
+        return {"count": len(self.rows)}
+
+
+class AsyncpgTable:
+    """``DatabaseRepository`` adapter over an asyncpg pool."""
+
+    def __init__(self, pool, schema: str):
+        self.pool = pool
+        self.schema = schema
+
+    async def fetch_all(self, query: str, params: List[Any]) -> List[Any]:
+        async with self.pool.acquire() as conn:
+            return await conn.fetch(query, *params)
+
+    async def fetch_one(self, query: str, params: List[Any]) -> Optional[Any]:
+        async with self.pool.acquire() as conn:
+            return await conn.fetchrow(query, *params)
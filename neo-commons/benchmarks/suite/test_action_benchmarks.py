@@ -0,0 +1,50 @@
+"""Event-to-action matching benchmarks."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+matchers = pytest.importorskip(
+    "neo_commons.platform.actions.infrastructure.matchers", exc_type=ImportError
+)
+condition_matcher_benchmark = pytest.importorskip(
+    "condition_matcher_benchmark", exc_type=ImportError
+)
+
+CONDITIONS = condition_matcher_benchmark.CONDITIONS
+EVENT_DATA = condition_matcher_benchmark.EVENT_DATA
+
+
+@pytest.mark.benchmark(group="actions")
+@pytest.mark.parametrize("name", list(CONDITIONS))
+def test_compiled_condition(benchmark, name):
+    """Evaluation of one compiled subscription condition."""
+    predicate = matchers.compile_condition(CONDITIONS[name])
+    benchmark(predicate, EVENT_DATA)
+
+
+@pytest.mark.benchmark(group="actions")
+@pytest.mark.parametrize("subscriptions", [100, 10000])
+def test_match_actions(benchmark, subscriptions):
+    """Routing one event through an index of conditional subscriptions."""
+    actions = [
+        SimpleNamespace(id=uuid4(), is_active=True, is_healthy=True, priority="normal")
+        for _ in range(subscriptions)
+    ]
+    names = list(CONDITIONS)
+    matcher = matchers.EventActionMatcher()
+    matcher.load(
+        [
+            SimpleNamespace(
+                id=uuid4(),
+                action_id=action.id,
+                event_patterns=[f"service{i % 50}.*.created"],
+                conditions=CONDITIONS[names[i % len(names)]],
+            )
+            for i, action in enumerate(actions)
+        ],
+        actions,
+    )
+
+    assert benchmark(matcher.match_actions, "service7.orders.created", EVENT_DATA)
@@ -0,0 +1,164 @@
+"""Token validation and permission check benchmarks."""
+
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from stand_ins import CannedDatabaseService
+
+jwt = pytest.importorskip("jwt")
+rsa = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.rsa")
+serialization = pytest.importorskip("cryptography.hazmat.primitives.serialization")
+
+identifiers = pytest.importorskip(
+    "neo_commons.core.value_objects.identifiers", exc_type=ImportError
+)
+jwt_validator = pytest.importorskip(
+    "neo_commons.features.auth.services.jwt_validator", exc_type=ImportError
+)
+keycloak_config = pytest.importorskip(
+    "neo_commons.features.auth.entities.keycloak_config", exc_type=ImportError
+)
+auth_context = pytest.importorskip(
+    "neo_commons.features.auth.entities.auth_context", exc_type=ImportError
+)
+permission_checker = pytest.importorskip(
+    "neo_commons.features.permissions.repositories.permission_checker", exc_type=ImportError
+)
+
+ISSUER = "https://keycloak.bench/realms/platform"
+PERMISSIONS = [f"resource{i}:{action}" for i in range(40) for action in ("read", "write", "delete")]
+
+
+@pytest.fixture(scope="module")
+def signing_keys():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    return private_key, public_pem
+
+
+def make_token(private_key) -> str:
+    now = int(time.time())
+    claims = {
+        "sub": str(uuid4()),
+        "iss": ISSUER,
+        "aud": "neo-api",
+        "iat": now,
+        "nbf": now,
+        "exp": now + 3600,
+        "email": "jane@example.com",
+        "preferred_username": "jane",
+        "given_name": "Jane",
+        "family_name": "Doe",
+        "session_state": str(uuid4()),
+        "scope": "openid profile email",
+        "realm_access": {"roles": ["admin", "user"]},
+    }
+    return jwt.encode(claims, private_key, algorithm="RS256")
+
+
+@pytest.fixture
+def validator(signing_keys):
+    _, public_pem = signing_keys
+    realm_id = identifiers.RealmId("platform")
+    config = keycloak_config.KeycloakConfig(
+        server_url="https://keycloak.bench",
+        realm_name="platform",
+        client_id="neo-api",
+        realm_id=realm_id,
+        audience="neo-api",
+        issuer=ISSUER,
+    )
+    platform_user_id = identifiers.UserId(str(uuid4()))
+
+    class RealmManager:
+        async def get_realm_config_by_id(self, realm_id):
+            return config
+
+        async def get_realm_by_id(self, realm_id):
+            return SimpleNamespace(tenant_id=None)
+
+    class UserMapper:
+        async def map_keycloak_to_platform(self, keycloak_user_id, tenant_id):
+            return platform_user_id
+
+    class PublicKeyCache:
+        async def get_public_key(self, realm_id):
+            return public_pem
+
+    return jwt_validator.JWTValidator(RealmManager(), UserMapper(), PublicKeyCache()), realm_id
+
+
+@pytest.mark.benchmark(group="auth")
+def test_validate_token(run_async, validator, signing_keys):
+    """RS256 verification, claim checks and auth context construction (cached public key)."""
+    jwt_validator_, realm_id = validator
+    token = make_token(signing_keys[0])
+
+    run_async(lambda: jwt_validator_.validate_token(token, realm_id))
+
+
+@pytest.fixture
+def context():
+    return auth_context.AuthContext.from_token_claims(
+        claims={"sub": str(uuid4()), "email": "jane@example.com", "exp": int(time.time()) + 3600},
+        user_id=identifiers.UserId(str(uuid4())),
+        keycloak_user_id=identifiers.KeycloakUserId(str(uuid4())),
+        tenant_id=None,
+        realm_id=identifiers.RealmId("platform"),
+        permissions={identifiers.PermissionCode(code) for code in PERMISSIONS},
+    )
+
+
+@pytest.mark.benchmark(group="auth")
+def test_auth_context_has_permission(benchmark, context):
+    """In-request permission check against the token's auth context."""
+    assert benchmark(context.has_permission, "resource39:delete")
+
+
+@pytest.mark.benchmark(group="auth")
+def test_auth_context_has_any_permission(benchmark, context):
+    required = ["reports:export", "billing:read", "resource20:write"]
+    assert benchmark(context.has_any_permission, required)
+
+
+class DictPermissionCache:
+    def __init__(self):
+        self.data = {}
+
+    async def get_user_permissions(self, user_id, tenant_id=None, scope_id=None):
+        return self.data.get((user_id, tenant_id, scope_id))
+
+    async def set_user_permissions(
+        self, user_id, permissions, tenant_id=None, scope_id=None, ttl=None
+    ):
+        self.data[(user_id, tenant_id, scope_id)] = permissions
+        return True
+
+
+@pytest.mark.benchmark(group="auth")
+def test_permission_checker_cached(run_async, loop):
+    """``has_permission`` answered from the permission cache."""
+    checker = permission_checker.AsyncPGPermissionChecker(
+        CannedDatabaseService([{"code": code} for code in PERMISSIONS]), DictPermissionCache()
+    )
+    user_id = identifiers.UserId(str(uuid4()))
+    tenant_id = identifiers.TenantId("acme")
+    assert loop.run_until_complete(checker.has_permission(user_id, "resource1:read", tenant_id))
+
+    run_async(lambda: checker.has_permission(user_id, "resource1:read", tenant_id))
+
+
+@pytest.mark.benchmark(group="auth")
+def test_permission_checker_uncached(run_async):
+    """``has_permission`` loading the permission set from the database (canned rows)."""
+    checker = permission_checker.AsyncPGPermissionChecker(
+        CannedDatabaseService([{"code": code} for code in PERMISSIONS])
+    )
+    user_id = identifiers.UserId(str(uuid4()))
+
+    run_async(lambda: checker.has_permission(user_id, "resource1:read"))
@@ -0,0 +1,69 @@
+"""Cache get/set benchmarks for the in-process and Redis tiers."""
+
+import pytest
+
+cache_manager = pytest.importorskip(
+    "neo_commons.platform.cache.application.services.cache_manager", exc_type=ImportError
+)
+memory_repository = pytest.importorskip(
+    "neo_commons.platform.cache.infrastructure.repositories.memory_cache_repository",
+    exc_type=ImportError,
+)
+redis_repository = pytest.importorskip(
+    "neo_commons.platform.cache.infrastructure.repositories.redis_cache_repository",
+    exc_type=ImportError,
+)
+
+VALUE = {
+    "user_id": "5b0c5c9e-7d57-4c4b-9a53-2f0b6f1f0e11",
+    "roles": ["admin", "billing"],
+    "permissions": [f"resource{i}:read" for i in range(20)],
+    "preferences": {"locale": "en", "timezone": "Europe/Berlin"},
+}
+
+
+@pytest.fixture(params=["memory", "redis"])
+def manager(request, bench_key):
+    """``CacheManager`` over one tier."""
+    if request.param == "memory":
+        repository = memory_repository.MemoryCacheRepository()
+    else:
+        repository = redis_repository.RedisCacheRepository(
+            request.getfixturevalue("redis_client"), key_prefix=f"{bench_key}:cache:"
+        )
+    return cache_manager.CacheManager(repository)
+
+
+def hit_counting(get):
+    """Wrap ``get`` to count hits, so a tier that never hits shows in the results."""
+    counts = {"calls": 0, "hits": 0}
+
+    async def counted():
+        value = await get()
+        counts["calls"] += 1
+        counts["hits"] += value is not None
+
+    return counted, counts
+
+
+@pytest.mark.benchmark(group="cache")
+def test_cache_set(run_async, manager):
+    run_async(
+        lambda: manager.set("user:42", VALUE, namespace="auth", ttl_seconds=300, tenant_id="acme")
+    )
+
+
+@pytest.mark.benchmark(group="cache")
+def test_cache_get_hit(benchmark, run_async, loop, manager):
+    assert loop.run_until_complete(
+        manager.set("user:42", VALUE, namespace="auth", ttl_seconds=300, tenant_id="acme")
+    )
+    get, counts = hit_counting(lambda: manager.get("user:42", namespace="auth", tenant_id="acme"))
+
+    run_async(get)
+    benchmark.extra_info["hit_ratio"] = counts["hits"] / max(counts["calls"], 1)
+
+
+@pytest.mark.benchmark(group="cache")
+def test_cache_get_miss(run_async, manager):
+    run_async(lambda: manager.get("user:missing", namespace="auth", tenant_id="acme"))
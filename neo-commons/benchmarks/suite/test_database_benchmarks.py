@@ -0,0 +1,121 @@
+"""Schema resolution, query statistics and pagination benchmarks."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from stand_ins import CannedDatabaseService, InMemoryCache
+
+pagination = pytest.importorskip("neo_commons.features.pagination", exc_type=ImportError)
+query_fingerprint = pytest.importorskip(
+    "neo_commons.features.database.utils.query_fingerprint", exc_type=ImportError
+)
+query_observer = pytest.importorskip(
+    "neo_commons.features.database.repositories.query_observer", exc_type=ImportError
+)
+
+TENANT_QUERY = (
+    "SELECT u.id, u.email, u.status FROM tenant_acme.users u "
+    "JOIN tenant_acme.user_roles ur ON ur.user_id = u.id "
+    "WHERE u.status IN ('active', 'invited') AND ur.role_id = $1 AND u.created_at > $2 "
+    "ORDER BY u.created_at DESC LIMIT 50"
+)
+
+
+def schema_resolver_class():
+    module = pytest.importorskip(
+        "neo_commons.features.database.repositories.schema_resolver", exc_type=ImportError
+    )
+    return module.DatabaseSchemaResolver
+
+
+@pytest.mark.benchmark(group="database")
+def test_resolve_tenant_schema_cached(run_async, loop):
+    """Tenant schema answered from the tenant cache."""
+    tenant_cache = pytest.importorskip(
+        "neo_commons.features.tenants.services.tenant_cache", exc_type=ImportError
+    )
+    resolver = schema_resolver_class()(
+        CannedDatabaseService([{"schema_name": "tenant_acme", "slug": "acme", "name": "Acme"}]),
+        cache=tenant_cache.TenantCache(InMemoryCache()),
+    )
+    assert loop.run_until_complete(resolver.get_tenant_schema("acme-id")) == "tenant_acme"
+
+    run_async(lambda: resolver.resolve_schema("acme-id", "tenant"))
+
+
+@pytest.mark.benchmark(group="database")
+def test_resolve_tenant_schema_uncached(run_async):
+    """Tenant schema lookup and validation without a cache (canned admin row)."""
+    resolver = schema_resolver_class()(
+        CannedDatabaseService([{"schema_name": "tenant_acme", "slug": "acme", "name": "Acme"}])
+    )
+
+    run_async(lambda: resolver.resolve_schema("acme-id", "tenant"))
+
+
+@pytest.mark.benchmark(group="database")
+def test_fingerprint_query_uncached(benchmark):
+    """SQL normalization of a statement not yet in the fingerprint cache."""
+    benchmark(query_fingerprint.fingerprint_query.__wrapped__, TENANT_QUERY)
+
+
+@pytest.mark.benchmark(group="database")
+def test_query_observer_observe(benchmark):
+    """Query logger callback run for every statement on a pooled connection."""
+    observer = query_observer.QueryObserver("bench", slow_query_threshold_ms=1000)
+    record = SimpleNamespace(query=TENANT_QUERY, args=(1, None), elapsed=0.004, exception=None)
+
+    benchmark(observer.observe, record)
+
+
+class ItemRepository(
+    pagination.PaginatedRepositoryMixin, pagination.CursorPaginatedRepositoryMixin
+):
+    BASE_QUERY = "SELECT id, name, status, created_at FROM {schema}.items WHERE status = $1"
+    COUNT_QUERY = "SELECT COUNT(*) AS count FROM {schema}.items WHERE status = $1"
+
+    def __init__(self, table):
+        super().__init__()
+        self._db = table
+        self._schema = table.schema
+
+    def _map_row_to_entity(self, row):
+        return SimpleNamespace(
+            id=row["id"], name=row["name"], status=row["status"], created_at=row["created_at"]
+        )
+
+
+@pytest.mark.benchmark(group="pagination")
+@pytest.mark.parametrize("page", [1, 100])
+def test_offset_page(run_async, loop, pagination_table, page):
+    """Offset page of 50 rows plus the (cached) total count."""
+    repository = ItemRepository(pagination_table)
+    request = pagination.OffsetPaginationRequest(page=page, per_page=50)
+
+    def fetch_page():
+        return repository.find_paginated(
+            request, ItemRepository.BASE_QUERY, ItemRepository.COUNT_QUERY, ["active"]
+        )
+
+    assert len(loop.run_until_complete(fetch_page()).items) == 50
+
+    run_async(fetch_page, batch=20)
+
+
+@pytest.mark.benchmark(group="pagination")
+def test_cursor_page(run_async, loop, pagination_table):
+    """Keyset page of 50 rows after a cursor deep into the table."""
+    repository = ItemRepository(pagination_table)
+    cursor = repository._encode_cursor({"id": 5000})
+    request = pagination.CursorPaginationRequest(limit=50, cursor_after=cursor)
+
+    def fetch_page():
+        return repository.find_cursor_paginated(
+            request, ItemRepository.BASE_QUERY, "id", ["active"]
+        )
+
+    response = loop.run_until_complete(fetch_page())
+    assert len(response.items) == 50 and response.has_more
+
+    run_async(fetch_page, batch=20)
@@ -0,0 +1,81 @@
+"""Event publish and consume benchmarks on Redis streams."""
+
+from uuid import uuid4
+
+import pytest
+
+event_entity = pytest.importorskip(
+    "neo_commons.platform.events.domain.entities.event", exc_type=ImportError
+)
+publishers = pytest.importorskip(
+    "neo_commons.platform.events.infrastructure.publishers.redis_event_publisher",
+    exc_type=ImportError,
+)
+processors = pytest.importorskip(
+    "neo_commons.platform.events.infrastructure.processors.redis_event_processor",
+    exc_type=ImportError,
+)
+
+CONSUME_BATCH = 100
+
+
+def make_event():
+    return event_entity.Event.create(
+        "users.created",
+        uuid4(),
+        "user",
+        {"email": "jane@example.com", "roles": ["admin", "user"], "plan": "pro", "seats": 25},
+        tenant_id=uuid4(),
+        source_service="bench",
+    )
+
+
+@pytest.mark.benchmark(group="events")
+@pytest.mark.parametrize("wire_format", ["compact", "fields"])
+def test_encode_event(benchmark, wire_format):
+    """Stream entry encoding of one event."""
+    publisher = publishers.RedisEventPublisher(None, wire_format=wire_format)
+    event = make_event()
+
+    benchmark(publisher.encode_entry, event, "admin")
+
+
+@pytest.mark.benchmark(group="events")
+@pytest.mark.parametrize("wire_format", ["compact", "fields"])
+def test_publish_event(run_async, redis_client, bench_key, wire_format):
+    """``publish`` of one event: encoding plus one XADD."""
+    publisher = publishers.RedisEventPublisher(redis_client, max_len=10000, wire_format=wire_format)
+    event = make_event()
+    queue = f"{bench_key}:events"
+
+    run_async(lambda: publisher.publish(event, "admin", queue_name=queue))
+
+
+@pytest.mark.benchmark(group="events")
+@pytest.mark.parametrize("lazy_events", [False, True], ids=["event", "lazy"])
+def test_publish_consume_batch(run_async, loop, redis_client, bench_key, lazy_events):
+    """Pipelined XADD of a batch, then reading, decoding, handling and acking it.
+
+    Times are per batch of ``CONSUME_BATCH`` events (see ``ops_per_round``
+    for the number of batches per round).
+    """
+    publisher = publishers.RedisEventPublisher(redis_client, max_len=100000)
+    processor = processors.RedisEventProcessor(redis_client, lazy_events=lazy_events)
+    queue = f"{bench_key}:events"
+    _, _, fields = publisher.encode_entry(make_event(), "admin", queue_name=queue)
+    batch = [(queue, fields)] * CONSUME_BATCH
+    handled = 0
+
+    async def handler(event, queue_name):
+        nonlocal handled
+        handled += 1
+
+    async def publish_and_drain():
+        target = handled + CONSUME_BATCH
+        await publisher.publish_entries(batch)
+        while handled < target:
+            await processor.consume(queue, "bench", handler, max_events=CONSUME_BATCH, timeout_ms=1)
+
+    run_async(publish_and_drain, batch=5)
+    pending = loop.run_until_complete(redis_client.xpending(queue, "bench"))
+    assert pending["pending"] == 0
@@ -0,0 +1,30 @@
+"""Full middleware stack benchmarks."""
+
+import pytest
+
+middleware_stack_benchmark = pytest.importorskip("middleware_stack_benchmark", exc_type=ImportError)
+
+
+@pytest.mark.benchmark(group="middleware")
+@pytest.mark.parametrize("variant", ["bare", "stacked", "combined"])
+def test_middleware_stack(run_async, loop, variant):
+    """One GET through the production stack (``bare``: the app alone)."""
+    app = middleware_stack_benchmark.build_app(variant)
+    scope = middleware_stack_benchmark.make_scope(42)
+    request_message = {"type": "http.request", "body": b"", "more_body": False}
+    statuses = []
+
+    async def receive():
+        return request_message
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    async def request():
+        await app(dict(scope), receive, send)
+
+    loop.run_until_complete(request())
+    assert statuses == [200]
+
+    run_async(request)
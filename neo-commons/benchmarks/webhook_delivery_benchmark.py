@@ -0,0 +1,127 @@
+"""Webhook delivery benchmark.
+
+Starts a local keep-alive HTTP server and delivers webhooks to it with a
+new ``httpx.AsyncClient`` per delivery (the previous handler behaviour),
+through the shared ``WebhookDeliveryEngine``, and through the engine with
+batching enabled. Reports deliveries per second and latency percentiles
+as seen by the caller.
+
+``--concurrency`` callers deliver at once; the engine admits at most
+``--endpoint-concurrency`` of them to the endpoint at a time (its adaptive
+per-endpoint limit), the per-delivery client admits all of them.
+
+Usage:
+    python benchmarks/webhook_delivery_benchmark.py --deliveries 5000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+
+from neo_commons.platform.actions.infrastructure.handlers.webhook import WebhookDeliveryEngine
+
+RESPONSE = b'{"ok":true}'
+
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, delay: float) -> None:
+    """Minimal HTTP/1.1 server: answers every request with 200 and keeps the connection open."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            if delay:
+                await asyncio.sleep(delay)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: " + str(len(RESPONSE)).encode() + b"\r\n\r\n" + RESPONSE
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def run(name: str, deliver: Callable[[int], Awaitable[None]], deliveries: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await deliver(i)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(deliveries)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{name:<22} {deliveries / elapsed:9.0f} deliveries/s  p50={p50:7.2f} ms  p99={p99:7.2f} ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--deliveries", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--endpoint-concurrency", type=int, default=10)
+    parser.add_argument("--server-latency-ms", type=float, default=0.0)
+    parser.add_argument("--batch-size", type=int, default=50)
+    args = parser.parse_args()
+
+    server = await asyncio.start_server(
+        lambda r, w: handle_connection(r, w, args.server_latency_ms / 1000), "127.0.0.1", 0, backlog=4096
+    )
+    port = server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/hook"
+    secret = {"auth_type": "hmac", "auth_config": {"secret": "s3cret", "algorithm": "sha256"}}
+
+    def payload(i: int) -> dict:
+        return {"event_id": str(i), "event_type": "users.created", "data": {"user_id": i}}
+
+    async def per_request_client(i: int) -> None:
+        async with httpx.AsyncClient(timeout=30) as client:
+            response = await client.post(url, content=json.dumps(payload(i)))
+            response.raise_for_status()
+
+    engine = WebhookDeliveryEngine(
+        default_concurrency=args.endpoint_concurrency, max_concurrency=args.endpoint_concurrency
+    )
+    config = {"webhook_url": url, **secret}
+
+    async def shared_engine(i: int) -> None:
+        await engine.deliver(config, payload(i))
+
+    batched_config = {
+        "webhook_url": f"{url}/batched",
+        **secret,
+        "batch": {"max_size": args.batch_size, "max_wait_ms": 5},
+    }
+
+    async def batched_engine(i: int) -> None:
+        await engine.deliver(batched_config, payload(i))
+
+    async with server:
+        await run("client per delivery", per_request_client, args.deliveries, args.concurrency)
+        await run("shared engine", shared_engine, args.deliveries, args.concurrency)
+        await run("shared engine batched", batched_engine, args.deliveries, args.concurrency)
+        await engine.close()
+
+    for endpoint, stats in engine.get_stats()["endpoints"].items():
+        print(f"{endpoint}: requests={stats['requests']} delivered={stats['delivered']} "
+              f"limit={stats['concurrency_limit']} circuit={stats['circuit_state']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -11,6 +11,14 @@ import sys
 from typing import Dict, Any, Optional
 from enum import Enum
 
+from ..infrastructure.logging import (
+    JSONLogFormatter,
+    Redactor,
+    SamplingFilter,
+    configure_async_logging,
+    shutdown_async_logging,
+)
+
 
 class LogLevel(str, Enum):
     """Supported log levels."""
@@ -79,27 +87,39 @@ class LoggingConfig:
         enable_sql_logging = os.getenv("ENABLE_SQL_LOGGING", "false").lower() == "true"
         enable_auth_logging = os.getenv("ENABLE_AUTH_LOGGING", "false").lower() == "true"
         enable_db_logging = os.getenv("ENABLE_DB_LOGGING", "false").lower() == "true"
+        # Log I/O on a background writer thread instead of the calling thread; the
+        # thread starts with the first record and again in forked children
+        enable_async_logging = os.getenv("LOG_ASYNC", "true").lower() == "true"
+        log_queue_size = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+        # Hot-path DEBUG/INFO sampling, e.g. "neo_commons.features.auth=0.1"
+        log_sampling = os.getenv("LOG_SAMPLING", "")
         
         # Use verbosity to determine log level
         effective_log_level = get_log_level_from_verbosity(log_verbosity)
         
         # Configure log format
         if log_format == "json":
-            format_string = '{"time":"%(asctime)s","level":"%(levelname)s","module":"%(name)s","message":"%(message)s"}'
+            formatter = {
+                "()": JSONLogFormatter,
+                "redactor": Redactor(),
+            }
         elif log_format == "detailed":
-            format_string = "%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s"
+            formatter = {
+                "format": "%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s",
+                "datefmt": "%Y-%m-%d %H:%M:%S",
+            }
         else:  # simple
-            format_string = "%(asctime)s - %(levelname)s - %(message)s"
+            formatter = {
+                "format": "%(asctime)s - %(levelname)s - %(message)s",
+                "datefmt": "%Y-%m-%d %H:%M:%S",
+            }
         
         # Create logging configuration
         logging_config = {
             "version": 1,
             "disable_existing_loggers": False,
             "formatters": {
-                "default": {
-                    "format": format_string,
-                    "datefmt": "%Y-%m-%d %H:%M:%S",
-                },
+                "default": formatter,
             },
             "handlers": {
                 "console": {
@@ -156,13 +176,24 @@ class LoggingConfig:
                 "propagate": False,
             }
         
-        # Apply configuration
+        # Apply configuration (restoring handlers a previous async setup replaced)
+        shutdown_async_logging()
         logging.config.dictConfig(logging_config)
         
+        if enable_async_logging:
+            configure_async_logging(
+                loggers=logging_config["loggers"],
+                queue_size=log_queue_size,
+                sampling=SamplingFilter.from_string(log_sampling),
+            )
+        
         # Log configuration info (only in debug mode)
         logger = logging.getLogger(__name__)
         if effective_log_level == "DEBUG":
-            logger.debug(f"Logging configured: level={effective_log_level}, format={log_format}")
+            logger.debug(
+                "Logging configured: level=%s, format=%s, async=%s",
+                effective_log_level, log_format, enable_async_logging
+            )
     
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
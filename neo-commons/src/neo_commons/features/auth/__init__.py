@@ -48,6 +48,8 @@ async def protected_route(
 ```
 """
 
+import logging
+
 # Core entities and value objects
 from .entities.auth_context import AuthContext
 from .entities.jwt_token import JWTToken
@@ -76,6 +78,7 @@ from .entities.cache_protocols import (
 # Service implementations  
 from .services.auth_service import AuthService
 from .services.auth_cache_service import AuthCacheService
+from .services.auth_context_refresher import AuthContextRefresher
 from .services.jwt_validator import JWTValidator
 from .services.keycloak_service import KeycloakService
 from .services.realm_manager import RealmManager
@@ -84,12 +87,14 @@ from .services.user_mapper import UserMapper
 
 # Adapter implementations
 from .adapters.keycloak_admin import KeycloakAdminAdapter
+from .adapters.keycloak_http_pool import KeycloakHttpPool, get_keycloak_http_pool
 from .adapters.keycloak_openid import KeycloakOpenIDAdapter
 from .adapters.redis_auth_cache import RedisAuthCache
 
 # Repository implementations
 from .repositories.realm_repository import RealmRepository
 from .repositories.user_mapping_repository import UserMappingRepository
+from .repositories.user_mapping_cache import UserMappingCache, get_user_mapping_cache
 
 # FastAPI integration
 from .dependencies import (
@@ -168,6 +173,7 @@ __all__ = [
     # Service implementations
     "AuthService",
     "AuthCacheService",
+    "AuthContextRefresher",
     "JWTValidator",
     "KeycloakService",
     "RealmManager", 
@@ -178,12 +184,16 @@ __all__ = [
     
     # Adapter implementations
     "KeycloakAdminAdapter",
+    "KeycloakHttpPool",
+    "get_keycloak_http_pool",
     "KeycloakOpenIDAdapter",
     "RedisAuthCache",
     
     # Repository implementations
     "RealmRepository",
     "UserMappingRepository",
+    "UserMappingCache",
+    "get_user_mapping_cache",
     
     # FastAPI integration
     "AuthDependencies",
@@ -235,6 +245,9 @@ __all__ = [
 ]
 
 
+logger = logging.getLogger(__name__)
+
+
 # Factory for creating configured auth services
 
 class AuthServiceFactory:
@@ -270,6 +283,7 @@ class AuthServiceFactory:
         self._token_service = None
         self._auth_service = None
         self._auth_dependencies = None
+        self._auth_context_refresher = None
     
     async def get_auth_cache(self) -> RedisAuthCache:
         """Get or create Redis auth cache."""
@@ -479,6 +493,19 @@ class AuthServiceFactory:
             )
         return self._auth_dependencies
     
+    async def get_auth_context_refresher(self) -> AuthContextRefresher:
+        """Get or create the RBAC change event worker that keeps auth caches warm."""
+        if not self._auth_context_refresher:
+            if not self.database_service:
+                raise ValueError("Auth context refresher requires a database service")
+            
+            auth_cache_service = await self.get_auth_cache_service()
+            self._auth_context_refresher = AuthContextRefresher(
+                database_service=self.database_service,
+                auth_cache_service=auth_cache_service,
+            )
+        return self._auth_context_refresher
+    
     async def initialize_all_services(self) -> None:
         """Initialize all services for the factory."""
         # Initialize services in dependency order
@@ -486,12 +513,19 @@ class AuthServiceFactory:
         self.get_realm_repository()
         self.get_user_mapping_repository()
         await self.get_realm_manager()
-        await self.get_user_mapper()
+        user_mapper = await self.get_user_mapper()
         await self.get_jwt_validator()
         await self.get_keycloak_service()
         await self.get_token_service()
         await self.get_auth_service()
         await self.get_auth_dependencies()
+        
+        # Warm the platform user mapping cache so token validation skips the DB
+        if self.database_service:
+            try:
+                await user_mapper.mapping_cache.preload(self.database_service)
+            except Exception as e:
+                logger.warning(f"Failed to preload user mapping cache: {e}")
     
     async def cleanup(self) -> None:
         """Cleanup factory resources."""
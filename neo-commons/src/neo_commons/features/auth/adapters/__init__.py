@@ -4,9 +4,12 @@ Contains adapters for external services like Keycloak.
 """
 
 from .keycloak_admin import KeycloakAdminAdapter
+from .keycloak_http_pool import KeycloakHttpPool, get_keycloak_http_pool
 from .keycloak_openid import KeycloakOpenIDAdapter
 
 __all__ = [
     "KeycloakAdminAdapter",
+    "KeycloakHttpPool",
+    "get_keycloak_http_pool",
     "KeycloakOpenIDAdapter",
 ]
\ No newline at end of file
@@ -1,10 +1,10 @@
 """Keycloak Admin API adapter."""
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import httpx
-from keycloak import KeycloakAdmin
+from keycloak import KeycloakAdmin, KeycloakOpenIDConnection
 from keycloak.exceptions import KeycloakError
 
 from ....core.exceptions.auth import (
@@ -14,6 +14,7 @@ from ....core.exceptions.auth import (
 )
 from ....core.value_objects.identifiers import RealmId, TenantId
 from ..entities.keycloak_config import KeycloakConfig
+from .keycloak_http_pool import get_keycloak_http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +68,7 @@ class KeycloakAdminAdapter:
             raise ValueError("Must provide either (username + password) or client_secret for authentication")
         
         self._admin_client: Optional[KeycloakAdmin] = None
+        self._realm_clients: Dict[str, KeycloakAdmin] = {}
         self._http_client: Optional[httpx.AsyncClient] = None
         self.target_realm = realm_name  # The realm we want to manage (different from auth realm)
     
@@ -93,56 +95,92 @@ class KeycloakAdminAdapter:
         await self._close_connections()
     
     async def _ensure_connected(self) -> None:
-        """Ensure connection to Keycloak admin API."""
+        """Ensure connection to Keycloak admin API.
+        
+        Admin tokens come from the shared Keycloak HTTP pool, so connecting
+        only logs in when no cached token is available for these credentials.
+        """
         if self._admin_client is None:
             try:
-                if self.client_secret:
-                    # Use client credentials authentication
-                    from keycloak import KeycloakOpenIDConnection
-                    
-                    connection = KeycloakOpenIDConnection(
-                        server_url=self.server_url,
-                        realm_name=self.realm_name,
-                        client_id=self.client_id,
-                        client_secret_key=self.client_secret,
-                        verify=self.verify,
-                    )
-                    
-                    self._admin_client = KeycloakAdmin(connection=connection)
-                    logger.info(f"Connected to Keycloak admin API using client credentials for realm: {self.realm_name}")
-                    
-                    # Store the target realm for operations
-                    self.target_realm = self.realm_name  # Client credentials usually work in the same realm
-                    
-                else:
-                    # Use admin username/password authentication
-                    # Admin users authenticate against master realm, then manage other realms
-                    self._admin_client = KeycloakAdmin(
-                        server_url=self.server_url,
-                        username=self.username,
-                        password=self.password,
-                        realm_name="master",  # Admin users ALWAYS authenticate in master realm
-                        client_id=self.client_id if self.client_id else "admin-cli",
-                        verify=self.verify,
-                    )
-                    logger.info(f"Connected to Keycloak admin API using admin credentials, will manage realm: {self.realm_name}")
-                    
-                    # Store the target realm for operations
-                    # Admin stays authenticated in master but operates on target realm
-                    self.target_realm = self.realm_name
+                # Admin users authenticate in master; client credentials in their own realm.
+                # Both start out operating on the auth realm, as before.
+                self._admin_client, fresh_login = await self._build_admin_client(self._auth_realm)
+                self.target_realm = self.realm_name
                 
-                # Test connection (uses master realm for admin auth)
-                await self._test_connection()
+                # Verify admin permissions only when a new login was performed
+                if fresh_login:
+                    await self._test_connection()
+                    if self.client_secret:
+                        logger.info(f"Connected to Keycloak admin API using client credentials for realm: {self.realm_name}")
+                    else:
+                        logger.info(f"Connected to Keycloak admin API using admin credentials, will manage realm: {self.realm_name}")
                 
             except Exception as e:
+                self._admin_client = None
                 logger.error(f"Failed to connect to Keycloak admin API: {e}")
                 raise KeycloakConnectionError(f"Cannot connect to Keycloak: {e}") from e
         
         if self._http_client is None:
-            self._http_client = httpx.AsyncClient(
-                timeout=self.timeout,
-                verify=self.verify,
-            )
+            self._http_client = get_keycloak_http_pool().get_client(self.server_url, self.verify)
+    
+    @property
+    def _auth_realm(self) -> str:
+        """Realm the admin credentials authenticate against."""
+        return self.realm_name if self.client_secret else "master"
+    
+    async def _build_admin_client(self, realm_name: str) -> Tuple[KeycloakAdmin, bool]:
+        """Create a KeycloakAdmin operating on ``realm_name`` with a pooled connection.
+        
+        Returns:
+            Tuple of (admin client, whether a new login was performed)
+        """
+        pool = get_keycloak_http_pool()
+        client_id = self.client_id or "admin-cli"
+        token, fresh_login = await pool.get_admin_token(
+            server_url=self.server_url,
+            realm_name=self._auth_realm,
+            client_id=client_id,
+            username=self.username,
+            password=self.password,
+            client_secret=self.client_secret,
+            verify=self.verify,
+        )
+        
+        connection = KeycloakOpenIDConnection(
+            server_url=self.server_url,
+            username=None if self.client_secret else self.username,
+            password=None if self.client_secret else self.password,
+            token=token,
+            realm_name=realm_name,
+            user_realm_name=self._auth_realm,
+            client_id=client_id,
+            client_secret_key=self.client_secret,
+            verify=self.verify,
+            timeout=self.timeout,
+        )
+        pool.attach(connection, self.server_url, self.verify)
+        # Token refreshes go through the embedded OpenID client
+        pool.attach(connection.keycloak_openid.connection, self.server_url, self.verify)
+        
+        return KeycloakAdmin(connection=connection), fresh_login
+    
+    async def _get_realm_client(self, realm_name: str) -> KeycloakAdmin:
+        """Get an admin client bound to ``realm_name``.
+        
+        Clients share the pooled HTTP connections and cached token, so one
+        adapter can serve several realms concurrently without switching the
+        realm on a shared client.
+        """
+        await self._ensure_connected()
+        
+        if realm_name == self._admin_client.connection.realm_name:
+            return self._admin_client
+        
+        admin_client = self._realm_clients.get(realm_name)
+        if admin_client is None:
+            admin_client, _ = await self._build_admin_client(realm_name)
+            self._realm_clients[realm_name] = admin_client
+        return admin_client
     
     async def _test_connection(self) -> None:
         """Test connection to Keycloak."""
@@ -155,38 +193,15 @@ class KeycloakAdminAdapter:
         except KeycloakError as e:
             raise KeycloakConnectionError(f"Keycloak connection test failed: {e}") from e
     
-    def _create_realm_admin(self, realm_name: str) -> 'KeycloakAdmin':
-        """Create a KeycloakAdmin client for a specific realm."""
-        if self.client_secret:
-            # Use client credentials authentication
-            from keycloak import KeycloakOpenIDConnection
-            connection = KeycloakOpenIDConnection(
-                server_url=self.server_url,
-                realm_name=realm_name,
-                client_id=self.client_id,
-                client_secret_key=self.client_secret,
-                verify=self.verify,
-            )
-            return KeycloakAdmin(connection=connection)
-        else:
-            # Use admin username/password authentication
-            return KeycloakAdmin(
-                server_url=self.server_url,
-                username=self.username,
-                password=self.password,
-                realm_name=realm_name,
-                client_id=self.client_id,
-                verify=self.verify,
-            )
-    
     async def _close_connections(self) -> None:
-        """Close connections."""
-        if self._http_client:
-            await self._http_client.aclose()
-            self._http_client = None
+        """Release clients.
         
-        # KeycloakAdmin doesn't need explicit closing
+        The HTTP client belongs to the shared Keycloak pool and stays open
+        for reuse by other adapters.
+        """
+        self._http_client = None
         self._admin_client = None
+        self._realm_clients.clear()
     
     async def create_realm(
         self, 
@@ -279,28 +294,8 @@ class KeycloakAdminAdapter:
         await self._ensure_connected()
         
         try:
-            # Create a separate admin client for the target realm
-            if self.client_secret:
-                # Use client credentials authentication
-                from keycloak import KeycloakOpenIDConnection
-                connection = KeycloakOpenIDConnection(
-                    server_url=self.server_url,
-                    realm_name=realm_name,
-                    client_id=self.client_id,
-                    client_secret_key=self.client_secret,
-                    verify=self.verify,
-                )
-                target_admin = KeycloakAdmin(connection=connection)
-            else:
-                # Use admin username/password authentication
-                target_admin = KeycloakAdmin(
-                    server_url=self.server_url,
-                    username=self.username,
-                    password=self.password,
-                    realm_name=realm_name,
-                    client_id=self.client_id,
-                    verify=self.verify,
-                )
+            # Use an admin client bound to the target realm
+            target_admin = await self._get_realm_client(realm_name)
             
             client_data = {
                 "clientId": client_id,
@@ -387,40 +382,25 @@ class KeycloakAdminAdapter:
         user_data: Dict,
     ) -> str:
         """Create a new user in the realm."""
-        await self._ensure_connected()
-        
-        # Switch to target realm
-        original_realm = self._admin_client.connection.realm_name
-        self._admin_client.connection.realm_name = realm_name
+        admin_client = await self._get_realm_client(realm_name)
         
         try:
             # Use native async method from python-keycloak for user operations
-            user_id = await self._admin_client.a_create_user(user_data)
+            user_id = await admin_client.a_create_user(user_data)
             logger.info(f"Created user {user_data.get('username')} in realm {realm_name}")
             return user_id
         
         except KeycloakError as e:
             logger.error(f"Failed to create user: {e}")
             raise RealmConfigurationError(f"Cannot create user: {e}") from e
-        
-        finally:
-            # Restore original realm
-            self._admin_client.connection.realm_name = original_realm
     
     async def get_user_by_username(self, realm_name: str, username: str) -> Optional[Dict]:
         """Get user by username."""
-        await self._ensure_connected()
+        admin_client = await self._get_realm_client(realm_name)
         
         try:
-            # Switch to target realm for this operation
-            original_realm = self._admin_client.connection.realm_name
-            self._admin_client.connection.realm_name = realm_name
-            
             # Use async method to get users by username
-            users = await self._admin_client.a_get_users({"username": username})
-            
-            # Restore original realm
-            self._admin_client.connection.realm_name = original_realm
+            users = await admin_client.a_get_users({"username": username})
             
             if users:
                 return users[0]  # Username should be unique
@@ -432,18 +412,11 @@ class KeycloakAdminAdapter:
     
     async def get_user_by_email(self, realm_name: str, email: str) -> Optional[Dict]:
         """Get user by email."""
-        await self._ensure_connected()
+        admin_client = await self._get_realm_client(realm_name)
         
         try:
-            # Switch to target realm for this operation
-            original_realm = self._admin_client.connection.realm_name
-            self._admin_client.connection.realm_name = realm_name
-            
             # Use async method to get users by email
-            users = await self._admin_client.a_get_users({"email": email})
-            
-            # Restore original realm
-            self._admin_client.connection.realm_name = original_realm
+            users = await admin_client.a_get_users({"email": email})
             
             if users:
                 return users[0]  # Email should be unique
@@ -455,24 +428,16 @@ class KeycloakAdminAdapter:
     
     async def update_user(self, realm_name: str, user_id: str, user_data: Dict) -> None:
         """Update user information."""
-        await self._ensure_connected()
-        
-        # Switch to target realm
-        original_realm = self._admin_client.connection.realm_name
-        self._admin_client.connection.realm_name = realm_name
+        admin_client = await self._get_realm_client(realm_name)
         
         try:
             # Use native async method from python-keycloak for user operations
-            await self._admin_client.a_update_user(user_id, user_data)
+            await admin_client.a_update_user(user_id, user_data)
             logger.info(f"Updated user {user_id} in realm {realm_name}")
         
         except KeycloakError as e:
             logger.error(f"Failed to update user {user_id}: {e}")
             raise RealmConfigurationError(f"Cannot update user: {e}") from e
-        
-        finally:
-            # Restore original realm
-            self._admin_client.connection.realm_name = original_realm
     
     async def set_user_password(
         self,
@@ -482,61 +447,38 @@ class KeycloakAdminAdapter:
         temporary: bool = False,
     ) -> None:
         """Set user password."""
-        await self._ensure_connected()
-        
-        # Switch to target realm
-        original_realm = self._admin_client.connection.realm_name
-        self._admin_client.connection.realm_name = realm_name
+        admin_client = await self._get_realm_client(realm_name)
         
         try:
             # Use native async method from python-keycloak for user operations
-            await self._admin_client.a_set_user_password(user_id, password, temporary)
+            await admin_client.a_set_user_password(user_id, password, temporary)
             logger.info(f"Set password for user {user_id} in realm {realm_name}")
         
         except KeycloakError as e:
             logger.error(f"Failed to set password for user {user_id}: {e}")
             raise RealmConfigurationError(f"Cannot set user password: {e}") from e
-        
-        finally:
-            # Restore original realm
-            self._admin_client.connection.realm_name = original_realm
     
     async def send_user_email_verification(self, realm_name: str, user_id: str) -> None:
         """Send email verification to user."""
-        await self._ensure_connected()
-        
-        # Switch to target realm
-        original_realm = self._admin_client.connection.realm_name
-        self._admin_client.connection.realm_name = realm_name
+        admin_client = await self._get_realm_client(realm_name)
         
         try:
             # Use native async method from python-keycloak for user operations
-            await self._admin_client.a_send_verify_email(user_id)
+            await admin_client.a_send_verify_email(user_id)
             logger.info(f"Sent email verification to user {user_id}")
         
         except KeycloakError as e:
             logger.error(f"Failed to send email verification to user {user_id}: {e}")
             raise RealmConfigurationError(f"Cannot send email verification: {e}") from e
-        
-        finally:
-            # Restore original realm
-            self._admin_client.connection.realm_name = original_realm
     
     async def send_user_password_reset(self, realm_name: str, user_id: str) -> None:
         """Send password reset email to user."""
-        await self._ensure_connected()
+        admin_client = await self._get_realm_client(realm_name)
         
         try:
-            # Switch to target realm for this operation
-            original_realm = self._admin_client.connection.realm_name
-            self._admin_client.connection.realm_name = realm_name
-            
             # Use native async method from python-keycloak for user operations
-            await self._admin_client.a_send_update_account(user_id, ["UPDATE_PASSWORD"])
+            await admin_client.a_send_update_account(user_id, ["UPDATE_PASSWORD"])
             
-            # Restore original realm
-            self._admin_client.connection.realm_name = original_realm
-                
             logger.info(f"Sent password reset to user {user_id} in realm {realm_name}")
         
         except KeycloakError as e:
@@ -545,24 +487,17 @@ class KeycloakAdminAdapter:
     
     async def delete_user(self, realm_name: str, user_id: str) -> None:
         """Delete user from realm."""
-        await self._ensure_connected()
-        
-        # Switch to target realm
-        original_realm = self._admin_client.connection.realm_name
-        self._admin_client.connection.realm_name = realm_name
+        admin_client = await self._get_realm_client(realm_name)
         
         try:
             # Use native async method from python-keycloak for user operations  
-            await self._admin_client.a_delete_user(user_id)
+            await admin_client.a_delete_user(user_id)
             logger.info(f"Deleted user {user_id} from realm {realm_name}")
         
         except KeycloakError as e:
             logger.error(f"Failed to delete user {user_id}: {e}")
             raise RealmConfigurationError(f"Cannot delete user: {e}") from e
-        
-        finally:
-            # Restore original realm
-            self._admin_client.connection.realm_name = original_realm    
+    
     async def send_verify_email(self, realm_name: str, user_id: str) -> None:
         """Send email verification to user (alias for send_user_email_verification)."""
         await self.send_user_email_verification(realm_name, user_id)
@@ -575,15 +510,11 @@ class KeycloakAdminAdapter:
         lifespan: int = 3600
     ) -> None:
         """Send user action email with specified actions."""
-        await self._ensure_connected()
-        
-        # Switch to target realm
-        original_realm = self._admin_client.connection.realm_name
-        self._admin_client.connection.realm_name = realm_name
+        admin_client = await self._get_realm_client(realm_name)
         
         try:
             # Use native async method from python-keycloak for user operations
-            await self._admin_client.a_send_update_account(
+            await admin_client.a_send_update_account(
                 user_id=user_id,
                 payload=actions,
                 lifespan=lifespan
@@ -593,29 +524,19 @@ class KeycloakAdminAdapter:
         except KeycloakError as e:
             logger.error(f"Failed to send action email: {e}")
             raise RealmConfigurationError(f"Cannot send action email: {e}") from e
-        
-        finally:
-            self._admin_client.realm_name = original_realm
     
     async def get_user_credentials(self, realm_name: str, user_id: str) -> List[Dict]:
         """Get user credentials."""
-        await self._ensure_connected()
-        
-        # Switch to target realm
-        original_realm = self._admin_client.connection.realm_name
-        self._admin_client.connection.realm_name = realm_name
+        admin_client = await self._get_realm_client(realm_name)
         
         try:
             # Use native async method from python-keycloak
-            credentials = await self._admin_client.a_get_credentials(user_id=user_id)
+            credentials = await admin_client.a_get_credentials(user_id=user_id)
             return credentials
         
         except KeycloakError as e:
             logger.error(f"Failed to get user credentials: {e}")
             raise RealmConfigurationError(f"Cannot get user credentials: {e}") from e
-        
-        finally:
-            self._admin_client.realm_name = original_realm
     
     async def remove_user_totp(self, realm_name: str, user_id: str) -> None:
         """Remove TOTP from user."""
@@ -631,46 +552,32 @@ class KeycloakAdminAdapter:
     
     async def delete_user_credential(self, realm_name: str, user_id: str, credential_id: str) -> None:
         """Delete a specific user credential."""
-        await self._ensure_connected()
-        
-        # Switch to target realm
-        original_realm = self._admin_client.connection.realm_name
-        self._admin_client.connection.realm_name = realm_name
+        admin_client = await self._get_realm_client(realm_name)
         
         try:
             # Use native async method from python-keycloak
-            await self._admin_client.a_delete_credential(user_id=user_id, credential_id=credential_id)
+            await admin_client.a_delete_credential(user_id=user_id, credential_id=credential_id)
             logger.info(f"Deleted credential {credential_id} from user {user_id}")
         
         except KeycloakError as e:
             logger.error(f"Failed to delete credential: {e}")
             raise RealmConfigurationError(f"Cannot delete credential: {e}") from e
-        
-        finally:
-            self._admin_client.realm_name = original_realm
     
     async def logout_user(self, realm_name: str, user_id: str) -> None:
         """Logout all user sessions."""
-        await self._ensure_connected()
-        
-        # Switch to target realm  
-        original_realm = self._admin_client.realm_name
-        self._admin_client.realm_name = realm_name
+        admin_client = await self._get_realm_client(realm_name)
         
         try:
             # Get user sessions and logout each one
-            sessions = await self._admin_client.a_get_sessions(user_id=user_id)
+            sessions = await admin_client.a_get_sessions(user_id=user_id)
             
             for session in sessions:
                 # Logout each session - this needs to be sync as there's no async version
-                self._admin_client.delete_user_session(user_id=user_id, session_id=session["id"])
+                admin_client.delete_user_session(user_id=user_id, session_id=session["id"])
                 logger.debug(f"Logged out session {session['id']} for user {user_id}")
             
             logger.info(f"Logged out all sessions for user {user_id}")
         
         except KeycloakError as e:
             logger.error(f"Failed to logout user: {e}")
-            raise RealmConfigurationError(f"Cannot logout user: {e}") from e
-        
-        finally:
-            self._admin_client.realm_name = original_realm
\ No newline at end of file
+            raise RealmConfigurationError(f"Cannot logout user: {e}") from e
\ No newline at end of file
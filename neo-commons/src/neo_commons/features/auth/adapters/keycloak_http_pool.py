@@ -0,0 +1,361 @@
+"""Shared HTTP connection pool and admin token cache for Keycloak."""
+
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import time
+from collections import deque
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+import httpx
+
+from ....core.exceptions.auth import KeycloakConnectionError
+from ....infrastructure.tracing import make_httpx_hooks
+
+logger = logging.getLogger(__name__)
+
+# Number of recent request latencies kept per server for percentiles
+_LATENCY_SAMPLES = 1024
+
+
+class _ServerStats:
+    """Request counters for one Keycloak server."""
+
+    __slots__ = (
+        "requests", "errors", "connections_opened", "latencies", "total_latency", "max_latency"
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.connections_opened = 0
+        self.latencies: deque = deque(maxlen=_LATENCY_SAMPLES)
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        samples = sorted(self.latencies)
+
+        def percentile(p: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(p * len(samples)))] * 1000
+
+        reused = max(0, self.requests - self.connections_opened)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "connections_opened": self.connections_opened,
+            "connection_reuse_rate": reused / self.requests if self.requests else 0.0,
+            "avg_latency_ms": self.total_latency / self.requests * 1000 if self.requests else 0.0,
+            "p50_latency_ms": percentile(0.50),
+            "p95_latency_ms": percentile(0.95),
+            "max_latency_ms": self.max_latency * 1000,
+        }
+
+
+class KeycloakHttpPool:
+    """Process-wide pooled HTTP clients and cached admin tokens for Keycloak.
+
+    One ``httpx.AsyncClient`` is kept per Keycloak server and transport
+    setting (TLS verify, client certificate, proxies), so every realm on a
+    server shares the same keep-alive connections. HTTP/2 is negotiated when
+    the ``h2`` package is installed.
+
+    Admin tokens are cached per credential set and refreshed shortly before
+    they expire, so admin adapters no longer log in for every operation.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 50,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        connect_timeout: float = 5.0,
+        timeout: float = 30.0,
+        http2: Optional[bool] = None,
+        token_refresh_margin: float = 30.0,
+    ):
+        """Initialize Keycloak HTTP pool.
+
+        Args:
+            max_connections: Maximum open connections per Keycloak server
+            max_keepalive_connections: Maximum idle connections kept per server
+            keepalive_expiry: Seconds an idle connection is kept alive
+            connect_timeout: Connection establishment timeout in seconds
+            timeout: Read/write/pool timeout in seconds
+            http2: Enable HTTP/2; None enables it when ``h2`` is installed
+            token_refresh_margin: Refresh admin tokens this many seconds before expiry
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.http2 = importlib.util.find_spec("h2") is not None if http2 is None else http2
+        self.token_refresh_margin = token_refresh_margin
+
+        self._clients: Dict[Tuple[Any, ...], httpx.AsyncClient] = {}
+        self._stats: Dict[str, _ServerStats] = {}
+
+        # credential key -> (token, issued_at, expires_at)
+        self._tokens: Dict[Tuple[str, ...], Tuple[Dict[str, Any], float, float]] = {}
+        self._token_locks: Dict[Tuple[str, ...], asyncio.Lock] = {}
+        self._token_requests = 0
+        self._token_cache_hits = 0
+
+    @staticmethod
+    def normalize_server_url(server_url: str) -> str:
+        """Strip trailing slashes and the pre-v18 ``/auth`` suffix."""
+        server_url = server_url.rstrip("/")
+        if server_url.endswith("/auth"):
+            server_url = server_url[:-5]
+        return server_url
+
+    def get_client(
+        self,
+        server_url: str,
+        verify: Union[bool, str] = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+        proxies: Optional[Mapping[str, Any]] = None,
+    ) -> httpx.AsyncClient:
+        """Get the shared HTTP client for a Keycloak server.
+
+        Args:
+            server_url: Keycloak server URL
+            verify: TLS verification flag or CA bundle path
+            cert: Client certificate file, or (certificate, key) files
+            proxies: Proxies by URL pattern (``"https://"`` or requests-style
+                ``"https"``); values are proxy URLs or httpx transports
+        """
+        server_url = self.normalize_server_url(server_url)
+        proxies = dict(proxies or {})
+        key = (
+            server_url,
+            verify,
+            tuple(cert) if isinstance(cert, (list, tuple)) else cert,
+            tuple(sorted((k, v if isinstance(v, str) else id(v)) for k, v in proxies.items())),
+        )
+
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            stats = self._stats.setdefault(server_url, _ServerStats())
+            trace_request, trace_response = make_httpx_hooks("keycloak")
+            client = httpx.AsyncClient(
+                verify=verify,
+                cert=cert,
+                mounts=self._proxy_mounts(proxies, verify, cert),
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+                event_hooks={
+                    "request": [self._make_request_hook(stats), trace_request],
+                    "response": [self._make_response_hook(stats), trace_response],
+                },
+            )
+            self._clients[key] = client
+            logger.debug(
+                f"Created pooled Keycloak HTTP client for {server_url} (http2={self.http2})"
+            )
+
+        return client
+
+    def _proxy_mounts(
+        self,
+        proxies: Dict[str, Any],
+        verify: Union[bool, str],
+        cert: Optional[Union[str, Tuple[str, str]]],
+    ) -> Optional[Dict[str, httpx.AsyncBaseTransport]]:
+        """Build httpx mounts for proxies given as URLs or transports."""
+        if not proxies:
+            return None
+
+        mounts = {}
+        for pattern, proxy in proxies.items():
+            if "://" not in pattern:
+                pattern = f"{pattern}://"
+            if isinstance(proxy, str):
+                proxy = httpx.AsyncHTTPTransport(
+                    proxy=proxy, verify=verify, cert=cert, http2=self.http2, limits=self.limits
+                )
+            mounts[pattern] = proxy
+        return mounts
+
+    def _make_request_hook(self, stats: _ServerStats):
+        """Build a request hook that stamps start time and counts new connections."""
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                stats.connections_opened += 1
+
+        async def on_request(request: httpx.Request) -> None:
+            request.extensions["trace"] = trace
+            request.extensions["neo_started_at"] = time.perf_counter()
+
+        return on_request
+
+    def _make_response_hook(self, stats: _ServerStats):
+        """Build a response hook that records latency and errors."""
+
+        async def on_response(response: httpx.Response) -> None:
+            started_at = response.request.extensions.get("neo_started_at")
+            latency = time.perf_counter() - started_at if started_at else 0.0
+
+            stats.requests += 1
+            stats.latencies.append(latency)
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+            if response.status_code >= 500:
+                stats.errors += 1
+
+        return on_response
+
+    def attach(self, connection: Any, server_url: str, verify: Union[bool, str] = True) -> None:
+        """Route a python-keycloak connection through the shared client.
+
+        python-keycloak passes headers and timeouts per request, so its
+        ``ConnectionManager`` objects can safely share one ``AsyncClient``.
+        The connection's proxies and client certificate select the shared
+        client, and its ``aclose()`` no longer closes the shared client.
+        """
+        if connection is None or not hasattr(connection, "async_s"):
+            return
+
+        own_client = connection.async_s
+        connection.async_s = self.get_client(
+            server_url,
+            getattr(connection, "verify", verify),
+            cert=getattr(connection, "cert", None),
+            proxies=getattr(connection, "proxies", None),
+        )
+
+        async def aclose() -> None:
+            # Close only the replaced per-connection client, never a pooled one
+            if own_client not in self._clients.values():
+                await own_client.aclose()
+
+        connection.aclose = aclose
+
+    async def get_admin_token(
+        self,
+        server_url: str,
+        realm_name: str,
+        client_id: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        verify: bool = True,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Get a cached admin token, logging in only when needed.
+
+        Returns:
+            Tuple of (token, fresh). ``expires_in`` in the returned token is the
+            remaining lifetime, so python-keycloak schedules its own refresh
+            correctly. ``fresh`` is True when a new login was performed.
+        """
+        server_url = self.normalize_server_url(server_url)
+        secret = client_secret if client_secret else password or ""
+        key = (
+            server_url,
+            realm_name,
+            client_id,
+            username or "",
+            hashlib.sha256(secret.encode()).hexdigest(),
+        )
+
+        token = self._cached_token(key)
+        if token is not None:
+            self._token_cache_hits += 1
+            return token, False
+
+        lock = self._token_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            token = self._cached_token(key)
+            if token is not None:
+                self._token_cache_hits += 1
+                return token, False
+
+            if client_secret:
+                data = {
+                    "grant_type": "client_credentials",
+                    "client_id": client_id,
+                    "client_secret": client_secret,
+                }
+            else:
+                data = {
+                    "grant_type": "password",
+                    "client_id": client_id,
+                    "username": username,
+                    "password": password,
+                }
+
+            url = f"{server_url}/realms/{realm_name}/protocol/openid-connect/token"
+            self._token_requests += 1
+            try:
+                response = await self.get_client(server_url, verify).post(url, data=data)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise KeycloakConnectionError(f"Cannot obtain Keycloak admin token: {e}") from e
+
+            token = response.json()
+            issued_at = time.monotonic()
+            self._tokens[key] = (token, issued_at, issued_at + float(token.get("expires_in", 60)))
+            logger.debug(f"Obtained Keycloak admin token for {client_id} in realm {realm_name}")
+
+            return self._cached_token(key), True
+
+    def _cached_token(self, key: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Return the cached token with its remaining lifetime, if still usable."""
+        entry = self._tokens.get(key)
+        if entry is None:
+            return None
+
+        token, issued_at, expires_at = entry
+        now = time.monotonic()
+        lifetime = expires_at - issued_at
+        # Refresh a margin before expiry, but never sooner than 90% into the lifetime
+        margin = min(self.token_refresh_margin, lifetime * 0.1)
+        if now >= expires_at - margin:
+            del self._tokens[key]
+            return None
+
+        return {**token, "expires_in": int(expires_at - now)}
+
+    def invalidate_tokens(self, server_url: Optional[str] = None) -> None:
+        """Drop cached admin tokens, optionally for one server only."""
+        if server_url is None:
+            self._tokens.clear()
+            return
+        server_url = self.normalize_server_url(server_url)
+        self._tokens = {k: v for k, v in self._tokens.items() if k[0] != server_url}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get connection reuse and latency statistics per Keycloak server."""
+        return {
+            "http2": self.http2,
+            "clients": len(self._clients),
+            "cached_tokens": len(self._tokens),
+            "token_requests": self._token_requests,
+            "token_cache_hits": self._token_cache_hits,
+            "servers": {url: stats.snapshot() for url, stats in self._stats.items()},
+        }
+
+    async def aclose(self) -> None:
+        """Close all pooled clients and drop cached tokens."""
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+        self._tokens.clear()
+
+
+_keycloak_http_pool: Optional[KeycloakHttpPool] = None
+
+
+def get_keycloak_http_pool() -> KeycloakHttpPool:
+    """Get the process-wide Keycloak HTTP pool shared by all adapters."""
+    global _keycloak_http_pool
+    if _keycloak_http_pool is None:
+        _keycloak_http_pool = KeycloakHttpPool()
+    return _keycloak_http_pool
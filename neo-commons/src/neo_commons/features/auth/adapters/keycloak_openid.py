@@ -15,6 +15,7 @@ from ....core.exceptions.auth import (
 from ....core.value_objects.identifiers import RealmId
 from ..entities.jwt_token import JWTToken
 from ..entities.keycloak_config import KeycloakConfig
+from .keycloak_http_pool import get_keycloak_http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +79,12 @@ class KeycloakOpenIDAdapter:
                     client_secret_key=self.config.client_secret,
                     verify=self.config.require_https,
                 )
+                # Share pooled keep-alive connections with every other realm on this server
+                get_keycloak_http_pool().attach(
+                    self._openid_client.connection,
+                    self.config.server_url,
+                    self.config.require_https,
+                )
                 
                 logger.debug(f"Initialized OpenID client for realm: {self.config.realm_name}")
                 
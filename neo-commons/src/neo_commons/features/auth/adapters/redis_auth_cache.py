@@ -100,7 +100,7 @@ class RedisAuthCache(BaseAuthCache, AuthCacheManagerProtocol):
             full_key = self._make_key(key)
             
             await redis_client.setex(full_key, ttl, value)
-            logger.debug(f"Cached key {key} with TTL {ttl}")
+            logger.debug("Cached key %s with TTL %s", key, ttl)
         
         except Exception as e:
             logger.warning(f"Failed to set cache key {key}: {e}")
@@ -113,7 +113,7 @@ class RedisAuthCache(BaseAuthCache, AuthCacheManagerProtocol):
             full_key = self._make_key(key)
             
             await redis_client.delete(full_key)
-            logger.debug(f"Deleted cache key {key}")
+            logger.debug("Deleted cache key %s", key)
         
         except Exception as e:
             logger.warning(f"Failed to delete cache key {key}: {e}")
@@ -129,7 +129,7 @@ class RedisAuthCache(BaseAuthCache, AuthCacheManagerProtocol):
             
             if keys:
                 deleted_count = await redis_client.delete(*keys)
-                logger.debug(f"Deleted {deleted_count} keys matching pattern {pattern}")
+                logger.debug("Deleted %s keys matching pattern %s", deleted_count, pattern)
                 return deleted_count
             
             return 0
@@ -203,7 +203,7 @@ class RedisAuthCache(BaseAuthCache, AuthCacheManagerProtocol):
         """Invalidate all cached tokens for user."""
         pattern = self._make_user_tokens_pattern(user_id)
         deleted_count = await self._delete_pattern(pattern)
-        logger.info(f"Invalidated {deleted_count} tokens for user {user_id.value}")
+        logger.info("Invalidated %s tokens for user %s", deleted_count, user_id.value)
     
     # User mapping cache operations
     
@@ -257,7 +257,7 @@ class RedisAuthCache(BaseAuthCache, AuthCacheManagerProtocol):
         """Invalidate all user mappings for tenant."""
         pattern = f"auth:user_mapping:{tenant_id.value}:*"
         deleted_count = await self._delete_pattern(pattern)
-        logger.info(f"Invalidated {deleted_count} user mappings for tenant {tenant_id.value}")
+        logger.info("Invalidated %s user mappings for tenant %s", deleted_count, tenant_id.value)
     
     # Realm config cache operations
     
@@ -302,7 +302,7 @@ class RedisAuthCache(BaseAuthCache, AuthCacheManagerProtocol):
         """Invalidate all cached realm configurations."""
         pattern = "auth:realm_config:*"
         deleted_count = await self._delete_pattern(pattern)
-        logger.info(f"Invalidated {deleted_count} realm configurations")
+        logger.info("Invalidated %s realm configurations", deleted_count)
     
     # Bulk invalidation operations
     
@@ -310,7 +310,7 @@ class RedisAuthCache(BaseAuthCache, AuthCacheManagerProtocol):
         """Invalidate all cached data for tenant."""
         pattern = self._make_tenant_pattern(tenant_id)
         deleted_count = await self._delete_pattern(pattern)
-        logger.info(f"Invalidated {deleted_count} cache entries for tenant {tenant_id.value}")
+        logger.info("Invalidated %s cache entries for tenant %s", deleted_count, tenant_id.value)
     
     async def invalidate_realm_data(self, realm_id: RealmId) -> None:
         """Invalidate all cached data for realm."""
@@ -319,7 +319,7 @@ class RedisAuthCache(BaseAuthCache, AuthCacheManagerProtocol):
         await self._delete(public_key_key)
         
         # Could also invalidate realm-specific tokens if we tracked them
-        logger.info(f"Invalidated cache data for realm {realm_id.value}")
+        logger.info("Invalidated cache data for realm %s", realm_id.value)
     
     async def health_check(self) -> Dict[str, bool]:
         """Check cache connectivity and health."""
@@ -1,6 +1,7 @@
 """FastAPI middleware components for authentication."""
 
 import logging
+import math
 import time
 from typing import Callable, Optional
 
@@ -9,6 +10,7 @@ from fastapi.responses import JSONResponse
 
 from ...core.exceptions.auth import AuthenticationError, AuthorizationError
 from ...core.value_objects.identifiers import TenantId
+from ...infrastructure.middleware.rate_limiter import RateLimit, RateLimiter
 from .dependencies import AuthDependencies, AuthDependencyError
 from .entities.auth_context import AuthContext
 from .entities.protocols import RealmManagerProtocol
@@ -257,14 +259,20 @@ class RateLimitingMiddleware:
         auth_rate_limit: int = 10,  # requests per minute for auth endpoints
         general_rate_limit: int = 100,  # requests per minute for other endpoints
         window_seconds: int = 60,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
-        """Initialize rate limiting middleware."""
-        self.auth_rate_limit = auth_rate_limit
-        self.general_rate_limit = general_rate_limit
-        self.window_seconds = window_seconds
+        """Initialize rate limiting middleware.
         
-        # In-memory rate limiting (use Redis for production)
-        self.request_counts = {}
+        Args:
+            auth_rate_limit: Requests per window for auth endpoints
+            general_rate_limit: Requests per window for other endpoints
+            window_seconds: Rate limit window in seconds
+            rate_limiter: Shared limiter; pass one with a Redis client to limit across nodes
+        """
+        self.auth_rate_limit = RateLimit(auth_rate_limit, window_seconds)
+        self.general_rate_limit = RateLimit(general_rate_limit, window_seconds)
+        self.window_seconds = window_seconds
+        self.rate_limiter = rate_limiter or RateLimiter(key_prefix="neo_auth_ratelimit")
     
     async def __call__(self, request: Request, call_next: Callable) -> Response:
         """Apply rate limiting."""
@@ -283,41 +291,21 @@ class RateLimitingMiddleware:
         rate_limit = self.auth_rate_limit if is_auth_endpoint else self.general_rate_limit
         
         # Check rate limit
-        if await self._is_rate_limited(client_key, rate_limit):
+        decision = await self.rate_limiter.acquire(client_key, rate_limit)
+        if not decision.allowed:
             logger.warning(f"Rate limit exceeded for {client_key}")
+            retry_after = max(1, math.ceil(decision.retry_after))
             return JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "error": "rate_limit_exceeded",
-                    "message": f"Too many requests. Limit: {rate_limit} per minute",
-                    "retry_after": self.window_seconds,
+                    "message": f"Too many requests. Limit: {rate_limit.limit} per {self.window_seconds} seconds",
+                    "retry_after": retry_after,
                 },
-                headers={"retry-after": str(self.window_seconds)}
+                headers={"retry-after": str(retry_after)}
             )
         
         return await call_next(request)
-    
-    async def _is_rate_limited(self, client_key: str, limit: int) -> bool:
-        """Check if client is rate limited."""
-        now = time.time()
-        window_start = now - self.window_seconds
-        
-        # Clean old entries
-        if client_key in self.request_counts:
-            self.request_counts[client_key] = [
-                timestamp for timestamp in self.request_counts[client_key]
-                if timestamp > window_start
-            ]
-        else:
-            self.request_counts[client_key] = []
-        
-        # Check if limit exceeded
-        if len(self.request_counts[client_key]) >= limit:
-            return True
-        
-        # Add current request
-        self.request_counts[client_key].append(now)
-        return False
 
 
 def configure_auth_middleware(
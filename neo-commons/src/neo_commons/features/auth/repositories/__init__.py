@@ -4,9 +4,12 @@ Contains data access layer for authentication entities.
 """
 
 from .realm_repository import RealmRepository
+from .user_mapping_cache import UserMappingCache, get_user_mapping_cache
 from .user_mapping_repository import UserMappingRepository
 
 __all__ = [
     "RealmRepository", 
     "UserMappingRepository",
+    "UserMappingCache",
+    "get_user_mapping_cache",
 ]
\ No newline at end of file
@@ -20,44 +20,44 @@ class RealmRepository:
     
     async def create(self, realm: Realm) -> Realm:
         """Create a new realm."""
-        logger.info(f"Creating realm: {realm.realm_id.value}")
+        logger.info("Creating realm: %s", realm.realm_id.value)
         
         # TODO: Implement actual database persistence
         self._realms[realm.realm_id.value] = realm
         
-        logger.info(f"Successfully created realm: {realm.realm_id.value}")
+        logger.info("Successfully created realm: %s", realm.realm_id.value)
         return realm
     
     async def get_by_id(self, realm_id: RealmId) -> Optional[Realm]:
         """Get realm by ID."""
-        logger.debug(f"Getting realm by ID: {realm_id.value}")
+        logger.debug("Getting realm by ID: %s", realm_id.value)
         
         # TODO: Implement actual database query
         realm = self._realms.get(realm_id.value)
         
         if realm:
-            logger.debug(f"Found realm: {realm_id.value}")
+            logger.debug("Found realm: %s", realm_id.value)
         else:
-            logger.debug(f"Realm not found: {realm_id.value}")
+            logger.debug("Realm not found: %s", realm_id.value)
         
         return realm
     
     async def get_by_tenant_id(self, tenant_id: TenantId) -> Optional[Realm]:
         """Get realm by tenant ID."""
-        logger.debug(f"Getting realm for tenant: {tenant_id.value}")
+        logger.debug("Getting realm for tenant: %s", tenant_id.value)
         
         # TODO: Implement actual database query with tenant_id index
         for realm in self._realms.values():
             if realm.tenant_id == tenant_id:
-                logger.debug(f"Found realm for tenant: {realm.realm_id.value}")
+                logger.debug("Found realm for tenant: %s", realm.realm_id.value)
                 return realm
         
-        logger.debug(f"No realm found for tenant: {tenant_id.value}")
+        logger.debug("No realm found for tenant: %s", tenant_id.value)
         return None
     
     async def update(self, realm: Realm) -> Realm:
         """Update realm."""
-        logger.info(f"Updating realm: {realm.realm_id.value}")
+        logger.info("Updating realm: %s", realm.realm_id.value)
         
         # TODO: Implement actual database update
         if realm.realm_id.value not in self._realms:
@@ -65,17 +65,17 @@ class RealmRepository:
         
         self._realms[realm.realm_id.value] = realm
         
-        logger.info(f"Successfully updated realm: {realm.realm_id.value}")
+        logger.info("Successfully updated realm: %s", realm.realm_id.value)
         return realm
     
     async def delete(self, realm_id: RealmId) -> None:
         """Delete realm."""
-        logger.info(f"Deleting realm: {realm_id.value}")
+        logger.info("Deleting realm: %s", realm_id.value)
         
         # TODO: Implement actual database deletion
         if realm_id.value in self._realms:
             del self._realms[realm_id.value]
-            logger.info(f"Successfully deleted realm: {realm_id.value}")
+            logger.info("Successfully deleted realm: %s", realm_id.value)
         else:
             logger.warning(f"Realm not found for deletion: {realm_id.value}")
     
@@ -86,12 +86,12 @@ class RealmRepository:
         # TODO: Implement actual database query
         realms = list(self._realms.values())
         
-        logger.debug(f"Found {len(realms)} realms")
+        logger.debug("Found %s realms", len(realms))
         return realms
     
     async def list_by_status(self, status: str) -> List[Realm]:
         """List realms by status."""
-        logger.debug(f"Listing realms with status: {status}")
+        logger.debug("Listing realms with status: %s", status)
         
         # TODO: Implement actual database query with status filter
         realms = [
@@ -99,12 +99,12 @@ class RealmRepository:
             if realm.status == status
         ]
         
-        logger.debug(f"Found {len(realms)} realms with status {status}")
+        logger.debug("Found %s realms with status %s", len(realms), status)
         return realms
     
     async def count_by_tenant(self, tenant_id: TenantId) -> int:
         """Count realms for a tenant."""
-        logger.debug(f"Counting realms for tenant: {tenant_id.value}")
+        logger.debug("Counting realms for tenant: %s", tenant_id.value)
         
         # TODO: Implement actual database count query
         count = sum(
@@ -112,7 +112,7 @@ class RealmRepository:
             if realm.tenant_id == tenant_id
         )
         
-        logger.debug(f"Found {count} realms for tenant {tenant_id.value}")
+        logger.debug("Found %s realms for tenant %s", count, tenant_id.value)
         return count
     
     # TODO: Add actual database implementation methods:
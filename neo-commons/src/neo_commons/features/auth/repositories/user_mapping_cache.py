@@ -0,0 +1,215 @@
+"""In-process cache for Keycloak subject to platform user ID mappings."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from ....core.value_objects.identifiers import UserId
+
+logger = logging.getLogger(__name__)
+
+# Sentinel stored for subjects known to have no platform user
+_NEGATIVE = object()
+
+
+class UserMappingCache:
+    """Bounded, TTL'd cache for Keycloak ``sub`` -> platform ``UserId`` lookups.
+
+    Used on the token validation hot path so that resolving the platform
+    user for an admin token does not need a database round trip.
+
+    Features:
+    - LRU eviction bounded by ``max_size``
+    - Separate TTLs for positive and negative (not found) entries
+    - Single-flight loading: concurrent misses for the same subject share one query
+    - Bulk preload of active users at startup
+    """
+
+    def __init__(
+        self,
+        max_size: int = 50000,
+        ttl_seconds: int = 900,
+        negative_ttl_seconds: int = 30,
+    ):
+        """Initialize user mapping cache.
+
+        Args:
+            max_size: Maximum number of cached subjects
+            ttl_seconds: TTL for resolved mappings
+            negative_ttl_seconds: TTL for subjects with no platform user
+        """
+        if max_size <= 0:
+            raise ValueError("Max size must be positive")
+        if ttl_seconds <= 0 or negative_ttl_seconds <= 0:
+            raise ValueError("TTL must be positive")
+
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+
+        # (schema, subject) -> (expires_at, UserId | _NEGATIVE)
+        self._entries: OrderedDict[Tuple[str, str], Tuple[float, object]] = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+
+        # Statistics
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._loads = 0
+        self._evictions = 0
+
+    def get(self, subject: str, schema_name: str = "admin") -> Tuple[bool, Optional[UserId]]:
+        """Look up a cached mapping without loading.
+
+        Returns:
+            Tuple of (found, user_id). ``found`` is True for negative entries too,
+            in which case ``user_id`` is None.
+        """
+        key = (schema_name, subject)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        if value is _NEGATIVE:
+            self._negative_hits += 1
+            return True, None
+        self._hits += 1
+        return True, value
+
+    def put(self, subject: str, user_id: Optional[UserId], schema_name: str = "admin") -> None:
+        """Store a mapping; ``None`` records a negative entry."""
+        if user_id is None:
+            entry = (time.monotonic() + self.negative_ttl_seconds, _NEGATIVE)
+        else:
+            entry = (time.monotonic() + self.ttl_seconds, user_id)
+
+        key = (schema_name, subject)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def get_or_load(
+        self,
+        subject: str,
+        loader: Callable[[str], Awaitable[Optional[UserId]]],
+        schema_name: str = "admin",
+    ) -> Optional[UserId]:
+        """Return the cached mapping, loading it once on miss.
+
+        Concurrent callers missing on the same subject await a single
+        ``loader`` call. Loader errors propagate to every waiter and are
+        not cached.
+        """
+        found, user_id = self.get(subject, schema_name)
+        if found:
+            return user_id
+
+        key = (schema_name, subject)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            self._loads += 1
+            user_id = await loader(subject)
+            # Skip the store if the entry was invalidated while loading
+            if self._inflight.get(key) is future:
+                self.put(subject, user_id, schema_name)
+            future.set_result(user_id)
+            return user_id
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve so an unawaited future does not log "exception never retrieved"
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def invalidate(self, subject: str, schema_name: str = "admin") -> None:
+        """Drop a cached mapping and detach any in-flight load for it."""
+        key = (schema_name, subject)
+        self._entries.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached mappings."""
+        self._entries.clear()
+        self._inflight.clear()
+
+    async def preload(self, database_service, schema_name: str = "admin") -> int:
+        """Bulk load active users from the given schema.
+
+        Args:
+            database_service: Database service providing ``get_connection``
+            schema_name: Schema holding the ``users`` table
+
+        Returns:
+            Number of mappings loaded
+        """
+        if schema_name != "admin" and not schema_name.startswith("tenant_"):
+            raise ValueError(f"Invalid schema name: {schema_name}")
+
+        connection_name = "admin" if schema_name == "admin" else "shared"
+        async with database_service.get_connection(connection_name) as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT id, external_user_id FROM {schema_name}.users
+                WHERE external_user_id IS NOT NULL
+                  AND status = 'active' AND deleted_at IS NULL
+                ORDER BY last_login_at DESC NULLS LAST
+                LIMIT $1
+                """,
+                self.max_size,
+            )
+
+        # Insert least recent first so the most active users end up MRU
+        for row in reversed(rows):
+            self.put(row["external_user_id"], UserId(str(row["id"])), schema_name)
+
+        logger.info(f"Preloaded {len(rows)} user mappings from {schema_name}")
+        return len(rows)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get cache statistics."""
+        lookups = self._hits + self._negative_hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "negative_hits": self._negative_hits,
+            "misses": self._misses,
+            "loads": self._loads,
+            "evictions": self._evictions,
+            "in_flight": len(self._inflight),
+            "hit_rate": (self._hits + self._negative_hits) / lookups if lookups else 0.0,
+        }
+
+
+_user_mapping_cache: Optional[UserMappingCache] = None
+
+
+def get_user_mapping_cache() -> UserMappingCache:
+    """Get the process-wide user mapping cache shared by mapper and user sync."""
+    global _user_mapping_cache
+    if _user_mapping_cache is None:
+        _user_mapping_cache = UserMappingCache()
+    return _user_mapping_cache
@@ -51,7 +51,7 @@ class UserMappingRepository:
         }
         
         self._mappings[mapping_key] = mapping
-        logger.info(f"Successfully created user mapping for KC user {keycloak_user_id.value}")
+        logger.info("Successfully created user mapping for KC user %s", keycloak_user_id.value)
     
     async def get_by_keycloak_id(
         self, 
@@ -59,7 +59,7 @@ class UserMappingRepository:
         tenant_id: Optional[TenantId],
     ) -> Optional[Dict]:
         """Get mapping by Keycloak user ID."""
-        logger.debug(f"Getting mapping for Keycloak user {keycloak_user_id.value}")
+        logger.debug("Getting mapping for Keycloak user %s", keycloak_user_id.value)
         
         tenant_key = tenant_id.value if tenant_id else "platform_admin"
         mapping_key = f"{keycloak_user_id.value}:{tenant_key}"
@@ -68,9 +68,9 @@ class UserMappingRepository:
         mapping = self._mappings.get(mapping_key)
         
         if mapping:
-            logger.debug(f"Found mapping for Keycloak user {keycloak_user_id.value}")
+            logger.debug("Found mapping for Keycloak user %s", keycloak_user_id.value)
         else:
-            logger.debug(f"No mapping found for Keycloak user {keycloak_user_id.value}")
+            logger.debug("No mapping found for Keycloak user %s", keycloak_user_id.value)
         
         return mapping
     
@@ -80,7 +80,7 @@ class UserMappingRepository:
         tenant_id: TenantId,
     ) -> Optional[Dict]:
         """Get mapping by platform user ID."""
-        logger.debug(f"Getting mapping for platform user {platform_user_id.value}")
+        logger.debug("Getting mapping for platform user %s", platform_user_id.value)
         
         # TODO: Implement actual database query with platform_user_id index
         for mapping in self._mappings.values():
@@ -88,15 +88,15 @@ class UserMappingRepository:
                 mapping["platform_user_id"] == platform_user_id.value
                 and mapping["tenant_id"] == tenant_id.value
             ):
-                logger.debug(f"Found mapping for platform user {platform_user_id.value}")
+                logger.debug("Found mapping for platform user %s", platform_user_id.value)
                 return mapping
         
-        logger.debug(f"No mapping found for platform user {platform_user_id.value}")
+        logger.debug("No mapping found for platform user %s", platform_user_id.value)
         return None
     
     async def update_user_profile(self, platform_user_id: UserId, user_info: Dict) -> None:
         """Update user profile information."""
-        logger.debug(f"Updating profile for platform user {platform_user_id.value}")
+        logger.debug("Updating profile for platform user %s", platform_user_id.value)
         
         try:
             # TODO: Implement actual database update
@@ -105,7 +105,7 @@ class UserMappingRepository:
                 "updated_at": datetime.now(timezone.utc),
             }
             
-            logger.debug(f"Successfully updated profile for user {platform_user_id.value}")
+            logger.debug("Successfully updated profile for user %s", platform_user_id.value)
         
         except Exception as e:
             logger.error(f"Failed to update profile for user {platform_user_id.value}: {e}")
@@ -117,7 +117,7 @@ class UserMappingRepository:
         tenant_id: TenantId,
     ) -> None:
         """Delete user mapping."""
-        logger.info(f"Deleting mapping for platform user {platform_user_id.value}")
+        logger.info("Deleting mapping for platform user %s", platform_user_id.value)
         
         # TODO: Implement actual database deletion
         mapping_to_delete = None
@@ -132,7 +132,7 @@ class UserMappingRepository:
         
         if mapping_to_delete:
             del self._mappings[mapping_to_delete]
-            logger.info(f"Successfully deleted mapping for user {platform_user_id.value}")
+            logger.info("Successfully deleted mapping for user %s", platform_user_id.value)
         else:
             logger.warning(f"No mapping found to delete for user {platform_user_id.value}")
         
@@ -146,7 +146,7 @@ class UserMappingRepository:
         tenant_id: TenantId,
     ) -> Optional[Dict]:
         """Get complete user mapping information."""
-        logger.debug(f"Getting mapping info for platform user {platform_user_id.value}")
+        logger.debug("Getting mapping info for platform user %s", platform_user_id.value)
         
         mapping = await self.get_by_platform_id(platform_user_id, tenant_id)
         if not mapping:
@@ -165,7 +165,7 @@ class UserMappingRepository:
         tenant_id: TenantId,
     ) -> None:
         """Update last sync timestamp."""
-        logger.debug(f"Updating last sync for platform user {platform_user_id.value}")
+        logger.debug("Updating last sync for platform user %s", platform_user_id.value)
         
         # TODO: Implement actual database update
         for mapping in self._mappings.values():
@@ -178,7 +178,7 @@ class UserMappingRepository:
     
     async def list_mappings_by_tenant(self, tenant_id: TenantId) -> List[Dict]:
         """List all user mappings for a tenant."""
-        logger.debug(f"Listing mappings for tenant {tenant_id.value}")
+        logger.debug("Listing mappings for tenant %s", tenant_id.value)
         
         # TODO: Implement actual database query
         mappings = [
@@ -186,12 +186,12 @@ class UserMappingRepository:
             if mapping["tenant_id"] == tenant_id.value
         ]
         
-        logger.debug(f"Found {len(mappings)} mappings for tenant {tenant_id.value}")
+        logger.debug("Found %s mappings for tenant %s", len(mappings), tenant_id.value)
         return mappings
     
     async def cleanup_stale_mappings(self, days_threshold: int = 90) -> int:
         """Cleanup mappings that haven't been synced recently."""
-        logger.info(f"Cleaning up mappings not synced in {days_threshold} days")
+        logger.info("Cleaning up mappings not synced in %s days", days_threshold)
         
         cutoff_date = datetime.now(timezone.utc) - timezone.timedelta(days=days_threshold)
         
@@ -206,12 +206,12 @@ class UserMappingRepository:
         for key in stale_keys:
             del self._mappings[key]
         
-        logger.info(f"Cleaned up {len(stale_keys)} stale mappings")
+        logger.info("Cleaned up %s stale mappings", len(stale_keys))
         return len(stale_keys)
     
     async def get_mapping_stats(self, tenant_id: TenantId) -> Dict:
         """Get mapping statistics for a tenant."""
-        logger.debug(f"Getting mapping stats for tenant {tenant_id.value}")
+        logger.debug("Getting mapping stats for tenant %s", tenant_id.value)
         
         mappings = await self.list_mappings_by_tenant(tenant_id)
         
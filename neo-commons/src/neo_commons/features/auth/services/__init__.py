@@ -3,6 +3,7 @@
 Contains business logic services for authentication.
 """
 
+from .auth_context_refresher import AuthContextRefresher, RBAC_CHANGE_EVENT_TYPES
 from .jwt_validator import JWTValidator
 from .keycloak_service import KeycloakService
 from .realm_manager import RealmManager
@@ -10,6 +11,8 @@ from .token_service import TokenService
 from .user_mapper import UserMapper
 
 __all__ = [
+    "AuthContextRefresher",
+    "RBAC_CHANGE_EVENT_TYPES",
     "JWTValidator",
     "KeycloakService",
     "RealmManager",
@@ -100,7 +100,7 @@ class AuthCacheService:
         
         await self.cache_service.set(key, cached_data, ttl)
         tenant_display = tenant_id.value if tenant_id else "platform"
-        logger.debug(f"Cached {len(permissions)} permissions for user {user_id.value} in tenant {tenant_display}")
+        logger.debug("Cached %s permissions for user %s in tenant %s", len(permissions), user_id.value, tenant_display)
     
     # ========== User Roles Cache ==========
     
@@ -152,7 +152,7 @@ class AuthCacheService:
         
         await self.cache_service.set(key, cached_data, ttl)
         tenant_display = tenant_id.value if tenant_id else "platform"
-        logger.debug(f"Cached {len(roles)} roles for user {user_id.value} in tenant {tenant_display}")
+        logger.debug("Cached %s roles for user %s in tenant %s", len(roles), user_id.value, tenant_display)
     
     # ========== Complete User Data Cache ==========
     
@@ -199,7 +199,7 @@ class AuthCacheService:
         cached_data = json.dumps(user_data)
         await self.cache_service.set(key, cached_data, ttl)
         tenant_display = tenant_id.value if tenant_id else "platform"
-        logger.debug(f"Cached user data for user {user_id.value} in tenant {tenant_display}")
+        logger.debug("Cached user data for user %s in tenant %s", user_id.value, tenant_display)
     
     # ========== Auth Context Cache ==========
     
@@ -302,7 +302,7 @@ class AuthCacheService:
         
         cached_data = json.dumps(data)
         await self.cache_service.set(key, cached_data, ttl)
-        logger.debug(f"Cached auth context for user {auth_context.user_id.value}")
+        logger.debug("Cached auth context for user %s", auth_context.user_id.value)
     
     # ========== Cache Invalidation ==========
     
@@ -331,7 +331,7 @@ class AuthCacheService:
                 count += 1
         
         tenant_display = tenant_id.value if tenant_id else "platform"
-        logger.info(f"Invalidated {count} cache entries for user {user_id.value} in tenant {tenant_display}")
+        logger.info("Invalidated %s cache entries for user %s in tenant %s", count, user_id.value, tenant_display)
         return count
     
     async def invalidate_user_permissions(self,
@@ -350,7 +350,7 @@ class AuthCacheService:
         result = await self.cache_service.delete(key)
         
         if result:
-            logger.debug(f"Invalidated permissions cache for user {user_id.value}")
+            logger.debug("Invalidated permissions cache for user %s", user_id.value)
         
         return result
     
@@ -370,7 +370,7 @@ class AuthCacheService:
         result = await self.cache_service.delete(key)
         
         if result:
-            logger.debug(f"Invalidated roles cache for user {user_id.value}")
+            logger.debug("Invalidated roles cache for user %s", user_id.value)
         
         return result
     
@@ -395,7 +395,7 @@ class AuthCacheService:
             count = await self.cache_service.delete_pattern(pattern)
             total_count += count
         
-        logger.info(f"Invalidated {total_count} auth cache entries for tenant {tenant_id.value}")
+        logger.info("Invalidated %s auth cache entries for tenant %s", total_count, tenant_id.value)
         return total_count
     
     # ========== Helper Methods ==========
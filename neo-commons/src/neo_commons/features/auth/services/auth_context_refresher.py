@@ -0,0 +1,362 @@
+"""Event-driven recomputation of cached auth data after RBAC changes."""
+
+import asyncio
+import dataclasses
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from ....core.value_objects.identifiers import PermissionCode, RoleCode, TenantId, UserId
+from ...permissions.repositories.permission_checker import AsyncPGPermissionChecker
+from ...users.services.user_permission_service import UserPermissionService
+from .auth_cache_service import AuthCacheService
+
+logger = logging.getLogger(__name__)
+
+
+# Event types that change the effective roles or permissions of users
+RBAC_CHANGE_EVENT_TYPES = frozenset({
+    "roles.updated",
+    "roles.deleted",
+    "roles.permission_assigned",
+    "roles.permission_removed",
+    "roles.permissions_changed",
+    "permissions.updated",
+    "permissions.deleted",
+    "users.role_assigned",
+    "users.role_removed",
+    "users.permission_granted",
+    "users.permission_revoked",
+})
+
+
+class _ChangeSet:
+    """Role, permission and user references collected from change events."""
+    
+    __slots__ = ("user_ids", "role_ids", "role_codes", "permission_ids", "permission_codes")
+    
+    def __init__(self):
+        self.user_ids: Set[UUID] = set()
+        self.role_ids: Set[int] = set()
+        self.role_codes: Set[str] = set()
+        self.permission_ids: Set[int] = set()
+        self.permission_codes: Set[str] = set()
+    
+    @property
+    def needs_lookup(self) -> bool:
+        return bool(self.role_ids or self.role_codes or self.permission_ids or self.permission_codes)
+
+
+class AuthContextRefresher:
+    """Rebuilds cached roles, permissions and auth contexts when RBAC data changes.
+    
+    Subscribes to role, permission and assignment change events, resolves the
+    affected users through ``user_roles`` / ``user_permissions`` and reloads
+    their effective RBAC data with a few set-based queries per batch of users.
+    Cache entries are overwritten rather than invalidated, so the first request
+    after an admin edits a role does not pay for the RBAC queries.
+    
+    Events are expected to carry any of ``user_id(s)``, ``role_id(s)``,
+    ``role_code(s)``, ``permission_id(s)`` or ``permission_code(s)`` in
+    ``event_data``; the tenant comes from ``event.tenant_id`` (None = admin).
+    """
+    
+    def __init__(
+        self,
+        database_service,
+        auth_cache_service: AuthCacheService,
+        batch_size: int = 500,
+        max_concurrency: int = 8,
+        event_types: Optional[Iterable[str]] = None,
+    ):
+        """Initialize auth context refresher.
+        
+        Args:
+            database_service: Database service providing ``get_connection``
+            auth_cache_service: Auth cache to write recomputed data to
+            batch_size: Users loaded per RBAC query
+            max_concurrency: Maximum batches recomputed concurrently
+            event_types: Event types to react to (defaults to RBAC_CHANGE_EVENT_TYPES)
+        """
+        if batch_size <= 0 or max_concurrency <= 0:
+            raise ValueError("Batch size and concurrency must be positive")
+        
+        self.database_service = database_service
+        self.auth_cache_service = auth_cache_service
+        self.batch_size = batch_size
+        self.event_types = frozenset(event_types) if event_types is not None else RBAC_CHANGE_EVENT_TYPES
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        
+        # Statistics
+        self._events_handled = 0
+        self._users_refreshed = 0
+        self._contexts_refreshed = 0
+        self._failures = 0
+    
+    # ========== Event Subscription ==========
+    
+    async def start(self, event_processor, queue_name: str, consumer_group: str = "auth-context-refresh", **kwargs) -> None:
+        """Subscribe to a change event stream through an event processor."""
+        await event_processor.start_consumer(queue_name, consumer_group, self.handle_event, **kwargs)
+    
+    async def handle_event(self, event, queue_name: str) -> None:
+        """Event handler for a single change event."""
+        await self.handle_events([event], queue_name)
+    
+    async def handle_events(self, events: List[Any], queue_name: str) -> None:
+        """Batch event handler; changes from all events are coalesced per tenant."""
+        changes: Dict[Optional[UUID], _ChangeSet] = defaultdict(_ChangeSet)
+        
+        for event in events:
+            if event.event_type.value not in self.event_types:
+                continue
+            self._events_handled += 1
+            self._collect_changes(event, changes[event.tenant_id])
+        
+        for tenant_uuid, change_set in changes.items():
+            tenant_id = TenantId(str(tenant_uuid)) if tenant_uuid else None
+            user_ids = await self.find_affected_users(change_set, tenant_id)
+            if user_ids:
+                await self.refresh_users(user_ids, tenant_id)
+    
+    @staticmethod
+    def _collect_changes(event, change_set: _ChangeSet) -> None:
+        """Extract user, role and permission references from an event."""
+        data = event.event_data or {}
+        
+        def values(single: str, plural: str) -> List[Any]:
+            found = list(data.get(plural) or [])
+            if data.get(single) is not None:
+                found.append(data[single])
+            return found
+        
+        change_set.user_ids.update(UUID(str(v)) for v in values("user_id", "user_ids"))
+        change_set.role_ids.update(int(v) for v in values("role_id", "role_ids"))
+        change_set.role_codes.update(str(v) for v in values("role_code", "role_codes"))
+        change_set.permission_ids.update(int(v) for v in values("permission_id", "permission_ids"))
+        change_set.permission_codes.update(str(v) for v in values("permission_code", "permission_codes"))
+        
+        reference = event.aggregate_reference
+        if reference is not None and reference.aggregate_type == "user":
+            change_set.user_ids.add(UUID(str(reference.aggregate_id)))
+    
+    # ========== Affected Users ==========
+    
+    async def find_affected_users(self, change_set: _ChangeSet, tenant_id: Optional[TenantId]) -> Set[UUID]:
+        """Resolve the users whose effective roles or permissions may have changed."""
+        user_ids = set(change_set.user_ids)
+        if not change_set.needs_lookup:
+            return user_ids
+        
+        schema, connection_name = self._schema_for(tenant_id)
+        async with self.database_service.get_connection(connection_name) as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT ur.user_id
+                FROM {schema}.user_roles ur
+                JOIN {schema}.roles r ON r.id = ur.role_id
+                WHERE ur.is_active = true
+                  AND (ur.role_id = ANY($1::int[]) OR r.code = ANY($2::text[]))
+                UNION
+                SELECT ur.user_id
+                FROM {schema}.user_roles ur
+                JOIN {schema}.role_permissions rp ON rp.role_id = ur.role_id
+                JOIN {schema}.permissions p ON p.id = rp.permission_id
+                WHERE ur.is_active = true
+                  AND (rp.permission_id = ANY($3::int[]) OR p.code = ANY($4::text[]))
+                UNION
+                SELECT up.user_id
+                FROM {schema}.user_permissions up
+                JOIN {schema}.permissions p ON p.id = up.permission_id
+                WHERE up.is_active = true
+                  AND (up.permission_id = ANY($3::int[]) OR p.code = ANY($4::text[]))
+                """,
+                list(change_set.role_ids),
+                list(change_set.role_codes),
+                list(change_set.permission_ids),
+                list(change_set.permission_codes),
+            )
+        
+        user_ids.update(row["user_id"] for row in rows)
+        return user_ids
+    
+    # ========== Recomputation ==========
+    
+    async def refresh_users(self, user_ids: Iterable[UUID], tenant_id: Optional[TenantId] = None) -> int:
+        """Recompute and cache RBAC data for the given users.
+        
+        Returns:
+            Number of users refreshed
+        """
+        user_ids = list(user_ids)
+        batches = [user_ids[i:i + self.batch_size] for i in range(0, len(user_ids), self.batch_size)]
+        
+        results = await asyncio.gather(
+            *(self._refresh_batch(batch, tenant_id) for batch in batches),
+            return_exceptions=True,
+        )
+        
+        refreshed = 0
+        for result in results:
+            if isinstance(result, Exception):
+                self._failures += 1
+                logger.error(f"Failed to refresh auth data batch: {result}")
+            else:
+                refreshed += result
+        
+        tenant_display = tenant_id.value if tenant_id else "platform"
+        logger.info(f"Refreshed auth data for {refreshed}/{len(user_ids)} users in tenant {tenant_display}")
+        return refreshed
+    
+    async def _refresh_batch(self, user_ids: List[UUID], tenant_id: Optional[TenantId]) -> int:
+        """Load and cache RBAC data for one batch of users."""
+        async with self._semaphore:
+            roles, permissions = await self._load_rbac(user_ids, tenant_id)
+            
+            await asyncio.gather(*(
+                self._cache_user(
+                    UserId(str(user_uuid)),
+                    tenant_id,
+                    {RoleCode(code) for code in roles.get(user_uuid, ())},
+                    permissions.get(user_uuid, {}),
+                )
+                for user_uuid in user_ids
+            ))
+            
+            self._users_refreshed += len(user_ids)
+            return len(user_ids)
+    
+    async def _cache_user(
+        self,
+        user_id: UserId,
+        tenant_id: Optional[TenantId],
+        roles: Set[RoleCode],
+        permissions: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Overwrite the cached roles, permissions and auth context of a user."""
+        await self.auth_cache_service.set_user_roles(user_id, tenant_id, roles)
+        await self.auth_cache_service.set_user_permissions(
+            user_id, tenant_id, {PermissionCode(code) for code in permissions}
+        )
+        await self._refresh_auth_context(user_id, tenant_id, roles, permissions)
+    
+    async def _refresh_auth_context(
+        self,
+        user_id: UserId,
+        tenant_id: Optional[TenantId],
+        roles: Set[RoleCode],
+        permissions: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Rewrite a cached auth context with the new roles and permissions."""
+        auth_context = await self.auth_cache_service.get_auth_context(user_id, tenant_id)
+        if auth_context is None:
+            return
+        
+        metadata = dict(auth_context.metadata)
+        if "rich_permissions" in metadata:
+            # Same shape as the list JWTValidator stores at login
+            metadata["rich_permissions"] = UserPermissionService.format_permission_metadata(
+                list(permissions.values())
+            )
+        
+        await self.auth_cache_service.set_auth_context(
+            dataclasses.replace(
+                auth_context,
+                roles=roles,
+                permissions={PermissionCode(code) for code in permissions},
+                metadata=metadata,
+            )
+        )
+        self._contexts_refreshed += 1
+    
+    async def _load_rbac(
+        self,
+        user_ids: List[UUID],
+        tenant_id: Optional[TenantId],
+    ) -> Tuple[Dict[UUID, Set[str]], Dict[UUID, Dict[str, Dict[str, Any]]]]:
+        """Load role codes and permission details for a batch of users."""
+        schema, connection_name = self._schema_for(tenant_id)
+        
+        async with self.database_service.get_connection(connection_name) as conn:
+            role_rows = await conn.fetch(
+                f"""
+                SELECT ur.user_id, r.code
+                FROM {schema}.user_roles ur
+                JOIN {schema}.roles r ON r.id = ur.role_id
+                WHERE ur.user_id = ANY($1::uuid[])
+                  AND ur.is_active = true
+                  AND (ur.expires_at IS NULL OR ur.expires_at > NOW())
+                  AND r.deleted_at IS NULL
+                """,
+                user_ids,
+            )
+            role_permission_rows = await conn.fetch(
+                f"""
+                SELECT DISTINCT ur.user_id, p.code, p.resource, p.action,
+                       p.scope_level, p.is_dangerous, p.requires_mfa, p.requires_approval,
+                       p.permission_config, r.name AS role_name, r.code AS role_code
+                FROM {schema}.user_roles ur
+                JOIN {schema}.roles r ON r.id = ur.role_id
+                JOIN {schema}.role_permissions rp ON rp.role_id = ur.role_id
+                JOIN {schema}.permissions p ON p.id = rp.permission_id
+                WHERE ur.user_id = ANY($1::uuid[])
+                  AND ur.is_active = true
+                  AND (ur.expires_at IS NULL OR ur.expires_at > NOW())
+                  AND r.deleted_at IS NULL
+                  AND p.deleted_at IS NULL
+                """,
+                user_ids,
+            )
+            direct_permission_rows = await conn.fetch(
+                f"""
+                SELECT DISTINCT up.user_id, p.code, p.resource, p.action,
+                       p.scope_level, p.is_dangerous, p.requires_mfa, p.requires_approval,
+                       p.permission_config
+                FROM {schema}.user_permissions up
+                JOIN {schema}.permissions p ON p.id = up.permission_id
+                WHERE up.user_id = ANY($1::uuid[])
+                  AND up.is_active = true
+                  AND up.is_granted = true
+                  AND (up.expires_at IS NULL OR up.expires_at > NOW())
+                  AND p.deleted_at IS NULL
+                """,
+                user_ids,
+            )
+        
+        roles: Dict[UUID, Set[str]] = defaultdict(set)
+        for row in role_rows:
+            roles[row["user_id"]].add(row["code"])
+        
+        role_permissions: Dict[UUID, List[Any]] = defaultdict(list)
+        for row in role_permission_rows:
+            role_permissions[row["user_id"]].append(row)
+        direct_permissions: Dict[UUID, List[Any]] = defaultdict(list)
+        for row in direct_permission_rows:
+            direct_permissions[row["user_id"]].append(row)
+        
+        # Same per-permission details (with sources) as the permission checker builds
+        permissions = {
+            user_uuid: AsyncPGPermissionChecker.build_permission_details(
+                role_permissions.get(user_uuid, ()), direct_permissions.get(user_uuid, ())
+            )
+            for user_uuid in user_ids
+        }
+        
+        return roles, permissions
+    
+    @staticmethod
+    def _schema_for(tenant_id: Optional[TenantId]) -> Tuple[str, str]:
+        """Return (schema, connection name) for a tenant (None = admin)."""
+        if tenant_id is None:
+            return "admin", "admin"
+        return f"tenant_{tenant_id.value}", "shared"
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get refresher statistics."""
+        return {
+            "events_handled": self._events_handled,
+            "users_refreshed": self._users_refreshed,
+            "contexts_refreshed": self._contexts_refreshed,
+            "failures": self._failures,
+        }
@@ -28,6 +28,7 @@ from ....core.value_objects.identifiers import (
     TenantId,
     UserId,
 )
+from ..adapters.keycloak_http_pool import get_keycloak_http_pool
 from ..entities.auth_context import AuthContext
 from ..entities.protocols import (
     JWTValidatorProtocol,
@@ -57,7 +58,7 @@ class JWTValidator(JWTValidatorProtocol):
     
     async def validate_token(self, token: str, realm_id: RealmId) -> AuthContext:
         """Validate JWT token and return auth context."""
-        logger.debug(f"Validating token for realm {realm_id.value}")
+        logger.debug("Validating token for realm %s", realm_id.value)
         
         # Get realm configuration and realm object (supports both custom and database-stored realms)
         try:
@@ -104,13 +105,13 @@ class JWTValidator(JWTValidatorProtocol):
             )
             
             # Load roles and permissions from database ONLY
-            logger.info(f"Database service availability: {self.database_service is not None}")
+            logger.debug("Database service availability: %s", self.database_service is not None)
             if self.database_service:
                 # Load from database (ONLY source for roles and permissions)
-                logger.info(f"Loading database permissions for user {platform_user_id.value}, tenant: {realm.tenant_id}")
+                logger.debug("Loading database permissions for user %s, tenant: %s", platform_user_id.value, realm.tenant_id)
                 try:
                     roles, permissions, permission_metadata = await self._load_database_permissions(platform_user_id, realm.tenant_id)
-                    logger.info(f"Database loading result: {len(roles)} roles, {len(permissions)} permissions")
+                    logger.debug("Database loading result: %d roles, %d permissions", len(roles), len(permissions))
                 except Exception as e:
                     logger.error(f"Database permission loading failed: {e}")
                     # No fallback - empty roles and permissions if database fails
@@ -135,7 +136,7 @@ class JWTValidator(JWTValidatorProtocol):
             if permission_metadata:
                 auth_context.metadata['rich_permissions'] = permission_metadata
             
-            logger.info(f"Created auth context for user {platform_user_id.value}")
+            logger.info("Created auth context for user %s", platform_user_id.value)
             return auth_context
         
         except ExpiredSignatureError as e:
@@ -205,7 +206,7 @@ class JWTValidator(JWTValidatorProtocol):
         if self.public_key_cache:
             cached_key = await self.public_key_cache.get_public_key(realm_id)
             if cached_key:
-                logger.debug(f"Using cached public key for realm {realm_id.value}")
+                logger.debug("Using cached public key for realm %s", realm_id.value)
                 return cached_key
         
         # Get realm configuration
@@ -215,37 +216,33 @@ class JWTValidator(JWTValidatorProtocol):
             raise PublicKeyError(f"Realm configuration not found: {realm_id.value}") from e
         
         try:
-            # Get public key from Keycloak
-            from ..adapters.keycloak_admin import KeycloakAdminAdapter
-            
-            # This is a simplified approach - in production, you might want to
-            # use a dedicated service or the OpenID adapter
-            admin_adapter = KeycloakAdminAdapter(
-                server_url=config.server_url,
-                username="admin",  # This would come from configuration
-                password="admin",  # This would come from configuration
+            # The JWKS endpoint is public, so fetch it over the pooled
+            # Keycloak client instead of logging in to the admin API
+            pool = get_keycloak_http_pool()
+            server_url = pool.normalize_server_url(config.server_url)
+            response = await pool.get_client(server_url).get(
+                f"{server_url}/realms/{config.realm_name}/protocol/openid-connect/certs"
             )
+            response.raise_for_status()
+            jwks = response.json()
+            
+            # Extract the RSA public key
+            for key in jwks.get("keys", []):
+                if key.get("kty") == "RSA" and key.get("use") == "sig":
+                    public_key = self._jwk_to_pem(key)
+                    
+                    # Cache the public key
+                    if self.public_key_cache:
+                        await self.public_key_cache.cache_public_key(
+                            realm_id,
+                            public_key,
+                            config.public_key_ttl,
+                        )
+                    
+                    logger.debug("Retrieved public key for realm %s", realm_id.value)
+                    return public_key
             
-            async with admin_adapter:
-                jwks = await admin_adapter.get_realm_jwks(config.realm_name)
-                
-                # Extract the RSA public key
-                for key in jwks.get("keys", []):
-                    if key.get("kty") == "RSA" and key.get("use") == "sig":
-                        public_key = self._jwk_to_pem(key)
-                        
-                        # Cache the public key
-                        if self.public_key_cache:
-                            await self.public_key_cache.cache_public_key(
-                                realm_id,
-                                public_key,
-                                config.public_key_ttl,
-                            )
-                        
-                        logger.debug(f"Retrieved public key for realm {realm_id.value}")
-                        return public_key
-                
-                raise PublicKeyError(f"No RSA signing key found for realm {realm_id.value}")
+            raise PublicKeyError(f"No RSA signing key found for realm {realm_id.value}")
         
         except Exception as e:
             logger.error(f"Failed to get public key for realm {realm_id.value}: {e}")
@@ -310,7 +307,7 @@ class JWTValidator(JWTValidatorProtocol):
             # Store full permission details in metadata for response
             permission_metadata = user_auth_context['permissions']
             
-            logger.debug(f"Loaded {len(db_roles)} roles and {len(db_permission_codes)} permissions from database")
+            logger.debug("Loaded %s roles and %s permissions from database", len(db_roles), len(db_permission_codes))
             return db_roles, db_permission_codes, permission_metadata
             
         except Exception as e:
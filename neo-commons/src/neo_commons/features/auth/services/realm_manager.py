@@ -46,7 +46,7 @@ class RealmManager(RealmManagerProtocol):
             config: Keycloak configuration for the realm
             tenant_id: Optional tenant ID for multi-tenant scenarios
         """
-        logger.debug(f"Registering custom realm config for realm {realm_id.value}")
+        logger.debug("Registering custom realm config for realm %s", realm_id.value)
         
         # Store the config
         self._custom_realm_configs[realm_id.value] = config
@@ -63,7 +63,7 @@ class RealmManager(RealmManagerProtocol):
         )
         self._custom_realms[realm_id.value] = custom_realm
         
-        logger.info(f"Registered custom realm config for {realm_id.value}")
+        logger.info("Registered custom realm config for %s", realm_id.value)
     
     def register_platform_realm_config(self, realm_id: RealmId, config: KeycloakConfig) -> None:
         """Register a platform admin realm configuration.
@@ -79,11 +79,11 @@ class RealmManager(RealmManagerProtocol):
     
     async def get_realm_config_by_id(self, realm_id: RealmId) -> KeycloakConfig:
         """Get realm configuration by realm ID."""
-        logger.debug(f"Getting realm config by ID: {realm_id.value}")
+        logger.debug("Getting realm config by ID: %s", realm_id.value)
         
         # Check custom realm configs first
         if realm_id.value in self._custom_realm_configs:
-            logger.debug(f"Found custom realm config for ID: {realm_id.value}")
+            logger.debug("Found custom realm config for ID: %s", realm_id.value)
             return self._custom_realm_configs[realm_id.value]
         
         # Fall back to database-stored realms
@@ -98,12 +98,12 @@ class RealmManager(RealmManagerProtocol):
     
     async def get_realm_config(self, tenant_id: TenantId) -> KeycloakConfig:
         """Get realm configuration for tenant."""
-        logger.debug(f"Getting realm config for tenant {tenant_id.value}")
+        logger.debug("Getting realm config for tenant %s", tenant_id.value)
         
         # First check custom realm configs by tenant
         for realm_id, realm in self._custom_realms.items():
             if realm.tenant_id == tenant_id and realm.config:
-                logger.debug(f"Found custom realm config for tenant {tenant_id.value}")
+                logger.debug("Found custom realm config for tenant %s", tenant_id.value)
                 return realm.config
         
         # Fall back to database-stored realms
@@ -123,7 +123,7 @@ class RealmManager(RealmManagerProtocol):
         realm_settings: Optional[Dict] = None,
     ) -> Realm:
         """Create new realm for tenant."""
-        logger.info(f"Creating realm for tenant {tenant_id.value}")
+        logger.info("Creating realm for tenant %s", tenant_id.value)
         
         # Check if realm already exists for tenant
         existing_realm = await self.realm_repository.get_by_tenant_id(tenant_id)
@@ -171,7 +171,7 @@ class RealmManager(RealmManagerProtocol):
             # Save to repository
             await self.realm_repository.create(realm)
             
-            logger.info(f"Successfully created realm {realm_name} for tenant {tenant_id.value}")
+            logger.info("Successfully created realm %s for tenant %s", realm_name, tenant_id.value)
             return realm
         
         except Exception as e:
@@ -188,7 +188,7 @@ class RealmManager(RealmManagerProtocol):
     
     async def update_realm_settings(self, realm_id: RealmId, settings: Dict) -> None:
         """Update realm settings."""
-        logger.info(f"Updating settings for realm {realm_id.value}")
+        logger.info("Updating settings for realm %s", realm_id.value)
         
         realm = await self.realm_repository.get_by_id(realm_id)
         if not realm:
@@ -217,7 +217,7 @@ class RealmManager(RealmManagerProtocol):
             
             await self.realm_repository.update(updated_realm)
             
-            logger.info(f"Successfully updated realm {realm_id.value}")
+            logger.info("Successfully updated realm %s", realm_id.value)
         
         except Exception as e:
             logger.error(f"Failed to update realm {realm_id.value}: {e}")
@@ -225,7 +225,7 @@ class RealmManager(RealmManagerProtocol):
     
     async def delete_realm(self, realm_id: RealmId) -> None:
         """Delete realm."""
-        logger.info(f"Deleting realm {realm_id.value}")
+        logger.info("Deleting realm %s", realm_id.value)
         
         realm = await self.realm_repository.get_by_id(realm_id)
         if not realm:
@@ -239,7 +239,7 @@ class RealmManager(RealmManagerProtocol):
             # Delete from repository
             await self.realm_repository.delete(realm_id)
             
-            logger.info(f"Successfully deleted realm {realm_id.value}")
+            logger.info("Successfully deleted realm %s", realm_id.value)
         
         except Exception as e:
             logger.error(f"Failed to delete realm {realm_id.value}: {e}")
@@ -254,11 +254,11 @@ class RealmManager(RealmManagerProtocol):
     
     async def get_realm_by_id(self, realm_id: RealmId) -> Optional[Realm]:
         """Get realm by ID."""
-        logger.debug(f"Getting realm by ID: {realm_id.value}")
+        logger.debug("Getting realm by ID: %s", realm_id.value)
         
         # First check custom realms
         if realm_id.value in self._custom_realms:
-            logger.debug(f"Found custom realm for ID: {realm_id.value}")
+            logger.debug("Found custom realm for ID: %s", realm_id.value)
             return self._custom_realms[realm_id.value]
         
         # Fall back to database-stored realms
@@ -267,12 +267,12 @@ class RealmManager(RealmManagerProtocol):
     
     async def get_realm_by_tenant(self, tenant_id: TenantId) -> Optional[Realm]:
         """Get realm by tenant ID."""
-        logger.debug(f"Getting realm for tenant: {tenant_id.value}")
+        logger.debug("Getting realm for tenant: %s", tenant_id.value)
         
         # First check custom realms
         for realm in self._custom_realms.values():
             if realm.tenant_id == tenant_id:
-                logger.debug(f"Found custom realm for tenant: {tenant_id.value}")
+                logger.debug("Found custom realm for tenant: %s", tenant_id.value)
                 return realm
         
         # Fall back to database-stored realms
@@ -281,7 +281,7 @@ class RealmManager(RealmManagerProtocol):
     
     async def enable_realm(self, realm_id: RealmId) -> None:
         """Enable a realm."""
-        logger.info(f"Enabling realm {realm_id.value}")
+        logger.info("Enabling realm %s", realm_id.value)
         
         await self.update_realm_settings(realm_id, {"enabled": True})
         
@@ -303,7 +303,7 @@ class RealmManager(RealmManagerProtocol):
     
     async def disable_realm(self, realm_id: RealmId) -> None:
         """Disable a realm."""
-        logger.info(f"Disabling realm {realm_id.value}")
+        logger.info("Disabling realm %s", realm_id.value)
         
         await self.update_realm_settings(realm_id, {"enabled": False})
         
@@ -325,7 +325,7 @@ class RealmManager(RealmManagerProtocol):
     
     async def sync_realm_with_keycloak(self, realm_id: RealmId) -> Realm:
         """Synchronize realm data with Keycloak."""
-        logger.info(f"Syncing realm {realm_id.value} with Keycloak")
+        logger.info("Syncing realm %s with Keycloak", realm_id.value)
         
         realm = await self.realm_repository.get_by_id(realm_id)
         if not realm:
@@ -351,7 +351,7 @@ class RealmManager(RealmManagerProtocol):
             
             await self.realm_repository.update(updated_realm)
             
-            logger.info(f"Successfully synced realm {realm_id.value}")
+            logger.info("Successfully synced realm %s", realm_id.value)
             return updated_realm
         
         except Exception as e:
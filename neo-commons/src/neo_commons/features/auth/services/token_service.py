@@ -38,7 +38,7 @@ class TokenService:
         realm_id: RealmId,
     ) -> AuthContext:
         """Validate token and cache the auth context."""
-        logger.debug(f"Validating and caching token for realm {realm_id.value}")
+        logger.debug("Validating and caching token for realm %s", realm_id.value)
         
         # Generate token ID for caching
         token_id = TokenId(generate_uuid_v7())
@@ -58,7 +58,7 @@ class TokenService:
             ttl = int((auth_context.expires_at - datetime.now(timezone.utc)).total_seconds())
             if ttl > 0:
                 await self.token_cache.cache_token(token_id, auth_context, ttl)
-                logger.debug(f"Cached auth context for {ttl} seconds")
+                logger.debug("Cached auth context for %s seconds", ttl)
         
         return auth_context
     
@@ -68,7 +68,7 @@ class TokenService:
         realm_id: RealmId,
     ) -> tuple[JWTToken, AuthContext]:
         """Refresh token and return new token with auth context."""
-        logger.info(f"Refreshing token for realm {realm_id.value}")
+        logger.info("Refreshing token for realm %s", realm_id.value)
         
         # Refresh the token
         new_token = await self.keycloak_client.refresh_token(refresh_token, realm_id)
@@ -82,7 +82,7 @@ class TokenService:
         if self.token_cache:
             await self.token_cache.invalidate_user_tokens(auth_context.user_id)
         
-        logger.info(f"Successfully refreshed token for user {auth_context.user_id.value}")
+        logger.info("Successfully refreshed token for user %s", auth_context.user_id.value)
         return new_token, auth_context
     
     async def revoke_token(
@@ -92,7 +92,7 @@ class TokenService:
         user_id: Optional[UserId] = None,
     ) -> None:
         """Revoke token and clear cache."""
-        logger.info(f"Revoking token for realm {realm_id.value}")
+        logger.info("Revoking token for realm %s", realm_id.value)
         
         try:
             # Logout in Keycloak (this revokes the token)
@@ -116,7 +116,7 @@ class TokenService:
         realm_id: RealmId,
     ) -> Dict:
         """Introspect token with caching for repeated calls."""
-        logger.debug(f"Introspecting token for realm {realm_id.value}")
+        logger.debug("Introspecting token for realm %s", realm_id.value)
         
         # For now, directly call Keycloak (could add caching later)
         introspection = await self.keycloak_client.introspect_token(token, realm_id)
@@ -145,7 +145,7 @@ class TokenService:
             age_seconds = (datetime.now(timezone.utc) - issued_at).total_seconds()
             
             is_fresh = age_seconds <= max_age_seconds
-            logger.debug(f"Token age: {age_seconds}s, fresh: {is_fresh}")
+            logger.debug("Token age: %ss, fresh: %s", age_seconds, is_fresh)
             
             return is_fresh
         
@@ -200,7 +200,7 @@ class TokenService:
             introspection = await self.introspect_token_with_cache(access_token, realm_id)
             
             is_active = introspection.get("active", False)
-            logger.debug(f"Token active status: {is_active}")
+            logger.debug("Token active status: %s", is_active)
             
             return is_active
         
@@ -242,11 +242,11 @@ class TokenService:
     
     async def invalidate_user_sessions(self, user_id: UserId) -> None:
         """Invalidate all cached sessions for a user."""
-        logger.info(f"Invalidating all sessions for user {user_id.value}")
+        logger.info("Invalidating all sessions for user %s", user_id.value)
         
         if self.token_cache:
             await self.token_cache.invalidate_user_tokens(user_id)
-            logger.info(f"Invalidated cached tokens for user {user_id.value}")
+            logger.info("Invalidated cached tokens for user %s", user_id.value)
         else:
             logger.debug("No token cache configured")
     
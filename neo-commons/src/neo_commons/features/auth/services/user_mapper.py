@@ -7,6 +7,7 @@ from ....core.exceptions.auth import UserMappingError
 from ....core.value_objects.identifiers import KeycloakUserId, TenantId, UserId
 from ....utils.uuid import generate_uuid_v7
 from ..entities.protocols import UserMapperProtocol
+from ..repositories.user_mapping_cache import UserMappingCache, get_user_mapping_cache
 from ..repositories.user_mapping_repository import UserMappingRepository
 
 logger = logging.getLogger(__name__)
@@ -18,9 +19,28 @@ class UserMapper(UserMapperProtocol):
     def __init__(
         self,
         user_mapping_repository: UserMappingRepository,
+        mapping_cache: Optional[UserMappingCache] = None,
     ):
-        """Initialize user mapper."""
+        """Initialize user mapper.
+        
+        Args:
+            user_mapping_repository: Repository for persisted mappings
+            mapping_cache: Platform user lookup cache (defaults to the shared cache)
+        """
         self.user_mapping_repository = user_mapping_repository
+        self.mapping_cache = mapping_cache or get_user_mapping_cache()
+    
+    async def _lookup_admin_user_id(self, keycloak_user_id: str) -> Optional[UserId]:
+        """Look up platform admin user ID by external (Keycloak) user ID."""
+        async with self.user_mapping_repository.database_service.get_connection("admin") as conn:
+            result = await conn.fetchrow(
+                "SELECT id FROM admin.users WHERE external_user_id = $1",
+                keycloak_user_id
+            )
+        
+        if result and result['id']:
+            return UserId(str(result['id']))
+        return None
     
     async def map_keycloak_to_platform(
         self, 
@@ -28,30 +48,26 @@ class UserMapper(UserMapperProtocol):
         tenant_id: Optional[TenantId],
     ) -> UserId:
         """Map Keycloak user ID to platform user ID."""
-        logger.debug(f"Mapping Keycloak user {keycloak_user_id.value} to platform user")
+        logger.debug("Mapping Keycloak user %s to platform user", keycloak_user_id.value)
         
         try:
             # For platform admin users (no tenant), look up existing user in database
             if tenant_id is None:
                 logger.debug("Platform admin user detected, looking up platform user ID in database")
                 
-                # First, check if user exists in database by external_user_id (Keycloak ID)
+                # First, check if user exists in database by external_user_id (Keycloak ID),
+                # served from the mapping cache when possible
                 if hasattr(self.user_mapping_repository, 'database_service') and self.user_mapping_repository.database_service:
                     try:
-                        async with self.user_mapping_repository.database_service.get_connection("admin") as conn:
-                            result = await conn.fetchrow(
-                                "SELECT id FROM admin.users WHERE external_user_id = $1",
-                                keycloak_user_id.value
-                            )
-                            
-                            logger.debug(f"Database query result: {result}")
-                            
-                            if result and result['id']:
-                                platform_user_id = UserId(str(result['id']))
-                                logger.debug(f"Found existing platform admin user: {platform_user_id.value}")
-                                return platform_user_id
-                            else:
-                                logger.debug(f"No user found with external_user_id: {keycloak_user_id.value}")
+                        platform_user_id = await self.mapping_cache.get_or_load(
+                            keycloak_user_id.value, self._lookup_admin_user_id
+                        )
+                        
+                        if platform_user_id:
+                            logger.debug("Found existing platform admin user: %s", platform_user_id.value)
+                            return platform_user_id
+                        else:
+                            logger.debug("No user found with external_user_id: %s", keycloak_user_id.value)
                     
                     except Exception as e:
                         logger.warning(f"Failed to query database for existing user: {e}")
@@ -62,7 +78,7 @@ class UserMapper(UserMapperProtocol):
                 )
                 
                 if existing_mapping:
-                    logger.debug(f"Found existing admin user mapping: {existing_mapping['platform_user_id']}")
+                    logger.debug("Found existing admin user mapping: %s", existing_mapping['platform_user_id'])
                     return UserId(existing_mapping["platform_user_id"])
                 
                 # If no user exists, create a new one (this should be rare for platform admin)
@@ -88,7 +104,7 @@ class UserMapper(UserMapperProtocol):
             )
             
             if existing_mapping:
-                logger.debug(f"Found existing mapping: {existing_mapping['platform_user_id']}")
+                logger.debug("Found existing mapping: %s", existing_mapping['platform_user_id'])
                 return UserId(existing_mapping["platform_user_id"])
             
             # Create new mapping
@@ -116,7 +132,7 @@ class UserMapper(UserMapperProtocol):
         tenant_id: TenantId,
     ) -> Optional[KeycloakUserId]:
         """Map platform user ID to Keycloak user ID."""
-        logger.debug(f"Mapping platform user {platform_user_id.value} to Keycloak user")
+        logger.debug("Mapping platform user %s to Keycloak user", platform_user_id.value)
         
         try:
             mapping = await self.user_mapping_repository.get_by_platform_id(
@@ -124,11 +140,11 @@ class UserMapper(UserMapperProtocol):
             )
             
             if not mapping:
-                logger.debug(f"No Keycloak mapping found for platform user {platform_user_id.value}")
+                logger.debug("No Keycloak mapping found for platform user %s", platform_user_id.value)
                 return None
             
             keycloak_user_id = KeycloakUserId(mapping["keycloak_user_id"])
-            logger.debug(f"Found Keycloak mapping: {keycloak_user_id.value}")
+            logger.debug("Found Keycloak mapping: %s", keycloak_user_id.value)
             return keycloak_user_id
         
         except Exception as e:
@@ -160,7 +176,7 @@ class UserMapper(UserMapperProtocol):
             # Sync user profile
             await self.sync_user_profile(platform_user_id, user_info)
             
-            logger.info(f"Successfully created user mapping with profile sync")
+            logger.info("Successfully created user mapping with profile sync")
         
         except Exception as e:
             logger.error(f"Failed to create user mapping: {e}")
@@ -168,7 +184,7 @@ class UserMapper(UserMapperProtocol):
     
     async def sync_user_profile(self, platform_user_id: UserId, user_info: Dict) -> None:
         """Sync user profile from Keycloak to platform."""
-        logger.debug(f"Syncing profile for platform user {platform_user_id.value}")
+        logger.debug("Syncing profile for platform user %s", platform_user_id.value)
         
         try:
             # Update user profile in platform database
@@ -176,7 +192,7 @@ class UserMapper(UserMapperProtocol):
                 platform_user_id, user_info
             )
             
-            logger.debug(f"Successfully synced profile for user {platform_user_id.value}")
+            logger.debug("Successfully synced profile for user %s", platform_user_id.value)
         
         except Exception as e:
             logger.error(f"Failed to sync profile for user {platform_user_id.value}: {e}")
@@ -189,12 +205,12 @@ class UserMapper(UserMapperProtocol):
         tenant_id: TenantId,
     ) -> None:
         """Delete user mapping."""
-        logger.info(f"Deleting user mapping for platform user {platform_user_id.value}")
+        logger.info("Deleting user mapping for platform user %s", platform_user_id.value)
         
         try:
             await self.user_mapping_repository.delete_mapping(platform_user_id, tenant_id)
             
-            logger.info(f"Successfully deleted user mapping for {platform_user_id.value}")
+            logger.info("Successfully deleted user mapping for %s", platform_user_id.value)
         
         except Exception as e:
             logger.error(f"Failed to delete user mapping: {e}")
@@ -206,7 +222,7 @@ class UserMapper(UserMapperProtocol):
         tenant_id: TenantId,
     ) -> Optional[Dict]:
         """Get complete user mapping information."""
-        logger.debug(f"Getting mapping info for platform user {platform_user_id.value}")
+        logger.debug("Getting mapping info for platform user %s", platform_user_id.value)
         
         try:
             mapping_info = await self.user_mapping_repository.get_mapping_info(
@@ -225,7 +241,7 @@ class UserMapper(UserMapperProtocol):
         tenant_id: TenantId,
     ) -> None:
         """Update last sync timestamp for user mapping."""
-        logger.debug(f"Updating last sync for platform user {platform_user_id.value}")
+        logger.debug("Updating last sync for platform user %s", platform_user_id.value)
         
         try:
             await self.user_mapping_repository.update_last_sync(platform_user_id, tenant_id)
@@ -236,7 +252,7 @@ class UserMapper(UserMapperProtocol):
     
     async def bulk_sync_users(self, tenant_id: TenantId, user_infos: Dict[str, Dict]) -> Dict:
         """Bulk sync multiple users for a tenant."""
-        logger.info(f"Bulk syncing {len(user_infos)} users for tenant {tenant_id.value}")
+        logger.info("Bulk syncing %s users for tenant %s", len(user_infos), tenant_id.value)
         
         results = {
             "success": [],
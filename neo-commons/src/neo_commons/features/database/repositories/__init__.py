@@ -5,6 +5,7 @@ including connection management, schema resolution, and health monitoring.
 """
 
 from .connection_manager import DatabaseConnectionManager, AsyncConnectionPool
+from .query_observer import QueryObserver, QueryTemplateStats
 from .connection_registry import InMemoryConnectionRegistry
 from .redis_connection_registry import RedisConnectionRegistry
 from .health_checker import DatabaseHealthChecker, ContinuousHealthMonitor
@@ -16,6 +17,8 @@ from .pool_optimizer import ConnectionPoolOptimizer, OptimizationStrategy, Optim
 __all__ = [
     "DatabaseConnectionManager",
     "AsyncConnectionPool",
+    "QueryObserver",
+    "QueryTemplateStats",
     "InMemoryConnectionRegistry",
     "RedisConnectionRegistry", 
     "DatabaseHealthChecker",
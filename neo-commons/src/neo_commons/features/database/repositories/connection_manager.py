@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from typing import Dict, Optional, List, Any, AsyncContextManager
 from contextlib import asynccontextmanager
 import asyncpg
@@ -27,6 +28,8 @@ from ....core.exceptions.database import (
 )
 from ..utils.queries import BASIC_HEALTH_CHECK
 from ..utils.connection_factory import ConnectionFactory
+from ....infrastructure.tracing import SpanKind, current_span, get_tracer, instrument_asyncpg_connection
+from .query_observer import QueryObserver
 
 logger = logging.getLogger(__name__)
 
@@ -82,12 +85,20 @@ class PoolMetrics:
 class AsyncConnectionPool(ConnectionPool):
     """Implementation of ConnectionPool using asyncpg."""
     
-    def __init__(self, connection: DatabaseConnection):
+    def __init__(self,
+                 connection: DatabaseConnection,
+                 slow_query_threshold_ms: float = 100.0,
+                 explain_slow_queries: bool = True):
         self._connection_config = connection
         self._pool: Optional[asyncpg.Pool] = None
         self._metrics = PoolMetrics()
         self._is_closing = False
         self._lock = asyncio.Lock()
+        self._query_observer = QueryObserver(
+            connection.connection_name,
+            slow_query_threshold_ms=slow_query_threshold_ms,
+            explain_connection=self._spare_connection if explain_slow_queries else None,
+        )
     
     async def _create_pool(self) -> asyncpg.Pool:
         """Create the asyncpg connection pool."""
@@ -124,8 +135,19 @@ class AsyncConnectionPool(ConnectionPool):
         pool = await self._ensure_pool()
         
         try:
+            started_ns = time.time_ns()
             conn = await pool.acquire(timeout=self._connection_config.pool_timeout_seconds)
             self._metrics.active_connections += 1
+            
+            # Pool wait time and the queries on this connection show up in traces
+            if current_span().recording:
+                get_tracer().record_span(
+                    "db.acquire", started_ns, time.time_ns(), SpanKind.CLIENT,
+                    {"db.connection_name": self._connection_config.connection_name}
+                )
+            instrument_asyncpg_connection(conn)
+            # Idempotent; loggers stay registered across pool releases
+            conn.add_query_logger(self._query_observer.observe)
             return conn
         except Exception as e:
             logger.error(f"Failed to acquire connection: {e}")
@@ -149,6 +171,24 @@ class AsyncConnectionPool(ConnectionPool):
         finally:
             await self.release_connection(conn)
     
+    @asynccontextmanager
+    async def _spare_connection(self) -> AsyncContextManager[Optional[asyncpg.Connection]]:
+        """Yield an idle pooled connection for background work, or None if none is idle."""
+        pool = self._pool
+        if pool is None or self._is_closing or pool.get_idle_size() == 0:
+            yield None
+            return
+        conn = await pool.acquire(timeout=self._connection_config.pool_timeout_seconds)
+        try:
+            yield conn
+        finally:
+            await pool.release(conn)
+    
+    @property
+    def query_observer(self) -> QueryObserver:
+        """Per-template query statistics of this pool."""
+        return self._query_observer
+    
     async def close(self) -> None:
         """Close the connection pool."""
         self._is_closing = True
@@ -245,7 +285,8 @@ class AsyncConnectionPool(ConnectionPool):
                     "active_connections": self._metrics.active_connections,
                     "failed_acquisitions": self._metrics.failed_connections,
                     "health_check_failures": self._metrics.health_check_failures
-                }
+                },
+                "queries": self._query_observer.get_stats()
             }
             
         except Exception as e:
@@ -269,10 +310,14 @@ class DatabaseConnectionManager(ConnectionManager):
     def __init__(self, 
                  registry: ConnectionRegistry,
                  health_checker: ConnectionHealthChecker,
-                 failover_manager: Optional[FailoverManager] = None):
+                 failover_manager: Optional[FailoverManager] = None,
+                 slow_query_threshold_ms: float = 100.0,
+                 explain_slow_queries: bool = True):
         self._registry = registry
         self._health_checker = health_checker
         self._failover_manager = failover_manager
+        self._slow_query_threshold_ms = slow_query_threshold_ms
+        self._explain_slow_queries = explain_slow_queries
         self._pools: Dict[str, AsyncConnectionPool] = {}
         self._lock = asyncio.Lock()
     
@@ -295,7 +340,11 @@ class DatabaseConnectionManager(ConnectionManager):
                 raise ConnectionPoolError(f"Connection '{connection_name}' is not available")
             
             # Create new pool
-            pool = AsyncConnectionPool(connection)
+            pool = AsyncConnectionPool(
+                connection,
+                slow_query_threshold_ms=self._slow_query_threshold_ms,
+                explain_slow_queries=self._explain_slow_queries
+            )
             self._pools[connection_name] = pool
             
             logger.info(f"Created new pool for connection: {connection_name}")
@@ -313,22 +362,19 @@ class DatabaseConnectionManager(ConnectionManager):
                            connection_name: str, 
                            query: str, 
                            *args: Any) -> List[Dict[str, Any]]:
-        """Execute a query and return results."""
-        start_time = datetime.utcnow()
+        """Execute a query and return results.
         
+        Timing and the slow-query log come from the pool's query observer;
+        only the row count, which query loggers do not see, is added here.
+        """
         try:
-            async with self.get_connection(connection_name) as conn:
+            pool = await self.get_pool(connection_name)
+            async with pool.connection() as conn:
                 rows = await conn.fetch(query, *args)
                 
                 # Convert to list of dicts
                 results = [dict(row) for row in rows]
-                
-                # Log performance
-                duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-                if duration_ms > 100:  # Log slow queries
-                    logger.warning(
-                        f"Slow query ({duration_ms:.2f}ms) on {connection_name}: {query[:100]}..."
-                    )
+                pool.query_observer.record_rows(query, len(results))
                 
                 return results
                 
@@ -375,8 +421,14 @@ class DatabaseConnectionManager(ConnectionManager):
                              *args: Any) -> str:
         """Execute a command (INSERT, UPDATE, DELETE) and return status."""
         try:
-            async with self.get_connection(connection_name) as conn:
-                return await conn.execute(command, *args)
+            pool = await self.get_pool(connection_name)
+            async with pool.connection() as conn:
+                status = await conn.execute(command, *args)
+                # Status tags such as "UPDATE 3" end with the affected row count
+                count = status.rsplit(" ", 1)[-1]
+                if count.isdigit():
+                    pool.query_observer.record_rows(command, int(count))
+                return status
                 
         except Exception as e:
             logger.error(f"Command failed on {connection_name}: {e}")
@@ -0,0 +1,308 @@
+"""Per-template query statistics, slow-query log and EXPLAIN capture.
+
+``QueryObserver.observe`` is registered as an asyncpg query logger on every
+pooled connection, so it sees every statement regardless of which helper
+ran it. Statements are aggregated by fingerprint (one template across all
+tenant schemas and parameter values). Slow statements are logged and, at a
+bounded rate, re-run under ``EXPLAIN (ANALYZE, BUFFERS)`` on a spare pooled
+connection in a background task inside a rolled-back transaction; the plan
+is kept with the template's statistics.
+
+ANALYZE executes the statement, and a rollback does not undo everything
+(sequence advances, advisory locks, notifications), so it only runs for
+plain reads: statements with a locking clause or calls to known
+side-effecting functions get the estimated plan (``EXPLAIN (FORMAT JSON)``)
+instead. Reads calling volatile user-defined functions cannot be recognized;
+pass ``analyze_reads=False`` when such functions have side effects.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import re
+import time
+from collections import deque
+from typing import Any, AsyncContextManager, Callable, Deque, Dict, List, Optional, Set
+
+from ..utils.query_fingerprint import TENANT_SCHEMA_PREFIX, fingerprint_id, fingerprint_query
+from ....infrastructure.monitoring.metrics_recorder import QuantileSketch
+
+logger = logging.getLogger(__name__)
+
+# Statements EXPLAIN accepts
+_EXPLAINABLE = frozenset({"select", "with", "insert", "update", "delete", "merge", "values", "table"})
+# Statements EXPLAIN ANALYZE may run without side effects
+_READ_ONLY = frozenset({"select", "values", "table"})
+# Row locks taken by ANALYZE would block other transactions until the rollback
+_LOCKING_CLAUSE = re.compile(
+    r"\bfor\s+(?:no\s+key\s+update|key\s+share|update|share)\b", re.I
+)
+# Calls whose effects survive a rollback or reach other sessions
+_SIDE_EFFECT_CALL = re.compile(
+    r"\b(?:nextval|setval|pg_notify|pg_advisory_\w*|pg_try_advisory_\w*|dblink\w*|lo_\w+"
+    r"|pg_cancel_backend|pg_terminate_backend|pg_reload_conf|pg_rotate_logfile)\s*\(",
+    re.I,
+)
+
+
+def _analyze_is_safe(query: str) -> bool:
+    """Whether ``query`` can run under ANALYZE without row locks or lasting side effects."""
+    return not (_LOCKING_CLAUSE.search(query) or _SIDE_EFFECT_CALL.search(query))
+
+
+class QueryTemplateStats:
+    """Aggregated statistics of one query template."""
+
+    __slots__ = (
+        "fingerprint", "id", "operation", "calls", "errors", "slow_calls", "total_ms", "max_ms",
+        "rows", "row_calls", "sketch", "explain_samples", "last_explain",
+    )
+
+    def __init__(self, fingerprint: str, max_explain_samples: int):
+        self.fingerprint = fingerprint
+        self.id = fingerprint_id(fingerprint)
+        self.operation = fingerprint.split(" ", 1)[0]
+        self.calls = 0
+        self.errors = 0
+        self.slow_calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.row_calls = 0
+        self.sketch = QuantileSketch()
+        self.explain_samples: Deque[Dict[str, Any]] = deque(maxlen=max_explain_samples)
+        self.last_explain = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        p50, p95, p99 = self.sketch.quantiles((0.5, 0.95, 0.99))
+        return {
+            "id": self.id,
+            "fingerprint": self.fingerprint,
+            "calls": self.calls,
+            "errors": self.errors,
+            "slow_calls": self.slow_calls,
+            "total_time_ms": round(self.total_ms, 2),
+            "mean_time_ms": round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+            "p50_time_ms": round(p50 or 0.0, 2),
+            "p95_time_ms": round(p95 or 0.0, 2),
+            "p99_time_ms": round(p99 or 0.0, 2),
+            "max_time_ms": round(self.max_ms, 2),
+            "rows": self.rows,
+            "mean_rows": round(self.rows / self.row_calls, 2) if self.row_calls else None,
+            "explain_samples": list(self.explain_samples),
+        }
+
+
+class QueryObserver:
+    """Aggregates statements per template and captures plans of slow ones."""
+
+    def __init__(
+        self,
+        connection_name: str = "default",
+        slow_query_threshold_ms: float = 100.0,
+        explain_connection: Optional[Callable[[], AsyncContextManager[Any]]] = None,
+        explain_interval_seconds: float = 600.0,
+        max_explains_per_minute: int = 6,
+        explain_timeout_seconds: float = 10.0,
+        analyze_reads: bool = True,
+        analyze_writes: bool = False,
+        max_templates: int = 2000,
+        max_explain_samples: int = 3,
+        tenant_schema_prefix: str = TENANT_SCHEMA_PREFIX,
+    ):
+        """Initialize observer.
+
+        Args:
+            connection_name: Connection the observed pool belongs to
+            slow_query_threshold_ms: Statements slower than this are logged
+                and may have their plan captured
+            explain_connection: Context manager factory yielding a spare
+                connection for EXPLAIN, or None when none is idle; None
+                disables plan capture
+            explain_interval_seconds: Minimum seconds between plans of one template
+            max_explains_per_minute: Plans captured per minute across all templates
+            explain_timeout_seconds: Statement timeout of an EXPLAIN run
+            analyze_reads: Run ANALYZE for reads without locking clauses or
+                side-effecting calls; otherwise reads only get their estimated plan
+            analyze_writes: Also run ANALYZE for writes (rolled back, but
+                sequence defaults still advance); otherwise writes only get
+                their estimated plan
+            max_templates: Templates tracked; further new templates are not tracked
+            max_explain_samples: Plans kept per template
+            tenant_schema_prefix: Prefix of tenant schema names
+        """
+        self.connection_name = connection_name
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self.explain_connection = explain_connection
+        self.explain_interval_seconds = explain_interval_seconds
+        self.max_explains_per_minute = max_explains_per_minute
+        self.explain_timeout_seconds = explain_timeout_seconds
+        self.analyze_reads = analyze_reads
+        self.analyze_writes = analyze_writes
+        self.max_templates = max_templates
+        self.max_explain_samples = max_explain_samples
+        self.tenant_schema_prefix = tenant_schema_prefix
+
+        self.queries = 0
+        self.untracked_queries = 0
+        self.explains = 0
+        self.explain_failures = 0
+        self.explains_skipped = 0
+        self._templates: Dict[str, QueryTemplateStats] = {}
+        self._explain_window_start = 0.0
+        self._explains_in_window = 0
+        self._explaining = False
+        self._tasks: Set[asyncio.Task] = set()
+
+    def observe(self, record: Any) -> None:
+        """asyncpg query logger callback (``connection.add_query_logger``)."""
+        query = record.query
+        if not query or query.lstrip()[:7].lower() == "explain":
+            return
+        elapsed_ms = record.elapsed * 1000
+        stats = self._template(query)
+        self.queries += 1
+        if stats is None:
+            self.untracked_queries += 1
+            return
+
+        stats.calls += 1
+        stats.total_ms += elapsed_ms
+        if elapsed_ms > stats.max_ms:
+            stats.max_ms = elapsed_ms
+        stats.sketch.add(elapsed_ms)
+        if record.exception is not None:
+            stats.errors += 1
+            return
+
+        if elapsed_ms >= self.slow_query_threshold_ms:
+            stats.slow_calls += 1
+            logger.warning(
+                "Slow query (%.2fms) on %s [%s]: %s",
+                elapsed_ms, self.connection_name, stats.id, stats.fingerprint[:200],
+            )
+            if self._should_explain(stats):
+                self._schedule_explain(stats, query, record.args)
+
+    def record_rows(self, query: str, rows: int) -> None:
+        """Add the row count of a statement whose result the caller saw."""
+        stats = self._templates.get(fingerprint_query(query, self.tenant_schema_prefix))
+        if stats is not None:
+            stats.rows += rows
+            stats.row_calls += 1
+
+    def top(self, limit: int = 10, order_by: str = "total_time_ms") -> List[Dict[str, Any]]:
+        """Templates ranked by ``total_time_ms``, ``calls``, ``max_time_ms`` or ``slow_calls``."""
+        key = {
+            "total_time_ms": lambda s: s.total_ms,
+            "calls": lambda s: s.calls,
+            "max_time_ms": lambda s: s.max_ms,
+            "slow_calls": lambda s: s.slow_calls,
+        }[order_by]
+        ranked = sorted(list(self._templates.values()), key=key, reverse=True)
+        return [stats.to_dict() for stats in ranked[:limit]]
+
+    def get_template(self, query_or_id: str) -> Optional[Dict[str, Any]]:
+        """Statistics of one template, by template id or by any query of it."""
+        for stats in list(self._templates.values()):
+            if stats.id == query_or_id:
+                return stats.to_dict()
+        stats = self._templates.get(fingerprint_query(query_or_id, self.tenant_schema_prefix))
+        return stats.to_dict() if stats else None
+
+    def get_stats(self, top: int = 10) -> Dict[str, Any]:
+        """Counters and the top templates by total time."""
+        return {
+            "queries": self.queries,
+            "templates": len(self._templates),
+            "untracked_queries": self.untracked_queries,
+            "slow_threshold_ms": self.slow_query_threshold_ms,
+            "explains": self.explains,
+            "explain_failures": self.explain_failures,
+            "explains_skipped": self.explains_skipped,
+            "top": self.top(top),
+        }
+
+    def reset(self) -> None:
+        """Drop all template statistics."""
+        self._templates.clear()
+        self.queries = 0
+        self.untracked_queries = 0
+
+    def _template(self, query: str) -> Optional[QueryTemplateStats]:
+        fingerprint = fingerprint_query(query, self.tenant_schema_prefix)
+        stats = self._templates.get(fingerprint)
+        if stats is None:
+            if len(self._templates) >= self.max_templates:
+                return None
+            stats = self._templates[fingerprint] = QueryTemplateStats(fingerprint, self.max_explain_samples)
+        return stats
+
+    def _should_explain(self, stats: QueryTemplateStats) -> bool:
+        if self.explain_connection is None or self._explaining or stats.operation not in _EXPLAINABLE:
+            return False
+        now = time.monotonic()
+        if stats.last_explain and now - stats.last_explain < self.explain_interval_seconds:
+            return False
+        if now - self._explain_window_start >= 60.0:
+            self._explain_window_start = now
+            self._explains_in_window = 0
+        if self._explains_in_window >= self.max_explains_per_minute:
+            return False
+        self._explains_in_window += 1
+        stats.last_explain = now
+        return True
+
+    def _schedule_explain(self, stats: QueryTemplateStats, query: str, args: Any) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._explaining = True
+        # A fresh context keeps the EXPLAIN run out of the caller's trace and request context
+        task = loop.create_task(self._explain(stats, query, tuple(args or ())), context=contextvars.Context())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _explain(self, stats: QueryTemplateStats, query: str, args: tuple) -> None:
+        if stats.operation in _READ_ONLY:
+            analyze = self.analyze_reads and _analyze_is_safe(query)
+        else:
+            analyze = self.analyze_writes and not _SIDE_EFFECT_CALL.search(query)
+        options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+        try:
+            async with self.explain_connection() as conn:
+                if conn is None:
+                    # No idle connection: never compete with requests for the pool
+                    self.explains_skipped += 1
+                    stats.last_explain = 0.0
+                    return
+                transaction = conn.transaction()
+                await transaction.start()
+                try:
+                    await conn.execute(
+                        f"SET LOCAL statement_timeout = {int(self.explain_timeout_seconds * 1000)}"
+                    )
+                    raw = await conn.fetchval(f"EXPLAIN ({options}) {query}", *args)
+                finally:
+                    await transaction.rollback()
+
+            plan = json.loads(raw) if isinstance(raw, str) else raw
+            plan = plan[0] if isinstance(plan, list) else plan
+            stats.explain_samples.append({
+                "captured_at": time.time(),
+                "analyzed": analyze,
+                "planning_time_ms": plan.get("Planning Time"),
+                "execution_time_ms": plan.get("Execution Time"),
+                "plan": plan.get("Plan"),
+            })
+            self.explains += 1
+            logger.info("Captured query plan of [%s] on %s", stats.id, self.connection_name)
+
+        except Exception as e:
+            self.explain_failures += 1
+            logger.debug("EXPLAIN of [%s] on %s failed: %s", stats.id, self.connection_name, e)
+
+        finally:
+            self._explaining = False
@@ -10,6 +10,7 @@ from typing import Dict, List, Optional, Any, AsyncContextManager
 from contextlib import asynccontextmanager
 
 from ....infrastructure.monitoring import critical_performance, medium_performance
+from ....infrastructure.tracing import SpanKind, traced
 
 from ..entities import (
     ConnectionManager,
@@ -167,6 +168,7 @@ class DatabaseService:
             yield connection
     
     @critical_performance(name="database.execute_query", include_args=True)
+    @traced("database.execute_query", SpanKind.CLIENT)
     async def execute_query(self,
                            connection_name: str,
                            query: str,
@@ -177,6 +179,7 @@ class DatabaseService:
             return await conn.fetch(query, *args, **kwargs)
     
     @critical_performance(name="database.execute_tenant_query", include_args=True)
+    @traced("database.execute_tenant_query", SpanKind.CLIENT)
     async def execute_tenant_query(self,
                                   tenant_id: str,
                                   query: str,
@@ -502,7 +505,7 @@ class DatabaseManager:
             # Register the admin connection
             await registry.register_connection(admin_connection)
             
-            logger.info(f"Initialized admin database connection: {admin_connection.safe_dsn}")
+            logger.info("Initialized admin database connection: %s", admin_connection.safe_dsn)
             
         except Exception as e:
             logger.error(f"Failed to initialize admin database connection: {e}")
@@ -596,13 +599,13 @@ class DatabaseManager:
                         # Register the connection
                         await registry.register_connection(connection)
                         loaded_count += 1
-                        logger.debug(f"Auto-loaded database connection: {connection.connection_name}")
+                        logger.debug("Auto-loaded database connection: %s", connection.connection_name)
                         
                     except Exception as connection_error:
                         logger.error(f"Failed to load database connection {row.get('connection_name', 'unknown')}: {connection_error}")
                         continue
                 
-                logger.info(f"Auto-loaded {loaded_count} database connections from admin.database_connections table")
+                logger.info("Auto-loaded %s database connections from admin.database_connections table", loaded_count)
                 
             finally:
                 await conn.close()
@@ -688,13 +691,13 @@ class DatabaseManager:
                     # Register the connection
                     await registry.register_connection(connection)
                     loaded_count += 1
-                    logger.debug(f"Auto-loaded database connection: {connection.connection_name}")
+                    logger.debug("Auto-loaded database connection: %s", connection.connection_name)
                     
                 except Exception as connection_error:
                     logger.error(f"Failed to load database connection {row.get('connection_name', 'unknown')}: {connection_error}")
                     continue
             
-            logger.info(f"Auto-loaded {loaded_count} database connections from admin.database_connections table with failover support")
+            logger.info("Auto-loaded %s database connections from admin.database_connections table with failover support", loaded_count)
             
         except Exception as e:
             # Log error but don't fail startup - failover system should handle degraded mode
@@ -811,7 +814,7 @@ class DatabaseManager:
             await redis_registry.sync_from_database(database_connections)
             sync_stats["connections_synced"] = len(database_connections)
             
-            logger.info(f"Redis registry sync completed: {sync_stats['connections_synced']} connections synced, {sync_stats['connections_failed']} failed")
+            logger.info("Redis registry sync completed: %s connections synced, %s failed", sync_stats['connections_synced'], sync_stats['connections_failed'])
             return sync_stats
             
         except Exception as e:
@@ -853,7 +856,7 @@ class DatabaseManager:
                     try:
                         await self.connection_registry.register_connection(conn)
                         reload_stats["added"].append(conn.connection_name)
-                        logger.info(f"Added new connection: {conn.connection_name}")
+                        logger.info("Added new connection: %s", conn.connection_name)
                     except Exception as e:
                         reload_stats["errors"].append(f"Failed to add {conn.connection_name}: {str(e)}")
             
@@ -865,7 +868,7 @@ class DatabaseManager:
                         if current_conn and self._connection_changed(current_conn, conn):
                             await self.connection_registry.update_connection(conn)
                             reload_stats["updated"].append(conn.connection_name)
-                            logger.info(f"Updated connection: {conn.connection_name}")
+                            logger.info("Updated connection: %s", conn.connection_name)
                     except Exception as e:
                         reload_stats["errors"].append(f"Failed to update {conn.connection_name}: {str(e)}")
             
@@ -876,7 +879,7 @@ class DatabaseManager:
                     if current_conn:
                         await self.connection_registry.remove_connection(current_conn.id)
                         reload_stats["removed"].append(conn_name)
-                        logger.info(f"Removed connection: {conn_name}")
+                        logger.info("Removed connection: %s", conn_name)
                 except Exception as e:
                     reload_stats["errors"].append(f"Failed to remove {conn_name}: {str(e)}")
             
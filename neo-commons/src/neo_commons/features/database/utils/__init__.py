@@ -27,6 +27,7 @@ from .error_handling import (
     handle_health_check_error,
 )
 from .admin_connection import AdminConnectionUtils
+from .query_fingerprint import fingerprint_query, fingerprint_id
 
 __all__ = [
     "validate_pool_configuration",
@@ -50,4 +51,6 @@ __all__ = [
     "handle_query_error",
     "handle_health_check_error",
     "AdminConnectionUtils",
+    "fingerprint_query",
+    "fingerprint_id",
 ]
\ No newline at end of file
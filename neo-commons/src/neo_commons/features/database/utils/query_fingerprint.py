@@ -0,0 +1,66 @@
+"""SQL fingerprinting for per-template query statistics.
+
+A fingerprint is the query text with literals, parameters and tenant schema
+names replaced by placeholders, so the same statement run against any
+tenant schema, with any values, maps to one template.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+
+# Tenant schemas are named "<prefix><slug>" (see DatabaseSettings.tenant_schema_prefix)
+TENANT_SCHEMA_PREFIX = "tenant_"
+TENANT_SCHEMA_PLACEHOLDER = "{tenant}"
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRINGS = re.compile(r"(?:\b[eEbBxXuU]&?)?'(?:[^']|'')*'")
+_DOLLAR_STRINGS = re.compile(r"\$(\w*)\$.*?\$\1\$", re.DOTALL)
+_PARAMETERS = re.compile(r"\$\d+")
+_NUMBERS = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_OPERATORS = re.compile(r" ?(-?[=<>!]+) ?")
+_COMMAS = re.compile(r" ?, ?")
+_OPEN_PARENS = re.compile(r"\( ")
+_CLOSE_PARENS = re.compile(r" \)")
+_IN_LISTS = re.compile(r"\(\?(?:, \?)*\)")
+_VALUES_ROWS = re.compile(r"\(\?\)(?:, \(\?\))+")
+
+
+@lru_cache(maxsize=1024)
+def _tenant_schema_pattern(prefix: str) -> "re.Pattern[str]":
+    return re.compile(rf'"?\b{re.escape(prefix)}\w+"?(?=\s*\.)', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def fingerprint_query(query: str, tenant_schema_prefix: str = TENANT_SCHEMA_PREFIX) -> str:
+    """Normalize a query to its template.
+
+    Comments are dropped, string and numeric literals and ``$n`` parameters
+    become ``?``, lists of placeholders collapse to ``(?)``, tenant schema
+    qualifiers become ``{tenant}`` and whitespace and case are normalized.
+
+    Args:
+        query: SQL text
+        tenant_schema_prefix: Prefix of tenant schema names
+
+    Returns:
+        Normalized query template
+    """
+    text = _COMMENTS.sub(" ", query)
+    text = _DOLLAR_STRINGS.sub("?", text)
+    text = _STRINGS.sub("?", text)
+    text = _tenant_schema_pattern(tenant_schema_prefix).sub(TENANT_SCHEMA_PLACEHOLDER, text)
+    text = _PARAMETERS.sub("?", text)
+    text = _NUMBERS.sub("?", text)
+    text = _WHITESPACE.sub(" ", text).strip().rstrip(";").strip().lower()
+    text = _OPERATORS.sub(r" \1 ", text)
+    text = _COMMAS.sub(", ", text)
+    text = _CLOSE_PARENS.sub(")", _OPEN_PARENS.sub("(", text))
+    text = _IN_LISTS.sub("(?)", text)
+    return _VALUES_ROWS.sub("(?)", text)
+
+
+def fingerprint_id(fingerprint: str) -> str:
+    """Short stable identifier of a fingerprint, for logs and reports."""
+    return hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest()
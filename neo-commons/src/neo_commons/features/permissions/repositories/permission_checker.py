@@ -20,6 +20,42 @@ class AsyncPGPermissionChecker(PermissionChecker):
         self.database_service = database_service
         self.permission_cache = permission_cache
     
+    @staticmethod
+    def build_permission_details(role_rows, direct_rows) -> Dict[str, Dict[str, Any]]:
+        """Merge role and direct permission rows into per-code details with their sources.
+        
+        Role rows carry ``role_name`` and ``role_code``; a permission granted
+        through several roles and/or directly keeps one entry with all sources.
+        """
+        permissions: Dict[str, Dict[str, Any]] = {}
+        
+        for source, rows in (('role', role_rows), ('direct', direct_rows)):
+            for row in rows:
+                perm_code = row['code']
+                if perm_code not in permissions:
+                    permissions[perm_code] = {
+                        'code': perm_code,
+                        'resource': row['resource'],
+                        'action': row['action'],
+                        'scope_level': row['scope_level'],
+                        'is_dangerous': row['is_dangerous'],
+                        'requires_mfa': row['requires_mfa'],
+                        'requires_approval': row['requires_approval'],
+                        'permission_config': row['permission_config'] or {},
+                        'sources': []
+                    }
+                
+                if source == 'role':
+                    permissions[perm_code]['sources'].append({
+                        'type': 'role',
+                        'role_name': row['role_name'],
+                        'role_code': row['role_code']
+                    })
+                else:
+                    permissions[perm_code]['sources'].append({'type': 'direct'})
+        
+        return permissions
+    
     def _validate_schema_name(self, schema_name: str) -> str:
         """Validate schema name to prevent SQL injection."""
         if schema_name == 'admin' or schema_name.startswith('tenant_'):
@@ -154,7 +190,7 @@ class AsyncPGPermissionChecker(PermissionChecker):
                 rows = await conn.fetch(query, user_id.value, scope_type, scope_id)
                 permissions = {row['code'] for row in rows}
                 
-                logger.debug(f"Found {len(permissions)} permissions for user {user_id.value} in {safe_schema}")
+                logger.debug("Found %s permissions for user %s in %s", len(permissions), user_id.value, safe_schema)
                 return permissions
                 
         except Exception as e:
@@ -224,7 +260,7 @@ class AsyncPGPermissionChecker(PermissionChecker):
                     )
                     roles.append(role)
                 
-                logger.debug(f"Found {len(roles)} roles for user {user_id.value} in {safe_schema}")
+                logger.debug("Found %s roles for user %s in %s", len(roles), user_id.value, safe_schema)
                 return roles
                 
         except Exception as e:
@@ -279,49 +315,7 @@ class AsyncPGPermissionChecker(PermissionChecker):
                 role_rows = await conn.fetch(role_perms_query, user_id.value)
                 direct_rows = await conn.fetch(direct_perms_query, user_id.value)
                 
-                permissions = {}
-                
-                # Process role permissions
-                for row in role_rows:
-                    perm_code = row['code']
-                    if perm_code not in permissions:
-                        permissions[perm_code] = {
-                            'code': perm_code,
-                            'resource': row['resource'],
-                            'action': row['action'],
-                            'scope_level': row['scope_level'],
-                            'is_dangerous': row['is_dangerous'],
-                            'requires_mfa': row['requires_mfa'],
-                            'requires_approval': row['requires_approval'],
-                            'permission_config': row['permission_config'] or {},
-                            'sources': []
-                        }
-                    
-                    permissions[perm_code]['sources'].append({
-                        'type': 'role',
-                        'role_name': row['role_name'],
-                        'role_code': row['role_code']
-                    })
-                
-                # Process direct permissions
-                for row in direct_rows:
-                    perm_code = row['code']
-                    if perm_code not in permissions:
-                        permissions[perm_code] = {
-                            'code': perm_code,
-                            'resource': row['resource'],
-                            'action': row['action'],
-                            'scope_level': row['scope_level'],
-                            'is_dangerous': row['is_dangerous'],
-                            'requires_mfa': row['requires_mfa'],
-                            'requires_approval': row['requires_approval'],
-                            'permission_config': row['permission_config'] or {},
-                            'sources': []
-                        }
-                    
-                    permissions[perm_code]['sources'].append({
-                        'type': 'direct'
-                    })
+                permissions = self.build_permission_details(role_rows, direct_rows)
                 
                 return {
                     'user_id': user_id.value,
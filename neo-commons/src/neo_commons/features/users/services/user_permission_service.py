@@ -18,6 +18,33 @@ class UserPermissionService:
         self.database_service = database_service
         self.permission_checker = AsyncPGPermissionChecker(database_service, permission_cache)
     
+    @staticmethod
+    def format_permission_metadata(permission_details: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Format permission details as the ``rich_permissions`` list of an auth context.
+        
+        Permissions are grouped by resource (in first-seen order) and carry
+        their metadata without the grant sources.
+        """
+        permissions_by_resource: Dict[str, List[Dict[str, Any]]] = {}
+        
+        for perm_detail in permission_details:
+            permissions_by_resource.setdefault(perm_detail['resource'], []).append({
+                'code': perm_detail['code'],
+                'resource': perm_detail['resource'],
+                'action': perm_detail['action'],
+                'scope_level': perm_detail['scope_level'],
+                'is_dangerous': perm_detail['is_dangerous'],
+                'requires_mfa': perm_detail['requires_mfa'],
+                'requires_approval': perm_detail['requires_approval'],
+                'permission_config': perm_detail['permission_config']
+            })
+        
+        # Flatten permissions from by_resource into a simple list
+        flattened_permissions = []
+        for resource_permissions in permissions_by_resource.values():
+            flattened_permissions.extend(resource_permissions)
+        return flattened_permissions
+    
     async def get_user_auth_context(
         self,
         user_id: UserId,
@@ -50,42 +77,9 @@ class UserPermissionService:
                     'priority': role.priority
                 })
             
-            # Categorize permissions by resource with full metadata
-            permissions_by_resource = {}
-            dangerous_permissions = []
-            mfa_required_permissions = []
-            approval_required_permissions = []
-            
-            for perm_detail in permission_details.get('permissions', []):
-                resource = perm_detail['resource']
-                if resource not in permissions_by_resource:
-                    permissions_by_resource[resource] = []
-                
-                perm_info = {
-                    'code': perm_detail['code'],
-                    'resource': perm_detail['resource'],
-                    'action': perm_detail['action'],
-                    'scope_level': perm_detail['scope_level'],
-                    'is_dangerous': perm_detail['is_dangerous'],
-                    'requires_mfa': perm_detail['requires_mfa'],
-                    'requires_approval': perm_detail['requires_approval'],
-                    'permission_config': perm_detail['permission_config']
-                }
-                
-                permissions_by_resource[resource].append(perm_info)
-                
-                # Track special permission categories
-                if perm_detail['is_dangerous']:
-                    dangerous_permissions.append(perm_detail['code'])
-                if perm_detail['requires_mfa']:
-                    mfa_required_permissions.append(perm_detail['code'])
-                if perm_detail['requires_approval']:
-                    approval_required_permissions.append(perm_detail['code'])
-            
-            # Flatten permissions from by_resource into a simple list
-            flattened_permissions = []
-            for resource_permissions in permissions_by_resource.values():
-                flattened_permissions.extend(resource_permissions)
+            flattened_permissions = self.format_permission_metadata(
+                permission_details.get('permissions', [])
+            )
             
             return {
                 'user_id': user_id.value,
@@ -4,6 +4,7 @@ import logging
 from typing import Optional, Dict, Any
 
 from ....core.value_objects import UserId
+from ...auth.repositories.user_mapping_cache import UserMappingCache, get_user_mapping_cache
 from ..entities.user import User
 from ..repositories.user_repository import UserRepository
 
@@ -13,9 +14,14 @@ logger = logging.getLogger(__name__)
 class UserService:
     """Service for user business logic."""
     
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        user_mapping_cache: Optional[UserMappingCache] = None,
+    ):
         """Initialize user service."""
         self.user_repository = user_repository
+        self.user_mapping_cache = user_mapping_cache or get_user_mapping_cache()
     
     async def sync_keycloak_user(
         self,
@@ -38,6 +44,10 @@ class UserService:
             schema_name=schema_name
         )
         
+        # Replace any stale or negative mapping with the synced user
+        self.user_mapping_cache.invalidate(external_user_id, schema_name)
+        self.user_mapping_cache.put(external_user_id, user_id, schema_name)
+        
         # Update last login timestamp
         await self.user_repository.update_last_login(user_id, schema_name)
         
@@ -6,6 +6,8 @@ Core infrastructure components that serve all features and services:
 - fastapi/: FastAPI application factory and configuration
 - protocols/: Infrastructure contracts and interfaces
 - monitoring/: Performance monitoring and metrics collection
+- logging/: Non-blocking structured logging pipeline
+- tracing/: Distributed tracing and trace context propagation
 """
 
 # Configuration infrastructure
@@ -272,6 +272,8 @@ class FastAPIConfig:
     enable_logging: bool = True
     enable_performance_monitoring: bool = True
     enable_error_handling: bool = True
+    enable_metrics: bool = True
+    metrics_path: str = "/metrics"
     
     # Database and cache
     database_url: Optional[str] = None
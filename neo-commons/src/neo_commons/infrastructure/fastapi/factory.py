@@ -7,7 +7,7 @@ proper middleware configuration, and service-specific customization.
 import logging
 from typing import Optional, Dict, Any, Callable, List, TYPE_CHECKING
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
@@ -29,6 +29,12 @@ from .config import (
 from .middleware_setup import setup_middleware_stack
 from .dependencies import configure_dependency_overrides
 from ..middleware import MiddlewareFactory
+from ..monitoring.metrics_registry import MetricsRegistry, get_metrics_registry
+from ..monitoring.metrics_collectors import (
+    register_cache_repository,
+    register_connection_pools,
+    register_performance_monitor,
+)
 # from ...features.users.services import UserService  # TODO: Enable when UserService is implemented
 from ...features.cache.services import CacheService
 # from ...features.tenants.services import TenantService  # TODO: Enable when TenantService is implemented
@@ -49,12 +55,14 @@ class FastAPIFactory:
         user_service: Optional["UserService"] = None,
         cache_service: Optional[CacheService] = None,
         tenant_service: Optional["TenantService"] = None,
-        database_service: Optional[DatabaseService] = None
+        database_service: Optional[DatabaseService] = None,
+        metrics_registry: Optional[MetricsRegistry] = None
     ):
         self.user_service = user_service
         self.cache_service = cache_service
         self.tenant_service = tenant_service
         self.database_service = database_service
+        self.metrics_registry = metrics_registry
         self._middleware_factory: Optional[MiddlewareFactory] = None
     
     def create_app(
@@ -147,6 +155,10 @@ class FastAPIFactory:
         # Add health check endpoints
         self._add_health_endpoints(app, config)
         
+        # Add Prometheus/OpenMetrics endpoint
+        if config.enable_metrics:
+            self._add_metrics_endpoint(app, config)
+        
         logger.info(
             f"Created {config.service_type.value} FastAPI application",
             extra={
@@ -284,6 +296,24 @@ class FastAPIFactory:
             middleware_factory=self._middleware_factory
         )
     
+    def _add_metrics_endpoint(self, app: FastAPI, config: FastAPIConfig) -> None:
+        """Expose built-in metrics for Prometheus scraping."""
+        registry = self.metrics_registry or get_metrics_registry()
+        app.state.metrics_registry = registry
+        
+        # Components owned by the factory; middleware registers itself on creation
+        register_performance_monitor(registry)
+        if self.database_service and hasattr(self.database_service.connection_manager, "get_all_pool_metrics"):
+            register_connection_pools(registry, self.database_service.connection_manager)
+        if self.cache_service and hasattr(self.cache_service, "get_stats"):
+            register_cache_repository(registry, self.cache_service, "default")
+        
+        @app.get(config.metrics_path, include_in_schema=False)
+        async def metrics(request: Request):
+            """Prometheus/OpenMetrics exposition (cached, bounded per metric)."""
+            payload, content_type = await registry.render(request.headers.get("accept"))
+            return Response(content=payload, headers={"Content-Type": content_type})
+    
     def _add_health_endpoints(self, app: FastAPI, config: FastAPIConfig) -> None:
         """Add standard health check endpoints."""
         
@@ -0,0 +1,41 @@
+"""Non-blocking structured logging infrastructure.
+
+Provides a queue-based handler with a background writer thread, a fast JSON
+formatter, lazily computed log values, per-logger sampling of hot-path
+records and redaction with patterns compiled once.
+"""
+
+from .encoding import LazyValue, lazy, dumps
+from .redaction import Redactor, DEFAULT_SENSITIVE_FIELDS, DEFAULT_SENSITIVE_HEADERS
+from .sampling import SamplingFilter
+from .pipeline import (
+    AsyncLogWriter,
+    QueueLogHandler,
+    JSONLogFormatter,
+    configure_async_logging,
+    shutdown_async_logging,
+    get_log_writer,
+)
+
+__all__ = [
+    # Encoding
+    "LazyValue",
+    "lazy",
+    "dumps",
+
+    # Redaction
+    "Redactor",
+    "DEFAULT_SENSITIVE_FIELDS",
+    "DEFAULT_SENSITIVE_HEADERS",
+
+    # Sampling
+    "SamplingFilter",
+
+    # Pipeline
+    "AsyncLogWriter",
+    "QueueLogHandler",
+    "JSONLogFormatter",
+    "configure_async_logging",
+    "shutdown_async_logging",
+    "get_log_writer",
+]
@@ -0,0 +1,61 @@
+"""Fast JSON encoding and lazily computed values for log records.
+
+``orjson`` is used when installed, otherwise a pre-configured stdlib encoder.
+Values wrapped with ``lazy`` are only computed when a record is actually
+encoded, which with the async pipeline happens on the log writer thread.
+"""
+
+import json
+from datetime import date, datetime, time
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class LazyValue:
+    """Value computed on first use, e.g. a redacted request body."""
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any):
+        self.func = func
+        self.args = args
+
+    def resolve(self) -> Any:
+        return self.func(*self.args)
+
+    def __str__(self) -> str:
+        return str(self.resolve())
+
+    __repr__ = __str__
+
+
+def lazy(func: Callable[..., Any], *args: Any) -> LazyValue:
+    """Defer ``func(*args)`` until the log record is encoded."""
+    return LazyValue(func, *args)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, LazyValue):
+        return value.resolve()
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    # UUIDs, Decimals, value objects: their string form
+    return str(value)
+
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default)
+
+
+def dumps(value: Any) -> str:
+    """Encode a value as compact JSON, resolving lazy values."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return _encoder.encode(value)
@@ -0,0 +1,276 @@
+"""Queue-based logging pipeline with a background writer thread.
+
+``QueueLogHandler`` replaces a regular handler on the logger side. Emitting
+a record only applies the level and filters and puts the record on a bounded
+queue; it never formats, never takes the wrapped handler's lock and never
+blocks. The ``AsyncLogWriter`` thread formats records (``%``-style arguments
+are merged there, tracebacks rendered there) and calls the wrapped handlers,
+so stream, file or network I/O stays off the event loop. When the queue is
+full, records are dropped and counted instead of stalling the caller.
+
+Writers installed by ``configure_async_logging`` start their thread with the
+first record, so importing and configuring starts no thread. Threads do not
+survive ``fork()``: in a forked child every writer drops the parent's queue
+and restarts its thread on the child's first record.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import weakref
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .encoding import dumps
+from .redaction import Redactor
+from .sampling import SamplingFilter
+
+_STOP = object()
+
+# Every writer, so forked children can reset them
+_writers: "weakref.WeakSet[AsyncLogWriter]" = weakref.WeakSet()
+
+
+class AsyncLogWriter:
+    """Background thread that formats and writes records for ``QueueLogHandler``s."""
+
+    def __init__(self, queue_size: int = 10000, autostart: bool = False):
+        """Initialize writer.
+
+        Args:
+            queue_size: Records buffered before new ones are dropped
+            autostart: Start the thread when the first record is submitted
+        """
+        self._queue: queue.Queue = queue.Queue(queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._start_on_submit = autostart
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        _writers.add(self)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the writer thread (idempotent)."""
+        with self._start_lock:
+            if self.running:
+                return
+            self._thread = threading.Thread(target=self._run, name="neo-log-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Write all queued records, then stop the writer thread."""
+        self._start_on_submit = False
+        if not self.running:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, handler: logging.Handler, record: logging.LogRecord) -> bool:
+        """Queue a record for ``handler``; returns False when it was dropped."""
+        if self._start_on_submit and self._thread is None:
+            self.start()
+        try:
+            self._queue.put_nowait((handler, record))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    def _after_fork_in_child(self) -> None:
+        """Reset the state copied from the parent, whose thread was not copied."""
+        self._start_on_submit = self._start_on_submit or self._thread is not None
+        self._queue = queue.Queue(self._queue.maxsize)
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def _run(self) -> None:
+        get = self._queue.get
+        while True:
+            item = get()
+            if item is _STOP:
+                break
+            handler, record = item
+            try:
+                handler.handle(record)
+                self.written += 1
+            except Exception:
+                self.failed += 1
+                handler.handleError(record)
+
+
+class QueueLogHandler(logging.Handler):
+    """Hands records for a wrapped handler to an ``AsyncLogWriter``.
+
+    Records are passed on unformatted; as with any logging call, objects
+    passed as message arguments must not be mutated after logging.
+    """
+
+    def __init__(self, handler: logging.Handler, writer: AsyncLogWriter):
+        """Initialize handler.
+
+        Args:
+            handler: Handler that formats and writes on the writer thread
+            writer: Writer owning the queue and thread
+        """
+        super().__init__(handler.level)
+        self.handler = handler
+        self.writer = writer
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # The queue is thread-safe; no handler lock on the logging path
+        result = self.filter(record)
+        if isinstance(result, logging.LogRecord):
+            record = result
+        if result:
+            self.emit(record)
+        return bool(result)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.writer.submit(self.handler, record)
+
+    def flush(self) -> None:
+        self.handler.flush()
+
+    def close(self) -> None:
+        self.handler.close()
+        super().close()
+
+
+class JSONLogFormatter(logging.Formatter):
+    """Formats records as one JSON object per line.
+
+    ``extra={"structured_data": {...}}`` fields are merged into the object.
+    With a ``Redactor``, structured data and the message are redacted here,
+    on the writer thread when used behind a ``QueueLogHandler``.
+    """
+
+    def __init__(self, redactor: Optional[Redactor] = None, static_fields: Optional[Mapping[str, Any]] = None):
+        """Initialize formatter.
+
+        Args:
+            redactor: Redacts structured data and message text
+            static_fields: Fields added to every record (service name, environment)
+        """
+        super().__init__()
+        self.redactor = redactor
+        self.static_fields = dict(static_fields or {})
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        entry: Dict[str, Any] = dict(self.static_fields)
+
+        structured = getattr(record, "structured_data", None)
+        if structured:
+            entry.update(self.redactor.redact(structured) if self.redactor else structured)
+        if self.redactor:
+            message = self.redactor.redact_text(message)
+
+        entry["time"] = datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds")
+        entry["level"] = record.levelname
+        entry["logger"] = record.name
+        entry["message"] = message
+        sample_rate = getattr(record, "sample_rate", None)
+        if sample_rate is not None:
+            entry["sample_rate"] = sample_rate
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return dumps(entry)
+
+
+_writer: Optional[AsyncLogWriter] = None
+_replaced: List[Tuple[logging.Logger, logging.Handler, QueueLogHandler]] = []
+
+
+def configure_async_logging(
+    loggers: Optional[Iterable[str]] = None,
+    queue_size: int = 10000,
+    sampling: Optional[SamplingFilter] = None,
+) -> AsyncLogWriter:
+    """Move logger handlers behind a shared background writer.
+
+    Handlers attached to the root logger and to every configured logger (or
+    only ``loggers``, when given) are wrapped in ``QueueLogHandler``s; a
+    handler shared by several loggers gets a single wrapper. Calling this
+    again first restores the previous configuration.
+
+    Args:
+        loggers: Logger names to convert besides the root logger
+        queue_size: Records buffered before new ones are dropped
+        sampling: Filter sampling DEBUG/INFO records before they are queued
+
+    Returns:
+        The writer; its thread starts with the first record
+    """
+    global _writer
+    shutdown_async_logging()
+
+    writer = AsyncLogWriter(queue_size, autostart=True)
+    if loggers is None:
+        names = [name for name, item in logging.Logger.manager.loggerDict.items() if isinstance(item, logging.Logger)]
+    else:
+        names = list(loggers)
+
+    wrappers: Dict[int, QueueLogHandler] = {}
+    for target in [logging.getLogger()] + [logging.getLogger(name) for name in names]:
+        for handler in list(target.handlers):
+            if isinstance(handler, QueueLogHandler):
+                continue
+            wrapper = wrappers.get(id(handler))
+            if wrapper is None:
+                wrapper = wrappers[id(handler)] = QueueLogHandler(handler, writer)
+                if sampling is not None:
+                    wrapper.addFilter(sampling)
+            target.removeHandler(handler)
+            target.addHandler(wrapper)
+            _replaced.append((target, handler, wrapper))
+
+    _writer = writer
+    return writer
+
+
+def shutdown_async_logging() -> None:
+    """Write queued records and restore the original handlers."""
+    global _writer
+    for target, handler, wrapper in reversed(_replaced):
+        target.removeHandler(wrapper)
+        target.addHandler(handler)
+    _replaced.clear()
+    if _writer is not None:
+        _writer.stop()
+        _writer = None
+
+
+def get_log_writer() -> Optional[AsyncLogWriter]:
+    """The writer installed by ``configure_async_logging``, if any."""
+    return _writer
+
+
+def _after_fork_in_child() -> None:
+    for writer in list(_writers):
+        writer._after_fork_in_child()
+
+
+atexit.register(shutdown_async_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
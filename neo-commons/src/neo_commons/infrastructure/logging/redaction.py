@@ -0,0 +1,108 @@
+"""Redaction of sensitive values in logged headers, data and text.
+
+All patterns are compiled once per ``Redactor``, and the sensitive-or-not
+decision for each field name is cached, so redacting a record is a dict
+lookup per key rather than a scan over every sensitive field.
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from .encoding import LazyValue
+
+DEFAULT_SENSITIVE_FIELDS = ("password", "token", "secret", "key", "credentials")
+DEFAULT_SENSITIVE_HEADERS = ("authorization", "cookie", "x-api-key", "x-auth-token")
+
+MASK = "***"
+
+
+def _mask(value: Any, head: int, tail: int) -> Any:
+    if isinstance(value, str) and len(value) > 8:
+        if MASK in value:
+            # Already redacted
+            return value
+        return f"{value[:head]}{MASK}{value[-tail:]}"
+    return MASK
+
+
+class Redactor:
+    """Masks sensitive headers, fields (matched by substring) and ``key=value`` text."""
+
+    def __init__(
+        self,
+        sensitive_fields: Optional[Iterable[str]] = None,
+        sensitive_headers: Optional[Iterable[str]] = None,
+        max_cached_keys: int = 4096,
+    ):
+        """Initialize redactor.
+
+        Args:
+            sensitive_fields: Substrings marking a field name as sensitive
+            sensitive_headers: Header names (case-insensitive) to mask
+            max_cached_keys: Field names whose decision is cached
+        """
+        fields = [field.lower() for field in (sensitive_fields or DEFAULT_SENSITIVE_FIELDS)]
+        self.sensitive_fields = tuple(fields)
+        self.sensitive_headers = frozenset(
+            header.lower() for header in (sensitive_headers or DEFAULT_SENSITIVE_HEADERS)
+        )
+        alternation = "|".join(re.escape(field) for field in fields)
+        self._field_pattern = re.compile(alternation, re.IGNORECASE) if fields else None
+        self._text_pattern = re.compile(
+            r"(?P<key>[\"']?[\w-]*(?:%s)[\w-]*[\"']?\s*[:=]\s*[\"']?)(?P<value>[^\"'\s,;&}]+)" % alternation,
+            re.IGNORECASE,
+        ) if fields else None
+        self._key_cache: Dict[str, bool] = {}
+        self._max_cached_keys = max_cached_keys
+
+    def is_sensitive_field(self, key: str) -> bool:
+        """Whether a field name contains one of the sensitive substrings."""
+        sensitive = self._key_cache.get(key)
+        if sensitive is None:
+            sensitive = bool(self._field_pattern and self._field_pattern.search(key))
+            if len(self._key_cache) < self._max_cached_keys:
+                self._key_cache[key] = sensitive
+        return sensitive
+
+    def redact_headers(self, headers: Mapping[str, str]) -> Dict[str, str]:
+        """Copy of ``headers`` with sensitive values masked."""
+        sensitive_headers = self.sensitive_headers
+        return {
+            key: _mask(value, 4, 4) if key.lower() in sensitive_headers else value
+            for key, value in headers.items()
+        }
+
+    def redact(self, data: Any) -> Any:
+        """Recursively mask sensitive fields in dicts and lists, resolving lazy values."""
+        if isinstance(data, LazyValue):
+            data = data.resolve()
+        if isinstance(data, dict):
+            return {
+                key: _mask(value, 3, 2) if isinstance(key, str) and self.is_sensitive_field(key)
+                else self.redact(value)
+                for key, value in data.items()
+            }
+        if isinstance(data, (list, tuple)):
+            return [self.redact(item) for item in data]
+        return data
+
+    def redact_text(self, text: str) -> str:
+        """Mask values of ``field=value`` and ``"field": "value"`` pairs in free text."""
+        if self._text_pattern is None:
+            return text
+        return self._text_pattern.sub(lambda match: match.group("key") + MASK, text)
+
+    def redact_body(self, body: str, max_size: Optional[int] = None) -> Any:
+        """Redact a request or response body.
+
+        Returns:
+            The parsed, redacted JSON value, or the (truncated) redacted text
+            when the body is not JSON
+        """
+        try:
+            return self.redact(json.loads(body))
+        except (ValueError, TypeError):
+            if max_size is not None and len(body) > max_size:
+                body = body[:max_size] + "..."
+            return self.redact_text(body)
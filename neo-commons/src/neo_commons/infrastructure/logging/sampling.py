@@ -0,0 +1,67 @@
+"""Per-logger sampling of hot-path DEBUG and INFO records."""
+
+import logging
+from typing import Dict, Mapping, Optional
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps one in N low-level records per logger; WARNING and above always pass.
+
+    Rates are configured per logger name prefix, the longest matching prefix
+    wins (``""`` matches every logger). Sampling is counter based rather than
+    random, so a burst from one hot path is thinned evenly. Kept records get
+    a ``sample_rate`` attribute so counts can be scaled back up.
+    """
+
+    def __init__(self, rates: Mapping[str, float], max_level: int = logging.INFO):
+        """Initialize filter.
+
+        Args:
+            rates: Fraction of records to keep (0..1) per logger name prefix
+            max_level: Highest level that is sampled
+        """
+        super().__init__()
+        self.rates = dict(rates)
+        self.max_level = max_level
+        self.dropped = 0
+        self._prefixes = sorted(self.rates, key=len, reverse=True)
+        self._intervals: Dict[str, int] = {}
+        self._counters: Dict[str, int] = {}
+
+    @classmethod
+    def from_string(cls, spec: str, max_level: int = logging.INFO) -> Optional["SamplingFilter"]:
+        """Build from ``"logger=rate,other.logger=rate"``; None when empty."""
+        rates = {}
+        for item in spec.split(","):
+            name, sep, rate = item.strip().rpartition("=")
+            if sep:
+                rates[name.strip()] = float(rate)
+        return cls(rates, max_level) if rates else None
+
+    def _interval(self, name: str) -> int:
+        interval = self._intervals.get(name)
+        if interval is None:
+            interval = 1
+            for prefix in self._prefixes:
+                if not prefix or name == prefix or name.startswith(prefix + "."):
+                    rate = self.rates[prefix]
+                    # 0 drops everything, 1 keeps everything
+                    interval = 0 if rate <= 0 else max(1, round(1 / rate))
+                    break
+            self._intervals[name] = interval
+        return interval
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        interval = self._interval(record.name)
+        if interval == 1:
+            return True
+        if interval:
+            count = self._counters.get(record.name, 0)
+            self._counters[record.name] = count + 1
+            if count % interval == 0:
+                record.sample_rate = 1 / interval
+                return True
+        self.dropped += 1
+        return False
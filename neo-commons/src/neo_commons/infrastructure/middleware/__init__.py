@@ -9,8 +9,11 @@ security, and performance monitoring following Feature-First + Clean Core archit
 # from .tenant_middleware import TenantContextMiddleware, MultiTenantDatabaseMiddleware  # TODO: Enable when TenantService is implemented  
 from .logging_middleware import StructuredLoggingMiddleware, RequestContextLoggerAdapter
 from .security_middleware import SecurityMiddleware, CORSMiddleware, RateLimitMiddleware
+from .rate_limiter import RateLimit, RateLimitDecision, RateLimiter
 from .performance_middleware import PerformanceMiddleware, TimingMiddleware, DatabasePerformanceMiddleware
 from .error_middleware import ErrorHandlingMiddleware, ValidationErrorHandler, DatabaseErrorHandler
+from .tracing_middleware import TracingMiddleware
+from .asgi import ASGIMiddleware, CombinedMiddleware, HTTPRequestContext
 from .factory import MiddlewareFactory, create_middleware_factory
 # from .dependencies import (  # TODO: Enable when services are implemented
 #     get_current_user,
@@ -44,12 +47,19 @@ __all__ = [
     "SecurityMiddleware",
     "CORSMiddleware",
     "RateLimitMiddleware",
+    "RateLimit",
+    "RateLimitDecision",
+    "RateLimiter",
     "PerformanceMiddleware",
     "TimingMiddleware",
     "DatabasePerformanceMiddleware",
     "ErrorHandlingMiddleware",
     "ValidationErrorHandler",
     "DatabaseErrorHandler",
+    "TracingMiddleware",
+    "ASGIMiddleware",
+    "CombinedMiddleware",
+    "HTTPRequestContext",
     
     # Factory and configuration
     "MiddlewareFactory",
@@ -0,0 +1,256 @@
+"""Pure-ASGI middleware base and combined middleware pass.
+
+``BaseHTTPMiddleware`` runs the downstream app in a separate task and
+proxies every response through a memory stream. Stacked six deep, that is
+six task hops and response wrappers per request, which dominates the
+latency of small requests and interferes with streaming responses.
+
+Middlewares here are plain ASGI callables built from request hooks:
+
+- ``on_request(ctx)``: before the app runs; raise to reject the request
+- ``on_response_start(ctx, headers)``: mutate response headers in place
+- ``on_error(ctx, exc)``: return a response to handle the exception,
+  ``None`` to let it propagate, or raise a different exception
+- ``on_complete(ctx)``: after the response body was sent (or on error)
+
+Each middleware can be added on its own, or several can run as stages of a
+single ``CombinedMiddleware`` pass that shares one ``HTTPRequestContext``
+and wraps ``send`` once. Stage semantics match nesting the same
+middlewares outer to inner.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPRequestContext:
+    """Per-request state shared by all middleware stages."""
+
+    __slots__ = (
+        "scope", "receive", "start_time", "status_code", "response_started",
+        "response_time", "error", "values", "_request", "_headers", "_client_ip",
+    )
+
+    def __init__(self, scope: Scope, receive: Receive):
+        self.scope = scope
+        self.receive = receive
+        self.start_time = time.perf_counter()
+        self.status_code: Optional[int] = None
+        self.response_started = False
+        # Seconds from request start to response start
+        self.response_time: Optional[float] = None
+        # Exception raised further in, even if an outer stage handled it
+        self.error: Optional[BaseException] = None
+        # Stage-private values, keyed by stage
+        self.values: Dict[str, Any] = {}
+        self._request: Optional[Request] = None
+        self._headers: Optional[Headers] = None
+        self._client_ip: Optional[str] = None
+
+    @property
+    def request(self) -> Request:
+        """Starlette request view of the scope (``request.state`` is shared with the app)."""
+        if self._request is None:
+            self._request = Request(self.scope, self.receive)
+        return self._request
+
+    @property
+    def headers(self) -> Headers:
+        if self._headers is None:
+            self._headers = Headers(scope=self.scope)
+        return self._headers
+
+    @property
+    def method(self) -> str:
+        return self.scope["method"]
+
+    @property
+    def path(self) -> str:
+        return self.scope["path"]
+
+    @property
+    def route_template(self) -> str:
+        """Matched route template once routing ran, so path parameters don't create new series."""
+        return getattr(self.scope.get("route"), "path", None) or "unmatched"
+
+    @property
+    def client_ip(self) -> str:
+        """Client IP from forwarding headers or the connection."""
+        if self._client_ip is None:
+            headers = self.headers
+            forwarded_for = headers.get("x-forwarded-for")
+            if forwarded_for:
+                self._client_ip = forwarded_for.split(",")[0].strip()
+            else:
+                client = self.scope.get("client")
+                self._client_ip = headers.get("x-real-ip") or (client[0] if client else "unknown")
+        return self._client_ip
+
+    def elapsed(self) -> float:
+        """Seconds since the request started."""
+        return time.perf_counter() - self.start_time
+
+
+class ASGIMiddleware:
+    """Base class for pure-ASGI HTTP middleware defined by request hooks.
+
+    Subclasses override the hooks they need; hooks that are not overridden
+    cost nothing per request. Non-HTTP scopes pass straight through.
+    """
+
+    exempt_paths: Sequence[str] = ()
+
+    def __init__(self, app: Optional[ASGIApp] = None):
+        """Initialize middleware.
+
+        Args:
+            app: Downstream ASGI app; None when used as a ``CombinedMiddleware`` stage
+        """
+        self.app = app
+        self._plan: Optional[_StagePlan] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        plan = self._plan
+        if plan is None:
+            plan = self._plan = _StagePlan((self,))
+        await _run_stages(self.app, plan, scope, receive, send)
+
+    def applies(self, ctx: HTTPRequestContext) -> bool:
+        """Whether this middleware handles the request (``exempt_paths`` prefixes are skipped)."""
+        exempt_paths = self.exempt_paths
+        return not (exempt_paths and ctx.path.startswith(tuple(exempt_paths)))
+
+    async def on_request(self, ctx: HTTPRequestContext) -> None:
+        """Called before the app; raise to reject the request."""
+
+    def on_response_start(self, ctx: HTTPRequestContext, headers: MutableHeaders) -> None:
+        """Called when the response starts; mutate ``headers`` in place."""
+
+    async def on_error(self, ctx: HTTPRequestContext, exc: Exception) -> Optional[Response]:
+        """Called for exceptions raised further in; return a response to handle it."""
+        return None
+
+    async def on_complete(self, ctx: HTTPRequestContext) -> None:
+        """Called after the response was sent or the request failed."""
+
+
+def _overrides(stage: ASGIMiddleware, hook: str) -> bool:
+    return getattr(type(stage), hook) is not getattr(ASGIMiddleware, hook)
+
+
+class _StagePlan:
+    """Stages with the hooks each one actually overrides, computed once."""
+
+    __slots__ = ("stages", "filtered", "request", "response_start", "error", "complete")
+
+    def __init__(self, stages: Sequence[ASGIMiddleware]):
+        self.stages = tuple(stages)
+        self.filtered = any(stage.exempt_paths or _overrides(stage, "applies") for stage in self.stages)
+        self.request = tuple(_overrides(stage, "on_request") for stage in self.stages)
+        self.response_start = tuple(_overrides(stage, "on_response_start") for stage in self.stages)
+        self.error = tuple(_overrides(stage, "on_error") for stage in self.stages)
+        self.complete = tuple(_overrides(stage, "on_complete") for stage in self.stages)
+
+
+async def _run_stages(app: ASGIApp, plan: _StagePlan, scope: Scope, receive: Receive, send: Send) -> None:
+    ctx = HTTPRequestContext(scope, receive)
+    if plan.filtered:
+        indexes = [i for i, stage in enumerate(plan.stages) if stage.applies(ctx)]
+    else:
+        indexes = list(range(len(plan.stages)))
+    if not indexes:
+        await app(scope, receive, send)
+        return
+
+    stages = plan.stages
+    entered = 0
+    # Stages whose response headers hooks see the response (outer to inner)
+    visible: List[int] = indexes
+
+    async def send_wrapper(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            ctx.status_code = message["status"]
+            ctx.response_time = ctx.elapsed()
+            ctx.response_started = True
+            headers = None
+            for i in reversed(visible):
+                if plan.response_start[i]:
+                    if headers is None:
+                        headers = MutableHeaders(scope=message)
+                    stages[i].on_response_start(ctx, headers)
+        await send(message)
+
+    try:
+        for i in indexes:
+            if plan.request[i]:
+                await stages[i].on_request(ctx)
+            entered += 1
+        await app(scope, ctx.receive, send_wrapper)
+
+    except Exception as exc:
+        ctx.error = exc
+        # Propagate outward through the stages that were entered, innermost first
+        response = None
+        for position in range(entered - 1, -1, -1):
+            i = indexes[position]
+            if not plan.error[i]:
+                continue
+            try:
+                response = await stages[i].on_error(ctx, exc)
+            except Exception as replaced:
+                exc = replaced
+                continue
+            if response is not None:
+                visible = indexes[:position]
+                break
+        if response is None or ctx.response_started:
+            raise exc
+        await response(scope, ctx.receive, send_wrapper)
+
+    finally:
+        for position in range(entered - 1, -1, -1):
+            i = indexes[position]
+            if plan.complete[i]:
+                try:
+                    await stages[i].on_complete(ctx)
+                except Exception as e:
+                    logger.error(f"Middleware completion hook failed: {e}")
+
+
+class CombinedMiddleware:
+    """Runs several middleware stages in a single ASGI pass.
+
+    Equivalent to nesting the stages in order (first = outermost), but with
+    one request context, one ``send`` wrapper and no per-layer call overhead.
+    """
+
+    def __init__(self, app: ASGIApp, stages: Sequence[ASGIMiddleware]):
+        """Initialize combined middleware.
+
+        Args:
+            app: Downstream ASGI app
+            stages: Middleware instances (created with ``app=None``), outermost first
+        """
+        self.app = app
+        self.plan = _StagePlan(stages)
+
+    @property
+    def stages(self) -> Sequence[ASGIMiddleware]:
+        return self.plan.stages
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        await _run_stages(self.app, self.plan, scope, receive, send)
@@ -9,8 +9,6 @@ import traceback
 from typing import Dict, Any, Optional, Callable, Union
 from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
 from datetime import datetime
 
 from ...core.exceptions import (
@@ -26,11 +24,14 @@ from ...core.exceptions import (
     SecurityError
 )
 from ...core.exceptions import get_http_status_code
+from ..monitoring.metrics_registry import MetricsRegistry
+from ..monitoring.metrics_collectors import register_error_middleware
+from .asgi import ASGIMiddleware, HTTPRequestContext
 
 logger = logging.getLogger(__name__)
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware(ASGIMiddleware):
     """Comprehensive error handling middleware."""
     
     def __init__(
@@ -39,7 +40,8 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
         debug: bool = False,
         include_trace: bool = False,
         custom_handlers: Optional[Dict[type, Callable]] = None,
-        sensitive_fields: Optional[list] = None
+        sensitive_fields: Optional[list] = None,
+        metrics_registry: Optional[MetricsRegistry] = None
     ):
         super().__init__(app)
         self.debug = debug
@@ -56,15 +58,13 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             "errors_by_status": {},
             "last_error_time": None
         }
+        
+        # Expose error statistics on /metrics (global registry when None)
+        register_error_middleware(metrics_registry, self)
     
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def on_error(self, ctx: HTTPRequestContext, exc: Exception) -> JSONResponse:
         """Handle errors and provide structured error responses."""
-        try:
-            response = await call_next(request)
-            return response
-        
-        except Exception as exc:
-            return await self._handle_exception(request, exc)
+        return await self._handle_exception(ctx.request, exc)
     
     async def _handle_exception(self, request: Request, exc: Exception) -> JSONResponse:
         """Handle and format exceptions into proper HTTP responses."""
@@ -4,7 +4,7 @@ Provides convenience functions to configure all middleware components
 with sensible defaults and proper ordering for optimal security and performance.
 """
 
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from fastapi import FastAPI
 
 # Auth middleware moved to features/auth/middleware.py for better organization
@@ -12,8 +12,11 @@ from fastapi import FastAPI
 # from .tenant_middleware import TenantContextMiddleware, MultiTenantDatabaseMiddleware  # TODO: Enable when TenantService is implemented
 from .logging_middleware import StructuredLoggingMiddleware
 from .security_middleware import SecurityMiddleware, CORSMiddleware, RateLimitMiddleware
+from .rate_limiter import RateLimiter
 from .performance_middleware import PerformanceMiddleware, TimingMiddleware, DatabasePerformanceMiddleware
 from .error_middleware import ErrorHandlingMiddleware
+from .tracing_middleware import TracingMiddleware
+from .asgi import ASGIMiddleware, CombinedMiddleware
 
 # from ...features.users.services import UserService  # TODO: Enable when UserService is implemented
 from ...features.cache.services import CacheService
@@ -31,7 +34,8 @@ class MiddlewareFactory:
         jwt_secret: str,
         jwt_algorithm: str = "RS256",
         user_service=None,  # Optional until UserService is implemented
-        tenant_service=None  # Optional until TenantService is implemented
+        tenant_service=None,  # Optional until TenantService is implemented
+        redis_client=None  # Shared rate limits; defaults to the cache service's client
     ):
         self.user_service = user_service
         self.cache_service = cache_service
@@ -39,6 +43,19 @@ class MiddlewareFactory:
         self.database_service = database_service
         self.jwt_secret = jwt_secret
         self.jwt_algorithm = jwt_algorithm
+        self.redis_client = redis_client or getattr(cache_service, 'redis_client', None)
+        self._rate_limiter: Optional[RateLimiter] = None
+    
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Rate limiter shared by every stack this factory configures.
+        
+        Redis-backed when a Redis client is available, so all nodes draw from
+        the same budgets; per-process otherwise.
+        """
+        if self._rate_limiter is None:
+            self._rate_limiter = RateLimiter(redis_client=self.redis_client)
+        return self._rate_limiter
     
     def configure_full_stack(
         self,
@@ -49,13 +66,16 @@ class MiddlewareFactory:
         enable_security: bool = True,
         enable_performance: bool = True,
         enable_error_handling: bool = True,
+        enable_tracing: bool = True,
         cors_origins: Optional[List[str]] = None,
         rate_limit: str = "100/minute",
+        fused: bool = False,
         **kwargs
     ) -> FastAPI:
         """Configure complete middleware stack with optimal ordering.
         
         Middleware order (outer to inner):
+        0. Tracing (request span, current for everything below)
         1. Error Handling (outermost - catches all exceptions)
         2. Security (CORS, security headers)
         3. Logging (request/response logging)
@@ -64,7 +84,12 @@ class MiddlewareFactory:
         6. Authentication (JWT validation, user mapping)
         7. Tenant Context (tenant resolution, schema setup)
         8. Database Context (innermost - ensures proper schema)
+        
+        With ``fused=True`` the middlewares run as stages of a single
+        ``CombinedMiddleware`` pass sharing one request context; CORS then
+        wraps the combined pass, so error responses also get CORS headers.
         """
+        stack: List[Tuple[type, Dict[str, Any]]] = []
         
         # 8. Database Context (innermost) - TODO: Enable when MultiTenantDatabaseMiddleware is implemented
         # if enable_tenant_context and self.tenant_service:
@@ -95,56 +120,73 @@ class MiddlewareFactory:
         #         **kwargs.get('auth_middleware', {})
         #     )
         
-        # 5. Rate Limiting
-        if enable_security and rate_limit:
-            app.add_middleware(
-                RateLimitMiddleware,
-                cache_service=self.cache_service,
-                default_rate_limit=rate_limit,
-                **kwargs.get('rate_limit_middleware', {})
-            )
+        # 0. Tracing, so every other middleware runs inside the request span
+        if enable_tracing:
+            stack.append((TracingMiddleware, kwargs.get('tracing_middleware', {})))
         
-        # 4. Performance Monitoring
-        if enable_performance:
-            app.add_middleware(
-                PerformanceMiddleware,
-                cache_service=self.cache_service,
-                **kwargs.get('performance_middleware', {})
-            )
+        # 1. Error Handling (outermost)
+        if enable_error_handling:
+            stack.append((ErrorHandlingMiddleware, {
+                'debug': kwargs.get('debug', False),
+                **kwargs.get('error_middleware', {})
+            }))
         
-        # 3. Structured Logging
-        if enable_logging:
-            app.add_middleware(
-                StructuredLoggingMiddleware,
-                **kwargs.get('logging_middleware', {})
-            )
+        # CORS (if origins specified)
+        if cors_origins:
+            stack.append((CORSMiddleware, {
+                'allow_origins': cors_origins,
+                'allow_credentials': True,
+                **kwargs.get('cors_middleware', {})
+            }))
         
         # 2. Security Headers and General Security
         if enable_security:
-            app.add_middleware(
-                SecurityMiddleware,
-                **kwargs.get('security_middleware', {})
-            )
+            stack.append((SecurityMiddleware, kwargs.get('security_middleware', {})))
         
-        # CORS (if origins specified)
-        if cors_origins:
-            app.add_middleware(
-                CORSMiddleware,
-                allow_origins=cors_origins,
-                allow_credentials=True,
-                **kwargs.get('cors_middleware', {})
-            )
+        # 3. Structured Logging
+        if enable_logging:
+            stack.append((StructuredLoggingMiddleware, kwargs.get('logging_middleware', {})))
         
-        # 1. Error Handling (outermost)
-        if enable_error_handling:
-            app.add_middleware(
-                ErrorHandlingMiddleware,
-                debug=kwargs.get('debug', False),
-                **kwargs.get('error_middleware', {})
-            )
+        # 4. Performance Monitoring
+        if enable_performance:
+            stack.append((PerformanceMiddleware, {
+                'cache_service': self.cache_service,
+                **kwargs.get('performance_middleware', {})
+            }))
+        
+        # 5. Rate Limiting
+        if enable_security and rate_limit:
+            stack.append((RateLimitMiddleware, {
+                'cache_service': self.cache_service,
+                'default_rate_limit': rate_limit,
+                'rate_limiter': self.rate_limiter,
+                **kwargs.get('rate_limit_middleware', {})
+            }))
         
+        self._install_stack(app, stack, fused)
         return app
     
+    def _install_stack(
+        self,
+        app: FastAPI,
+        stack: List[Tuple[type, Dict[str, Any]]],
+        fused: bool = False
+    ) -> None:
+        """Add middlewares given outermost first.
+        
+        When fused, all ``ASGIMiddleware`` entries become stages of one
+        ``CombinedMiddleware``; other middlewares (CORS) wrap it.
+        """
+        if fused:
+            stages = [cls(None, **options) for cls, options in stack if issubclass(cls, ASGIMiddleware)]
+            stack = [(cls, options) for cls, options in stack if not issubclass(cls, ASGIMiddleware)]
+            if stages:
+                app.add_middleware(CombinedMiddleware, stages=stages)
+        
+        # Starlette wraps middlewares added later around earlier ones
+        for cls, options in reversed(stack):
+            app.add_middleware(cls, **options)
+    
     def configure_minimal_stack(
         self,
         app: FastAPI,
@@ -252,41 +294,36 @@ class MiddlewareFactory:
         #         **kwargs.get('auth_middleware', {})
         #     )
         
-        # Rate limiting for API protection
-        app.add_middleware(
-            RateLimitMiddleware,
-            cache_service=self.cache_service,
-            default_rate_limit=kwargs.get('rate_limit', '200/minute'),
-            **kwargs.get('rate_limit_middleware', {})
-        )
-        
-        # Performance monitoring
-        app.add_middleware(
-            PerformanceMiddleware,
-            cache_service=self.cache_service,
-            **kwargs.get('performance_middleware', {})
-        )
-        
-        # Structured logging for APIs
-        app.add_middleware(
-            StructuredLoggingMiddleware,
-            log_requests=True,
-            log_responses=True,
-            **kwargs.get('logging_middleware', {})
-        )
-        
-        # Security headers
-        app.add_middleware(
-            SecurityMiddleware,
-            **kwargs.get('security_middleware', {})
-        )
-        
-        # Error handling
-        app.add_middleware(
-            ErrorHandlingMiddleware,
-            debug=kwargs.get('debug', False),
-            **kwargs.get('error_middleware', {})
-        )
+        stack = [
+            # Request tracing
+            (TracingMiddleware, kwargs.get('tracing_middleware', {})),
+            # Error handling
+            (ErrorHandlingMiddleware, {
+                'debug': kwargs.get('debug', False),
+                **kwargs.get('error_middleware', {})
+            }),
+            # Security headers
+            (SecurityMiddleware, kwargs.get('security_middleware', {})),
+            # Structured logging for APIs
+            (StructuredLoggingMiddleware, {
+                'log_requests': True,
+                'log_responses': True,
+                **kwargs.get('logging_middleware', {})
+            }),
+            # Performance monitoring
+            (PerformanceMiddleware, {
+                'cache_service': self.cache_service,
+                **kwargs.get('performance_middleware', {})
+            }),
+            # Rate limiting for API protection
+            (RateLimitMiddleware, {
+                'cache_service': self.cache_service,
+                'default_rate_limit': kwargs.get('rate_limit', '200/minute'),
+                'rate_limiter': self.rate_limiter,
+                **kwargs.get('rate_limit_middleware', {})
+            }),
+        ]
+        self._install_stack(app, stack, kwargs.get('fused', False))
         
         return app
 
@@ -297,7 +334,8 @@ def create_middleware_factory(
     jwt_secret: str,
     jwt_algorithm: str = "RS256",
     user_service=None,  # Optional until UserService is implemented
-    tenant_service=None  # Optional until TenantService is implemented
+    tenant_service=None,  # Optional until TenantService is implemented
+    redis_client=None
 ) -> MiddlewareFactory:
     """Create a middleware factory with required services."""
     return MiddlewareFactory(
@@ -306,7 +344,8 @@ def create_middleware_factory(
         jwt_secret=jwt_secret,
         jwt_algorithm=jwt_algorithm,
         user_service=user_service,
-        tenant_service=tenant_service
+        tenant_service=tenant_service,
+        redis_client=redis_client
     )
 
 
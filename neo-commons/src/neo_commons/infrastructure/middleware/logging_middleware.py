@@ -6,21 +6,22 @@ performance metrics, and structured log format for observability.
 
 import logging
 import time
-import json
 from typing import Optional, Dict, Any, List
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import Message, Receive
 from datetime import datetime
 from uuid import uuid4
 
 from ...core.value_objects import UserId, TenantId
 from ...utils.uuid import generate_uuid7
+from ..logging import Redactor, lazy
+from .asgi import ASGIMiddleware, HTTPRequestContext
 
 logger = logging.getLogger(__name__)
 
 
-class StructuredLoggingMiddleware(BaseHTTPMiddleware):
+class StructuredLoggingMiddleware(ASGIMiddleware):
     """FastAPI middleware for structured request/response logging."""
     
     def __init__(
@@ -47,39 +48,67 @@ class StructuredLoggingMiddleware(BaseHTTPMiddleware):
             "password", "token", "secret", "key", "credentials"
         ]
         self.max_body_size = max_body_size
+        self._redactor = Redactor(self.sensitive_fields, self.sensitive_headers)
         self.exempt_paths = exempt_paths or [
             "/health", "/metrics", "/docs", "/openapi.json"
         ]
     
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Process request with structured logging."""
-        
-        # Skip logging for exempt paths
-        if any(request.url.path.startswith(path) for path in self.exempt_paths):
-            return await call_next(request)
+    async def on_request(self, ctx: HTTPRequestContext) -> None:
+        """Assign the request ID and log the request start."""
+        request = ctx.request
         
         # Generate request ID if not provided
-        request_id = request.headers.get("X-Request-ID") or str(generate_uuid7())
+        request_id = ctx.headers.get("X-Request-ID") or str(generate_uuid7())
         
         # Store request ID in request state
         request.state.request_id = request_id
+        ctx.values["request_id"] = request_id
+        ctx.values["request_timestamp"] = time.time()
         
-        # Extract context information
-        user_context = getattr(request.state, 'user_context', None)
-        tenant_context = getattr(request.state, 'tenant_context', None)
+        # Log request if enabled
+        if self.log_requests and logger.isEnabledFor(logging.INFO):
+            request_log = self._log_context(ctx).copy()
+            request_log.update({
+                "event_type": "request_start",
+                # Redacted when the record is written, off the request path
+                "headers": lazy(self._redactor.redact_headers, ctx.headers),
+            })
+            
+            # Add request body if enabled and appropriate
+            if self.log_request_body and self._should_log_body(request):
+                request_body = await self._get_request_body(request)
+                if request_body:
+                    request_log["request_body"] = lazy(self._sanitize_body, request_body)
+                
+                # The body was consumed here; replay it to the app
+                ctx.receive = self._replay_body(await request.body(), ctx.receive)
+            
+            logger.info("Request started", extra={"structured_data": request_log})
+    
+    def _log_context(self, ctx: HTTPRequestContext) -> Dict[str, Any]:
+        """Base log context, built on first use so unlogged requests never pay for it."""
+        log_context = ctx.values.get("log_context")
+        if log_context is not None:
+            return log_context
+        
+        request = ctx.request
         
         # Build base log context
         log_context = {
-            "request_id": request_id,
-            "timestamp": datetime.utcnow().isoformat(),
-            "method": request.method,
+            "request_id": ctx.values["request_id"],
+            "timestamp": datetime.utcfromtimestamp(ctx.values["request_timestamp"]).isoformat(),
+            "method": ctx.method,
             "url": str(request.url),
-            "path": request.url.path,
+            "path": ctx.path,
             "query_params": dict(request.query_params),
-            "client_ip": self._get_client_ip(request),
-            "user_agent": request.headers.get("User-Agent"),
+            "client_ip": ctx.client_ip,
+            "user_agent": ctx.headers.get("User-Agent"),
         }
         
+        # Extract context information
+        user_context = getattr(request.state, 'user_context', None)
+        tenant_context = getattr(request.state, 'tenant_context', None)
+        
         # Add user context if available
         if user_context:
             log_context.update({
@@ -98,152 +127,97 @@ class StructuredLoggingMiddleware(BaseHTTPMiddleware):
                 "region": tenant_context.get("region"),
             })
         
-        # Log request if enabled
-        if self.log_requests:
-            request_log = log_context.copy()
-            request_log.update({
-                "event_type": "request_start",
-                "headers": self._sanitize_headers(dict(request.headers)),
-            })
-            
-            # Add request body if enabled and appropriate
-            if self.log_request_body and self._should_log_body(request):
-                request_body = await self._get_request_body(request)
-                if request_body:
-                    request_log["request_body"] = self._sanitize_body(request_body)
-            
-            logger.info("Request started", extra={"structured_data": request_log})
+        ctx.values["log_context"] = log_context
+        return log_context
+    
+    def on_response_start(self, ctx: HTTPRequestContext, headers: MutableHeaders) -> None:
+        """Add request ID and processing time headers."""
+        headers["X-Request-ID"] = ctx.values["request_id"]
+        headers["X-Processing-Time"] = str(round(ctx.response_time * 1000, 2))
+        if self.log_responses:
+            ctx.values["response_headers"] = headers
+    
+    async def on_error(self, ctx: HTTPRequestContext, exc: Exception) -> None:
+        """Log the failed request; the exception keeps propagating."""
+        processing_time = ctx.elapsed()
         
-        # Process request and measure timing
-        start_time = time.time()
+        # Log error
+        error_log = self._log_context(ctx).copy()
+        error_log.update({
+            "event_type": "request_error",
+            "error_type": type(exc).__name__,
+            "error_message": str(exc),
+            "processing_time_ms": round(processing_time * 1000, 2),
+        })
         
-        try:
-            response = await call_next(request)
-            
-            # Calculate processing time
-            processing_time = time.time() - start_time
-            
-            # Log response if enabled
-            if self.log_responses:
-                response_log = log_context.copy()
-                response_log.update({
-                    "event_type": "request_complete",
-                    "status_code": response.status_code,
-                    "processing_time_ms": round(processing_time * 1000, 2),
-                    "response_headers": self._sanitize_headers(dict(response.headers)),
-                })
-                
-                # Determine log level based on status code
-                if response.status_code >= 500:
-                    log_level = logging.ERROR
-                elif response.status_code >= 400:
-                    log_level = logging.WARNING
-                else:
-                    log_level = logging.INFO
-                
-                logger.log(
-                    log_level,
-                    f"Request completed - {response.status_code} in {processing_time * 1000:.2f}ms",
-                    extra={"structured_data": response_log}
-                )
-            
-            # Add performance headers
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Processing-Time"] = str(round(processing_time * 1000, 2))
-            
-            return response
+        logger.error(
+            "Request failed - %s: %s", type(exc).__name__, exc,
+            extra={"structured_data": error_log},
+            exc_info=True
+        )
         
-        except Exception as e:
-            # Calculate processing time for error case
-            processing_time = time.time() - start_time
-            
-            # Log error
-            error_log = log_context.copy()
-            error_log.update({
-                "event_type": "request_error",
-                "error_type": type(e).__name__,
-                "error_message": str(e),
-                "processing_time_ms": round(processing_time * 1000, 2),
-            })
-            
-            logger.error(
-                f"Request failed - {type(e).__name__}: {e}",
-                extra={"structured_data": error_log},
-                exc_info=True
-            )
-            
-            # Re-raise the exception
-            raise
+        return None
     
-    def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP address from request."""
-        # Check for forwarded headers first
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
+    async def on_complete(self, ctx: HTTPRequestContext) -> None:
+        """Log the response once it was sent."""
+        if not self.log_responses or ctx.status_code is None or ctx.error is not None:
+            return
         
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip
+        # Determine log level based on status code
+        if ctx.status_code >= 500:
+            log_level = logging.ERROR
+        elif ctx.status_code >= 400:
+            log_level = logging.WARNING
+        else:
+            log_level = logging.INFO
+        
+        if not logger.isEnabledFor(log_level):
+            return
         
-        # Fallback to client host
-        if hasattr(request, "client") and request.client:
-            return request.client.host
+        processing_time = ctx.response_time
+        response_log = self._log_context(ctx).copy()
+        response_log.update({
+            "event_type": "request_complete",
+            "status_code": ctx.status_code,
+            "processing_time_ms": round(processing_time * 1000, 2),
+            "response_headers": lazy(self._sanitize_headers, ctx.values.get("response_headers") or {}),
+        })
         
-        return "unknown"
+        logger.log(
+            log_level,
+            "Request completed - %s in %.2fms", ctx.status_code, processing_time * 1000,
+            extra={"structured_data": response_log}
+        )
     
-    def _sanitize_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
-        """Sanitize sensitive headers for logging."""
-        sanitized = {}
+    @staticmethod
+    def _replay_body(body: bytes, receive: Receive) -> Receive:
+        """Receive callable that returns an already read body, then defers to ``receive``."""
+        replayed = False
         
-        for key, value in headers.items():
-            key_lower = key.lower()
-            
-            if key_lower in self.sensitive_headers:
-                # Mask sensitive headers
-                if len(value) > 8:
-                    sanitized[key] = f"{value[:4]}***{value[-4:]}"
-                else:
-                    sanitized[key] = "***"
-            else:
-                sanitized[key] = value
+        async def replay() -> Message:
+            nonlocal replayed
+            if replayed:
+                return await receive()
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
         
-        return sanitized
+        return replay
     
-    def _sanitize_body(self, body: str) -> str:
-        """Sanitize sensitive fields in request/response body."""
-        try:
-            # Try to parse as JSON and sanitize
-            data = json.loads(body)
-            sanitized_data = self._sanitize_dict(data)
-            return json.dumps(sanitized_data)
-        except (json.JSONDecodeError, TypeError):
-            # If not JSON, return truncated string
-            return body[:self.max_body_size] + "..." if len(body) > self.max_body_size else body
+    def _sanitize_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
+        """Sanitize sensitive headers for logging."""
+        return self._redactor.redact_headers(headers)
+    
+    def _sanitize_body(self, body: str) -> Any:
+        """Sanitize sensitive fields in request/response body.
+        
+        JSON bodies are returned as the redacted value, so the log encoder
+        serializes them once instead of embedding a re-encoded string.
+        """
+        return self._redactor.redact_body(body, self.max_body_size)
     
     def _sanitize_dict(self, data: Any) -> Any:
         """Recursively sanitize dictionary for sensitive fields."""
-        if isinstance(data, dict):
-            sanitized = {}
-            for key, value in data.items():
-                key_lower = key.lower()
-                
-                if any(sensitive in key_lower for sensitive in self.sensitive_fields):
-                    # Mask sensitive fields
-                    if isinstance(value, str) and len(value) > 8:
-                        sanitized[key] = f"{value[:3]}***{value[-2:]}"
-                    else:
-                        sanitized[key] = "***"
-                else:
-                    sanitized[key] = self._sanitize_dict(value)
-            
-            return sanitized
-        
-        elif isinstance(data, list):
-            return [self._sanitize_dict(item) for item in data]
-        
-        else:
-            return data
+        return self._redactor.redact(data)
     
     def _should_log_body(self, request: Request) -> bool:
         """Determine if request body should be logged."""
@@ -6,22 +6,33 @@ and optimization insights for production observability.
 
 import logging
 import time
-import psutil
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
 from datetime import datetime
-from collections import defaultdict, deque
 import asyncio
 
 from ...features.cache.services import CacheService
+from ..monitoring.metrics_registry import MetricsRegistry, get_metrics_registry
+from ..monitoring.metrics_collectors import register_performance_middleware
+from ..monitoring.metrics_recorder import OperationRecorder
+from ..monitoring.request_profiling import ProcessResourceSampler, SlowRequestProfiler, get_resource_sampler
+from ..monitoring.loop_monitor import EventLoopMonitor, get_event_loop_monitor
+from .asgi import ASGIMiddleware, HTTPRequestContext
 
 logger = logging.getLogger(__name__)
 
 
-class PerformanceMiddleware(BaseHTTPMiddleware):
-    """Comprehensive performance monitoring middleware."""
+class PerformanceMiddleware(ASGIMiddleware):
+    """Comprehensive performance monitoring middleware.
+    
+    The request path only reads a monotonic clock and updates per-route
+    counters and histograms keyed by the route template. Process memory and
+    CPU are sampled on a background interval, statistics are written to the
+    cache periodically, and the opt-in profiler samples stacks of slow
+    requests only. The event loop monitor is started with the first request
+    and reports lag and blocking calls of the whole process.
+    """
     
     def __init__(
         self,
@@ -31,7 +42,13 @@ class PerformanceMiddleware(BaseHTTPMiddleware):
         enable_profiling: bool = False,
         slow_request_threshold: float = 1.0,  # seconds
         metrics_retention: int = 3600,  # 1 hour
-        exempt_paths: Optional[list] = None
+        exempt_paths: Optional[list] = None,
+        metrics_registry: Optional[MetricsRegistry] = None,
+        resource_sampler: Optional[ProcessResourceSampler] = None,
+        profiler: Optional[SlowRequestProfiler] = None,
+        cache_flush_interval: float = 60.0,  # seconds
+        monitor_event_loop: bool = True,
+        loop_monitor: Optional[EventLoopMonitor] = None
     ):
         super().__init__(app)
         self.cache_service = cache_service
@@ -42,296 +59,260 @@ class PerformanceMiddleware(BaseHTTPMiddleware):
         self.exempt_paths = exempt_paths or [
             "/health", "/metrics", "/docs", "/openapi.json"
         ]
+        self.cache_flush_interval = cache_flush_interval
         
-        # In-memory metrics storage
-        self.request_metrics = defaultdict(list)
-        self.performance_stats = {
+        # Per-route statistics keyed by "METHOD:route template"
+        self.request_metrics: Dict[str, OperationRecorder] = {}
+        self._stats = {
             "total_requests": 0,
             "total_response_time": 0.0,
             "slow_requests": 0,
-            "error_requests": 0,
-            "peak_memory_mb": 0.0,
-            "peak_cpu_percent": 0.0
+            "error_requests": 0
         }
         
-        # System monitoring
-        self.process = psutil.Process()
-    
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Monitor request performance and collect metrics."""
-        
-        # Skip monitoring for exempt paths
-        if any(request.url.path.startswith(path) for path in self.exempt_paths):
-            return await call_next(request)
-        
-        # Start performance monitoring
-        start_time = time.time()
-        start_cpu_time = time.process_time()
-        
-        # Get initial system metrics
-        initial_memory = self._get_memory_usage()
-        initial_cpu = self._get_cpu_usage()
+        # System monitoring happens off the request path
+        self.resource_sampler = resource_sampler or get_resource_sampler()
+        self.profiler = profiler
+        if enable_profiling and self.profiler is None:
+            self.profiler = SlowRequestProfiler(slow_threshold=slow_request_threshold)
+        self.loop_monitor = loop_monitor
+        if monitor_event_loop and self.loop_monitor is None:
+            self.loop_monitor = get_event_loop_monitor()
         
-        # Add timing header to request
-        request.state.performance_start = start_time
-        
-        try:
-            # Process request
-            response = await call_next(request)
-            
-            # Calculate timing metrics
-            end_time = time.time()
-            total_time = end_time - start_time
-            cpu_time = time.process_time() - start_cpu_time
-            
-            # Get final system metrics
-            final_memory = self._get_memory_usage()
-            final_cpu = self._get_cpu_usage()
-            
-            # Calculate performance metrics
-            metrics = {
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "response_time_ms": round(total_time * 1000, 2),
-                "cpu_time_ms": round(cpu_time * 1000, 2),
-                "memory_delta_mb": round(final_memory - initial_memory, 2),
-                "peak_memory_mb": round(max(initial_memory, final_memory), 2),
-                "cpu_usage_percent": round(max(initial_cpu, final_cpu), 2),
-                "timestamp": datetime.utcnow().isoformat(),
-                "is_slow": total_time > self.slow_request_threshold,
-                "is_error": response.status_code >= 400
-            }
-            
-            # Add context information if available
-            if hasattr(request.state, 'user_context') and request.state.user_context:
-                metrics["user_id"] = str(request.state.user_context.user_id)
-                metrics["tenant_id"] = str(request.state.user_context.tenant_id)
-            
-            # Record metrics
-            await self._record_metrics(metrics)
-            
-            # Add performance headers to response
-            self._add_performance_headers(response, metrics)
-            
-            # Log slow requests
-            if metrics["is_slow"]:
-                logger.warning(
-                    f"Slow request detected: {request.method} {request.url.path} "
-                    f"took {metrics['response_time_ms']}ms",
-                    extra={"performance_metrics": metrics}
-                )
-            
-            return response
+        self._next_cache_flush = 0.0
+        self._cache_task: Optional[asyncio.Task] = None
         
-        except Exception as e:
-            # Record error metrics
-            end_time = time.time()
-            total_time = end_time - start_time
-            
-            error_metrics = {
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": 500,
-                "response_time_ms": round(total_time * 1000, 2),
-                "error_type": type(e).__name__,
-                "timestamp": datetime.utcnow().isoformat(),
-                "is_error": True
-            }
-            
-            await self._record_metrics(error_metrics)
-            
-            logger.error(
-                f"Request error: {request.method} {request.url.path}",
-                extra={"performance_metrics": error_metrics},
-                exc_info=True
-            )
-            
-            # Re-raise the exception
-            raise
+        # Scrapeable metrics; routes are labelled by template to bound cardinality
+        self.metrics_registry = metrics_registry or get_metrics_registry()
+        self._request_duration = self.metrics_registry.histogram(
+            "neo_http_request_duration_seconds",
+            "HTTP request duration",
+            ["method", "route", "status"]
+        )
+        register_performance_middleware(self.metrics_registry, self)
     
-    async def _record_metrics(self, metrics: Dict[str, Any]) -> None:
-        """Record performance metrics."""
+    @property
+    def performance_stats(self) -> Dict[str, Any]:
+        """Request counters with peak process resource usage."""
+        return {
+            **self._stats,
+            "peak_memory_mb": self.resource_sampler.peak_memory_mb,
+            "peak_cpu_percent": self.resource_sampler.peak_cpu_percent
+        }
+    
+    async def on_request(self, ctx: HTTPRequestContext) -> None:
+        """Start timing (exempt paths are skipped by ``applies``)."""
+        ctx.request.state.performance_start = ctx.start_time
+        if self.loop_monitor is not None:
+            self.loop_monitor.start()
+        if self.profiler is not None:
+            ctx.values["profile_token"] = self.profiler.begin(f"{ctx.method} {ctx.path}")
+    
+    def on_response_start(self, ctx: HTTPRequestContext, headers: MutableHeaders) -> None:
+        """Add timing headers."""
+        headers["X-Response-Time"] = f"{ctx.response_time * 1000:.2f}ms"
+        if ctx.response_time > self.slow_request_threshold:
+            headers["X-Performance-Warning"] = "slow-request"
+    
+    async def on_error(self, ctx: HTTPRequestContext, exc: Exception) -> None:
+        """Log the failed request; the exception keeps propagating."""
+        logger.error(
+            f"Request error: {ctx.method} {ctx.path}",
+            extra={"performance_metrics": {
+                "method": ctx.method,
+                "path": ctx.path,
+                "response_time_ms": round(ctx.elapsed() * 1000, 2),
+                "error_type": type(exc).__name__
+            }},
+            exc_info=True
+        )
+        return None
+    
+    async def on_complete(self, ctx: HTTPRequestContext) -> None:
+        """Record metrics once the response body was sent."""
+        duration = ctx.elapsed()
+        profile = None
+        profile_token = ctx.values.get("profile_token")
+        if profile_token is not None:
+            profile = self.profiler.end(profile_token, duration)
+        status_code = ctx.status_code if ctx.status_code is not None else 500
+        self._record(ctx, status_code, duration, profile)
+    
+    def _record(
+        self,
+        ctx: HTTPRequestContext,
+        status_code: int,
+        duration: float,
+        profile: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Record request metrics; constant time and memory per request."""
         if not self.enable_metrics:
             return
         
         try:
-            # Update in-memory stats
-            self.performance_stats["total_requests"] += 1
-            self.performance_stats["total_response_time"] += metrics["response_time_ms"]
+            route = ctx.route_template
+            is_slow = duration > self.slow_request_threshold
+            is_error = status_code >= 400
             
-            if metrics.get("is_slow"):
-                self.performance_stats["slow_requests"] += 1
+            self._stats["total_requests"] += 1
+            self._stats["total_response_time"] += duration * 1000
+            if is_slow:
+                self._stats["slow_requests"] += 1
+            if is_error:
+                self._stats["error_requests"] += 1
             
-            if metrics.get("is_error"):
-                self.performance_stats["error_requests"] += 1
-            
-            if "peak_memory_mb" in metrics:
-                self.performance_stats["peak_memory_mb"] = max(
-                    self.performance_stats["peak_memory_mb"],
-                    metrics["peak_memory_mb"]
-                )
+            self._request_duration.labels(ctx.method, route, str(status_code)).observe(duration)
             
-            if "cpu_usage_percent" in metrics:
-                self.performance_stats["peak_cpu_percent"] = max(
-                    self.performance_stats["peak_cpu_percent"],
-                    metrics["cpu_usage_percent"]
+            endpoint_key = f"{ctx.method}:{route}"
+            recorder = self.request_metrics.get(endpoint_key)
+            if recorder is None:
+                recorder = self.request_metrics[endpoint_key] = OperationRecorder(
+                    endpoint_key, "http", self.slow_request_threshold * 1000, capacity=32
                 )
+            recorder.calls += 1
+            recorder.record(duration * 1000, is_error)
             
-            # Store detailed metrics per endpoint
-            endpoint_key = f"{metrics['method']}:{metrics['path']}"
-            self.request_metrics[endpoint_key].append(metrics)
+            if is_slow:
+                self._log_slow_request(ctx, route, status_code, duration, profile)
             
-            # Limit metrics history
-            if len(self.request_metrics[endpoint_key]) > 1000:
-                self.request_metrics[endpoint_key] = self.request_metrics[endpoint_key][-500:]
-            
-            # Store in cache if available
-            if self.cache_service:
-                await self._store_metrics_in_cache(metrics)
+            # Persist aggregated stats periodically, never per request
+            if self.cache_service is not None:
+                now = time.perf_counter()
+                if now >= self._next_cache_flush:
+                    self._next_cache_flush = now + self.cache_flush_interval
+                    self._cache_task = asyncio.create_task(self._store_metrics_in_cache())
         
         except Exception as e:
             logger.error(f"Failed to record metrics: {e}")
     
-    async def _store_metrics_in_cache(self, metrics: Dict[str, Any]) -> None:
-        """Store metrics in cache for persistence."""
+    def _log_slow_request(
+        self,
+        ctx: HTTPRequestContext,
+        route: str,
+        status_code: int,
+        duration: float,
+        profile: Optional[Dict[str, Any]]
+    ) -> None:
+        """Log a slow request with its context and profile, if sampled."""
+        metrics = {
+            "method": ctx.method,
+            "path": ctx.path,
+            "route": route,
+            "status_code": status_code,
+            "response_time_ms": round(duration * 1000, 2),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+        # Add context information if available
+        user_context = getattr(ctx.request.state, "user_context", None)
+        if user_context:
+            metrics["user_id"] = str(user_context.user_id)
+            metrics["tenant_id"] = str(user_context.tenant_id)
+        
+        if profile:
+            metrics["profile"] = profile
+        
+        logger.warning(
+            f"Slow request detected: {ctx.method} {ctx.path} "
+            f"took {metrics['response_time_ms']}ms",
+            extra={"performance_metrics": metrics}
+        )
+    
+    async def _store_metrics_in_cache(self) -> None:
+        """Store aggregated statistics in cache for persistence."""
         try:
-            # Store current metrics
-            cache_key = f"performance_metrics:{int(time.time())}"
             await self.cache_service.set(
-                cache_key,
-                metrics,
+                "performance_stats:current",
+                self.performance_stats,
                 ttl=self.metrics_retention
             )
-            
-            # Update aggregated stats
-            stats_key = "performance_stats:current"
             await self.cache_service.set(
-                stats_key,
-                self.performance_stats,
+                "performance_stats:endpoints",
+                self.get_endpoint_metrics(),
                 ttl=self.metrics_retention
             )
         
         except Exception as e:
             logger.warning(f"Failed to store metrics in cache: {e}")
     
-    def _get_memory_usage(self) -> float:
-        """Get current memory usage in MB."""
-        try:
-            memory_info = self.process.memory_info()
-            return memory_info.rss / 1024 / 1024  # Convert to MB
-        except Exception:
-            return 0.0
-    
-    def _get_cpu_usage(self) -> float:
-        """Get current CPU usage percentage."""
-        try:
-            return self.process.cpu_percent()
-        except Exception:
-            return 0.0
-    
-    def _add_performance_headers(self, response: Response, metrics: Dict[str, Any]) -> None:
-        """Add performance headers to response."""
-        response.headers.update({
-            "X-Response-Time": f"{metrics['response_time_ms']}ms",
-            "X-CPU-Time": f"{metrics.get('cpu_time_ms', 0)}ms",
-            "X-Memory-Delta": f"{metrics.get('memory_delta_mb', 0)}MB",
-        })
-        
-        # Add warning header for slow requests
-        if metrics.get("is_slow"):
-            response.headers["X-Performance-Warning"] = "slow-request"
-    
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get performance summary statistics."""
-        total_requests = self.performance_stats["total_requests"]
+        total_requests = self._stats["total_requests"]
         
         if total_requests == 0:
             return {"message": "No requests processed yet"}
         
-        avg_response_time = self.performance_stats["total_response_time"] / total_requests
-        error_rate = (self.performance_stats["error_requests"] / total_requests) * 100
-        slow_request_rate = (self.performance_stats["slow_requests"] / total_requests) * 100
+        avg_response_time = self._stats["total_response_time"] / total_requests
+        error_rate = (self._stats["error_requests"] / total_requests) * 100
+        slow_request_rate = (self._stats["slow_requests"] / total_requests) * 100
+        resources = self.resource_sampler
         
         return {
             "total_requests": total_requests,
             "average_response_time_ms": round(avg_response_time, 2),
             "error_rate_percent": round(error_rate, 2),
             "slow_request_rate_percent": round(slow_request_rate, 2),
-            "peak_memory_mb": round(self.performance_stats["peak_memory_mb"], 2),
-            "peak_cpu_percent": round(self.performance_stats["peak_cpu_percent"], 2),
-            "current_memory_mb": round(self._get_memory_usage(), 2),
-            "current_cpu_percent": round(self._get_cpu_usage(), 2)
+            "peak_memory_mb": round(resources.peak_memory_mb, 2),
+            "peak_cpu_percent": round(resources.peak_cpu_percent, 2),
+            "current_memory_mb": round(resources.memory_mb, 2),
+            "current_cpu_percent": round(resources.cpu_percent, 2),
+            "event_loop": self.loop_monitor.get_stats() if self.loop_monitor else None
         }
     
     def get_endpoint_metrics(self, endpoint: str = None) -> Dict[str, Any]:
-        """Get metrics for specific endpoint or all endpoints."""
+        """Get metrics for specific endpoint or all endpoints.
+        
+        Args:
+            endpoint: ``METHOD:route template`` key, e.g. ``GET:/users/{user_id}``
+        """
         if endpoint:
-            metrics_list = self.request_metrics.get(endpoint, [])
-            if not metrics_list:
+            recorder = self.request_metrics.get(endpoint)
+            if recorder is None or not recorder.sampled:
                 return {"message": f"No metrics found for endpoint: {endpoint}"}
             
-            response_times = [m["response_time_ms"] for m in metrics_list]
+            p95, p99 = recorder.sketch.quantiles((0.95, 0.99))
             
             return {
                 "endpoint": endpoint,
-                "total_requests": len(metrics_list),
-                "average_response_time_ms": round(sum(response_times) / len(response_times), 2),
-                "min_response_time_ms": min(response_times),
-                "max_response_time_ms": max(response_times),
-                "p95_response_time_ms": round(self._calculate_percentile(response_times, 95), 2),
-                "p99_response_time_ms": round(self._calculate_percentile(response_times, 99), 2),
-                "error_count": sum(1 for m in metrics_list if m.get("is_error")),
-                "slow_request_count": sum(1 for m in metrics_list if m.get("is_slow"))
+                "total_requests": recorder.calls,
+                "average_response_time_ms": round(recorder.total_ms / recorder.sampled, 2),
+                "min_response_time_ms": round(recorder.min_ms, 2),
+                "max_response_time_ms": round(recorder.max_ms, 2),
+                "p95_response_time_ms": round(p95, 2),
+                "p99_response_time_ms": round(p99, 2),
+                "error_count": recorder.errors,
+                "slow_request_count": recorder.violations
             }
         else:
             # Return summary for all endpoints
-            endpoint_summaries = {}
-            for endpoint_key in self.request_metrics:
-                endpoint_summaries[endpoint_key] = self.get_endpoint_metrics(endpoint_key)
-            
-            return endpoint_summaries
+            return {
+                endpoint_key: self.get_endpoint_metrics(endpoint_key)
+                for endpoint_key in list(self.request_metrics)
+            }
     
-    def _calculate_percentile(self, values: list, percentile: float) -> float:
-        """Calculate percentile value from a list of numbers."""
-        if not values:
-            return 0.0
-        
-        sorted_values = sorted(values)
-        index = (percentile / 100) * (len(sorted_values) - 1)
-        
-        if index.is_integer():
-            return sorted_values[int(index)]
-        else:
-            lower_index = int(index)
-            upper_index = lower_index + 1
-            weight = index - lower_index
-            
-            return sorted_values[lower_index] * (1 - weight) + sorted_values[upper_index] * weight
+    def get_slow_request_profiles(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Stack profiles of recent slow requests (requires ``enable_profiling``)."""
+        return self.profiler.get_profiles(limit) if self.profiler else []
+    
+    def get_event_loop_blocks(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Recent event loop block reports with the blocking stacks."""
+        return self.loop_monitor.get_reports(limit) if self.loop_monitor else []
 
 
-class TimingMiddleware(BaseHTTPMiddleware):
+class TimingMiddleware(ASGIMiddleware):
     """Lightweight timing middleware for basic request timing."""
     
     def __init__(self, app, add_headers: bool = True):
         super().__init__(app)
         self.add_headers = add_headers
     
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def on_response_start(self, ctx: HTTPRequestContext, headers: MutableHeaders) -> None:
         """Add basic timing to requests."""
-        start_time = time.time()
-        
-        response = await call_next(request)
-        
-        process_time = time.time() - start_time
-        
         if self.add_headers:
-            response.headers["X-Process-Time"] = f"{process_time:.4f}"
-        
-        return response
+            headers["X-Process-Time"] = f"{ctx.response_time:.4f}"
 
 
-class DatabasePerformanceMiddleware(BaseHTTPMiddleware):
+class DatabasePerformanceMiddleware(ASGIMiddleware):
     """Middleware for tracking database performance metrics."""
     
     def __init__(
@@ -353,26 +334,22 @@ class DatabasePerformanceMiddleware(BaseHTTPMiddleware):
             "connections_closed": 0
         }
     
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Monitor database performance during request."""
-        
-        # Initialize request-level DB tracking
-        request.state.db_queries = []
-        request.state.db_query_count = 0
-        request.state.db_total_time = 0.0
-        
-        response = await call_next(request)
-        
-        # Add database performance headers
-        if hasattr(request.state, 'db_query_count'):
-            response.headers["X-DB-Query-Count"] = str(request.state.db_query_count)
-            response.headers["X-DB-Total-Time"] = f"{request.state.db_total_time:.4f}s"
-            
-            # Warn about excessive queries
-            if request.state.db_query_count > 10:
-                response.headers["X-DB-Warning"] = "high-query-count"
+    async def on_request(self, ctx: HTTPRequestContext) -> None:
+        """Initialize request-level DB tracking."""
+        state = ctx.request.state
+        state.db_queries = []
+        state.db_query_count = 0
+        state.db_total_time = 0.0
+    
+    def on_response_start(self, ctx: HTTPRequestContext, headers: MutableHeaders) -> None:
+        """Add database performance headers."""
+        state = ctx.request.state
+        headers["X-DB-Query-Count"] = str(state.db_query_count)
+        headers["X-DB-Total-Time"] = f"{state.db_total_time:.4f}s"
         
-        return response
+        # Warn about excessive queries
+        if state.db_query_count > 10:
+            headers["X-DB-Warning"] = "high-query-count"
     
     def record_query(self, query: str, execution_time: float, request: Request = None) -> None:
         """Record database query metrics."""
@@ -0,0 +1,242 @@
+"""Rate limiting engine shared by the rate limiting middlewares.
+
+Implements GCRA (generic cell rate algorithm), which keeps a single
+"theoretical arrival time" per key, so memory and work per check are O(1)
+regardless of the window size. Limits are enforced across nodes through an
+atomic Redis Lua script; each node leases small batches of tokens from Redis
+so that most requests for busy keys are answered locally.
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# KEYS[1] = limiter key
+# ARGV[1] = emission interval (us), ARGV[2] = burst tolerance (us), ARGV[3] = tokens requested
+# Returns {granted, remaining, retry_after_us, reset_after_us}
+_GCRA_ACQUIRE_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local available = math.floor((now + tolerance - tat) / interval) + 1
+if available < 0 then available = 0 end
+local granted = math.min(requested, available)
+if granted > 0 then
+  tat = tat + granted * interval
+  redis.call('SET', KEYS[1], string.format('%.0f', tat), 'PX', math.ceil((tat - now) / 1000))
+end
+local retry_after = 0
+if granted == 0 then retry_after = tat - tolerance - now end
+return {granted, available - granted, retry_after, tat - now}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Rate limit of ``limit`` requests per ``period`` seconds."""
+
+    limit: int
+    period: float
+    burst: Optional[int] = None
+
+    _PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+    def __post_init__(self):
+        if self.limit <= 0 or self.period <= 0:
+            raise ValueError("Rate limit and period must be positive")
+
+    @classmethod
+    def parse(cls, rate_limit_str: str) -> "RateLimit":
+        """Parse rate limit string (e.g., '100/minute')."""
+        parts = rate_limit_str.split("/")
+        if len(parts) != 2:
+            raise ValueError(f"Invalid rate limit format: {rate_limit_str}")
+
+        period = parts[1].strip().lower()
+        if period not in cls._PERIODS:
+            raise ValueError(f"Invalid period: {period}")
+
+        return cls(limit=int(parts[0]), period=cls._PERIODS[period])
+
+    @property
+    def emission_interval(self) -> float:
+        """Seconds between requests at the sustained rate."""
+        return self.period / self.limit
+
+    @property
+    def tolerance(self) -> float:
+        """Burst tolerance in seconds (defaults to a full window of burst)."""
+        return self.emission_interval * ((self.burst or self.limit) - 1)
+
+    def __str__(self) -> str:
+        return f"{self.limit}/{self.period:g}s"
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of a rate limit check."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float = 0.0
+    reset_after: float = 0.0
+
+
+class RateLimiter:
+    """GCRA rate limiter with optional Redis backing and local token leases.
+
+    Without a Redis client the limiter works per process. With one, every
+    node shares the same budget: a node that misses locally atomically takes
+    a batch of up to ``max_batch`` tokens from Redis and serves subsequent
+    requests from that lease until it is used up or ``lease_seconds`` pass.
+    Unused leased tokens are forfeited, so batches are kept small relative to
+    the limit (limits below ``20 * max_batch`` use proportionally smaller
+    batches; strict limits such as 10/minute always go to Redis).
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        key_prefix: str = "neo_ratelimit",
+        max_batch: int = 10,
+        lease_seconds: float = 1.0,
+        max_local_keys: int = 100000,
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            redis_client: Async Redis client (e.g., redis.asyncio.Redis); None for per-process limiting
+            key_prefix: Prefix for Redis keys
+            max_batch: Maximum tokens leased from Redis per round trip
+            lease_seconds: Maximum lifetime of a local token lease
+            max_local_keys: Bound on locally tracked keys before expired ones are swept
+        """
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self.max_batch = max(1, max_batch)
+        self.lease_seconds = lease_seconds
+        self.max_local_keys = max_local_keys
+
+        self._script = redis_client.register_script(_GCRA_ACQUIRE_SCRIPT) if redis_client else None
+
+        # key -> [tokens, expires_at, remaining_hint]; tokens == 0 with a future
+        # expires_at caches a denial until the key can admit again
+        self._leases: Dict[str, list] = {}
+        # key -> theoretical arrival time, used without Redis or when Redis fails
+        self._local_tat: Dict[str, float] = {}
+
+        # Statistics
+        self._local_hits = 0
+        self._redis_calls = 0
+        self._redis_errors = 0
+        self._rejections = 0
+
+    def _batch_size(self, rate: RateLimit) -> int:
+        """Tokens to lease per Redis round trip for the given rate."""
+        return max(1, min(self.max_batch, rate.limit // 20))
+
+    async def acquire(self, key: str, rate: RateLimit) -> RateLimitDecision:
+        """Consume one token for ``key`` under ``rate``."""
+        now = time.monotonic()
+
+        lease = self._leases.get(key)
+        if lease is not None and lease[1] > now:
+            if lease[0] > 0:
+                lease[0] -= 1
+                if lease[0] == 0:
+                    del self._leases[key]
+                self._local_hits += 1
+                return RateLimitDecision(True, rate.limit, lease[2] + lease[0])
+            self._local_hits += 1
+            self._rejections += 1
+            return RateLimitDecision(False, rate.limit, 0, retry_after=lease[1] - now)
+
+        if self._script is None:
+            decision = self._acquire_local(key, rate, now)
+        else:
+            try:
+                decision = await self._acquire_redis(key, rate, now)
+            except Exception as e:
+                self._redis_errors += 1
+                logger.warning(f"Redis rate limit check failed, using local limiter: {e}")
+                decision = self._acquire_local(key, rate, now)
+
+        if not decision.allowed:
+            self._rejections += 1
+        return decision
+
+    async def _acquire_redis(self, key: str, rate: RateLimit, now: float) -> RateLimitDecision:
+        """Lease a batch of tokens from Redis."""
+        self._redis_calls += 1
+        batch = self._batch_size(rate)
+        interval_us = max(1, int(rate.emission_interval * 1_000_000))
+        tolerance_us = int(rate.tolerance * 1_000_000)
+
+        granted, remaining, retry_after_us, reset_after_us = await self._script(
+            keys=[f"{self.key_prefix}:{key}"],
+            args=[interval_us, tolerance_us, batch],
+        )
+        granted, remaining = int(granted), int(remaining)
+        retry_after = int(retry_after_us) / 1_000_000
+        reset_after = int(reset_after_us) / 1_000_000
+
+        if granted == 0:
+            self._store_lease(key, 0, now + retry_after, 0)
+            return RateLimitDecision(False, rate.limit, 0, retry_after, reset_after)
+
+        if granted > 1:
+            self._store_lease(key, granted - 1, now + self.lease_seconds, remaining)
+        else:
+            self._leases.pop(key, None)
+        return RateLimitDecision(True, rate.limit, remaining + granted - 1, 0.0, reset_after)
+
+    def _acquire_local(self, key: str, rate: RateLimit, now: float) -> RateLimitDecision:
+        """GCRA check against the in-process state."""
+        interval = rate.emission_interval
+        tat = max(self._local_tat.get(key, now), now)
+
+        if tat - now > rate.tolerance:
+            retry_after = tat - rate.tolerance - now
+            return RateLimitDecision(False, rate.limit, 0, retry_after, tat - now)
+
+        tat += interval
+        if key not in self._local_tat and len(self._local_tat) >= self.max_local_keys:
+            self._sweep_local(now)
+        self._local_tat[key] = tat
+
+        remaining = math.floor((rate.tolerance - (tat - now)) / interval) + 1
+        return RateLimitDecision(True, rate.limit, max(0, remaining), 0.0, tat - now)
+
+    def _store_lease(self, key: str, tokens: int, expires_at: float, remaining: int) -> None:
+        """Record a local lease, sweeping expired leases when the table is full."""
+        if key not in self._leases and len(self._leases) >= self.max_local_keys:
+            now = time.monotonic()
+            self._leases = {k: v for k, v in self._leases.items() if v[1] > now}
+        self._leases[key] = [tokens, expires_at, remaining]
+
+    def _sweep_local(self, now: float) -> None:
+        """Drop local GCRA state for keys that have fully recovered."""
+        self._local_tat = {k: tat for k, tat in self._local_tat.items() if tat > now}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics."""
+        return {
+            "backend": "redis" if self._script else "local",
+            "local_hits": self._local_hits,
+            "redis_calls": self._redis_calls,
+            "redis_errors": self._redis_errors,
+            "rejections": self._rejections,
+            "leased_keys": len(self._leases),
+            "local_keys": len(self._local_tat),
+        }
+
@@ -5,24 +5,68 @@ for enhanced application security and compliance.
 """
 
 import logging
+import math
 import time
 from typing import Optional, List, Dict, Any, Callable
 from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.cors import CORSMiddleware as StarletteCORSMiddleware
-from starlette.responses import Response
-from collections import defaultdict, deque
+from starlette.types import Receive, Scope, Send
 from datetime import datetime, timedelta
 import ipaddress
 import re
 
-from ...core.exceptions import SecurityError, RateLimitExceededError
+from ...core.exceptions import SecurityError
 from ...features.cache.services import CacheService
+from .rate_limiter import RateLimit, RateLimitDecision, RateLimiter
+from .asgi import ASGIMiddleware, HTTPRequestContext
 
 logger = logging.getLogger(__name__)
 
+_SUSPICIOUS_URL_PATTERN = re.compile(
+    "|".join([
+        r"\.\.[\/\\]",  # Directory traversal
+        r"<script",       # XSS attempts
+        r"javascript:",   # JavaScript injection
+        r"data:.*base64", # Data URI attacks
+        r"\x00",          # Null byte injection
+    ]),
+    re.IGNORECASE
+)
 
-class SecurityMiddleware(BaseHTTPMiddleware):
+_SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Content-Security-Policy": (
+        "default-src 'self'; "
+        "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
+        "style-src 'self' 'unsafe-inline'; "
+        "img-src 'self' data: https:; "
+        "connect-src 'self' https:; "
+        "font-src 'self' https:; "
+        "frame-ancestors 'none';"
+    ),
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+    "Permissions-Policy": (
+        "geolocation=(), "
+        "microphone=(), "
+        "camera=(), "
+        "payment=(), "
+        "usb=(), "
+        "magnetometer=(), "
+        "gyroscope=()"
+    )
+}
+
+_SECURITY_HEADERS_RAW = [
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in _SECURITY_HEADERS.items()
+]
+
+
+class SecurityMiddleware(ASGIMiddleware):
     """Comprehensive security middleware for FastAPI applications."""
     
     def __init__(
@@ -48,22 +92,13 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             re.compile(pattern, re.IGNORECASE) for pattern in self.blocked_user_agents
         ]
     
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Apply security checks and headers."""
+    async def on_request(self, ctx: HTTPRequestContext) -> None:
+        """Apply security checks."""
+        if not self.enable_request_validation:
+            return
         
         try:
-            # Validate request
-            if self.enable_request_validation:
-                await self._validate_request(request)
-            
-            # Process request
-            response = await call_next(request)
-            
-            # Add security headers
-            if self.enable_security_headers:
-                self._add_security_headers(response)
-            
-            return response
+            await self._validate_request(ctx.request)
         
         except SecurityError as e:
             logger.warning(f"Security violation: {e}")
@@ -75,6 +110,11 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             logger.error(f"Security middleware error: {e}")
             raise
     
+    def on_response_start(self, ctx: HTTPRequestContext, headers: MutableHeaders) -> None:
+        """Add security headers."""
+        if self.enable_security_headers:
+            self._add_security_headers(headers)
+    
     async def _validate_request(self, request: Request) -> None:
         """Validate incoming request for security issues."""
         
@@ -134,15 +174,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
     
     def _has_suspicious_patterns(self, url: str) -> bool:
         """Check for suspicious patterns in URL."""
-        suspicious_patterns = [
-            r"\.\.[\/\\]",  # Directory traversal
-            r"<script",       # XSS attempts
-            r"javascript:",   # JavaScript injection
-            r"data:.*base64", # Data URI attacks
-            r"\x00",          # Null byte injection
-        ]
-        
-        return any(re.search(pattern, url, re.IGNORECASE) for pattern in suspicious_patterns)
+        return _SUSPICIOUS_URL_PATTERN.search(url) is not None
     
     def _validate_headers(self, request: Request) -> None:
         """Validate request headers for security issues."""
@@ -156,37 +188,12 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             if "\x00" in name or "\x00" in value:
                 raise SecurityError("Null byte in header")
     
-    def _add_security_headers(self, response: Response) -> None:
-        """Add security headers to response."""
-        security_headers = {
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            "X-XSS-Protection": "1; mode=block",
-            "Referrer-Policy": "strict-origin-when-cross-origin",
-            "Content-Security-Policy": (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
-                "style-src 'self' 'unsafe-inline'; "
-                "img-src 'self' data: https:; "
-                "connect-src 'self' https:; "
-                "font-src 'self' https:; "
-                "frame-ancestors 'none';"
-            ),
-            "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
-            "Permissions-Policy": (
-                "geolocation=(), "
-                "microphone=(), "
-                "camera=(), "
-                "payment=(), "
-                "usb=(), "
-                "magnetometer=(), "
-                "gyroscope=()"
-            )
-        }
-        
-        for header, value in security_headers.items():
-            if header not in response.headers:
-                response.headers[header] = value
+    def _add_security_headers(self, headers: MutableHeaders) -> None:
+        """Add security headers the response does not set itself."""
+        # Appending pre-encoded pairs avoids a header list scan per header
+        raw = headers.raw
+        present = {name for name, _ in raw}
+        raw.extend(item for item in _SECURITY_HEADERS_RAW if item[0] not in present)
 
 
 class CORSMiddleware(StarletteCORSMiddleware):
@@ -217,80 +224,79 @@ class CORSMiddleware(StarletteCORSMiddleware):
             max_age=max_age
         )
     
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Enhanced CORS handling with logging."""
-        origin = request.headers.get("origin")
-        
-        # Log CORS rejections if enabled
-        if self.log_cors_rejections and origin:
-            if not self.is_allowed_origin(origin):
+        if self.log_cors_rejections and scope["type"] == "http":
+            origin = Headers(scope=scope).get("origin")
+            
+            # Log CORS rejections if enabled
+            if origin and not self.is_allowed_origin(origin):
                 logger.warning(
-                    f"CORS request rejected: origin={origin}, path={request.url.path}"
+                    f"CORS request rejected: origin={origin}, path={scope['path']}"
                 )
         
-        return await super().dispatch(request, call_next)
+        await super().__call__(scope, receive, send)
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware with multiple strategies."""
+class RateLimitMiddleware(ASGIMiddleware):
+    """Rate limiting middleware with multiple strategies.
+    
+    Limits are enforced by a shared ``RateLimiter``; pass one built with a
+    Redis client to share budgets across nodes.
+    """
     
     def __init__(
         self,
         app,
-        cache_service: CacheService,
+        cache_service: Optional[CacheService] = None,
         default_rate_limit: str = "100/minute",
         burst_rate_limit: str = "20/second",
         rate_limit_by: str = "ip",  # ip, user, tenant
         exempt_paths: Optional[List[str]] = None,
         custom_limits: Optional[Dict[str, str]] = None,
-        enable_burst_protection: bool = True
+        enable_burst_protection: bool = True,
+        rate_limiter: Optional[RateLimiter] = None
     ):
         super().__init__(app)
         self.cache_service = cache_service
-        self.default_rate_limit = self._parse_rate_limit(default_rate_limit)
-        self.burst_rate_limit = self._parse_rate_limit(burst_rate_limit) if enable_burst_protection else None
+        self.default_rate_limit = RateLimit.parse(default_rate_limit)
+        self.burst_rate_limit = RateLimit.parse(burst_rate_limit) if enable_burst_protection else None
         self.rate_limit_by = rate_limit_by
         self.exempt_paths = exempt_paths or ["/health", "/metrics"]
-        self.custom_limits = {k: self._parse_rate_limit(v) for k, v in (custom_limits or {}).items()}
-        
-        # In-memory backup for high-frequency checks
-        self.local_counters = defaultdict(lambda: defaultdict(deque))
+        self.custom_limits = {k: RateLimit.parse(v) for k, v in (custom_limits or {}).items()}
+        self.rate_limiter = rate_limiter or RateLimiter()
     
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Apply rate limiting."""
+    async def on_request(self, ctx: HTTPRequestContext) -> None:
+        """Apply rate limiting (exempt paths are skipped by ``applies``)."""
+        request = ctx.request
         
-        # Skip rate limiting for exempt paths
-        if any(request.url.path.startswith(path) for path in self.exempt_paths):
-            return await call_next(request)
+        # Get rate limit key
+        limit_key = self._get_rate_limit_key(request)
         
-        try:
-            # Get rate limit key
-            limit_key = self._get_rate_limit_key(request)
-            
-            # Check rate limits
-            await self._check_rate_limits(request, limit_key)
-            
-            # Process request
-            response = await call_next(request)
-            
-            # Add rate limit headers
-            self._add_rate_limit_headers(response, limit_key)
-            
-            return response
+        # Check rate limits
+        decision = await self._check_rate_limits(request, limit_key)
         
-        except RateLimitExceededError as e:
+        if not decision.allowed:
             logger.warning(
-                f"Rate limit exceeded: key={limit_key}, path={request.url.path}"
+                f"Rate limit exceeded: key={limit_key}, path={ctx.path}"
             )
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=str(e),
+                detail=f"Rate limit exceeded: {decision.limit} requests",
                 headers={
-                    "Retry-After": "60",
-                    "X-RateLimit-Limit": str(self.default_rate_limit[0]),
+                    "Retry-After": str(max(1, math.ceil(decision.retry_after))),
+                    "X-RateLimit-Limit": str(decision.limit),
                     "X-RateLimit-Remaining": "0"
                 }
             )
+        
+        ctx.values["rate_limit_decision"] = decision
+    
+    def on_response_start(self, ctx: HTTPRequestContext, headers: MutableHeaders) -> None:
+        """Add rate limit headers."""
+        decision = ctx.values.get("rate_limit_decision")
+        if decision is not None:
+            self._add_rate_limit_headers(headers, decision)
     
     def _get_rate_limit_key(self, request: Request) -> str:
         """Generate rate limit key based on configuration."""
@@ -322,86 +328,30 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             client_ip = self._get_client_ip(request)
             return f"rate_limit:ip:{client_ip}"
     
-    async def _check_rate_limits(self, request: Request, limit_key: str) -> None:
-        """Check if request exceeds rate limits."""
-        current_time = time.time()
+    async def _check_rate_limits(self, request: Request, limit_key: str) -> RateLimitDecision:
+        """Check request against all applicable limits.
         
+        Returns the first rejecting decision, or the default limit's decision.
+        """
         # Check burst rate limit first (if enabled)
         if self.burst_rate_limit:
-            burst_key = f"{limit_key}:burst"
-            await self._check_single_rate_limit(
-                burst_key, self.burst_rate_limit, current_time
-            )
+            decision = await self.rate_limiter.acquire(f"{limit_key}:burst", self.burst_rate_limit)
+            if not decision.allowed:
+                return decision
         
         # Check default rate limit
-        await self._check_single_rate_limit(
-            limit_key, self.default_rate_limit, current_time
-        )
+        default_decision = await self.rate_limiter.acquire(limit_key, self.default_rate_limit)
+        if not default_decision.allowed:
+            return default_decision
         
         # Check custom limits for specific paths
         for path_pattern, limit in self.custom_limits.items():
-            if request.url.path.startswith(path_pattern):
-                custom_key = f"{limit_key}:{path_pattern}"
-                await self._check_single_rate_limit(
-                    custom_key, limit, current_time
-                )
-    
-    async def _check_single_rate_limit(
-        self, 
-        key: str, 
-        limit: tuple, 
-        current_time: float
-    ) -> None:
-        """Check a single rate limit."""
-        limit_count, limit_window = limit
-        window_start = current_time - limit_window
-        
-        # Use local counter for high-frequency checks
-        local_key = f"{key}:{int(current_time // limit_window)}"
-        request_times = self.local_counters[local_key]['times']
-        
-        # Clean old entries
-        while request_times and request_times[0] < window_start:
-            request_times.popleft()
-        
-        # Check if limit exceeded
-        if len(request_times) >= limit_count:
-            raise RateLimitExceededError(
-                f"Rate limit exceeded: {limit_count} requests per {limit_window} seconds"
-            )
-        
-        # Record this request
-        request_times.append(current_time)
+            if request.scope["path"].startswith(path_pattern):
+                decision = await self.rate_limiter.acquire(f"{limit_key}:{path_pattern}", limit)
+                if not decision.allowed:
+                    return decision
         
-        # Also update cache for persistence (async)
-        try:
-            await self.cache_service.increment(
-                key, 
-                ttl=int(limit_window)
-            )
-        except Exception as e:
-            logger.warning(f"Failed to update rate limit cache: {e}")
-    
-    def _parse_rate_limit(self, rate_limit_str: str) -> tuple:
-        """Parse rate limit string (e.g., '100/minute') to (count, seconds)."""
-        parts = rate_limit_str.split("/")
-        if len(parts) != 2:
-            raise ValueError(f"Invalid rate limit format: {rate_limit_str}")
-        
-        count = int(parts[0])
-        period = parts[1].lower()
-        
-        period_map = {
-            "second": 1,
-            "minute": 60,
-            "hour": 3600,
-            "day": 86400
-        }
-        
-        if period not in period_map:
-            raise ValueError(f"Invalid period: {period}")
-        
-        return count, period_map[period]
+        return default_decision
     
     def _get_client_ip(self, request: Request) -> str:
         """Get client IP address."""
@@ -418,15 +368,10 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         
         return "unknown"
     
-    def _add_rate_limit_headers(self, response: Response, limit_key: str) -> None:
+    def _add_rate_limit_headers(self, headers: MutableHeaders, decision: RateLimitDecision) -> None:
         """Add rate limit headers to response."""
-        limit_count, limit_window = self.default_rate_limit
-        
-        # Calculate remaining requests (simplified)
-        remaining = max(0, limit_count - 1)  # Approximate
-        
-        response.headers.update({
-            "X-RateLimit-Limit": str(limit_count),
-            "X-RateLimit-Remaining": str(remaining),
-            "X-RateLimit-Reset": str(int(time.time() + limit_window))
-        })
\ No newline at end of file
+        headers.update({
+            "X-RateLimit-Limit": str(decision.limit),
+            "X-RateLimit-Remaining": str(decision.remaining),
+            "X-RateLimit-Reset": str(int(time.time() + decision.reset_after))
+        })
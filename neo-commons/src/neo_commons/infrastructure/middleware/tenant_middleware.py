@@ -7,8 +7,7 @@ and request routing based on tenant identification.
 import logging
 from typing import Optional, Dict, Any
 from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ...core.value_objects import TenantId
 from ...core.shared.context import RequestContext
@@ -16,11 +15,12 @@ from ...core.exceptions import TenantNotFoundError, AuthorizationError
 from ...features.tenants.services import TenantService
 from ...features.cache.services import CacheService
 from ...features.database.services import DatabaseService
+from .asgi import ASGIMiddleware, HTTPRequestContext
 
 logger = logging.getLogger(__name__)
 
 
-class TenantContextMiddleware(BaseHTTPMiddleware):
+class TenantContextMiddleware(ASGIMiddleware):
     """FastAPI middleware for tenant context management and isolation."""
     
     def __init__(
@@ -47,12 +47,9 @@ class TenantContextMiddleware(BaseHTTPMiddleware):
             "/admin"  # Platform admin endpoints
         ]
     
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Process tenant context for incoming requests."""
-        
-        # Skip tenant resolution for exempt paths
-        if any(request.url.path.startswith(path) for path in self.exempt_paths):
-            return await call_next(request)
+    async def on_request(self, ctx: HTTPRequestContext) -> None:
+        """Process tenant context for incoming requests (exempt paths are skipped by ``applies``)."""
+        request = ctx.request
         
         try:
             # Extract tenant identifier from request
@@ -104,8 +101,6 @@ class TenantContextMiddleware(BaseHTTPMiddleware):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Internal tenant resolution error"
             )
-        
-        return await call_next(request)
     
     async def _extract_tenant_id(self, request: Request) -> Optional[TenantId]:
         """Extract tenant ID from request headers, subdomain, or path."""
@@ -182,7 +177,7 @@ class TenantContextMiddleware(BaseHTTPMiddleware):
             # Set schema context in database service
             await self.database_service.set_schema_context(schema_name)
             
-            logger.debug(f"Database schema configured: {schema_name} for tenant {tenant_id}")
+            logger.debug("Database schema configured: %s for tenant %s", schema_name, tenant_id)
     
     def _extract_subdomain(self, host: str) -> Optional[str]:
         """Extract subdomain from host header."""
@@ -208,24 +203,29 @@ class TenantContextMiddleware(BaseHTTPMiddleware):
         return any(request.url.path.startswith(path) for path in tenant_paths)
 
 
-class MultiTenantDatabaseMiddleware(BaseHTTPMiddleware):
-    """Specialized middleware for tenant database schema management."""
+class MultiTenantDatabaseMiddleware:
+    """Specialized middleware for tenant database schema management.
     
-    def __init__(self, app, database_service: DatabaseService):
-        super().__init__(app)
+    Plain ASGI middleware: the schema context has to wrap the whole app
+    call, which the request hooks of ``ASGIMiddleware`` cannot express.
+    """
+    
+    def __init__(self, app: ASGIApp, database_service: DatabaseService):
+        self.app = app
         self.database_service = database_service
     
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Ensure proper database schema context throughout request."""
         
         # Get tenant context from previous middleware
-        tenant_context = getattr(request.state, 'tenant_context', None)
+        tenant_context = scope.get("state", {}).get("tenant_context") if scope["type"] == "http" else None
         
         if tenant_context:
             schema_name = tenant_context.get("schema_name")
             
             # Set schema for the entire request lifecycle
             async with self.database_service.schema_context(schema_name):
-                return await call_next(request)
+                await self.app(scope, receive, send)
+                return
         
-        return await call_next(request)
\ No newline at end of file
+        await self.app(scope, receive, send)
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""Tracing middleware for FastAPI applications.
+
+Continues the caller's trace from the W3C ``traceparent`` header (or starts
+a new one) and makes the request span current, so database, cache,
+Keycloak and event spans created while handling the request nest under it.
+"""
+
+import logging
+from typing import List, Optional
+
+from starlette.datastructures import MutableHeaders
+
+from ..tracing import SpanKind, extract, get_tracer
+from .asgi import ASGIMiddleware, HTTPRequestContext
+
+logger = logging.getLogger(__name__)
+
+
+class TracingMiddleware(ASGIMiddleware):
+    """Server span per HTTP request with W3C trace context propagation.
+
+    With tracing disabled, an incoming ``traceparent`` is still made current
+    so it propagates to outgoing calls and published events unchanged.
+    """
+
+    def __init__(
+        self,
+        app,
+        exempt_paths: Optional[List[str]] = None,
+        add_trace_header: bool = True,
+    ):
+        """Initialize tracing middleware.
+
+        Args:
+            app: Downstream ASGI app
+            exempt_paths: Paths that are never traced
+            add_trace_header: Return the trace ID in an ``X-Trace-ID`` header
+        """
+        super().__init__(app)
+        self.exempt_paths = exempt_paths or ["/health", "/metrics"]
+        self.add_trace_header = add_trace_header
+
+    async def on_request(self, ctx: HTTPRequestContext) -> None:
+        """Start the request span and make it current."""
+        tracer = get_tracer()
+        parent = extract(ctx.headers)
+        if parent is None and not tracer.enabled:
+            return
+
+        span = tracer.start_span(
+            f"HTTP {ctx.method}",
+            SpanKind.SERVER,
+            {"http.method": ctx.method, "http.target": ctx.path},
+            parent=parent,
+        )
+        scope = tracer.use_span(span, end_on_exit=True)
+        scope.__enter__()
+        ctx.values["tracing"] = scope
+
+    def on_response_start(self, ctx: HTTPRequestContext, headers: MutableHeaders) -> None:
+        """Return the trace ID to the client."""
+        scope = ctx.values.get("tracing")
+        if self.add_trace_header and scope is not None and scope.span.context is not None:
+            headers["X-Trace-ID"] = scope.span.context.trace_id_hex
+
+    async def on_complete(self, ctx: HTTPRequestContext) -> None:
+        """Name the span after the matched route, end it and restore the context."""
+        scope = ctx.values.pop("tracing", None)
+        if scope is None:
+            return
+
+        span = scope.span
+        if span.recording:
+            route = ctx.route_template
+            span.name = f"HTTP {ctx.method} {route}"
+            span.set_attribute("http.route", route)
+            span.set_attribute("http.status_code", ctx.status_code)
+            if ctx.error is not None:
+                span.record_exception(ctx.error)
+            elif ctx.status_code is not None and ctx.status_code >= 500:
+                span.error = f"HTTP {ctx.status_code}"
+        scope.__exit__(None, None, None)
@@ -20,12 +20,53 @@ from .performance import (
     performance_timer,
 )
 
+from .metrics_recorder import (
+    QuantileSketch,
+    OperationRecorder,
+    RecorderDelta,
+)
+
+from .metrics_registry import (
+    MetricsRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    get_metrics_registry,
+    set_metrics_registry,
+)
+
+from .metrics_collectors import (
+    register_performance_monitor,
+    register_connection_pools,
+    register_cache_repository,
+    register_token_cache,
+    register_error_middleware,
+    register_performance_middleware,
+    register_event_loop_monitor,
+)
+
 from .persistence import (
     PerformanceStorage,
     DatabasePerformanceStorage,
     BackgroundMetricsPersister,
 )
 
+from .rollups import (
+    RollupBucket,
+    MetricsRollup,
+)
+
+from .request_profiling import (
+    ProcessResourceSampler,
+    SlowRequestProfiler,
+    get_resource_sampler,
+)
+
+from .loop_monitor import (
+    EventLoopMonitor,
+    get_event_loop_monitor,
+)
+
 __all__ = [
     # Core classes
     "PerformanceLevel",
@@ -48,8 +89,39 @@ __all__ = [
     # Context manager
     "performance_timer",
     
+    # Recording
+    "QuantileSketch",
+    "OperationRecorder",
+    "RecorderDelta",
+    
+    # Metrics exposition
+    "MetricsRegistry",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "get_metrics_registry",
+    "set_metrics_registry",
+    "register_performance_monitor",
+    "register_connection_pools",
+    "register_cache_repository",
+    "register_token_cache",
+    "register_error_middleware",
+    "register_performance_middleware",
+    "register_event_loop_monitor",
+    
     # Database persistence (optional)
     "PerformanceStorage",
     "DatabasePerformanceStorage", 
     "BackgroundMetricsPersister",
+    "RollupBucket",
+    "MetricsRollup",
+    
+    # Request instrumentation
+    "ProcessResourceSampler",
+    "SlowRequestProfiler",
+    "get_resource_sampler",
+    
+    # Event loop health
+    "EventLoopMonitor",
+    "get_event_loop_monitor",
 ]
\ No newline at end of file
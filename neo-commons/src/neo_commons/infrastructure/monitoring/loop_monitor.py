@@ -0,0 +1,223 @@
+"""Event-loop lag and blocking-call detection.
+
+``EventLoopMonitor`` runs a heartbeat task that sleeps for a fixed interval
+and measures how late it wakes up; that delay is what every other ready
+callback waited too. Lag samples go to the performance monitor (operation
+``event_loop.lag``) and to the ``neo_event_loop_lag_seconds`` histogram.
+
+A watchdog thread notices when the heartbeat is overdue by more than the
+block threshold and samples the loop thread's stack for as long as the loop
+stays blocked, so a block report names the code holding the loop
+(a synchronous ``jwt.decode``, a large serialization, ...), not just how
+long it took.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional
+
+from .metrics_collectors import register_event_loop_monitor
+from .metrics_recorder import OperationRecorder
+from .metrics_registry import MetricsRegistry, get_metrics_registry
+from .performance import PerformanceLevel, PerformanceMonitor, get_performance_monitor
+from .request_profiling import collapse_stack, thread_stack
+
+logger = logging.getLogger(__name__)
+
+# Performance monitor operation receiving the lag samples
+LAG_OPERATION = "event_loop.lag"
+
+
+class EventLoopMonitor:
+    """Measures event-loop lag and captures the stacks of blocking calls."""
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        block_threshold: float = 0.1,
+        sample_interval: Optional[float] = None,
+        max_reports: int = 50,
+        max_depth: int = 64,
+        performance_monitor: Optional[PerformanceMonitor] = None,
+        metrics_registry: Optional[MetricsRegistry] = None,
+    ):
+        """Initialize monitor.
+
+        Args:
+            interval: Seconds between heartbeats
+            block_threshold: Lag in seconds reported as a blocked loop
+            sample_interval: Seconds between stack samples of a blocked loop
+                (a quarter of the threshold, at most 25ms, by default)
+            max_reports: Number of block reports kept
+            max_depth: Maximum frames per recorded stack
+            performance_monitor: Receives lag samples (global monitor by default)
+            metrics_registry: Registry for the lag histogram (global registry by default)
+        """
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.sample_interval = sample_interval or min(block_threshold / 4, 0.025)
+        self.max_depth = max_depth
+        self.performance_monitor = performance_monitor or get_performance_monitor()
+        self.metrics_registry = metrics_registry or get_metrics_registry()
+        self._lag_histogram = self.metrics_registry.histogram(
+            "neo_event_loop_lag_seconds", "Delay of scheduled event loop wakeups"
+        )
+        register_event_loop_monitor(self.metrics_registry, self)
+
+        self.checks = 0
+        self.blocks = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self._reports: Deque[Dict[str, Any]] = deque(maxlen=max_reports)
+        self._recorder: Optional[OperationRecorder] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        # perf_counter time the heartbeat is due to wake up; 0 when not running
+        self._due = 0.0
+        self._block_due = 0.0
+        self._block_stacks: Counter = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start monitoring the running event loop (idempotent; call from the loop)."""
+        loop = asyncio.get_running_loop()
+        if loop is self._loop and self._task is not None and not self._task.done():
+            return
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._task = loop.create_task(self._heartbeat(), name="neo-loop-monitor")
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name="neo-loop-watchdog", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the heartbeat and the watchdog thread."""
+        self._stop.set()
+        task, loop = self._task, self._loop
+        if task is not None and loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(task.cancel)
+        self._task = None
+        self._due = 0.0
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Lag and block counters."""
+        recorder = self._recorder
+        stats = {
+            "checks": self.checks,
+            "blocks": self.blocks,
+            "last_lag_ms": round(self.last_lag_ms, 2),
+            "max_lag_ms": round(self.max_lag_ms, 2),
+        }
+        if recorder is not None and recorder.sampled:
+            p50, p99 = recorder.sketch.quantiles((0.5, 0.99))
+            stats["p50_lag_ms"] = round(p50, 2)
+            stats["p99_lag_ms"] = round(p99, 2)
+        return stats
+
+    def get_reports(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Most recent block reports, newest last."""
+        reports = list(self._reports)
+        return reports[-limit:] if limit else reports
+
+    async def _heartbeat(self) -> None:
+        interval = self.interval
+        perf_counter = time.perf_counter
+        try:
+            while True:
+                due = perf_counter() + interval
+                self._due = due
+                await asyncio.sleep(interval)
+                lag = perf_counter() - due
+                self._record(lag if lag > 0 else 0.0, due)
+        finally:
+            self._due = 0.0
+
+    def _record(self, lag: float, due: float) -> None:
+        lag_ms = lag * 1000
+        self.checks += 1
+        self.last_lag_ms = lag_ms
+        if lag_ms > self.max_lag_ms:
+            self.max_lag_ms = lag_ms
+        self._lag_histogram.observe(lag)
+
+        monitor = self.performance_monitor
+        if monitor.is_enabled():
+            if self._recorder is None:
+                self._recorder = monitor.recorder(LAG_OPERATION, PerformanceLevel.MEDIUM)
+            self._recorder.calls += 1
+            self._recorder.record(lag_ms, weight=1)
+
+        if lag >= self.block_threshold:
+            self._report_block(lag_ms, due)
+
+    def _report_block(self, lag_ms: float, due: float) -> None:
+        with self._lock:
+            stacks = self._block_stacks if self._block_due == due else Counter()
+            self._block_stacks = Counter()
+            self._block_due = 0.0
+
+        self.blocks += 1
+        report = {
+            "timestamp": time.time(),
+            "lag_ms": round(lag_ms, 2),
+            "samples": sum(stacks.values()),
+            "stacks": dict(stacks.most_common()),
+        }
+        self._reports.append(report)
+
+        top = stacks.most_common(1)
+        logger.warning(
+            "Event loop blocked for %.1fms%s",
+            lag_ms,
+            f" in {top[0][0].rsplit(';', 1)[-1]}" if top else "",
+            extra={"performance_metrics": report},
+        )
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.sample_interval):
+            due = self._due
+            if not due or time.perf_counter() - due < self.block_threshold:
+                continue
+            loop = self._loop
+            if loop is None or not loop.is_running():
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            try:
+                stack = collapse_stack(thread_stack(frame, self.max_depth))
+            except Exception:
+                # Frames change under us; a lost sample is fine
+                continue
+            with self._lock:
+                if self._block_due != due:
+                    self._block_stacks = Counter()
+                    self._block_due = due
+                self._block_stacks[stack] += 1
+
+
+_event_loop_monitor: Optional[EventLoopMonitor] = None
+
+
+def get_event_loop_monitor() -> EventLoopMonitor:
+    """Get the process-wide event loop monitor (started with ``start()`` on the loop)."""
+    global _event_loop_monitor
+    if _event_loop_monitor is None:
+        _event_loop_monitor = EventLoopMonitor()
+    return _event_loop_monitor
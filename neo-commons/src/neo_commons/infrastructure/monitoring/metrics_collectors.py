@@ -0,0 +1,226 @@
+"""Scrape-time collectors exposing built-in component statistics.
+
+Each ``register_*`` function registers a collector that reads a component's
+existing statistics (``get_stats()``, ``PoolMetrics``, ...) when
+``/metrics`` is scraped and turns them into metric families. Components are
+duck-typed so this module does not import them.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric, SummaryMetricFamily
+
+from .metrics_registry import MetricsRegistry, get_metrics_registry
+from .performance import PerformanceStats, get_performance_monitor
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+# PoolMetrics fields: (metric suffix, documentation, is counter, scale)
+_POOL_FIELDS = {
+    "total_connections": ("connections", "Connections in the pool", False, 1),
+    "active_connections": ("active_connections", "Connections in use", False, 1),
+    "idle_connections": ("idle_connections", "Idle connections", False, 1),
+    "total_connections_created": ("connections_created", "Connections created", True, 1),
+    "failed_connections": ("connection_failures", "Failed connection attempts", True, 1),
+    "health_check_failures": ("health_check_failures", "Failed health checks", True, 1),
+    "total_queries": ("queries", "Queries executed", True, 1),
+    "failed_queries": ("failed_queries", "Queries that failed", True, 1),
+    "acquisition_timeouts": ("acquisition_timeouts", "Connection acquisition timeouts", True, 1),
+    "avg_response_time_ms": ("response_time_avg_seconds", "Average query response time", False, 0.001),
+    "p95_response_time_ms": ("response_time_p95_seconds", "95th percentile query response time", False, 0.001),
+    "p99_response_time_ms": ("response_time_p99_seconds", "99th percentile query response time", False, 0.001),
+    "connection_acquisition_time_ms": (
+        "acquisition_time_avg_seconds", "Average connection acquisition time", False, 0.001
+    ),
+    "saturation_level": ("saturation", "Pool saturation (0 idle, 1 saturated)", False, 1),
+    "health_score": ("health_score", "Pool health score (0-100)", False, 1),
+    "queries_per_second": ("queries_per_second", "Recent query rate", False, 1),
+}
+
+
+def metric_name(*parts: str) -> str:
+    """Join parts into a valid metric name."""
+    return _INVALID_NAME_CHARS.sub("_", "_".join(part for part in parts if part)).lower()
+
+
+def stats_families(
+    prefix: str,
+    stats: Dict[str, Any],
+    labels: Dict[str, str],
+    counters: Iterable[str] = (),
+) -> List[Metric]:
+    """Turn the numeric entries of a ``get_stats()`` dict into metric families.
+
+    Args:
+        prefix: Metric name prefix, e.g. ``neo_cache``
+        stats: Statistics dict; non-numeric entries are skipped
+        labels: Labels identifying the component instance
+        counters: Keys that are monotonically increasing counters
+    """
+    counters = set(counters)
+    families: List[Metric] = []
+    for key, value in stats.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        name = metric_name(prefix, key)
+        if key in counters:
+            family = CounterMetricFamily(name, f"{prefix} {key}", labels=list(labels))
+        else:
+            family = GaugeMetricFamily(name, f"{prefix} {key}", labels=list(labels))
+        family.add_metric(list(labels.values()), value)
+        families.append(family)
+    return families
+
+
+def register_performance_monitor(registry: Optional[MetricsRegistry] = None, monitor: Any = None) -> None:
+    """Expose ``PerformanceMonitor`` operations as summaries with quantiles."""
+    registry = registry or get_metrics_registry()
+    monitor = monitor or get_performance_monitor()
+
+    def collect() -> List[Metric]:
+        duration = SummaryMetricFamily(
+            "neo_operation_duration_seconds", "Monitored operation duration", labels=["operation", "level"]
+        )
+        errors = CounterMetricFamily(
+            "neo_operation_errors", "Monitored operation errors", labels=["operation", "level"]
+        )
+        violations = CounterMetricFamily(
+            "neo_operation_threshold_violations",
+            "Monitored operation calls over their threshold",
+            labels=["operation", "level"],
+        )
+        for name, recorder in monitor.get_recorders().items():
+            if not recorder.calls:
+                continue
+            stats = PerformanceStats.from_recorder(recorder)
+            level = recorder.level.value
+            labels = {"operation": name, "level": level}
+            for quantile, value in (
+                ("0.5", stats.p50_time_ms),
+                ("0.95", stats.p95_time_ms),
+                ("0.99", stats.p99_time_ms),
+                ("0.999", stats.p999_time_ms),
+            ):
+                duration.add_sample(
+                    "neo_operation_duration_seconds", {**labels, "quantile": quantile}, value / 1000
+                )
+            duration.add_metric([name, level], stats.call_count, stats.total_time_ms / 1000)
+            errors.add_metric([name, level], stats.error_count)
+            violations.add_metric([name, level], stats.threshold_violations)
+        return [duration, errors, violations]
+
+    registry.register_collector("performance_monitor", collect)
+
+
+def register_connection_pools(registry: Optional[MetricsRegistry], connection_manager: Any) -> None:
+    """Expose ``PoolMetrics`` of every pool, labelled by pool name.
+
+    Args:
+        registry: Target registry (global registry when None)
+        connection_manager: Object with ``async get_all_pool_metrics()``
+    """
+    registry = registry or get_metrics_registry()
+
+    async def collect() -> List[Metric]:
+        pools = await connection_manager.get_all_pool_metrics()
+        families: Dict[str, Metric] = {}
+        for field_name, (suffix, documentation, is_counter, _) in _POOL_FIELDS.items():
+            family_class = CounterMetricFamily if is_counter else GaugeMetricFamily
+            families[field_name] = family_class(f"neo_db_pool_{suffix}", documentation, labels=["pool"])
+        for pool_name, metrics in pools.items():
+            for field_name, (_, _, _, scale) in _POOL_FIELDS.items():
+                value = getattr(metrics, field_name, None)
+                if value is not None:
+                    families[field_name].add_metric([pool_name], value * scale)
+        return list(families.values())
+
+    registry.register_collector("connection_pools", collect)
+
+
+def register_cache_repository(
+    registry: Optional[MetricsRegistry],
+    repository: Any,
+    cache_name: str,
+    counters: Sequence[str] = (
+        "hits", "misses", "sets", "deletes", "expired_cleanups", "evictions",
+        "hit_count", "miss_count", "get_count", "set_count", "delete_count", "error_count",
+    ),
+) -> None:
+    """Expose a cache repository's ``get_stats()`` (sync or async)."""
+    registry = registry or get_metrics_registry()
+
+    async def collect() -> List[Metric]:
+        stats = repository.get_stats()
+        if hasattr(stats, "__await__"):
+            stats = await stats
+        return stats_families("neo_cache", stats, {"cache": cache_name}, counters)
+
+    registry.register_collector(f"cache:{cache_name}", collect)
+
+
+def register_token_cache(registry: Optional[MetricsRegistry], token_cache: Any, cache_name: str = "tokens") -> None:
+    """Expose ``MemoryTokenCache.get_stats()``."""
+    register_cache_repository(registry, token_cache, cache_name)
+
+
+def register_error_middleware(registry: Optional[MetricsRegistry], middleware: Any) -> None:
+    """Expose ``ErrorHandlingMiddleware`` error statistics."""
+    registry = registry or get_metrics_registry()
+
+    def collect() -> List[Metric]:
+        stats = middleware.get_error_stats()
+        by_type = CounterMetricFamily("neo_http_errors_by_type", "Handled errors by exception type", labels=["type"])
+        for error_type, count in stats["errors_by_type"].items():
+            by_type.add_metric([error_type], count)
+        by_status = CounterMetricFamily("neo_http_errors_by_status", "Handled errors by status code", labels=["status"])
+        for status_code, count in stats["errors_by_status"].items():
+            by_status.add_metric([str(status_code)], count)
+        total = CounterMetricFamily("neo_http_errors", "Handled errors")
+        total.add_metric([], stats["total_errors"])
+        return [total, by_type, by_status]
+
+    registry.register_collector("error_middleware", collect)
+
+
+def register_performance_middleware(registry: Optional[MetricsRegistry], middleware: Any) -> None:
+    """Expose ``PerformanceMiddleware.performance_stats``."""
+    registry = registry or get_metrics_registry()
+
+    def collect() -> List[Metric]:
+        stats = middleware.performance_stats
+        return stats_families(
+            "neo_http",
+            {
+                "requests": stats["total_requests"],
+                "response_time_seconds": stats["total_response_time"] / 1000,
+                "slow_requests": stats["slow_requests"],
+                "error_requests": stats["error_requests"],
+                "peak_memory_mb": stats["peak_memory_mb"],
+                "peak_cpu_percent": stats["peak_cpu_percent"],
+            },
+            {},
+            counters=("requests", "response_time_seconds", "slow_requests", "error_requests"),
+        )
+
+    registry.register_collector("performance_middleware", collect)
+
+
+def register_event_loop_monitor(registry: Optional[MetricsRegistry], loop_monitor: Any) -> None:
+    """Expose ``EventLoopMonitor.get_stats()``."""
+    registry = registry or get_metrics_registry()
+
+    def collect() -> List[Metric]:
+        stats = loop_monitor.get_stats()
+        return stats_families(
+            "neo_event_loop",
+            {
+                "blocks": stats["blocks"],
+                "max_lag_seconds": stats["max_lag_ms"] / 1000,
+                "last_lag_seconds": stats["last_lag_ms"] / 1000,
+            },
+            {},
+            counters=("blocks",),
+        )
+
+    registry.register_collector("event_loop_monitor", collect)
@@ -0,0 +1,317 @@
+"""Bounded per-operation metric recording.
+
+``PerformanceMonitor`` keeps one ``OperationRecorder`` per operation
+instead of a list of every measurement. A recorder holds running counters,
+a fixed-size ring buffer of recent samples, and a ``QuantileSketch`` for
+percentiles, so memory per operation is constant however often it runs.
+
+Recording takes no locks. Under the GIL the worst a race between threads
+can do is drop a sample or a count, which is acceptable for monitoring.
+"""
+
+import math
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# (wall-clock timestamp, execution time ms, error occurred, metadata, calls represented)
+Sample = Tuple[float, float, bool, Optional[Dict[str, Any]], int]
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with bounded relative error.
+
+    Values are counted in logarithmic buckets (as in DDSketch): a value
+    ``v`` falls into bucket ``ceil(log(v) / log(gamma))``, so any quantile
+    is returned within ``relative_accuracy`` of the true value. Sketches
+    with the same accuracy merge by adding bucket counts.
+    """
+
+    __slots__ = ("relative_accuracy", "min_value", "count", "zero_count", "buckets", "_gamma", "_inv_log_gamma")
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-6):
+        """Initialize sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+            min_value: Values at or below this are counted as zero
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.count = 0
+        self.zero_count = 0
+        self.buckets: Dict[int, int] = {}
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._inv_log_gamma = 1 / math.log(self._gamma)
+
+    def add(self, value: float) -> None:
+        """Count one value."""
+        self.count += 1
+        if value <= self.min_value:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) * self._inv_log_gamma)
+        buckets = self.buckets
+        buckets[key] = buckets.get(key, 0) + 1
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add the counts of another sketch with the same accuracy."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        self.count += other.count
+        self.zero_count += other.zero_count
+        buckets = self.buckets
+        for key, count in other.buckets.items():
+            buckets[key] = buckets.get(key, 0) + count
+
+    def subtract(self, other: "QuantileSketch") -> None:
+        """Remove the counts of another sketch with the same accuracy.
+
+        Counts never go below zero, so subtracting values that were not
+        added leaves the sketch unchanged rather than corrupted.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot subtract sketches with different relative accuracy")
+        self.zero_count = max(self.zero_count - other.zero_count, 0)
+        buckets = self.buckets
+        for key, count in other.buckets.items():
+            remaining = buckets.get(key, 0) - count
+            if remaining > 0:
+                buckets[key] = remaining
+            else:
+                buckets.pop(key, None)
+        self.count = self.zero_count + sum(buckets.values())
+
+    def copy(self) -> "QuantileSketch":
+        sketch = QuantileSketch(self.relative_accuracy, self.min_value)
+        sketch.count = self.count
+        sketch.zero_count = self.zero_count
+        sketch.buckets = dict(self.buckets)
+        return sketch
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated value at quantile ``q`` (0..1), or None when empty."""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                # Midpoint of the bucket (gamma^(k-1), gamma^k] in relative terms
+                return 2 * self._gamma ** key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self.buckets) / (self._gamma + 1)
+
+    def quantiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        """Estimated values at several quantiles with a single pass."""
+        qs = list(qs)
+        if not self.count:
+            return [None] * len(qs)
+        order = sorted(range(len(qs)), key=lambda i: qs[i])
+        results: List[Optional[float]] = [None] * len(qs)
+        keys = sorted(self.buckets)
+        seen = self.zero_count
+        position = 0
+        for i in order:
+            rank = qs[i] * (self.count - 1)
+            if rank < self.zero_count:
+                results[i] = 0.0
+                continue
+            while position < len(keys) and seen + self.buckets[keys[position]] <= rank:
+                seen += self.buckets[keys[position]]
+                position += 1
+            key = keys[min(position, len(keys) - 1)]
+            results[i] = 2 * self._gamma ** key / (self._gamma + 1)
+        return results
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "min_value": self.min_value,
+            "zero_count": self.zero_count,
+            "buckets": {str(key): count for key, count in self.buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(data["relative_accuracy"], data.get("min_value", 1e-6))
+        sketch.zero_count = data.get("zero_count", 0)
+        sketch.buckets = {int(key): count for key, count in data.get("buckets", {}).items()}
+        sketch.count = sketch.zero_count + sum(sketch.buckets.values())
+        return sketch
+
+
+class RecorderDelta(NamedTuple):
+    """Counter and sketch changes of a recorder between two checkpoints."""
+
+    calls: int
+    sampled: int
+    errors: int
+    violations: int
+    total_ms: float
+    sketch: QuantileSketch
+
+
+class OperationRecorder:
+    """Counters, recent samples and quantile sketch of one operation."""
+
+    __slots__ = (
+        "operation_name", "level", "threshold_ms", "sample_stride", "capacity",
+        "calls", "sampled", "errors", "violations", "total_ms", "min_ms", "max_ms",
+        "sketch", "last_error", "_tick", "_ring", "_position", "_drained", "_checkpoint",
+    )
+
+    def __init__(
+        self,
+        operation_name: str,
+        level: Any,
+        threshold_ms: float,
+        sample_rate: float = 1.0,
+        capacity: int = 256,
+    ):
+        """Initialize recorder.
+
+        Args:
+            operation_name: Name of the recorded operation
+            level: Performance level of the operation
+            threshold_ms: Execution time above which a call is a violation
+            sample_rate: Fraction of calls that are timed (1 in ``1/rate``)
+            capacity: Number of recent samples kept
+        """
+        self.operation_name = operation_name
+        self.level = level
+        self.threshold_ms = threshold_ms
+        self.sample_stride = max(1, round(1 / sample_rate)) if sample_rate > 0 else 0
+        self.capacity = capacity
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all counters and samples."""
+        self.calls = 0
+        self.sampled = 0
+        self.errors = 0
+        self.violations = 0
+        self.total_ms = 0.0
+        self.min_ms = float('inf')
+        self.max_ms = 0.0
+        self.sketch = QuantileSketch()
+        self.last_error: Optional[str] = None
+        self._tick = 0
+        self._ring: List[Optional[Sample]] = [None] * self.capacity
+        self._position = 0
+        self._drained = 0
+        self._checkpoint = RecorderDelta(0, 0, 0, 0, 0.0, QuantileSketch())
+
+    def should_sample(self) -> bool:
+        """Count a call and decide whether it is timed."""
+        self.calls += 1
+        stride = self.sample_stride
+        if stride == 1:
+            return True
+        if not stride:
+            return False
+        self._tick += 1
+        if self._tick >= stride:
+            self._tick = 0
+            return True
+        return False
+
+    def record(
+        self,
+        execution_time_ms: float,
+        error_occurred: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[float] = None,
+        weight: Optional[int] = None,
+    ) -> bool:
+        """Record a timed call counted by ``should_sample``.
+
+        ``weight`` is the number of calls the sample stands for (the sample
+        stride by default; 1 for explicitly recorded metrics).
+
+        Returns:
+            Whether the call exceeded the threshold
+        """
+        self.sampled += 1
+        self.total_ms += execution_time_ms
+        if execution_time_ms < self.min_ms:
+            self.min_ms = execution_time_ms
+        if execution_time_ms > self.max_ms:
+            self.max_ms = execution_time_ms
+        self.sketch.add(execution_time_ms)
+        if error_occurred:
+            self.errors += 1
+            if metadata:
+                self.last_error = metadata.get("error_type")
+
+        position = self._position
+        self._ring[position % self.capacity] = (
+            timestamp if timestamp is not None else time.time(),
+            execution_time_ms,
+            error_occurred,
+            metadata,
+            weight or self.sample_stride or 1,
+        )
+        self._position = position + 1
+
+        if execution_time_ms > self.threshold_ms:
+            self.violations += 1
+            return True
+        return False
+
+    def record_error(self) -> None:
+        """Count an error of a call that was not timed."""
+        self.errors += 1
+
+    def recent(self, limit: int) -> List[Sample]:
+        """Up to ``limit`` most recent samples, oldest first."""
+        end = self._position
+        start = max(0, end - min(limit, self.capacity))
+        return [self._ring[i % self.capacity] for i in range(start, end)]
+
+    def drain(self) -> Tuple[List[Sample], int]:
+        """Samples recorded since the previous drain.
+
+        Returns:
+            The samples still in the ring buffer, oldest first, and the
+            number of samples overwritten before they could be drained
+        """
+        end = self._position
+        start = max(self._drained, end - self.capacity)
+        dropped = start - self._drained
+        self._drained = end
+        return [self._ring[i % self.capacity] for i in range(start, end)], dropped
+
+    def checkpoint(self) -> RecorderDelta:
+        """Counters and sketch accumulated since the previous checkpoint.
+
+        Unlike ``drain`` this covers every call, including samples that
+        were overwritten in the ring buffer and calls that were not timed.
+        """
+        previous = self._checkpoint
+        current = RecorderDelta(
+            self.calls,
+            self.sampled,
+            self.errors,
+            self.violations,
+            self.total_ms,
+            self.sketch.copy(),
+        )
+        self._checkpoint = current
+        sketch = current.sketch.copy()
+        sketch.subtract(previous.sketch)
+        return RecorderDelta(
+            current.calls - previous.calls,
+            current.sampled - previous.sampled,
+            current.errors - previous.errors,
+            current.violations - previous.violations,
+            current.total_ms - previous.total_ms,
+            sketch,
+        )
+
+    @property
+    def stored(self) -> int:
+        return min(self._position, self.capacity)
@@ -0,0 +1,468 @@
+"""Unified metrics registry with Prometheus/OpenMetrics exposition.
+
+Components record into counters, gauges and native histograms owned by a
+``MetricsRegistry``, or register a collector callback that turns their
+existing statistics into metric families at scrape time (so the hot path
+of e.g. the connection pools is not touched at all).
+
+Exposition cost is bounded independently of how many label sets exist:
+every metric keeps at most ``max_series_per_metric`` label sets (further
+label sets are folded into a single ``__overflow__`` series and counted),
+collector output is truncated to the same limit, and the rendered payload
+is cached for ``cache_ttl_seconds`` so concurrent or aggressive scrapers
+share one rendering.
+"""
+
+import asyncio
+import inspect
+import logging
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from prometheus_client.core import (
+    BucketSpan,
+    CounterMetricFamily,
+    GaugeMetricFamily,
+    HistogramMetricFamily,
+    Metric,
+    NativeHistogram,
+)
+from prometheus_client.exposition import choose_encoder
+from prometheus_client.utils import floatToGoString
+
+logger = logging.getLogger(__name__)
+
+MetricsCollector = Callable[[], Union[Iterable[Metric], Awaitable[Iterable[Metric]]]]
+
+OVERFLOW_LABEL_VALUE = "__overflow__"
+
+
+class _MetricBase:
+    """Metric with a bounded set of labelled children."""
+
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], max_series: int):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.max_series = max_series
+        self.overflowed = 0
+        self._children: Dict[Tuple[str, ...], Any] = {}
+
+    def labels(self, *values: Any, **labels: Any) -> Any:
+        """Get the child for a label set, creating it when needed."""
+        if labels:
+            values = tuple(labels[name] for name in self.labelnames)
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            if len(self._children) >= self.max_series:
+                # Unbounded label values (tenants, raw paths) must not grow exposition
+                self.overflowed += 1
+                key = (OVERFLOW_LABEL_VALUE,) * len(self.labelnames)
+                child = self._children.get(key)
+                if child is not None:
+                    return child
+            child = self._children[key] = self._new_child()
+        return child
+
+    def _default(self) -> Any:
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use .labels()")
+        return self.labels()
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def remove(self, *values: Any) -> None:
+        """Drop the child of a label set (e.g. a closed tenant pool)."""
+        self._children.pop(tuple(str(value) for value in values), None)
+
+    def clear(self) -> None:
+        self._children.clear()
+
+    def _label_dicts(self) -> Iterator[Tuple[Dict[str, str], Any]]:
+        for key, child in list(self._children.items()):
+            yield dict(zip(self.labelnames, key)), child
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Counter(_MetricBase):
+    """Monotonically increasing counter."""
+
+    metric_type = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def collect(self) -> Metric:
+        family = CounterMetricFamily(self.name, self.documentation, labels=self.labelnames)
+        for labels, child in self._label_dicts():
+            family.add_metric(list(labels.values()), child.value)
+        return family
+
+
+class Gauge(_MetricBase):
+    """Value that can go up and down."""
+
+    metric_type = "gauge"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def set(self, value: float) -> None:
+        self._default().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default().dec(amount)
+
+    def collect(self) -> Metric:
+        family = GaugeMetricFamily(self.name, self.documentation, labels=self.labelnames)
+        for labels, child in self._label_dicts():
+            family.add_metric(list(labels.values()), child.value)
+        return family
+
+
+class _HistogramValue:
+    """Sparse exponential buckets as used by Prometheus native histograms."""
+
+    __slots__ = ("count", "sum", "zero_count", "buckets", "_scale", "_zero_threshold")
+
+    def __init__(self, schema: int, zero_threshold: float):
+        self.count = 0
+        self.sum = 0.0
+        self.zero_count = 0
+        self.buckets: Dict[int, int] = {}
+        self._scale = 2 ** schema / math.log(2)
+        self._zero_threshold = zero_threshold
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        if value <= self._zero_threshold:
+            self.zero_count += 1
+            return
+        # Bucket i covers (2^((i-1)/2^schema), 2^(i/2^schema)]
+        index = math.ceil(math.log(value) * self._scale)
+        buckets = self.buckets
+        buckets[index] = buckets.get(index, 0) + 1
+
+
+class Histogram(_MetricBase):
+    """Native (sparse, exponential-bucket) histogram.
+
+    Observations land in buckets growing by ``2^(2^-schema)`` (about 9% at
+    the default schema 3), so there is no bucket layout to choose and any
+    range of values is covered. Scrapers negotiating OpenMetrics 2.0 receive
+    the native histogram; all others receive classic buckets at the powers
+    of two in ``classic_exponents``, which are exact sums of native buckets.
+    """
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        max_series: int,
+        schema: int = 3,
+        zero_threshold: float = 2.0 ** -20,
+        classic_exponents: Sequence[int] = tuple(range(-10, 7)),
+    ):
+        super().__init__(name, documentation, labelnames, max_series)
+        if not -4 <= schema <= 8:
+            raise ValueError("Native histogram schema must be between -4 and 8")
+        self.schema = schema
+        self.zero_threshold = zero_threshold
+        self.classic_exponents = tuple(sorted(classic_exponents))
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.schema, self.zero_threshold)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+    def collect(self, native: bool = False) -> Metric:
+        family = HistogramMetricFamily(self.name, self.documentation, labels=self.labelnames)
+        per_exponent = 2 ** self.schema if self.schema >= 0 else 1
+        for labels, child in self._label_dicts():
+            indices = sorted(child.buckets)
+            if native:
+                family.add_sample(
+                    self.name, labels, 0, native_histogram=self._native_value(child, indices)
+                )
+                continue
+
+            buckets = []
+            cumulative = child.zero_count
+            position = 0
+            for exponent in self.classic_exponents:
+                if self.schema >= 0:
+                    limit = exponent * per_exponent
+                else:
+                    # Coarse schemas only line up with every 2^-schema-th exponent
+                    limit = math.floor(exponent / 2 ** -self.schema)
+                while position < len(indices) and indices[position] <= limit:
+                    cumulative += child.buckets[indices[position]]
+                    position += 1
+                buckets.append((floatToGoString(2.0 ** exponent), cumulative))
+            buckets.append(("+Inf", child.count))
+            family.add_metric(list(labels.values()), buckets, child.sum)
+        return family
+
+    def _native_value(self, child: _HistogramValue, indices: List[int]) -> NativeHistogram:
+        spans: List[BucketSpan] = []
+        deltas: List[int] = []
+        previous_index = None
+        previous_count = 0
+        for index in indices:
+            count = child.buckets[index]
+            if previous_index is not None and index == previous_index + 1:
+                spans[-1] = BucketSpan(spans[-1].offset, spans[-1].length + 1)
+            else:
+                gap = index if previous_index is None else index - previous_index - 1
+                spans.append(BucketSpan(gap, 1))
+            deltas.append(count - previous_count)
+            previous_index, previous_count = index, count
+        return NativeHistogram(
+            count_value=child.count,
+            sum_value=child.sum,
+            schema=self.schema,
+            zero_threshold=self.zero_threshold,
+            zero_count=child.zero_count,
+            pos_spans=spans or None,
+            pos_deltas=deltas or None,
+        )
+
+
+class _Families:
+    """Adapter letting prometheus_client encoders render a fixed family list."""
+
+    def __init__(self, families: List[Metric]):
+        self._families = families
+
+    def collect(self) -> List[Metric]:
+        return self._families
+
+
+class MetricsRegistry:
+    """Registry of metrics and collectors exposed on ``/metrics``.
+
+    Also implements the ``prometheus_client`` collector protocol, so it can
+    be registered into a ``CollectorRegistry`` (only synchronous collectors
+    are included there).
+    """
+
+    def __init__(self, max_series_per_metric: int = 2000, cache_ttl_seconds: float = 1.0):
+        """Initialize registry.
+
+        Args:
+            max_series_per_metric: Label sets kept per metric; beyond this,
+                new label sets share an ``__overflow__`` series
+            cache_ttl_seconds: How long a rendered exposition is reused
+        """
+        self.max_series_per_metric = max_series_per_metric
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._metrics: Dict[str, _MetricBase] = {}
+        self._collectors: Dict[str, MetricsCollector] = {}
+        self._cache: Dict[str, Tuple[float, bytes]] = {}
+        self._render_lock: Optional[asyncio.Lock] = None
+        self._collector_errors = 0
+        self._truncated_samples = 0
+
+    # Metric factories are idempotent so components can call them on every init
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        **options: Any,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, **options)
+
+    def _get_or_create(self, metric_class, name, documentation, labelnames, **options):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = metric_class(name, documentation, labelnames, self.max_series_per_metric, **options)
+            self._metrics[name] = metric
+        elif not isinstance(metric, metric_class) or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"Metric {name} already registered as a different {metric.metric_type}")
+        return metric
+
+    def register_collector(self, name: str, collector: MetricsCollector) -> None:
+        """Register (or replace) a scrape-time collector.
+
+        Args:
+            name: Unique collector name; registering again replaces it
+            collector: Callable returning metric families, may be async
+        """
+        self._collectors[name] = collector
+
+    def unregister_collector(self, name: str) -> None:
+        self._collectors.pop(name, None)
+
+    def collect(self) -> Iterator[Metric]:
+        """Collect own metrics and synchronous collectors (prometheus_client protocol)."""
+        yield from self._collect_own(native=False)
+        for name, collector in list(self._collectors.items()):
+            if inspect.iscoroutinefunction(collector):
+                continue
+            yield from self._run_sync_collector(name, collector)
+
+    async def collect_async(self, native: bool = False) -> List[Metric]:
+        """Collect own metrics and all collectors, awaiting async ones."""
+        families = list(self._collect_own(native))
+        for name, collector in list(self._collectors.items()):
+            if not inspect.iscoroutinefunction(collector):
+                families.extend(self._run_sync_collector(name, collector))
+                continue
+            try:
+                families.extend(self._bounded(family) for family in await collector())
+            except Exception as e:
+                self._collector_errors += 1
+                logger.error(f"Metrics collector {name} failed: {e}")
+        return self._merged(families)
+
+    async def render(self, accept_header: Optional[str] = None) -> Tuple[bytes, str]:
+        """Render the exposition for an ``Accept`` header.
+
+        Returns:
+            Payload and its content type
+        """
+        encoder, content_type = choose_encoder(accept_header or "")
+        cached = self._cache.get(content_type)
+        now = time.monotonic()
+        if cached and now - cached[0] < self.cache_ttl_seconds:
+            return cached[1], content_type
+
+        if self._render_lock is None:
+            self._render_lock = asyncio.Lock()
+        async with self._render_lock:
+            # Another scrape may have rendered while we waited
+            cached = self._cache.get(content_type)
+            if cached and time.monotonic() - cached[0] < self.cache_ttl_seconds:
+                return cached[1], content_type
+
+            native = "openmetrics-text" in content_type and "version=2" in content_type
+            families = await self.collect_async(native=native)
+            families.extend(self._self_metrics())
+            payload = encoder(_Families(families))
+            self._cache[content_type] = (time.monotonic(), payload)
+            return payload, content_type
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "metrics": len(self._metrics),
+            "collectors": len(self._collectors),
+            "series": sum(len(metric._children) for metric in self._metrics.values()),
+            "overflowed_label_sets": sum(metric.overflowed for metric in self._metrics.values()),
+            "truncated_samples": self._truncated_samples,
+            "collector_errors": self._collector_errors,
+        }
+
+    def _collect_own(self, native: bool) -> Iterator[Metric]:
+        for metric in list(self._metrics.values()):
+            if isinstance(metric, Histogram):
+                yield metric.collect(native=native)
+            else:
+                yield metric.collect()
+
+    def _run_sync_collector(self, name: str, collector: MetricsCollector) -> List[Metric]:
+        try:
+            return [self._bounded(family) for family in collector()]
+        except Exception as e:
+            self._collector_errors += 1
+            logger.error(f"Metrics collector {name} failed: {e}")
+            return []
+
+    @staticmethod
+    def _merged(families: List[Metric]) -> List[Metric]:
+        """Merge same-named families (e.g. one per cache instance) into one."""
+        merged: Dict[str, Metric] = {}
+        for family in families:
+            existing = merged.get(family.name)
+            if existing is None:
+                merged[family.name] = family
+            elif existing.type == family.type:
+                existing.samples.extend(family.samples)
+            else:
+                logger.warning(f"Metric {family.name} collected as both {existing.type} and {family.type}")
+        return list(merged.values())
+
+    def _bounded(self, family: Metric) -> Metric:
+        """Keep at most ``max_series_per_metric`` label sets of a collected family."""
+        seen = set()
+        kept = []
+        for sample in family.samples:
+            key = tuple(sorted((k, v) for k, v in sample.labels.items() if k not in ("le", "quantile")))
+            if key not in seen:
+                if len(seen) >= self.max_series_per_metric:
+                    self._truncated_samples += 1
+                    continue
+                seen.add(key)
+            kept.append(sample)
+        family.samples = kept
+        return family
+
+    def _self_metrics(self) -> List[Metric]:
+        stats = self.get_stats()
+        series = GaugeMetricFamily("neo_metrics_series", "Label sets held by registry metrics")
+        series.add_metric([], stats["series"])
+        overflowed = CounterMetricFamily(
+            "neo_metrics_overflowed_label_sets", "Label sets folded into the overflow series"
+        )
+        overflowed.add_metric([], stats["overflowed_label_sets"])
+        errors = CounterMetricFamily("neo_metrics_collector_errors", "Failed collector runs")
+        errors.add_metric([], stats["collector_errors"])
+        return [series, overflowed, errors]
+
+
+# Global metrics registry instance
+_metrics_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get global metrics registry instance."""
+    global _metrics_registry
+    if _metrics_registry is None:
+        _metrics_registry = MetricsRegistry()
+    return _metrics_registry
+
+
+def set_metrics_registry(registry: MetricsRegistry) -> None:
+    """Set custom metrics registry for testing."""
+    global _metrics_registry
+    _metrics_registry = registry
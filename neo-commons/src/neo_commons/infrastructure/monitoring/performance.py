@@ -8,12 +8,13 @@ import time
 import asyncio
 import functools
 import logging
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 
 from ...core.shared.application import ConfigurationProtocol
+from .metrics_recorder import OperationRecorder, QuantileSketch, RecorderDelta, Sample
 
 
 class PerformanceLevel(Enum):
@@ -43,11 +44,18 @@ class PerformanceMetric:
     metadata: Dict[str, Any] = field(default_factory=dict)
     exceeded_threshold: bool = False
     error_occurred: bool = False
+    # Calls represented by this metric when the operation is sampled
+    sample_weight: int = 1
 
 
 @dataclass 
 class PerformanceStats:
-    """Aggregated performance statistics."""
+    """Aggregated performance statistics.
+    
+    Percentiles are estimated from the operation's quantile sketch and are
+    within 1% of the true value. When an operation is sampled, counts and
+    totals are extrapolated from ``sampled_count`` timed calls.
+    """
     
     operation_name: str
     call_count: int = 0
@@ -57,10 +65,16 @@ class PerformanceStats:
     max_time_ms: float = 0.0
     threshold_violations: int = 0
     error_count: int = 0
+    sampled_count: int = 0
+    p50_time_ms: float = 0.0
+    p95_time_ms: float = 0.0
+    p99_time_ms: float = 0.0
+    p999_time_ms: float = 0.0
     
     def update(self, metric: PerformanceMetric) -> None:
         """Update statistics with new metric."""
         self.call_count += 1
+        self.sampled_count += 1
         self.total_time_ms += metric.execution_time_ms
         self.avg_time_ms = self.total_time_ms / self.call_count
         self.min_time_ms = min(self.min_time_ms, metric.execution_time_ms)
@@ -70,20 +84,73 @@ class PerformanceStats:
             self.threshold_violations += 1
         if metric.error_occurred:
             self.error_count += 1
+    
+    @classmethod
+    def from_recorder(cls, recorder: OperationRecorder) -> "PerformanceStats":
+        """Build a statistics snapshot from an operation recorder."""
+        stats = cls(recorder.operation_name, call_count=recorder.calls, error_count=recorder.errors)
+        sampled = recorder.sampled
+        if not sampled:
+            return stats
+        
+        scale = recorder.calls / sampled
+        stats.sampled_count = sampled
+        stats.total_time_ms = recorder.total_ms * scale
+        stats.avg_time_ms = recorder.total_ms / sampled
+        stats.min_time_ms = recorder.min_ms
+        stats.max_time_ms = recorder.max_ms
+        stats.threshold_violations = round(recorder.violations * scale)
+        p50, p95, p99, p999 = recorder.sketch.quantiles(PERCENTILES)
+        # Bucket midpoints may fall just outside the observed range
+        clamp = lambda value: min(max(value, recorder.min_ms), recorder.max_ms)
+        stats.p50_time_ms = clamp(p50)
+        stats.p95_time_ms = clamp(p95)
+        stats.p99_time_ms = clamp(p99)
+        stats.p999_time_ms = clamp(p999)
+        return stats
+
+
+PERCENTILES = (0.5, 0.95, 0.99, 0.999)
+
+# Fraction of calls timed per level; critical operations are always timed
+DEFAULT_SAMPLE_RATES: Dict[PerformanceLevel, float] = {
+    PerformanceLevel.CRITICAL: 1.0,
+    PerformanceLevel.HIGH: 0.25,
+    PerformanceLevel.MEDIUM: 0.1,
+    PerformanceLevel.LOW: 0.01,
+}
 
 
 class PerformanceMonitor:
-    """Central performance monitoring system."""
+    """Central performance monitoring system.
+    
+    Each operation gets an ``OperationRecorder`` with bounded memory: running
+    counters, a ring buffer of recent samples and a quantile sketch. Recording
+    does not allocate metric objects or touch the persister; statistics and
+    new samples are materialized only when asked for by ``get_stats``,
+    ``get_metrics`` or the background persister's ``snapshot`` calls.
+    """
     
     def __init__(self, 
                  config: Optional[ConfigurationProtocol] = None,
-                 persistence_storage: Optional['PerformanceStorage'] = None):
-        """Initialize performance monitor."""
+                 persistence_storage: Optional['PerformanceStorage'] = None,
+                 sample_rates: Optional[Dict[PerformanceLevel, float]] = None,
+                 recent_capacity: int = 256):
+        """Initialize performance monitor.
+        
+        Args:
+            config: Configuration for enablement, thresholds and sample rates
+            persistence_storage: Optional storage for background persistence
+            sample_rates: Fraction of calls timed per level (overrides defaults)
+            recent_capacity: Recent samples kept per operation
+        """
         self._config = config
-        self._metrics: List[PerformanceMetric] = []
-        self._stats: Dict[str, PerformanceStats] = {}
+        self._recorders: Dict[str, OperationRecorder] = {}
+        self._sample_rates = {**DEFAULT_SAMPLE_RATES, **(sample_rates or {})}
+        self._recent_capacity = recent_capacity
         self._logger = logging.getLogger(f"{__name__}.PerformanceMonitor")
         self._enabled = True
+        self._samples_overwritten = 0
         
         # Optional database persistence (zero performance impact)
         self._persistence_storage = persistence_storage
@@ -91,7 +158,9 @@ class PerformanceMonitor:
         
         if self._persistence_storage:
             from .persistence import BackgroundMetricsPersister
-            self._background_persister = BackgroundMetricsPersister(self._persistence_storage)
+            self._background_persister = BackgroundMetricsPersister(
+                self._persistence_storage, snapshot_provider=self.snapshot
+            )
             self._background_persister.start()
         
     def is_enabled(self) -> bool:
@@ -111,61 +180,190 @@ class PerformanceMonitor:
             return float(self._config.get(key, AlertThreshold[level.name].value))
         return AlertThreshold[level.name].value
     
+    def get_sample_rate(self, level: PerformanceLevel) -> float:
+        """Get fraction of calls timed for performance level."""
+        rate = self._sample_rates[level]
+        if self._config:
+            rate = self._config.get(f"performance_monitoring.sample_rate.{level.value}", rate)
+        return float(rate)
+    
+    def recorder(self, operation_name: str, level: PerformanceLevel) -> OperationRecorder:
+        """Get or create the recorder of an operation.
+        
+        Threshold and sample rate are resolved once, when the recorder is
+        created; decorators hold on to the recorder for their lifetime.
+        """
+        recorder = self._recorders.get(operation_name)
+        if recorder is None:
+            recorder = OperationRecorder(
+                operation_name,
+                level,
+                self.get_threshold(level),
+                self.get_sample_rate(level),
+                self._recent_capacity,
+            )
+            self._recorders[operation_name] = recorder
+        return recorder
+    
+    def get_recorders(self) -> Dict[str, OperationRecorder]:
+        """Get the recorders of all operations seen so far."""
+        return dict(self._recorders)
+    
     def record_metric(self, metric: PerformanceMetric) -> None:
-        """Record a performance metric."""
+        """Record a performance metric.
+        
+        Explicitly recorded metrics are always kept, regardless of the
+        level's sample rate.
+        """
         if not self.is_enabled():
             return
-            
-        # Check threshold violation
-        threshold = self.get_threshold(metric.level)
-        metric.exceeded_threshold = metric.execution_time_ms > threshold
-        
-        # Store metric in memory
-        self._metrics.append(metric)
         
-        # Update statistics
-        if metric.operation_name not in self._stats:
-            self._stats[metric.operation_name] = PerformanceStats(metric.operation_name)
-        self._stats[metric.operation_name].update(metric)
-        
-        # Queue for background persistence (zero performance impact)
-        if self._background_persister:
-            self._background_persister.queue_metric(metric)
-            self._background_persister.queue_stats(self._stats)
-        
-        # Log threshold violations
+        recorder = self.recorder(metric.operation_name, metric.level)
+        recorder.calls += 1
+        metric.exceeded_threshold = recorder.record(
+            metric.execution_time_ms,
+            metric.error_occurred,
+            metric.metadata or None,
+            metric.timestamp.timestamp(),
+            metric.sample_weight,
+        )
         if metric.exceeded_threshold:
-            self._logger.warning(
-                f"Performance threshold exceeded for {metric.operation_name}: "
-                f"{metric.execution_time_ms:.2f}ms > {threshold}ms"
-            )
+            self.report_violation(recorder, metric.execution_time_ms)
+    
+    def report_violation(self, recorder: OperationRecorder, execution_time_ms: float) -> None:
+        """Log a call that exceeded its operation's threshold."""
+        self._logger.warning(
+            f"Performance threshold exceeded for {recorder.operation_name}: "
+            f"{execution_time_ms:.2f}ms > {recorder.threshold_ms}ms"
+        )
         
         # Log critical performance issues
-        if metric.level == PerformanceLevel.CRITICAL and metric.execution_time_ms > 5000:
+        if recorder.level == PerformanceLevel.CRITICAL and execution_time_ms > 5000:
             self._logger.error(
-                f"Critical performance issue in {metric.operation_name}: "
-                f"{metric.execution_time_ms:.2f}ms"
+                f"Critical performance issue in {recorder.operation_name}: "
+                f"{execution_time_ms:.2f}ms"
             )
     
     def get_stats(self, operation_name: Optional[str] = None) -> Union[PerformanceStats, Dict[str, PerformanceStats]]:
         """Get performance statistics."""
         if operation_name:
-            return self._stats.get(operation_name, PerformanceStats(operation_name))
-        return self._stats.copy()
+            recorder = self._recorders.get(operation_name)
+            if recorder is None:
+                return PerformanceStats(operation_name)
+            return PerformanceStats.from_recorder(recorder)
+        return {
+            name: PerformanceStats.from_recorder(recorder)
+            for name, recorder in list(self._recorders.items())
+            if recorder.calls
+        }
     
     def get_metrics(self, operation_name: Optional[str] = None, limit: int = 100) -> List[PerformanceMetric]:
         """Get recent performance metrics."""
-        metrics = self._metrics
         if operation_name:
-            metrics = [m for m in metrics if m.operation_name == operation_name]
+            recorder = self._recorders.get(operation_name)
+            recorders = [recorder] if recorder else []
+        else:
+            recorders = list(self._recorders.values())
+        
+        metrics = [
+            self._to_metric(recorder, sample)
+            for recorder in recorders
+            for sample in recorder.recent(limit)
+        ]
+        metrics.sort(key=lambda m: m.timestamp)
         return metrics[-limit:]
     
+    def snapshot(self) -> Tuple[
+        List[PerformanceMetric], Dict[str, PerformanceStats], List['RollupBucket']
+    ]:
+        """Samples recorded since the previous snapshot and current statistics.
+        
+        Called by the background persister at flush time. When samples were
+        overwritten in a ring buffer before the persister got to them, the
+        part of the recorder's counters and sketch those samples accounted
+        for is returned as a partial rollup bucket, so rollups still count
+        every call.
+        
+        Returns:
+            New samples, statistics of all operations, and partial rollup
+            buckets for overwritten samples
+        """
+        metrics: List[PerformanceMetric] = []
+        partials: List['RollupBucket'] = []
+        overwritten = 0
+        for recorder in list(self._recorders.values()):
+            samples, dropped = recorder.drain()
+            delta = recorder.checkpoint()
+            drained = [self._to_metric(recorder, sample) for sample in samples]
+            metrics.extend(drained)
+            if dropped:
+                overwritten += dropped
+                partials.append(self._overwritten_rollup(recorder, drained, delta))
+        
+        if overwritten:
+            self._samples_overwritten += overwritten
+            self._logger.debug(
+                f"{overwritten} performance samples overwritten before persistence; "
+                f"rolled up from recorder counters"
+            )
+        return metrics, self.get_stats(), partials
+    
+    @staticmethod
+    def _overwritten_rollup(
+        recorder: OperationRecorder, drained: List[PerformanceMetric], delta: RecorderDelta
+    ) -> 'RollupBucket':
+        """Aggregate of the calls in ``delta`` that ``drained`` does not cover."""
+        from .rollups import RollupBucket
+        
+        kept = QuantileSketch(delta.sketch.relative_accuracy, delta.sketch.min_value)
+        for metric in drained:
+            kept.add(metric.execution_time_ms)
+        sketch = delta.sketch
+        sketch.subtract(kept)
+        
+        sampled = max(delta.sampled - len(drained), 1)
+        calls = max(delta.calls - sum(metric.sample_weight for metric in drained), sampled)
+        scale = calls / sampled
+        low, high = sketch.quantiles([0.0, 1.0])
+        # Overwritten samples are older than everything still in the ring buffer
+        timestamp = drained[0].timestamp if drained else datetime.now(timezone.utc)
+        return RollupBucket(
+            bucket_start=timestamp,
+            operation_name=recorder.operation_name,
+            level=recorder.level,
+            call_count=calls,
+            error_count=max(
+                delta.errors - sum(m.sample_weight for m in drained if m.error_occurred), 0
+            ),
+            threshold_violations=round(
+                (delta.violations - sum(1 for m in drained if m.exceeded_threshold)) * scale
+            ),
+            total_time_ms=(delta.total_ms - sum(m.execution_time_ms for m in drained)) * scale,
+            min_time_ms=max(low, recorder.min_ms) if low is not None else recorder.min_ms,
+            max_time_ms=min(high, recorder.max_ms) if high is not None else recorder.max_ms,
+            sketch=sketch,
+        )
+    
+    @staticmethod
+    def _to_metric(recorder: OperationRecorder, sample: Sample) -> PerformanceMetric:
+        timestamp, execution_time_ms, error_occurred, metadata, weight = sample
+        return PerformanceMetric(
+            operation_name=recorder.operation_name,
+            execution_time_ms=execution_time_ms,
+            level=recorder.level,
+            timestamp=datetime.fromtimestamp(timestamp, timezone.utc),
+            metadata=dict(metadata) if metadata else {},
+            exceeded_threshold=execution_time_ms > recorder.threshold_ms,
+            error_occurred=error_occurred,
+            sample_weight=weight,
+        )
+    
     def get_bottlenecks(self, threshold_multiplier: float = 2.0) -> List[PerformanceStats]:
         """Identify performance bottlenecks."""
         bottlenecks = []
-        for stats in self._stats.values():
+        expected_threshold = self.get_threshold(PerformanceLevel.MEDIUM)
+        for stats in self.get_stats().values():
             if stats.call_count > 0:
-                expected_threshold = self.get_threshold(PerformanceLevel.MEDIUM)
                 if stats.avg_time_ms > expected_threshold * threshold_multiplier:
                     bottlenecks.append(stats)
         
@@ -174,8 +372,9 @@ class PerformanceMonitor:
     
     def clear_metrics(self) -> None:
         """Clear all stored metrics and statistics."""
-        self._metrics.clear()
-        self._stats.clear()
+        # Recorders are reset in place because decorators hold references to them
+        for recorder in self._recorders.values():
+            recorder.reset()
     
     async def shutdown(self) -> None:
         """Shutdown performance monitor and flush remaining metrics."""
@@ -184,10 +383,11 @@ class PerformanceMonitor:
     
     def get_summary(self) -> Dict[str, Any]:
         """Get performance monitoring summary."""
-        total_operations = len(self._stats)
-        total_calls = sum(s.call_count for s in self._stats.values())
-        total_violations = sum(s.threshold_violations for s in self._stats.values())
-        total_errors = sum(s.error_count for s in self._stats.values())
+        stats = self.get_stats()
+        total_operations = len(stats)
+        total_calls = sum(s.call_count for s in stats.values())
+        total_violations = sum(s.threshold_violations for s in stats.values())
+        total_errors = sum(s.error_count for s in stats.values())
         
         return {
             "enabled": self.is_enabled(),
@@ -196,7 +396,8 @@ class PerformanceMonitor:
             "threshold_violations": total_violations,
             "error_count": total_errors,
             "bottlenecks": len(self.get_bottlenecks()),
-            "metrics_stored": len(self._metrics),
+            "metrics_stored": sum(r.stored for r in self._recorders.values()),
+            "samples_overwritten": self._samples_overwritten,
             "persistence_enabled": self._persistence_storage is not None,
         }
 
@@ -244,41 +445,47 @@ def performance_monitor(
     def decorator(func: F) -> F:
         operation_name = name or f"{func.__module__}.{func.__qualname__}"
         perf_monitor = monitor or get_performance_monitor()
+        recorder = perf_monitor.recorder(operation_name, level)
+        
+        def call_metadata(args, kwargs) -> Optional[Dict[str, Any]]:
+            if not include_args:
+                return None
+            return {"args_count": len(args), "kwargs_keys": list(kwargs.keys())}
         
+        def record_error(args, kwargs, error: Exception, execution_time_ms: float) -> None:
+            metadata = call_metadata(args, kwargs) or {}
+            metadata["error_type"] = type(error).__name__
+            metadata["error_message"] = str(error)
+            if recorder.record(execution_time_ms, True, metadata):
+                perf_monitor.report_violation(recorder, execution_time_ms)
+        
+        # Hot paths: no metric objects, no dicts unless include_args, no locks
         if asyncio.iscoroutinefunction(func):
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs):
                 if not perf_monitor.is_enabled():
                     return await func(*args, **kwargs)
                 
-                start_time = time.perf_counter()
-                error_occurred = False
-                metadata = {}
-                
-                if include_args:
-                    metadata["args_count"] = len(args)
-                    metadata["kwargs_keys"] = list(kwargs.keys())
+                if not recorder.should_sample():
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception:
+                        recorder.record_error()
+                        raise
                 
+                start_time = time.perf_counter()
                 try:
                     result = await func(*args, **kwargs)
-                    return result
                 except Exception as e:
-                    error_occurred = True
-                    metadata["error_type"] = type(e).__name__
-                    metadata["error_message"] = str(e)
+                    record_error(args, kwargs, e, (time.perf_counter() - start_time) * 1000)
                     raise
-                finally:
-                    end_time = time.perf_counter()
-                    execution_time_ms = (end_time - start_time) * 1000
-                    
-                    metric = PerformanceMetric(
-                        operation_name=operation_name,
-                        execution_time_ms=execution_time_ms,
-                        level=level,
-                        metadata=metadata,
-                        error_occurred=error_occurred
-                    )
-                    perf_monitor.record_metric(metric)
+                
+                execution_time_ms = (time.perf_counter() - start_time) * 1000
+                if recorder.record(
+                    execution_time_ms, False, call_metadata(args, kwargs) if include_args else None
+                ):
+                    perf_monitor.report_violation(recorder, execution_time_ms)
+                return result
             
             return async_wrapper
         else:
@@ -287,34 +494,26 @@ def performance_monitor(
                 if not perf_monitor.is_enabled():
                     return func(*args, **kwargs)
                 
-                start_time = time.perf_counter()
-                error_occurred = False
-                metadata = {}
-                
-                if include_args:
-                    metadata["args_count"] = len(args)
-                    metadata["kwargs_keys"] = list(kwargs.keys())
+                if not recorder.should_sample():
+                    try:
+                        return func(*args, **kwargs)
+                    except Exception:
+                        recorder.record_error()
+                        raise
                 
+                start_time = time.perf_counter()
                 try:
                     result = func(*args, **kwargs)
-                    return result
                 except Exception as e:
-                    error_occurred = True
-                    metadata["error_type"] = type(e).__name__
-                    metadata["error_message"] = str(e)
+                    record_error(args, kwargs, e, (time.perf_counter() - start_time) * 1000)
                     raise
-                finally:
-                    end_time = time.perf_counter()
-                    execution_time_ms = (end_time - start_time) * 1000
-                    
-                    metric = PerformanceMetric(
-                        operation_name=operation_name,
-                        execution_time_ms=execution_time_ms,
-                        level=level,
-                        metadata=metadata,
-                        error_occurred=error_occurred
-                    )
-                    perf_monitor.record_metric(metric)
+                
+                execution_time_ms = (time.perf_counter() - start_time) * 1000
+                if recorder.record(
+                    execution_time_ms, False, call_metadata(args, kwargs) if include_args else None
+                ):
+                    perf_monitor.report_violation(recorder, execution_time_ms)
+                return result
             
             return sync_wrapper
     
@@ -2,14 +2,23 @@
 
 Provides optional database persistence for performance metrics without impacting
 the performance of monitored operations through async background processing.
+
+Metrics are pre-aggregated into 1-minute per-operation rollups before they are
+written, and only notable samples (errors, threshold violations) are stored
+individually. Both tables are partitioned by day and written with COPY, so
+retention cleanup drops whole partitions instead of deleting rows.
 """
 
 import asyncio
+import json
 import logging
-from typing import List, Optional, Dict, Protocol
-from datetime import datetime
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Dict, Protocol, Tuple
+from datetime import datetime, timedelta, timezone
 
+from .metrics_recorder import QuantileSketch
 from .performance import PerformanceMetric, PerformanceStats, PerformanceLevel
+from .rollups import MetricsRollup, RollupBucket, ROLLUP_COLUMNS, partition_days
 
 
 logger = logging.getLogger(__name__)
@@ -22,6 +31,10 @@ class PerformanceStorage(Protocol):
         """Store metrics to persistent storage."""
         ...
     
+    async def store_rollups(self, buckets: List[RollupBucket]) -> bool:
+        """Store pre-aggregated time buckets to persistent storage."""
+        ...
+    
     async def store_stats(self, stats: Dict[str, PerformanceStats]) -> bool:
         """Store aggregated statistics to persistent storage."""
         ...
@@ -37,45 +50,83 @@ class PerformanceStorage(Protocol):
         ...
     
     async def cleanup_old_metrics(self, older_than_days: int = 30) -> int:
-        """Clean up old metrics and return count of deleted records."""
+        """Clean up old metrics and return count of removed partitions or records."""
         ...
 
 
+SAMPLE_COLUMNS = (
+    "operation_name",
+    "execution_time_ms",
+    "level",
+    "timestamp",
+    "metadata",
+    "exceeded_threshold",
+    "error_occurred",
+)
+
+PARTITIONED_TABLES = ("performance_metric_samples", "performance_metric_rollups")
+
+
+def _json_value(value: Any) -> Any:
+    """Decode a JSONB column (a string unless a JSON codec is registered)."""
+    return json.loads(value) if isinstance(value, str) else value
+
+
 class DatabasePerformanceStorage:
-    """Database storage implementation for performance metrics."""
+    """Database storage implementation for performance metrics.
+    
+    ``performance_metric_rollups`` holds one row per operation, minute and
+    flush; rows of the same minute are partial aggregates merged on read.
+    ``performance_metric_samples`` holds individually stored samples. Both
+    are range-partitioned by day and partitions are created ahead of writes.
+    """
     
     def __init__(self, database_service, schema: str = "admin"):
         """Initialize with database service and schema."""
         self.database_service = database_service
         self.schema = schema
         self._initialized = False
+        self._partitions: set = set()
     
     async def _ensure_tables(self) -> None:
         """Ensure performance metrics tables exist."""
         if self._initialized:
             return
         
-        create_metrics_table = f"""
-        CREATE TABLE IF NOT EXISTS {self.schema}.performance_metrics (
-            id SERIAL PRIMARY KEY,
+        create_samples_table = f"""
+        CREATE TABLE IF NOT EXISTS {self.schema}.performance_metric_samples (
             operation_name VARCHAR(255) NOT NULL,
-            execution_time_ms DECIMAL(10,3) NOT NULL,
+            execution_time_ms DOUBLE PRECISION NOT NULL,
             level VARCHAR(20) NOT NULL,
-            timestamp TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            timestamp TIMESTAMPTZ NOT NULL,
             metadata JSONB DEFAULT '{{}}',
             exceeded_threshold BOOLEAN DEFAULT FALSE,
-            error_occurred BOOLEAN DEFAULT FALSE,
-            created_at TIMESTAMPTZ DEFAULT NOW()
-        );
+            error_occurred BOOLEAN DEFAULT FALSE
+        ) PARTITION BY RANGE (timestamp);
+        
+        CREATE INDEX IF NOT EXISTS idx_performance_metric_samples_operation
+            ON {self.schema}.performance_metric_samples(operation_name, timestamp);
+        """
+        
+        create_rollups_table = f"""
+        CREATE TABLE IF NOT EXISTS {self.schema}.performance_metric_rollups (
+            bucket_start TIMESTAMPTZ NOT NULL,
+            operation_name VARCHAR(255) NOT NULL,
+            level VARCHAR(20) NOT NULL,
+            call_count BIGINT NOT NULL,
+            error_count BIGINT NOT NULL DEFAULT 0,
+            threshold_violations BIGINT NOT NULL DEFAULT 0,
+            total_time_ms DOUBLE PRECISION NOT NULL,
+            min_time_ms DOUBLE PRECISION NOT NULL,
+            max_time_ms DOUBLE PRECISION NOT NULL,
+            p50_time_ms DOUBLE PRECISION,
+            p95_time_ms DOUBLE PRECISION,
+            p99_time_ms DOUBLE PRECISION,
+            sketch JSONB NOT NULL
+        ) PARTITION BY RANGE (bucket_start);
         
-        CREATE INDEX IF NOT EXISTS idx_performance_metrics_operation 
-            ON {self.schema}.performance_metrics(operation_name);
-        CREATE INDEX IF NOT EXISTS idx_performance_metrics_timestamp 
-            ON {self.schema}.performance_metrics(timestamp);
-        CREATE INDEX IF NOT EXISTS idx_performance_metrics_level 
-            ON {self.schema}.performance_metrics(level);
-        CREATE INDEX IF NOT EXISTS idx_performance_metrics_threshold 
-            ON {self.schema}.performance_metrics(exceeded_threshold) WHERE exceeded_threshold = TRUE;
+        CREATE INDEX IF NOT EXISTS idx_performance_metric_rollups_operation
+            ON {self.schema}.performance_metric_rollups(operation_name, bucket_start);
         """
         
         create_stats_table = f"""
@@ -91,56 +142,117 @@ class DatabasePerformanceStorage:
             last_updated TIMESTAMPTZ DEFAULT NOW()
         );
         
-        CREATE INDEX IF NOT EXISTS idx_performance_stats_avg_time 
+        ALTER TABLE {self.schema}.performance_stats
+            ADD COLUMN IF NOT EXISTS p50_time_ms DECIMAL(10,3),
+            ADD COLUMN IF NOT EXISTS p95_time_ms DECIMAL(10,3),
+            ADD COLUMN IF NOT EXISTS p99_time_ms DECIMAL(10,3),
+            ADD COLUMN IF NOT EXISTS p999_time_ms DECIMAL(10,3);
+        
+        CREATE INDEX IF NOT EXISTS idx_performance_stats_avg_time
             ON {self.schema}.performance_stats(avg_time_ms DESC);
         """
         
         try:
             async with self.database_service.get_connection("admin") as conn:
-                await conn.execute(create_metrics_table)
+                await conn.execute(create_samples_table)
+                await conn.execute(create_rollups_table)
                 await conn.execute(create_stats_table)
             
             self._initialized = True
             logger.info(f"Performance metrics tables ensured in schema {self.schema}")
-            
+        
         except Exception as e:
             logger.error(f"Failed to create performance metrics tables: {e}")
             raise
     
+    @staticmethod
+    def partition_name(table: str, day: datetime) -> str:
+        """Name of the daily partition of ``table`` starting at ``day``."""
+        return f"{table}_p{day:%Y%m%d}"
+    
+    async def _ensure_partitions(self, conn, table: str, timestamps: List[datetime]) -> None:
+        """Create the daily partitions the timestamps fall into, plus the next day's."""
+        for day in partition_days(min(timestamps), max(timestamps) + timedelta(days=1)):
+            name = self.partition_name(table, day)
+            if name in self._partitions:
+                continue
+            await conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.schema}.{name}
+                PARTITION OF {self.schema}.{table}
+                FOR VALUES FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')
+            """)
+            self._partitions.add(name)
+    
     async def store_metrics(self, metrics: List[PerformanceMetric]) -> bool:
-        """Store metrics to database with batch insert."""
+        """Store individual samples with a single COPY."""
         if not metrics:
             return True
-            
+        
         await self._ensure_tables()
         
         try:
-            insert_query = f"""
-            INSERT INTO {self.schema}.performance_metrics 
-            (operation_name, execution_time_ms, level, timestamp, metadata, exceeded_threshold, error_occurred)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
-            """
+            records = [
+                (
+                    metric.operation_name,
+                    metric.execution_time_ms,
+                    metric.level.value,
+                    metric.timestamp,
+                    json.dumps(metric.metadata, default=str),
+                    metric.exceeded_threshold,
+                    metric.error_occurred
+                )
+                for metric in metrics
+            ]
             
             async with self.database_service.get_connection("admin") as conn:
-                for metric in metrics:
-                    await conn.execute(
-                        insert_query,
-                        metric.operation_name,
-                        metric.execution_time_ms,
-                        metric.level.value,
-                        metric.timestamp,
-                        metric.metadata,
-                        metric.exceeded_threshold,
-                        metric.error_occurred
-                    )
+                await self._ensure_partitions(
+                    conn, "performance_metric_samples", [metric.timestamp for metric in metrics]
+                )
+                await conn.copy_records_to_table(
+                    "performance_metric_samples",
+                    schema_name=self.schema,
+                    columns=list(SAMPLE_COLUMNS),
+                    records=records
+                )
             
-            logger.debug(f"Stored {len(metrics)} performance metrics to database")
+            logger.debug(f"Stored {len(metrics)} performance samples to database")
             return True
-            
+        
         except Exception as e:
             logger.error(f"Failed to store performance metrics: {e}")
             return False
     
+    async def store_rollups(self, buckets: List[RollupBucket]) -> bool:
+        """Store pre-aggregated buckets with a single COPY."""
+        if not buckets:
+            return True
+        
+        await self._ensure_tables()
+        
+        try:
+            records = []
+            for bucket in buckets:
+                record = MetricsRollup.to_record(bucket)
+                records.append(record[:-1] + (json.dumps(record[-1]),))
+            
+            async with self.database_service.get_connection("admin") as conn:
+                await self._ensure_partitions(
+                    conn, "performance_metric_rollups", [bucket.bucket_start for bucket in buckets]
+                )
+                await conn.copy_records_to_table(
+                    "performance_metric_rollups",
+                    schema_name=self.schema,
+                    columns=list(ROLLUP_COLUMNS),
+                    records=records
+                )
+            
+            logger.debug(f"Stored {len(buckets)} performance rollups to database")
+            return True
+        
+        except Exception as e:
+            logger.error(f"Failed to store performance rollups: {e}")
+            return False
+    
     async def store_stats(self, stats: Dict[str, PerformanceStats]) -> bool:
         """Store aggregated statistics with upsert."""
         if not stats:
@@ -152,8 +264,9 @@ class DatabasePerformanceStorage:
             upsert_query = f"""
             INSERT INTO {self.schema}.performance_stats 
             (operation_name, call_count, total_time_ms, avg_time_ms, min_time_ms, 
-             max_time_ms, threshold_violations, error_count, last_updated)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, NOW())
+             max_time_ms, threshold_violations, error_count,
+             p50_time_ms, p95_time_ms, p99_time_ms, p999_time_ms, last_updated)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, NOW())
             ON CONFLICT (operation_name) DO UPDATE SET
                 call_count = EXCLUDED.call_count,
                 total_time_ms = EXCLUDED.total_time_ms,
@@ -162,6 +275,10 @@ class DatabasePerformanceStorage:
                 max_time_ms = GREATEST(performance_stats.max_time_ms, EXCLUDED.max_time_ms),
                 threshold_violations = EXCLUDED.threshold_violations,
                 error_count = EXCLUDED.error_count,
+                p50_time_ms = EXCLUDED.p50_time_ms,
+                p95_time_ms = EXCLUDED.p95_time_ms,
+                p99_time_ms = EXCLUDED.p99_time_ms,
+                p999_time_ms = EXCLUDED.p999_time_ms,
                 last_updated = NOW()
             """
             
@@ -176,7 +293,11 @@ class DatabasePerformanceStorage:
                         stat.min_time_ms,
                         stat.max_time_ms,
                         stat.threshold_violations,
-                        stat.error_count
+                        stat.error_count,
+                        stat.p50_time_ms,
+                        stat.p95_time_ms,
+                        stat.p99_time_ms,
+                        stat.p999_time_ms
                     )
             
             logger.debug(f"Stored {len(stats)} performance statistics to database")
@@ -222,7 +343,7 @@ class DatabasePerformanceStorage:
             query = f"""
             SELECT operation_name, execution_time_ms, level, timestamp, metadata, 
                    exceeded_threshold, error_occurred
-            FROM {self.schema}.performance_metrics
+            FROM {self.schema}.performance_metric_samples
             WHERE {where_clause}
             ORDER BY timestamp DESC
             LIMIT ${param_count}
@@ -239,7 +360,7 @@ class DatabasePerformanceStorage:
                         execution_time_ms=float(row['execution_time_ms']),
                         level=PerformanceLevel(row['level']),
                         timestamp=row['timestamp'],
-                        metadata=row['metadata'] or {},
+                        metadata=_json_value(row['metadata']) or {},
                         exceeded_threshold=row['exceeded_threshold'],
                         error_occurred=row['error_occurred']
                     ))
@@ -250,42 +371,161 @@ class DatabasePerformanceStorage:
             logger.error(f"Failed to retrieve performance metrics: {e}")
             return []
     
-    async def cleanup_old_metrics(self, older_than_days: int = 30) -> int:
-        """Clean up old metrics and return count of deleted records."""
+    async def get_rollups(
+        self,
+        operation_name: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> List[RollupBucket]:
+        """Retrieve rollups, merging partial rows of the same operation and bucket."""
         await self._ensure_tables()
         
         try:
-            cleanup_query = f"""
-            DELETE FROM {self.schema}.performance_metrics
-            WHERE timestamp < NOW() - INTERVAL '{older_than_days} days'
+            conditions = []
+            params: List[Any] = []
+            
+            if operation_name:
+                params.append(operation_name)
+                conditions.append(f"operation_name = ${len(params)}")
+            
+            if start_time:
+                params.append(start_time)
+                conditions.append(f"bucket_start >= ${len(params)}")
+            
+            if end_time:
+                params.append(end_time)
+                conditions.append(f"bucket_start <= ${len(params)}")
+            
+            where_clause = " AND ".join(conditions) if conditions else "TRUE"
+            
+            query = f"""
+            SELECT bucket_start, operation_name, level, call_count, error_count,
+                   threshold_violations, total_time_ms, min_time_ms, max_time_ms, sketch
+            FROM {self.schema}.performance_metric_rollups
+            WHERE {where_clause}
             """
             
             async with self.database_service.get_connection("admin") as conn:
-                result = await conn.execute(cleanup_query)
-                # Extract count from result (e.g., "DELETE 123" -> 123)
-                deleted_count = int(result.split()[-1]) if result.split()[-1].isdigit() else 0
-                
-                if deleted_count > 0:
-                    logger.info(f"Cleaned up {deleted_count} old performance metrics (older than {older_than_days} days)")
-                
-                return deleted_count
-                
+                rows = await conn.fetch(query, *params)
+            
+            merged = MetricsRollup()
+            merged.restore(
+                RollupBucket(
+                    bucket_start=row['bucket_start'],
+                    operation_name=row['operation_name'],
+                    level=PerformanceLevel(row['level']),
+                    call_count=row['call_count'],
+                    error_count=row['error_count'],
+                    threshold_violations=row['threshold_violations'],
+                    total_time_ms=row['total_time_ms'],
+                    min_time_ms=row['min_time_ms'],
+                    max_time_ms=row['max_time_ms'],
+                    sketch=QuantileSketch.from_dict(_json_value(row['sketch'])),
+                )
+                for row in rows
+            )
+            buckets = merged.drain(include_open=True)
+            buckets.sort(key=lambda bucket: (bucket.bucket_start, bucket.operation_name))
+            return buckets
+        
+        except Exception as e:
+            logger.error(f"Failed to retrieve performance rollups: {e}")
+            return []
+    
+    async def cleanup_old_metrics(self, older_than_days: int = 30) -> int:
+        """Drop daily partitions older than the retention period.
+        
+        Returns:
+            Number of partitions dropped
+        """
+        await self._ensure_tables()
+        
+        cutoff = f"{datetime.now(timezone.utc) - timedelta(days=older_than_days):%Y%m%d}"
+        list_partitions_query = """
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        JOIN pg_namespace ns ON ns.oid = parent.relnamespace
+        WHERE ns.nspname = $1 AND parent.relname = $2
+        """
+        
+        dropped = 0
+        try:
+            async with self.database_service.get_connection("admin") as conn:
+                for table in PARTITIONED_TABLES:
+                    for row in await conn.fetch(list_partitions_query, self.schema, table):
+                        name = row['relname']
+                        day = name[len(table) + 2:]
+                        # Drop a day's partition only once the whole day is past the cutoff
+                        if day.isdigit() and day < cutoff:
+                            await conn.execute(f"DROP TABLE IF EXISTS {self.schema}.{name}")
+                            self._partitions.discard(name)
+                            dropped += 1
+            
+            if dropped > 0:
+                logger.info(f"Dropped {dropped} performance metric partitions (older than {older_than_days} days)")
+            
+            return dropped
+        
         except Exception as e:
             logger.error(f"Failed to cleanup old performance metrics: {e}")
-            return 0
+            return dropped
 
 
 class BackgroundMetricsPersister:
-    """Background processor for async metrics persistence."""
+    """Background processor for async metrics persistence.
+    
+    Every metric, queued or pulled from the monitor's snapshot, is folded
+    into a ``MetricsRollup``, together with the snapshot's partial buckets
+    for samples overwritten in the monitor's ring buffers; completed
+    buckets are written with one COPY per ``batch_size`` rows. Only notable samples (errors and threshold
+    violations, or all samples with ``persist_all_samples``) are kept
+    individually, in a buffer bounded by ``max_pending_samples``, so memory
+    does not grow with traffic or with database outages.
+    """
     
-    def __init__(self, storage: PerformanceStorage, batch_size: int = 100, flush_interval: float = 30.0):
-        """Initialize background persister with storage backend."""
+    def __init__(
+        self,
+        storage: PerformanceStorage,
+        batch_size: int = 5000,
+        flush_interval: float = 30.0,
+        snapshot_provider: Optional[
+            Callable[
+                [],
+                Tuple[List[PerformanceMetric], Dict[str, PerformanceStats], List[RollupBucket]],
+            ]
+        ] = None,
+        bucket_seconds: int = 60,
+        persist_all_samples: bool = False,
+        max_pending_samples: int = 50000,
+    ):
+        """Initialize background persister with storage backend.
+        
+        Args:
+            storage: Storage backend
+            batch_size: Maximum rows per storage call
+            flush_interval: Seconds between flushes
+            snapshot_provider: Called at flush time for new metrics, current
+                statistics and partial buckets of overwritten samples
+                (``PerformanceMonitor.snapshot``), so the monitor does not
+                push anything on its hot path
+            bucket_seconds: Width of a rollup bucket
+            persist_all_samples: Store every sample individually, not only
+                errors and threshold violations
+            max_pending_samples: Samples buffered between flushes; the oldest
+                are dropped beyond this
+        """
         self.storage = storage
         self.batch_size = batch_size
         self.flush_interval = flush_interval
+        self.snapshot_provider = snapshot_provider
+        self.persist_all_samples = persist_all_samples
         
-        self._metrics_queue: asyncio.Queue = asyncio.Queue()
-        self._stats_queue: asyncio.Queue = asyncio.Queue()
+        self._rollup = MetricsRollup(bucket_seconds)
+        self._samples: Deque[PerformanceMetric] = deque(maxlen=max_pending_samples)
+        self._latest_stats: Optional[Dict[str, PerformanceStats]] = None
+        self._rows_written = 0
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._logger = logging.getLogger(f"{__name__}.BackgroundMetricsPersister")
@@ -307,10 +547,14 @@ class BackgroundMetricsPersister:
         self._running = False
         
         if self._task:
-            await self._task
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
         
-        # Flush any remaining metrics
-        await self._flush_all()
+        # Flush everything, including the bucket still being filled
+        await self._flush_all(include_open=True)
         self._logger.info("Stopped background metrics persistence")
     
     def queue_metric(self, metric: PerformanceMetric) -> None:
@@ -318,57 +562,81 @@ class BackgroundMetricsPersister:
         if not self._running:
             return
         
-        try:
-            self._metrics_queue.put_nowait(metric)
-        except asyncio.QueueFull:
-            self._logger.warning("Metrics queue full, dropping metric")
+        self._add(metric)
     
     def queue_stats(self, stats: Dict[str, PerformanceStats]) -> None:
         """Queue stats for background persistence (non-blocking)."""
         if not self._running:
             return
         
-        try:
-            self._stats_queue.put_nowait(stats.copy())
-        except asyncio.QueueFull:
-            self._logger.warning("Stats queue full, dropping stats")
+        # Latest stats override previous
+        self._latest_stats = stats.copy()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get persister statistics."""
+        return {
+            "metrics_aggregated": self._rollup.metrics_added,
+            "open_buckets": len(self._rollup),
+            "pending_samples": len(self._samples),
+            "rows_written": self._rows_written,
+        }
+    
+    def _add(self, metric: PerformanceMetric) -> None:
+        self._rollup.add(metric)
+        if self.persist_all_samples or metric.error_occurred or metric.exceeded_threshold:
+            self._samples.append(metric)
     
     async def _persistence_loop(self) -> None:
         """Main background persistence loop."""
-        try:
-            while self._running:
-                await asyncio.sleep(self.flush_interval)
+        while self._running:
+            await asyncio.sleep(self.flush_interval)
+            try:
                 await self._flush_all()
-        except Exception as e:
-            self._logger.error(f"Persistence loop error: {e}")
+            except Exception as e:
+                self._logger.error(f"Persistence loop error: {e}")
     
-    async def _flush_all(self) -> None:
-        """Flush all queued metrics and stats."""
-        # Flush metrics
-        metrics_batch = []
-        try:
-            while len(metrics_batch) < self.batch_size:
-                metric = self._metrics_queue.get_nowait()
-                metrics_batch.append(metric)
-        except asyncio.QueueEmpty:
-            pass
+    async def _flush_all(self, include_open: bool = False) -> None:
+        """Flush completed rollups, buffered samples and the latest stats.
         
-        if metrics_batch:
+        Args:
+            include_open: Also flush the bucket still being filled (on stop)
+        """
+        # Pull new samples and a statistics snapshot from the monitor
+        if self.snapshot_provider:
             try:
-                await self.storage.store_metrics(metrics_batch)
+                snapshot_metrics, self._latest_stats, partials = self.snapshot_provider()
+                for metric in snapshot_metrics:
+                    self._add(metric)
+                self._rollup.restore(partials)
             except Exception as e:
-                self._logger.error(f"Failed to flush metrics batch: {e}")
+                self._logger.error(f"Failed to take performance snapshot: {e}")
         
-        # Flush stats (latest stats override previous)
-        latest_stats = None
-        try:
-            while True:
-                latest_stats = self._stats_queue.get_nowait()
-        except asyncio.QueueEmpty:
-            pass
+        buckets = self._rollup.drain(include_open=include_open)
+        for offset in range(0, len(buckets), self.batch_size):
+            batch = buckets[offset:offset + self.batch_size]
+            if not await self._store(self.storage.store_rollups, batch):
+                # Aggregates are kept and merge with newer data of the same minute
+                self._rollup.restore(buckets[offset:])
+                break
+            self._rows_written += len(batch)
         
-        if latest_stats:
-            try:
-                await self.storage.store_stats(latest_stats)
-            except Exception as e:
-                self._logger.error(f"Failed to flush stats: {e}")
\ No newline at end of file
+        samples = list(self._samples)
+        self._samples.clear()
+        for offset in range(0, len(samples), self.batch_size):
+            batch = samples[offset:offset + self.batch_size]
+            if not await self._store(self.storage.store_metrics, batch):
+                self._samples.extendleft(reversed(samples[offset:]))
+                break
+            self._rows_written += len(batch)
+        
+        stats, self._latest_stats = self._latest_stats, None
+        if stats:
+            await self._store(self.storage.store_stats, stats)
+    
+    async def _store(self, store: Callable, data: Any) -> bool:
+        """Call a storage method; storage reports failure by returning False."""
+        try:
+            return await store(data) is not False
+        except Exception as e:
+            self._logger.error(f"Failed to flush performance data: {e}")
+            return False
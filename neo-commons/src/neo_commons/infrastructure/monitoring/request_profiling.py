@@ -0,0 +1,264 @@
+"""Low-overhead process resource sampling and slow-request profiling.
+
+``ProcessResourceSampler`` reads process memory and CPU with ``psutil`` on a
+background thread at a fixed interval, so request handling never pays for
+``/proc`` reads. ``SlowRequestProfiler`` is an opt-in sampling profiler: a
+background thread periodically looks at requests that have already run
+longer than the slow threshold and records their current stack, so fast
+requests are never sampled and the per-request cost is a dict insert/pop.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessResourceSampler:
+    """Samples process memory and CPU usage on a background thread."""
+
+    def __init__(self, interval: float = 5.0):
+        """Initialize sampler.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.memory_mb = 0.0
+        self.cpu_percent = 0.0
+        self.peak_memory_mb = 0.0
+        self.peak_cpu_percent = 0.0
+        self.samples = 0
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the sampling thread (idempotent)."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            # Prime cpu_percent, whose first call always returns 0.0
+            self.sample()
+            self._thread = threading.Thread(target=self._run, name="neo-resource-sampler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def sample(self) -> None:
+        """Take one sample now."""
+        try:
+            self.memory_mb = self._process.memory_info().rss / 1024 / 1024
+            self.cpu_percent = self._process.cpu_percent()
+        except Exception as e:
+            logger.debug(f"Process resource sampling failed: {e}")
+            return
+        self.peak_memory_mb = max(self.peak_memory_mb, self.memory_mb)
+        self.peak_cpu_percent = max(self.peak_cpu_percent, self.cpu_percent)
+        self.samples += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get latest and peak resource usage."""
+        return {
+            "memory_mb": round(self.memory_mb, 2),
+            "cpu_percent": round(self.cpu_percent, 2),
+            "peak_memory_mb": round(self.peak_memory_mb, 2),
+            "peak_cpu_percent": round(self.peak_cpu_percent, 2),
+            "samples": self.samples,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+_resource_sampler: Optional[ProcessResourceSampler] = None
+
+
+def get_resource_sampler() -> ProcessResourceSampler:
+    """Get the process-wide resource sampler, started on first use."""
+    global _resource_sampler
+    if _resource_sampler is None:
+        _resource_sampler = ProcessResourceSampler()
+    _resource_sampler.start()
+    return _resource_sampler
+
+
+class _ActiveRequest:
+    __slots__ = ("name", "task", "thread_id", "started", "stacks", "samples")
+
+    def __init__(self, name: str, task: Optional[asyncio.Task], thread_id: int):
+        self.name = name
+        self.task = task
+        self.thread_id = thread_id
+        self.started = time.perf_counter()
+        self.stacks: Counter = Counter()
+        self.samples = 0
+
+
+class SlowRequestProfiler:
+    """Sampling profiler that only samples requests once they are slow.
+
+    While a request is running, the loop thread's stack is recorded (what it
+    is computing). While it is suspended, the await chain is recorded (what
+    it waits on), unless the loop is busy with other work, in which case
+    that blocking stack is recorded under ``(loop busy)``. Stacks are stored
+    in collapsed form (``outer;inner;innermost``), ready for flame graph tools.
+    """
+
+    def __init__(
+        self,
+        slow_threshold: float = 1.0,
+        interval: float = 0.01,
+        max_profiles: int = 100,
+        max_depth: int = 64,
+    ):
+        """Initialize profiler.
+
+        Args:
+            slow_threshold: Seconds after which a request is sampled
+            interval: Seconds between stack samples
+            max_profiles: Number of slow request profiles kept
+            max_depth: Maximum frames per recorded stack
+        """
+        self.slow_threshold = slow_threshold
+        self.interval = interval
+        self.max_depth = max_depth
+        self._active: Dict[int, _ActiveRequest] = {}
+        self._profiles: Deque[Dict[str, Any]] = deque(maxlen=max_profiles)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the sampling thread (idempotent)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="neo-request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def begin(self, name: str) -> int:
+        """Register the current request; returns a token for ``end``."""
+        if self._thread is None:
+            self.start()
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        entry = _ActiveRequest(name, task, threading.get_ident())
+        token = id(entry)
+        self._active[token] = entry
+        return token
+
+    def end(self, token: int, duration: float) -> Optional[Dict[str, Any]]:
+        """Unregister a request.
+
+        Returns:
+            The request's profile when it was slow and sampled, else None
+        """
+        entry = self._active.pop(token, None)
+        if entry is None or not entry.samples:
+            return None
+        profile = {
+            "name": entry.name,
+            "duration_ms": round(duration * 1000, 2),
+            "samples": entry.samples,
+            "stacks": dict(entry.stacks.most_common()),
+        }
+        self._profiles.append(profile)
+        return profile
+
+    def get_profiles(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Most recent slow request profiles, newest last."""
+        profiles = list(self._profiles)
+        return profiles[-limit:] if limit else profiles
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            if not self._active:
+                continue
+            deadline = time.perf_counter() - self.slow_threshold
+            slow = [entry for entry in list(self._active.values()) if entry.started <= deadline]
+            if not slow:
+                continue
+            thread_frames = sys._current_frames()
+            for entry in slow:
+                try:
+                    stack = self._stack(entry, thread_frames)
+                except Exception:
+                    # Frames change under us; a lost sample is fine
+                    continue
+                if stack:
+                    entry.stacks[stack] += 1
+                    entry.samples += 1
+
+    def _stack(self, entry: _ActiveRequest, thread_frames: Dict[int, Any]) -> str:
+        coro = entry.task.get_coro() if entry.task is not None else None
+        thread_frame = thread_frames.get(entry.thread_id)
+        if coro is None or getattr(coro, "cr_running", False):
+            # Running right now: the loop thread's stack is this request's work
+            return self._collapse(self._thread_stack(thread_frame))
+        if thread_frame is not None and not thread_frame.f_code.co_filename.endswith("selectors.py"):
+            # Waiting while the loop is busy elsewhere: what is blocking it
+            # matters more than where the request waits
+            return "(loop busy);" + self._collapse(self._thread_stack(thread_frame))
+        # Suspended on I/O: follow the await chain down to what it waits on
+        frames = []
+        while coro is not None and len(frames) < self.max_depth:
+            frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+            if frame is None:
+                break
+            frames.append(frame)
+            coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+        return self._collapse(frames)
+
+    def _thread_stack(self, frame: Any) -> List[Any]:
+        return thread_stack(frame, self.max_depth)
+
+    @staticmethod
+    def _collapse(frames: List[Any]) -> str:
+        return collapse_stack(frames)
+
+
+def thread_stack(frame: Any, max_depth: int = 64) -> List[Any]:
+    """Frames of a thread's stack from ``frame`` outward, outermost first."""
+    frames = []
+    while frame is not None and len(frames) < max_depth:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+def collapse_stack(frames: List[Any]) -> str:
+    """Collapsed stack (``outer;inner;innermost``) as used by flame graph tools."""
+    return ";".join(
+        f"{frame.f_code.co_name} ({os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno})"
+        for frame in frames
+    )
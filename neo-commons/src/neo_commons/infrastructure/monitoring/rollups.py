@@ -0,0 +1,180 @@
+"""Time-bucketed pre-aggregation of performance metrics.
+
+Instead of one database row per measurement, the persister folds metrics
+into fixed-width (1 minute by default) per-operation buckets holding count,
+sum, min/max and a ``QuantileSketch``, and writes one row per bucket.
+Buckets from several processes or flushes for the same minute are partial
+aggregates that merge exactly (sketches merge by adding bucket counts).
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .metrics_recorder import QuantileSketch
+from .performance import PerformanceLevel, PerformanceMetric
+
+
+@dataclass
+class RollupBucket:
+    """Aggregate of one operation's metrics within one time bucket."""
+
+    bucket_start: datetime
+    operation_name: str
+    level: PerformanceLevel
+    call_count: int = 0
+    error_count: int = 0
+    threshold_violations: int = 0
+    total_time_ms: float = 0.0
+    min_time_ms: float = float('inf')
+    max_time_ms: float = 0.0
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def add(self, metric: PerformanceMetric) -> None:
+        """Add a metric, weighted by the sampling that produced it."""
+        weight = metric.sample_weight
+        self.call_count += weight
+        self.total_time_ms += metric.execution_time_ms * weight
+        self.min_time_ms = min(self.min_time_ms, metric.execution_time_ms)
+        self.max_time_ms = max(self.max_time_ms, metric.execution_time_ms)
+        if metric.error_occurred:
+            self.error_count += weight
+        if metric.exceeded_threshold:
+            self.threshold_violations += weight
+        self.sketch.add(metric.execution_time_ms)
+
+    def merge(self, other: "RollupBucket") -> None:
+        """Merge another partial aggregate of the same operation and bucket."""
+        self.call_count += other.call_count
+        self.error_count += other.error_count
+        self.threshold_violations += other.threshold_violations
+        self.total_time_ms += other.total_time_ms
+        self.min_time_ms = min(self.min_time_ms, other.min_time_ms)
+        self.max_time_ms = max(self.max_time_ms, other.max_time_ms)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def avg_time_ms(self) -> float:
+        return self.total_time_ms / self.call_count if self.call_count else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        return self.sketch.quantile(q)
+
+
+class MetricsRollup:
+    """In-memory per-operation, per-bucket aggregation of metrics.
+
+    Memory is proportional to operations x open buckets, not to the number
+    of metrics added.
+    """
+
+    def __init__(self, bucket_seconds: int = 60):
+        """Initialize rollup.
+
+        Args:
+            bucket_seconds: Width of a time bucket
+        """
+        self.bucket_seconds = bucket_seconds
+        self._buckets: Dict[Tuple[datetime, str], RollupBucket] = {}
+        self.metrics_added = 0
+
+    def bucket_start(self, timestamp: datetime) -> datetime:
+        """Start of the bucket containing ``timestamp`` (UTC)."""
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        epoch = int(timestamp.timestamp())
+        return datetime.fromtimestamp(epoch - epoch % self.bucket_seconds, timezone.utc)
+
+    def add(self, metric: PerformanceMetric) -> None:
+        """Fold a metric into its bucket."""
+        start = self.bucket_start(metric.timestamp)
+        key = (start, metric.operation_name)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = RollupBucket(start, metric.operation_name, metric.level)
+        bucket.add(metric)
+        self.metrics_added += 1
+
+    def add_many(self, metrics: Iterable[PerformanceMetric]) -> None:
+        for metric in metrics:
+            self.add(metric)
+
+    def restore(self, buckets: Iterable[RollupBucket]) -> None:
+        """Merge partial aggregates, e.g. buckets back after a failed write.
+
+        ``bucket_start`` may be any time within the bucket; it is aligned
+        to the start of the bucket it falls into.
+        """
+        for bucket in buckets:
+            bucket.bucket_start = self.bucket_start(bucket.bucket_start)
+            key = (bucket.bucket_start, bucket.operation_name)
+            existing = self._buckets.get(key)
+            if existing is None:
+                self._buckets[key] = bucket
+            else:
+                existing.merge(bucket)
+
+    def drain(self, now: Optional[datetime] = None, include_open: bool = False) -> List[RollupBucket]:
+        """Remove and return buckets that are complete.
+
+        Args:
+            now: Current time (defaults to UTC now)
+            include_open: Also drain the bucket still being filled (shutdown)
+        """
+        if include_open:
+            buckets = list(self._buckets.values())
+            self._buckets.clear()
+            return buckets
+
+        current = self.bucket_start(now or datetime.now(timezone.utc))
+        closed = [key for key in self._buckets if key[0] < current]
+        return [self._buckets.pop(key) for key in closed]
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    @staticmethod
+    def to_record(bucket: RollupBucket) -> Tuple[Any, ...]:
+        """Row tuple in ``ROLLUP_COLUMNS`` order."""
+        return (
+            bucket.bucket_start,
+            bucket.operation_name,
+            bucket.level.value,
+            bucket.call_count,
+            bucket.error_count,
+            bucket.threshold_violations,
+            bucket.total_time_ms,
+            bucket.min_time_ms,
+            bucket.max_time_ms,
+            bucket.sketch.quantile(0.5),
+            bucket.sketch.quantile(0.95),
+            bucket.sketch.quantile(0.99),
+            bucket.sketch.to_dict(),
+        )
+
+
+ROLLUP_COLUMNS = (
+    "bucket_start",
+    "operation_name",
+    "level",
+    "call_count",
+    "error_count",
+    "threshold_violations",
+    "total_time_ms",
+    "min_time_ms",
+    "max_time_ms",
+    "p50_time_ms",
+    "p95_time_ms",
+    "p99_time_ms",
+    "sketch",
+)
+
+
+def partition_days(start: datetime, end: datetime) -> List[datetime]:
+    """UTC midnights of the days overlapping ``[start, end]``."""
+    day = start.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    days = []
+    while day <= end:
+        days.append(day)
+        day += timedelta(days=1)
+    return days
@@ -0,0 +1,72 @@
+"""Distributed tracing infrastructure.
+
+Provides spans with context-local parenting, W3C ``traceparent``
+propagation across HTTP calls and event streams, pluggable exporters and
+hooks for asyncpg and httpx. Tracing is disabled (and close to free) until
+an exporter is configured with ``configure_tracing``.
+"""
+
+from .tracer import (
+    SpanKind,
+    SpanContext,
+    Span,
+    NonRecordingSpan,
+    INVALID_SPAN,
+    Tracer,
+    current_span,
+    get_tracer,
+    set_tracer,
+    configure_tracing,
+    traced,
+)
+from .propagation import (
+    TRACEPARENT,
+    format_traceparent,
+    parse_traceparent,
+    inject,
+    extract,
+)
+from .exporters import (
+    SpanExporter,
+    InMemorySpanExporter,
+    LoggingSpanExporter,
+    BatchSpanExporter,
+)
+from .integrations import (
+    trace_asyncpg_query,
+    instrument_asyncpg_connection,
+    make_httpx_hooks,
+)
+
+__all__ = [
+    # Spans and tracer
+    "SpanKind",
+    "SpanContext",
+    "Span",
+    "NonRecordingSpan",
+    "INVALID_SPAN",
+    "Tracer",
+    "current_span",
+    "get_tracer",
+    "set_tracer",
+    "configure_tracing",
+    "traced",
+
+    # Propagation
+    "TRACEPARENT",
+    "format_traceparent",
+    "parse_traceparent",
+    "inject",
+    "extract",
+
+    # Exporters
+    "SpanExporter",
+    "InMemorySpanExporter",
+    "LoggingSpanExporter",
+    "BatchSpanExporter",
+
+    # Integrations
+    "trace_asyncpg_query",
+    "instrument_asyncpg_connection",
+    "make_httpx_hooks",
+]
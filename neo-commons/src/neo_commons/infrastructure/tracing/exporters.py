@@ -0,0 +1,151 @@
+"""Span exporters.
+
+An exporter is anything with ``export(spans)`` and ``shutdown()``.
+``BatchSpanExporter`` wraps a slow exporter (network, files) so finishing a
+span only appends to a bounded buffer; a background thread exports batches.
+"""
+
+import logging
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Protocol, Sequence, runtime_checkable
+
+from .tracer import Span
+
+logger = logging.getLogger(__name__)
+
+
+@runtime_checkable
+class SpanExporter(Protocol):
+    """Receives finished spans."""
+
+    def export(self, spans: Sequence[Span]) -> None:
+        ...
+
+    def shutdown(self) -> None:
+        ...
+
+
+class InMemorySpanExporter:
+    """Keeps finished spans in memory, for tests and debugging."""
+
+    def __init__(self, max_spans: Optional[int] = None):
+        """Initialize exporter.
+
+        Args:
+            max_spans: Keep only the most recent spans; None keeps all
+        """
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self._spans.extend(spans)
+
+    def shutdown(self) -> None:
+        pass
+
+    def get_finished_spans(self, name: Optional[str] = None) -> List[Span]:
+        """Finished spans in completion order, optionally only those named ``name``."""
+        spans = list(self._spans)
+        return [span for span in spans if span.name == name] if name else spans
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+
+class LoggingSpanExporter:
+    """Writes each span as a structured log record."""
+
+    def __init__(self, level: int = logging.INFO, logger_name: str = "neo_commons.traces"):
+        self.level = level
+        self._logger = logging.getLogger(logger_name)
+
+    def export(self, spans: Sequence[Span]) -> None:
+        if not self._logger.isEnabledFor(self.level):
+            return
+        for span in spans:
+            self._logger.log(
+                self.level,
+                "span %s %.2fms",
+                span.name,
+                span.duration_ms or 0.0,
+                extra={"structured_data": span.to_dict()},
+            )
+
+    def shutdown(self) -> None:
+        pass
+
+
+class BatchSpanExporter:
+    """Buffers spans and exports them in batches on a background thread."""
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        max_queue_size: int = 4096,
+        max_batch_size: int = 512,
+        interval: float = 5.0,
+    ):
+        """Initialize batching exporter.
+
+        Args:
+            exporter: Exporter receiving the batches
+            max_queue_size: Spans buffered before new ones are dropped
+            max_batch_size: Spans per export call
+            interval: Seconds between exports
+        """
+        self.exporter = exporter
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self.interval = interval
+        self.dropped = 0
+        self.exported = 0
+        self._queue: Deque[Span] = deque()
+        self._wake = threading.Event()
+        self._stop = False
+        self._thread: Optional[threading.Thread] = None
+
+    def export(self, spans: Sequence[Span]) -> None:
+        if self._thread is None:
+            self._start()
+        for span in spans:
+            if len(self._queue) >= self.max_queue_size:
+                self.dropped += 1
+                continue
+            self._queue.append(span)
+        if len(self._queue) >= self.max_batch_size:
+            self._wake.set()
+
+    def shutdown(self) -> None:
+        """Export buffered spans and stop the thread."""
+        self._stop = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 5.0)
+            self._thread = None
+        self._flush()
+        self.exporter.shutdown()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"queued": len(self._queue), "exported": self.exported, "dropped": self.dropped}
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="neo-span-exporter", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self._flush()
+
+    def _flush(self) -> None:
+        queue = self._queue
+        while queue:
+            batch = []
+            while queue and len(batch) < self.max_batch_size:
+                batch.append(queue.popleft())
+            try:
+                self.exporter.export(batch)
+                self.exported += len(batch)
+            except Exception as e:
+                logger.warning("Failed to export %d spans: %s", len(batch), e)
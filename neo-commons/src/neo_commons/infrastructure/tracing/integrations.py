@@ -0,0 +1,87 @@
+"""Tracing hooks for asyncpg connections and httpx clients.
+
+Both only record spans inside an already recording span, so background
+queries and calls never start traces of their own.
+"""
+
+import time
+from typing import Any
+
+from .propagation import TRACEPARENT, format_traceparent
+from .tracer import SpanKind, current_span, get_tracer
+
+# Longest statement text kept on a query span
+MAX_STATEMENT_LENGTH = 1024
+
+
+def trace_asyncpg_query(record: Any) -> None:
+    """asyncpg query logger recording each query as a ``db.query`` span.
+
+    Register with ``connection.add_query_logger(trace_asyncpg_query)``.
+    asyncpg calls it after the query with the caller's context, so the span
+    is placed under the span that ran the query.
+    """
+    if not current_span().recording:
+        return
+    end_ns = time.time_ns()
+    query = record.query or ""
+    params = record.conn_params
+    get_tracer().record_span(
+        "db.query",
+        end_ns - int(record.elapsed * 1e9),
+        end_ns,
+        SpanKind.CLIENT,
+        {
+            "db.system": "postgresql",
+            "db.name": getattr(params, "database", None),
+            "db.operation": query.lstrip().split(None, 1)[0].upper() if query.strip() else None,
+            "db.statement": query[:MAX_STATEMENT_LENGTH],
+        },
+        record.exception,
+    )
+
+
+def instrument_asyncpg_connection(connection: Any) -> None:
+    """Trace queries of an asyncpg connection when tracing is enabled (idempotent)."""
+    if get_tracer().enabled:
+        connection.add_query_logger(trace_asyncpg_query)
+
+
+def make_httpx_hooks(service: str):
+    """Build httpx ``request``/``response`` event hooks tracing outgoing calls.
+
+    The request hook starts a client span and injects its ``traceparent``
+    header; the response hook ends it with the status code.
+
+    Args:
+        service: Peer service name recorded on the spans (e.g. ``keycloak``)
+    """
+
+    async def on_request(request: Any) -> None:
+        parent = current_span()
+        if parent.context is None:
+            return
+        span = get_tracer().start_span(
+            f"{service} {request.method}",
+            SpanKind.CLIENT,
+            {
+                "peer.service": service,
+                "http.method": request.method,
+                "http.url": str(request.url.copy_with(query=None)),
+            },
+        )
+        if span.context is not None:
+            request.headers[TRACEPARENT] = format_traceparent(span.context)
+        if span.recording:
+            request.extensions["neo_span"] = span
+
+    async def on_response(response: Any) -> None:
+        span = response.request.extensions.get("neo_span")
+        if span is None:
+            return
+        span.set_attribute("http.status_code", response.status_code)
+        if response.status_code >= 500:
+            span.error = f"HTTP {response.status_code}"
+        span.end()
+
+    return on_request, on_response
@@ -0,0 +1,67 @@
+"""W3C trace context (``traceparent``) propagation.
+
+Carriers are plain mappings: HTTP headers, Redis stream entry fields or any
+dict. Keys and values may be ``str`` or ``bytes`` when extracting.
+"""
+
+from typing import Any, Mapping, MutableMapping, Optional
+
+from .tracer import SpanContext, current_span
+
+TRACEPARENT = "traceparent"
+_TRACEPARENT_BYTES = TRACEPARENT.encode()
+
+
+def format_traceparent(context: SpanContext) -> str:
+    """Format a context as a version 00 ``traceparent`` value."""
+    return f"00-{context.trace_id:032x}-{context.span_id:016x}-{'01' if context.sampled else '00'}"
+
+
+def parse_traceparent(value: Any) -> Optional[SpanContext]:
+    """Parse a ``traceparent`` value; None when missing or malformed."""
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode("ascii", errors="replace")
+    if not isinstance(value, str):
+        return None
+    parts = value.strip().split("-")
+    if len(parts) < 4:
+        return None
+    version, trace_id, span_id, flags = parts[:4]
+    # Version ff is invalid; version 00 has exactly four fields
+    if len(version) != 2 or version == "ff" or (version == "00" and len(parts) != 4):
+        return None
+    if len(trace_id) != 32 or len(span_id) != 16 or len(flags) != 2:
+        return None
+    try:
+        trace = int(trace_id, 16)
+        span = int(span_id, 16)
+        sampled = bool(int(flags, 16) & 0x01)
+    except ValueError:
+        return None
+    if not trace or not span:
+        return None
+    return SpanContext(trace, span, sampled)
+
+
+def inject(carrier: MutableMapping[str, Any], context: Optional[SpanContext] = None) -> MutableMapping[str, Any]:
+    """Write the current (or given) trace context into ``carrier``.
+
+    Returns:
+        The carrier, unchanged when there is no trace context
+    """
+    if context is None:
+        context = current_span().context
+    if context is not None:
+        carrier[TRACEPARENT] = format_traceparent(context)
+    return carrier
+
+
+def extract(carrier: Optional[Mapping[Any, Any]]) -> Optional[SpanContext]:
+    """Read a trace context from ``carrier``; None when absent or invalid."""
+    if not carrier:
+        return None
+    value = carrier.get(TRACEPARENT)
+    if value is None and isinstance(carrier, dict):
+        # Redis returns stream entry fields with bytes keys
+        value = carrier.get(_TRACEPARENT_BYTES)
+    return parse_traceparent(value) if value is not None else None
@@ -0,0 +1,376 @@
+"""Spans, the tracer and the current-span context.
+
+The current span lives in a ``ContextVar``, so it follows the request
+through awaits and into tasks created while it is active. When no exporter
+is configured (or a trace is not sampled), spans are non-recording: they
+only carry the trace context for propagation and cost no allocation beyond
+the span object itself, and ``traced`` functions skip span handling
+entirely.
+"""
+
+import functools
+import inspect
+import logging
+import random
+import time
+from contextvars import ContextVar, Token
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .exporters import SpanExporter
+
+logger = logging.getLogger(__name__)
+
+
+class SpanKind(str, Enum):
+    """Role of a span in a trace."""
+    INTERNAL = "internal"
+    SERVER = "server"
+    CLIENT = "client"
+    PRODUCER = "producer"
+    CONSUMER = "consumer"
+
+
+class SpanContext:
+    """Identifiers propagated across process boundaries (W3C trace context)."""
+
+    __slots__ = ("trace_id", "span_id", "sampled")
+
+    def __init__(self, trace_id: int, span_id: int, sampled: bool = True):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.sampled = sampled
+
+    @property
+    def trace_id_hex(self) -> str:
+        return f"{self.trace_id:032x}"
+
+    @property
+    def span_id_hex(self) -> str:
+        return f"{self.span_id:016x}"
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            isinstance(other, SpanContext)
+            and (self.trace_id, self.span_id, self.sampled) == (other.trace_id, other.span_id, other.sampled)
+        )
+
+    def __repr__(self) -> str:
+        return f"SpanContext({self.trace_id_hex}, {self.span_id_hex}, sampled={self.sampled})"
+
+
+class NonRecordingSpan:
+    """Span that records nothing; carries a context for propagation, if any."""
+
+    __slots__ = ("context",)
+
+    recording = False
+
+    def __init__(self, context: Optional[SpanContext] = None):
+        self.context = context
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        pass
+
+
+# Current span when none is active; also returned by disabled tracers
+INVALID_SPAN = NonRecordingSpan()
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "name", "context", "parent_id", "kind", "attributes",
+        "start_ns", "end_ns", "error", "_tracer",
+    )
+
+    recording = True
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        context: SpanContext,
+        parent_id: Optional[int],
+        kind: SpanKind,
+        attributes: Optional[Dict[str, Any]],
+        start_ns: Optional[int] = None,
+    ):
+        self._tracer = tracer
+        self.name = name
+        self.context = context
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes: Dict[str, Any] = dict(attributes) if attributes else {}
+        self.start_ns = start_ns or time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        self.attributes.update(attributes)
+
+    def record_exception(self, exc: BaseException) -> None:
+        """Mark the span as failed with the given exception."""
+        self.error = f"{type(exc).__name__}: {exc}"
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        """Finish the span and hand it to the exporter (only the first call counts)."""
+        if self.end_ns is not None:
+            return
+        self.end_ns = end_ns or time.time_ns()
+        self._tracer._export(self)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.context.trace_id_hex,
+            "span_id": self.context.span_id_hex,
+            "parent_id": f"{self.parent_id:016x}" if self.parent_id else None,
+            "kind": self.kind.value,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "error": self.error,
+            "service": self._tracer.service_name,
+        }
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, {self.context!r}, duration_ms={self.duration_ms})"
+
+
+_current_span: ContextVar[Any] = ContextVar("neo_current_span", default=INVALID_SPAN)
+
+
+def current_span() -> Any:
+    """The active span; ``INVALID_SPAN`` (non-recording, no context) when there is none."""
+    return _current_span.get()
+
+
+class _SpanScope:
+    """Context manager making a span current for its duration and ending it."""
+
+    __slots__ = ("span", "token", "end_on_exit")
+
+    def __init__(self, span: Any, end_on_exit: bool = True):
+        self.span = span
+        self.token: Optional[Token] = None
+        self.end_on_exit = end_on_exit
+
+    def __enter__(self) -> Any:
+        if self.span is not INVALID_SPAN:
+            self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None:
+            self.span.record_exception(exc)
+        if self.token is not None:
+            _current_span.reset(self.token)
+        if self.end_on_exit:
+            self.span.end()
+
+
+class Tracer:
+    """Creates spans and hands finished ones to a pluggable exporter."""
+
+    def __init__(
+        self,
+        exporter: Optional["SpanExporter"] = None,
+        sample_rate: float = 1.0,
+        service_name: str = "neo-commons",
+    ):
+        """Initialize tracer.
+
+        Args:
+            exporter: Receives finished spans; None disables recording
+            sample_rate: Fraction of new traces recorded; child spans follow
+                their parent's decision
+            service_name: Service reported with every span
+        """
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.service_name = service_name
+        self._sample_bound = int(max(0.0, min(1.0, sample_rate)) * (1 << 64))
+        self.exported = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any span can be recorded."""
+        return self.exporter is not None and self._sample_bound > 0
+
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional[SpanContext] = None,
+        start_ns: Optional[int] = None,
+    ) -> Any:
+        """Start a span (not made current); the caller must ``end`` it.
+
+        Args:
+            name: Operation name
+            kind: Role of the span
+            attributes: Initial attributes
+            parent: Remote parent context; defaults to the current span's
+            start_ns: Start time in epoch nanoseconds, for spans recorded after the fact
+        """
+        if parent is None:
+            parent = _current_span.get().context
+        if not self.enabled:
+            # Pass an incoming context through unchanged
+            return INVALID_SPAN if parent is None else NonRecordingSpan(parent)
+
+        if parent is not None:
+            trace_id = parent.trace_id
+            sampled = parent.sampled
+        else:
+            trace_id = random.getrandbits(128) or 1
+            sampled = (trace_id & 0xFFFFFFFFFFFFFFFF) < self._sample_bound
+
+        context = SpanContext(trace_id, random.getrandbits(64) or 1, sampled)
+        if not sampled:
+            return NonRecordingSpan(context)
+        return Span(self, name, context, parent.span_id if parent else None, kind, attributes, start_ns)
+
+    def start_as_current_span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional[SpanContext] = None,
+    ) -> _SpanScope:
+        """Start a span that is current inside the ``with`` block and ends with it.
+
+        Exceptions leaving the block are recorded on the span.
+        """
+        return _SpanScope(self.start_span(name, kind, attributes, parent))
+
+    @staticmethod
+    def use_span(span: Any, end_on_exit: bool = False) -> _SpanScope:
+        """Make an existing span current inside a ``with`` block."""
+        return _SpanScope(span, end_on_exit)
+
+    def record_span(
+        self,
+        name: str,
+        start_ns: int,
+        end_ns: int,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Record an already finished operation as a child of the current span.
+
+        Used by instrumentation that only learns about an operation once it
+        completed (e.g. asyncpg query loggers). Nothing is recorded outside a
+        recording span, so such operations never start traces of their own.
+        """
+        parent = _current_span.get()
+        if not parent.recording:
+            return
+        span = self.start_span(name, kind, attributes, parent.context, start_ns)
+        if error is not None:
+            span.record_exception(error)
+        span.end(end_ns)
+
+    def _export(self, span: Span) -> None:
+        exporter = self.exporter
+        if exporter is None:
+            return
+        try:
+            exporter.export([span])
+            self.exported += 1
+        except Exception as e:
+            logger.debug("Span export failed: %s", e)
+
+    def shutdown(self) -> None:
+        """Flush and shut down the exporter."""
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer (disabled until ``configure_tracing`` or ``set_tracer``)."""
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> None:
+    """Set the global tracer."""
+    global _tracer
+    _tracer = tracer
+
+
+def configure_tracing(
+    exporter: "SpanExporter",
+    sample_rate: float = 1.0,
+    service_name: str = "neo-commons",
+) -> Tracer:
+    """Install a global tracer exporting to ``exporter``."""
+    tracer = Tracer(exporter, sample_rate, service_name)
+    set_tracer(tracer)
+    return tracer
+
+
+def traced(
+    name: Optional[str] = None,
+    kind: SpanKind = SpanKind.INTERNAL,
+    attributes: Optional[Dict[str, Any]] = None,
+) -> Callable:
+    """Decorator running a sync or async function inside a span.
+
+    Args:
+        name: Span name; defaults to the function's qualified name
+        kind: Role of the span
+        attributes: Static attributes added to every span
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                tracer = _tracer
+                if not tracer.enabled:
+                    return await func(*args, **kwargs)
+                with tracer.start_as_current_span(span_name, kind, attributes):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            tracer = _tracer
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.start_as_current_span(span_name, kind, attributes):
+                return func(*args, **kwargs)
+
+        return sync_wrapper
+
+    return decorator
@@ -3,11 +3,13 @@
 # Executors
 from .executors.default_action_executor import DefaultActionExecutor
 from .executors.enhanced_action_executor import EnhancedActionExecutor
+from .executors.execution_scheduler import ExecutionScheduler, PriorityLimiter
 
 # Repositories
 from .repositories.asyncpg_action_repository import AsyncPGActionRepository
 from .repositories.asyncpg_action_execution_repository import AsyncPGActionExecutionRepository
 from .repositories.asyncpg_event_action_subscription_repository import AsyncPGEventActionSubscriptionRepository
+from .repositories.buffered_action_execution_writer import BufferedActionExecutionWriter
 
 # Handlers - Import from handlers module for clean organization
 from .handlers import (
@@ -18,6 +20,8 @@ from .handlers import (
     # Webhook handlers
     HTTPWebhookHandler,
     EnhancedWebhookHandler,
+    WebhookDeliveryEngine,
+    get_webhook_delivery_engine,
     # Database handlers
     SimpleDatabaseHandler,
     EnhancedDatabaseHandler,
@@ -38,6 +42,8 @@ from .matchers.pattern_matcher import (
     ConditionMatcher,
     EventActionMatcher,
 )
+from .matchers.subscription_index import SubscriptionIndex
+from .matchers.condition_compiler import compile_condition
 
 # Retry System
 from .retry.retry_policy import (
@@ -47,16 +53,20 @@ from .retry.retry_policy import (
     ErrorClassifier,
     DEFAULT_RETRY_POLICIES,
 )
+from .retry.durable_retry_scheduler import DurableRetryScheduler
 
 __all__ = [
     # Executors
     "DefaultActionExecutor",
     "EnhancedActionExecutor",
+    "ExecutionScheduler",
+    "PriorityLimiter",
     
     # Repositories
     "AsyncPGActionRepository",
     "AsyncPGActionExecutionRepository", 
     "AsyncPGEventActionSubscriptionRepository",
+    "BufferedActionExecutionWriter",
     
     # Email handlers
     "SimpleEmailHandler",
@@ -66,6 +76,8 @@ __all__ = [
     # Webhook handlers
     "HTTPWebhookHandler", 
     "EnhancedWebhookHandler",
+    "WebhookDeliveryEngine",
+    "get_webhook_delivery_engine",
     
     # Database handlers
     "SimpleDatabaseHandler",
@@ -87,6 +99,8 @@ __all__ = [
     "RegexPatternMatcher",
     "ConditionMatcher",
     "EventActionMatcher",
+    "SubscriptionIndex",
+    "compile_condition",
     
     # Retry System
     "BackoffType",
@@ -94,4 +108,5 @@ __all__ = [
     "RetryScheduler",
     "ErrorClassifier",
     "DEFAULT_RETRY_POLICIES",
+    "DurableRetryScheduler",
 ]
\ No newline at end of file
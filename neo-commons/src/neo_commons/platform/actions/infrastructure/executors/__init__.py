@@ -2,8 +2,12 @@
 
 from .default_action_executor import DefaultActionExecutor
 from .enhanced_action_executor import EnhancedActionExecutor
+from .execution_scheduler import ExecutionScheduler, PriorityLimiter, DEFAULT_HANDLER_LIMITS
 
 __all__ = [
     "DefaultActionExecutor",
     "EnhancedActionExecutor",
+    "ExecutionScheduler",
+    "PriorityLimiter",
+    "DEFAULT_HANDLER_LIMITS",
 ]
\ No newline at end of file
@@ -10,6 +10,7 @@ from ...domain.entities.action import Action, ActionStatus
 from ...domain.entities.action_execution import ActionExecution
 from ...application.protocols.action_executor import ActionExecutorProtocol, ExecutionContext, ExecutionResult
 from ...application.handlers.action_handler import ActionHandler
+from .....infrastructure.tracing import get_tracer
 
 
 class ActionExecutionError(Exception):
@@ -71,10 +72,17 @@ class DefaultActionExecutor(ActionExecutorProtocol):
                 # Get execution timeout
                 timeout_seconds = await handler.get_execution_timeout(action.config)
                 
-                # Execute with timeout
-                execution_task = asyncio.create_task(
-                    handler.execute(action.config, input_data, context)
-                )
+                # Execute with timeout; the task inherits the span as its parent
+                tracer = get_tracer()
+                span = tracer.start_span("action.execute", attributes={
+                    "action.id": str(action.id),
+                    "action.type": action.action_type.value,
+                    "action.handler": action.handler_class,
+                })
+                with tracer.use_span(span):
+                    execution_task = asyncio.create_task(
+                        handler.execute(action.config, input_data, context)
+                    )
                 
                 # Store task for potential cancellation
                 execution_id = str(context.event.id)
@@ -103,6 +111,8 @@ class DefaultActionExecutor(ActionExecutorProtocol):
                     return result
                     
                 except asyncio.TimeoutError:
+                    span.record_exception(asyncio.TimeoutError(f"Timed out after {timeout_seconds} seconds"))
+                    
                     # Cancel the execution task
                     execution_task.cancel()
                     try:
@@ -119,9 +129,14 @@ class DefaultActionExecutor(ActionExecutorProtocol):
                         execution_time_ms=execution_time_ms
                     )
                 
+                except Exception as e:
+                    span.record_exception(e)
+                    raise
+                
                 finally:
                     # Clean up timeout task
                     self._timeout_tasks.pop(execution_id, None)
+                    span.end()
             
             finally:
                 # Always cleanup execution environment
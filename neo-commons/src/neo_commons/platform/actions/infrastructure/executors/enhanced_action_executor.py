@@ -1,8 +1,9 @@
 """Enhanced action executor with registry, retry, and error handling."""
 
+import logging
 import traceback
 import asyncio
-from typing import Dict, Any, Optional
+from typing import Awaitable, Callable, Dict, Any, Optional
 from datetime import datetime
 
 from ...application.protocols.action_executor import ActionExecutorProtocol, ExecutionContext, ExecutionResult
@@ -11,15 +12,53 @@ from ...domain.entities.action_execution import ActionExecution, ActionStatus
 from ...domain.value_objects.execution_id import ExecutionId
 from ..registries.handler_registry import get_handler_registry
 from ..retry.retry_policy import RetryPolicy, RetryScheduler, ErrorClassifier
+from .execution_scheduler import ExecutionScheduler
+from .....infrastructure.tracing import get_tracer
+
+logger = logging.getLogger(__name__)
+
+# Name under which retries are registered with durable schedulers
+RETRY_HANDLER_NAME = "enhanced_action_executor.retry"
 
 
 class EnhancedActionExecutor(ActionExecutorProtocol):
     """Enhanced action executor with full retry and error handling."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        retry_scheduler=None,
+        action_loader: Optional[Callable[[str, str], Awaitable[Optional[Action]]]] = None,
+        execution_scheduler: Optional[ExecutionScheduler] = None
+    ):
+        """
+        Initialize enhanced action executor.
+        
+        Args:
+            retry_scheduler: Scheduler for retries; defaults to the in-memory
+                ``RetryScheduler``. Pass a ``DurableRetryScheduler`` to keep
+                pending retries across restarts (requires ``action_loader``).
+            action_loader: Loads an action by ID and schema when a retry runs,
+                so retries use the current action configuration, e.g.
+                ``lambda action_id, schema: repository.get_by_id(ActionId(action_id), schema)``.
+                Without it, retries reuse the action they failed with.
+            execution_scheduler: Admission control giving each handler class
+                its own concurrency limit under a global in-flight cap
+        
+        Raises:
+            ValueError: If a durable retry scheduler is given without an action loader
+        """
+        durable = hasattr(retry_scheduler, "register_handler")
+        if durable and action_loader is None:
+            raise ValueError("A durable retry scheduler requires an action_loader")
+        
         self.handler_registry = get_handler_registry()
-        self.retry_scheduler = RetryScheduler()
+        self.retry_scheduler = retry_scheduler or RetryScheduler()
         self.error_classifier = ErrorClassifier()
+        self.action_loader = action_loader
+        self.execution_scheduler = execution_scheduler or ExecutionScheduler()
+        
+        if durable:
+            self.retry_scheduler.register_handler(RETRY_HANDLER_NAME, self.run_retry)
     
     async def execute(
         self, 
@@ -29,18 +68,20 @@ class EnhancedActionExecutor(ActionExecutorProtocol):
         """Execute an action with comprehensive error handling and retry logic."""
         execution_id = ExecutionId.generate()
         
-        # Create execution record
+        # Create execution record; retries carry their attempt number in the context
+        context_data = getattr(execution_context, "context_data", None) or {}
         execution = ActionExecution.create(
             execution_id=execution_id,
             action_id=action.id,
             event_id=execution_context.event_id,
             input_data=execution_context.input_data,
-            attempt_number=1
+            attempt_number=context_data.get("retry_attempt", 1)
         )
         
         try:
-            # Execute the action
-            result = await self._execute_with_timeout(action, execution_context, execution)
+            # Execute the action once its handler and the executor have capacity
+            async with self.execution_scheduler.slot(action):
+                result = await self._execute_with_timeout(action, execution_context, execution)
             
             # Mark as completed
             execution.complete(result.output_data if result else {})
@@ -104,22 +145,28 @@ class EnhancedActionExecutor(ActionExecutorProtocol):
             
             # Execute with timeout
             timeout_seconds = action.timeout_seconds
+            span_attributes = {
+                "action.id": str(action.id),
+                "action.handler": action.handler_class,
+                "action.execution_id": str(execution.id),
+            }
             
-            if timeout_seconds and timeout_seconds > 0:
-                result = await asyncio.wait_for(
-                    handler.execute(
+            with get_tracer().start_as_current_span("action.execute", attributes=span_attributes):
+                if timeout_seconds and timeout_seconds > 0:
+                    result = await asyncio.wait_for(
+                        handler.execute(
+                            config=action.config,
+                            input_data=execution_context.input_data,
+                            context=execution_context
+                        ),
+                        timeout=timeout_seconds
+                    )
+                else:
+                    result = await handler.execute(
                         config=action.config,
                         input_data=execution_context.input_data,
                         context=execution_context
-                    ),
-                    timeout=timeout_seconds
-                )
-            else:
-                result = await handler.execute(
-                    config=action.config,
-                    input_data=execution_context.input_data,
-                    context=execution_context
-                )
+                    )
             
             # Calculate execution time
             end_time = datetime.utcnow()
@@ -159,34 +206,62 @@ class EnhancedActionExecutor(ActionExecutorProtocol):
         """Schedule a retry for a failed execution."""
         error_type = self.error_classifier.classify_error(original_error)
         
-        # Create retry callback
-        async def retry_callback():
-            # Create new execution for retry
-            retry_execution_context = ExecutionContext(
-                event_id=execution_context.event_id,
-                input_data=execution_context.input_data,
-                context_data={
-                    **execution_context.context_data,
-                    "retry_attempt": failed_execution.attempt_number + 1,
-                    "parent_execution_id": str(failed_execution.id.value)
-                },
-                schema=execution_context.schema,
-                tenant_id=execution_context.tenant_id,
-                organization_id=execution_context.organization_id
-            )
-            
-            # Execute retry (this will create a new execution record)
-            await self.execute(action, retry_execution_context)
+        # Plain data, so durable schedulers can persist it
+        payload = {
+            "action_id": str(action.id.value),
+            "schema": execution_context.schema,
+            "event_id": execution_context.event_id,
+            "input_data": execution_context.input_data,
+            "context_data": {
+                **execution_context.context_data,
+                "retry_attempt": failed_execution.attempt_number + 1,
+                "parent_execution_id": str(failed_execution.id.value)
+            },
+            "tenant_id": execution_context.tenant_id,
+            "organization_id": execution_context.organization_id
+        }
+        
+        # Without a loader the pending retry holds the action itself (in-memory scheduler only)
+        retry_kwargs = {} if self.action_loader is not None else {"action": action}
         
         # Schedule the retry
         await self.retry_scheduler.schedule_retry(
             execution_id=str(failed_execution.id.value),
             retry_policy=retry_policy,
             attempt_number=failed_execution.attempt_number + 1,
-            retry_callback=retry_callback,
-            error_type=error_type
+            retry_callback=self.run_retry,
+            payload=payload,
+            error_type=error_type,
+            **retry_kwargs
         )
     
+    async def run_retry(self, payload: Dict[str, Any], action: Optional[Action] = None) -> None:
+        """Re-execute an action from a scheduled retry payload.
+        
+        The action is resolved through ``action_loader`` when one is set, so a
+        retry runs against the action's current configuration.
+        """
+        if self.action_loader is not None:
+            action = await self.action_loader(payload["action_id"], payload["schema"])
+        if action is None:
+            logger.warning(f"Skipping retry of unknown action {payload['action_id']}")
+            return
+        if not action.is_active:
+            logger.info(f"Skipping retry of inactive action {payload['action_id']}")
+            return
+        
+        retry_execution_context = ExecutionContext(
+            event_id=payload["event_id"],
+            input_data=payload["input_data"],
+            context_data=payload["context_data"],
+            schema=payload["schema"],
+            tenant_id=payload["tenant_id"],
+            organization_id=payload["organization_id"]
+        )
+        
+        # Execute retry (this will create a new execution record)
+        await self.execute(action, retry_execution_context)
+    
     def _get_retry_policy(self, action: Action) -> RetryPolicy:
         """Get retry policy for an action."""
         if action.retry_policy:
@@ -214,6 +289,7 @@ class EnhancedActionExecutor(ActionExecutorProtocol):
         """Get handler registry statistics."""
         return {
             **self.handler_registry.get_cache_stats(),
+            "execution_queues": self.execution_scheduler.get_metrics(),
             "scheduled_retries": self.retry_scheduler.get_scheduled_count(),
             "scheduled_executions": self.retry_scheduler.get_scheduled_executions()
         }
@@ -0,0 +1,169 @@
+"""Admission control for action executions.
+
+Every execution needs a slot in its handler's bulkhead and a slot in the
+global in-flight cap before its handler runs. Bulkheads isolate handler
+classes from each other: a slow SMTP server or webhook target can exhaust
+its own slots, but not the event loop or the database connections used by
+other handlers. Waiters are admitted by ``action.priority``, highest first,
+and in arrival order within a priority.
+"""
+
+import asyncio
+import heapq
+import itertools
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from ..matchers.pattern_matcher import action_priority_rank
+
+# Concurrent executions per handler class; other handlers get the default
+DEFAULT_HANDLER_LIMITS: Dict[str, int] = {
+    "TemplateEmailHandler": 10,
+    "SimpleEmailHandler": 10,
+    "SendGridEmailHandler": 20,
+    "EnhancedWebhookHandler": 50,
+    "HTTPWebhookHandler": 50,
+    "SimpleDatabaseHandler": 5,
+    "EnhancedDatabaseHandler": 5,
+    "TenantSchemaHandler": 2,
+    "TwilioSMSHandler": 10,
+    "AWSSNSSMSHandler": 10,
+}
+
+
+class PriorityLimiter:
+    """Counting semaphore that admits higher-priority waiters first."""
+
+    def __init__(self, limit: int):
+        """Initialize priority limiter.
+
+        Args:
+            limit: Maximum number of concurrent holders
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.limit = limit
+        self.active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._waiting = 0
+        self._waiting_by_priority: Dict[int, int] = {}
+
+        # Statistics
+        self.admitted = 0
+        self.queued = 0
+        self.max_waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    async def acquire(self, priority: int = 0) -> None:
+        """Wait for a slot; higher ``priority`` values are admitted first."""
+        # Cancelled waiters stay in the heap until popped, so count live ones
+        if self.active < self.limit and not self._waiting:
+            self.active += 1
+            self.admitted += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._sequence), future))
+        self._waiting += 1
+        self._waiting_by_priority[priority] = self._waiting_by_priority.get(priority, 0) + 1
+        self.queued += 1
+        self.max_waiting = max(self.max_waiting, self._waiting)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before cancellation; pass it on
+                self.release()
+            raise
+        finally:
+            self._waiting -= 1
+            self._waiting_by_priority[priority] -= 1
+        self.admitted += 1
+
+    def release(self) -> None:
+        """Free a slot and hand it to the highest-priority waiter."""
+        self.active -= 1
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self.active += 1
+                future.set_result(None)
+                return
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "waiting": self.waiting,
+            "waiting_by_priority": {p: n for p, n in self._waiting_by_priority.items() if n},
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "max_waiting": self.max_waiting,
+        }
+
+
+class ExecutionScheduler:
+    """Per-handler bulkheads and a global in-flight cap with priority lanes."""
+
+    def __init__(
+        self,
+        max_in_flight: int = 200,
+        handler_limits: Optional[Dict[str, int]] = None,
+        default_handler_limit: int = 20,
+    ):
+        """Initialize execution scheduler.
+
+        Args:
+            max_in_flight: Maximum executions running at once across handlers
+            handler_limits: Concurrent executions per handler, keyed by the
+                handler class name or full ``handler_class`` path; merged
+                over ``DEFAULT_HANDLER_LIMITS``
+            default_handler_limit: Limit for handlers without an entry
+        """
+        self.handler_limits = {**DEFAULT_HANDLER_LIMITS, **(handler_limits or {})}
+        self.default_handler_limit = default_handler_limit
+        self._global = PriorityLimiter(max_in_flight)
+        self._bulkheads: Dict[str, PriorityLimiter] = {}
+
+    def bulkhead_for(self, handler_class: str) -> PriorityLimiter:
+        """Bulkhead of a handler class path, created on first use."""
+        bulkhead = self._bulkheads.get(handler_class)
+        if bulkhead is None:
+            class_name = handler_class.rsplit(".", 1)[-1]
+            limit = self.handler_limits.get(
+                handler_class, self.handler_limits.get(class_name, self.default_handler_limit)
+            )
+            bulkhead = self._bulkheads[handler_class] = PriorityLimiter(limit)
+        return bulkhead
+
+    @asynccontextmanager
+    async def slot(self, action) -> AsyncIterator[None]:
+        """Hold a bulkhead and a global slot for the duration of an execution.
+
+        The bulkhead is acquired first, so executions queued behind a
+        saturated handler never hold global capacity.
+        """
+        priority = action_priority_rank(action)
+        bulkhead = self.bulkhead_for(action.handler_class)
+
+        await bulkhead.acquire(priority)
+        try:
+            await self._global.acquire(priority)
+            try:
+                yield
+            finally:
+                self._global.release()
+        finally:
+            bulkhead.release()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth and utilization per bulkhead and globally."""
+        return {
+            "in_flight": self._global.get_stats(),
+            "handlers": {name: bulkhead.get_stats() for name, bulkhead in self._bulkheads.items()},
+            "queue_depth": self._global.waiting + sum(b.waiting for b in self._bulkheads.values()),
+        }
@@ -8,6 +8,7 @@ from .email.template_email_handler import TemplateEmailHandler
 # Webhook handlers  
 from .webhook.http_webhook_handler import HTTPWebhookHandler
 from .webhook.enhanced_webhook_handler import EnhancedWebhookHandler
+from .webhook.webhook_delivery_engine import WebhookDeliveryEngine, get_webhook_delivery_engine
 
 # Database handlers
 from .database.simple_database_handler import SimpleDatabaseHandler
@@ -27,6 +28,8 @@ __all__ = [
     # Webhook handlers
     "HTTPWebhookHandler",
     "EnhancedWebhookHandler",
+    "WebhookDeliveryEngine",
+    "get_webhook_delivery_engine",
     
     # Database handlers
     "SimpleDatabaseHandler",
@@ -2,8 +2,12 @@
 
 from .http_webhook_handler import HTTPWebhookHandler
 from .enhanced_webhook_handler import EnhancedWebhookHandler
+from .webhook_delivery_engine import WebhookDeliveryEngine, WebhookDeliveryError, get_webhook_delivery_engine
 
 __all__ = [
     "HTTPWebhookHandler",
     "EnhancedWebhookHandler",
+    "WebhookDeliveryEngine",
+    "WebhookDeliveryError",
+    "get_webhook_delivery_engine",
 ]
\ No newline at end of file
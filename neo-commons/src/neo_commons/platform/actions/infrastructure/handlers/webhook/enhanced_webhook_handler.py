@@ -2,17 +2,19 @@
 
 import asyncio
 import json
-import hashlib
-import hmac
-import base64
-import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from enum import Enum
-import httpx
 
 from ....application.handlers.action_handler import ActionHandler
 from ....application.protocols.action_executor import ExecutionContext, ExecutionResult
+from .webhook_delivery_engine import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    WebhookDeliveryEngine,
+    get_webhook_delivery_engine,
+)
 
 
 class AuthType(Enum):
@@ -25,71 +27,6 @@ class AuthType(Enum):
     JWT = "jwt"
 
 
-class CircuitState(Enum):
-    """Circuit breaker states."""
-    CLOSED = "closed"
-    OPEN = "open"  
-    HALF_OPEN = "half_open"
-
-
-class CircuitBreaker:
-    """Circuit breaker implementation for webhook resilience."""
-    
-    def __init__(
-        self,
-        failure_threshold: int = 5,
-        recovery_timeout: int = 60,
-        expected_exception: type = Exception
-    ):
-        self.failure_threshold = failure_threshold
-        self.recovery_timeout = recovery_timeout
-        self.expected_exception = expected_exception
-        
-        self.failure_count = 0
-        self.last_failure_time = None
-        self.state = CircuitState.CLOSED
-    
-    def call(self, func):
-        """Decorator for circuit breaker."""
-        async def wrapper(*args, **kwargs):
-            if self.state == CircuitState.OPEN:
-                if self._should_attempt_reset():
-                    self.state = CircuitState.HALF_OPEN
-                else:
-                    raise Exception(f"Circuit breaker is OPEN. Last failure: {self.last_failure_time}")
-            
-            try:
-                result = await func(*args, **kwargs)
-                self._on_success()
-                return result
-                
-            except self.expected_exception as e:
-                self._on_failure()
-                raise
-        
-        return wrapper
-    
-    def _should_attempt_reset(self) -> bool:
-        """Check if circuit breaker should attempt to reset."""
-        return (
-            self.last_failure_time and
-            time.time() - self.last_failure_time >= self.recovery_timeout
-        )
-    
-    def _on_success(self):
-        """Handle successful call."""
-        self.failure_count = 0
-        self.state = CircuitState.CLOSED
-    
-    def _on_failure(self):
-        """Handle failed call."""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-        
-        if self.failure_count >= self.failure_threshold:
-            self.state = CircuitState.OPEN
-
-
 class EnhancedWebhookHandler(ActionHandler):
     """
     Enhanced webhook handler with circuit breaker, advanced auth, and resilience features.
@@ -103,14 +40,20 @@ class EnhancedWebhookHandler(ActionHandler):
     - timeout_seconds: Request timeout (default: 30)
     - verify_ssl: Whether to verify SSL certificates (default: True)
     - circuit_breaker: Circuit breaker configuration
+    - concurrency: Adaptive concurrency bounds (initial, min, max)
+    - batch: Deliver several events per request (enabled, max_size, max_wait_ms)
     - retry_config: Retry configuration with exponential backoff
     - payload_compression: Enable gzip compression (default: False)
     - include_metadata: Include event metadata in payload (default: True)
+    
+    Requests go through the shared ``WebhookDeliveryEngine``, so connections,
+    circuit breakers and concurrency limits are kept per endpoint across
+    executions rather than per handler instance.
     """
     
-    def __init__(self):
+    def __init__(self, delivery_engine: Optional[WebhookDeliveryEngine] = None):
         super().__init__()
-        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.delivery_engine = delivery_engine or get_webhook_delivery_engine()
     
     @property
     def handler_name(self) -> str:
@@ -125,15 +68,8 @@ class EnhancedWebhookHandler(ActionHandler):
         return ["webhook", "enhanced_webhook", "webhook_secure"]
     
     def _get_circuit_breaker(self, webhook_url: str, config: Dict[str, Any]) -> CircuitBreaker:
-        """Get or create circuit breaker for webhook URL."""
-        if webhook_url not in self._circuit_breakers:
-            cb_config = config.get("circuit_breaker", {})
-            self._circuit_breakers[webhook_url] = CircuitBreaker(
-                failure_threshold=cb_config.get("failure_threshold", 5),
-                recovery_timeout=cb_config.get("recovery_timeout", 60),
-                expected_exception=Exception
-            )
-        return self._circuit_breakers[webhook_url]
+        """Get the shared circuit breaker of a webhook URL."""
+        return self.delivery_engine.endpoint(webhook_url, config).circuit
     
     async def validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate enhanced webhook handler configuration."""
@@ -196,22 +132,19 @@ class EnhancedWebhookHandler(ActionHandler):
         jitter = retry_config.get("jitter", True)
         
         last_exception = None
+        attempts = 0
         
         for attempt in range(max_retries + 1):
+            attempts = attempt + 1
             try:
-                # Use circuit breaker
-                @circuit_breaker.call
-                async def make_request():
-                    return await self._make_webhook_request(config, input_data, context)
-                
-                result = await make_request()
-                return result
+                # The delivery engine applies the endpoint's circuit breaker
+                return await self._make_webhook_request(config, input_data, context)
                 
             except Exception as e:
                 last_exception = e
                 
-                # Don't retry on the last attempt
-                if attempt == max_retries:
+                # Don't retry on the last attempt or while the circuit is open
+                if attempt == max_retries or isinstance(e, CircuitOpenError):
                     break
                 
                 # Calculate delay for exponential backoff
@@ -226,10 +159,10 @@ class EnhancedWebhookHandler(ActionHandler):
         return ExecutionResult(
             success=False,
             output_data={},
-            error_message=f"Webhook request failed after {max_retries + 1} attempts: {str(last_exception)}",
+            error_message=f"Webhook request failed after {attempts} attempts: {str(last_exception)}",
             error_details={
                 "webhook_url": webhook_url,
-                "attempts": max_retries + 1,
+                "attempts": attempts,
                 "circuit_breaker_state": circuit_breaker.state.value,
                 "last_error": str(last_exception),
                 "error_type": type(last_exception).__name__ if last_exception else "Unknown"
@@ -243,95 +176,55 @@ class EnhancedWebhookHandler(ActionHandler):
         context: ExecutionContext
     ) -> ExecutionResult:
         """Make the actual webhook request."""
-        try:
-            # Extract configuration
-            webhook_url = config["webhook_url"]
-            method = config.get("method", "POST").upper()
-            auth_type = config.get("auth_type", "none")
-            auth_config = config.get("auth_config", {})
-            custom_headers = config.get("headers", {})
-            timeout_seconds = config.get("timeout_seconds", 30)
-            verify_ssl = config.get("verify_ssl", True)
-            payload_compression = config.get("payload_compression", False)
-            include_metadata = config.get("include_metadata", True)
-            
-            # Prepare payload
-            if include_metadata:
-                payload_data = {
-                    "event_id": str(context.event.id.value) if hasattr(context, 'event') else None,
-                    "event_type": context.event.event_type.value if hasattr(context, 'event') else None,
-                    "schema": context.schema if hasattr(context, 'schema') else None,
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                    "data": input_data,
-                    "metadata": {
-                        "handler": self.handler_name,
-                        "version": self.handler_version,
-                        "tenant_id": getattr(context, 'tenant_id', None),
-                        "organization_id": getattr(context, 'organization_id', None),
-                        "user_id": getattr(context, 'user_id', None)
-                    }
+        webhook_url = config["webhook_url"]
+        method = config.get("method", "POST").upper()
+        payload_compression = config.get("payload_compression", False)
+        include_metadata = config.get("include_metadata", True)
+        
+        # Prepare payload
+        if include_metadata:
+            payload_data = {
+                "event_id": str(context.event.id.value) if hasattr(context, 'event') else None,
+                "event_type": context.event.event_type.value if hasattr(context, 'event') else None,
+                "schema": context.schema if hasattr(context, 'schema') else None,
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "data": input_data,
+                "metadata": {
+                    "handler": self.handler_name,
+                    "version": self.handler_version,
+                    "tenant_id": getattr(context, 'tenant_id', None),
+                    "organization_id": getattr(context, 'organization_id', None),
+                    "user_id": getattr(context, 'user_id', None)
                 }
-            else:
-                payload_data = input_data
-            
-            # Serialize payload
-            payload_json = json.dumps(payload_data, separators=(',', ':'), default=str)
-            
-            # Prepare headers
-            headers = {
-                "Content-Type": "application/json",
-                "User-Agent": f"neo-commons-actions/{self.handler_version}",
-                **custom_headers
             }
-            
-            # Add compression if enabled
-            content = payload_json.encode('utf-8')
-            if payload_compression:
-                import gzip
-                content = gzip.compress(content)
-                headers["Content-Encoding"] = "gzip"
-            
-            # Add authentication
-            await self._add_authentication(headers, content, auth_type, auth_config, method, webhook_url)
-            
-            # Send webhook request
-            async with httpx.AsyncClient(verify=verify_ssl, timeout=timeout_seconds) as client:
-                response = await client.request(
-                    method=method,
-                    url=webhook_url,
-                    content=content,
-                    headers=headers
-                )
-                
-                # Check response status
-                response.raise_for_status()
-                
-                # Parse response
-                try:
-                    response_data = response.json()
-                except (json.JSONDecodeError, ValueError):
-                    response_data = {"raw_response": response.text[:1000]}  # Limit response size
-                
-                return ExecutionResult(
-                    success=True,
-                    output_data={
-                        "webhook_url": webhook_url,
-                        "method": method,
-                        "status_code": response.status_code,
-                        "response_headers": dict(response.headers),
-                        "response_data": response_data,
-                        "payload_size": len(content),
-                        "compressed": payload_compression,
-                        "response_time_ms": int(response.elapsed.total_seconds() * 1000)
-                    }
-                )
+        else:
+            payload_data = input_data
         
-        except httpx.TimeoutException as e:
-            raise Exception(f"Request timeout after {timeout_seconds}s")
-        except httpx.HTTPStatusError as e:
-            raise Exception(f"HTTP {e.response.status_code}: {e.response.text[:500]}")
-        except Exception as e:
-            raise Exception(f"Request failed: {str(e)}")
+        # Send through the shared engine (pooled client, per-endpoint circuit and batching)
+        response = await self.delivery_engine.deliver(
+            config, payload_data, user_agent=f"neo-commons-actions/{self.handler_version}"
+        )
+        
+        # Parse response
+        try:
+            response_data = response.json()
+        except (json.JSONDecodeError, ValueError):
+            response_data = {"raw_response": response.text[:1000]}  # Limit response size
+        
+        return ExecutionResult(
+            success=True,
+            output_data={
+                "webhook_url": webhook_url,
+                "method": method,
+                "status_code": response.status_code,
+                "response_headers": response.headers,
+                "response_data": response_data,
+                "payload_size": response.payload_size,
+                "batch_size": response.batch_size,
+                "compressed": payload_compression,
+                "response_time_ms": int(response.elapsed_ms)
+            }
+        )
     
     async def _add_authentication(
         self,
@@ -343,46 +236,7 @@ class EnhancedWebhookHandler(ActionHandler):
         url: str
     ):
         """Add authentication to request headers."""
-        if auth_type == "basic":
-            username = auth_config["username"]
-            password = auth_config["password"]
-            credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
-            headers["Authorization"] = f"Basic {credentials}"
-        
-        elif auth_type == "bearer":
-            token = auth_config["token"]
-            headers["Authorization"] = f"Bearer {token}"
-        
-        elif auth_type == "api_key":
-            key = auth_config["key"]
-            value = auth_config["value"]
-            headers[key] = value
-        
-        elif auth_type == "hmac":
-            secret = auth_config["secret"]
-            algorithm = auth_config.get("algorithm", "sha256")
-            header_name = auth_config.get("header_name", "X-HMAC-Signature")
-            
-            # Create HMAC signature
-            if algorithm == "sha256":
-                hash_func = hashlib.sha256
-            elif algorithm == "sha512":
-                hash_func = hashlib.sha512
-            else:
-                hash_func = hashlib.sha256  # Default fallback
-            
-            signature = hmac.new(
-                secret.encode('utf-8'),
-                content,
-                hash_func
-            ).hexdigest()
-            
-            headers[header_name] = f"{algorithm}={signature}"
-        
-        elif auth_type == "jwt":
-            # For JWT, we expect a pre-signed token
-            token = auth_config["token"]
-            headers["Authorization"] = f"Bearer {token}"
+        self.delivery_engine.apply_authentication(headers, content, auth_type, auth_config)
     
     async def get_execution_timeout(self, config: Dict[str, Any]) -> int:
         """Get execution timeout including retry delays."""
@@ -414,27 +268,23 @@ class EnhancedWebhookHandler(ActionHandler):
             
             verify_ssl = config.get("verify_ssl", True)
             
-            # Test basic connectivity
-            async with httpx.AsyncClient(verify=verify_ssl, timeout=10) as client:
-                try:
-                    response = await client.head(webhook_url)
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 405:  # Method not allowed
-                        response = await client.get(webhook_url)
-                    else:
-                        response = e.response
-                
-                return {
-                    "healthy": response.status_code < 500,
-                    "status": f"Endpoint reachable (HTTP {response.status_code})",
-                    "details": {
-                        "webhook_url": webhook_url,
-                        "status_code": response.status_code,
-                        "circuit_state": circuit_breaker.state.value,
-                        "failure_count": circuit_breaker.failure_count,
-                        "response_time_ms": int(response.elapsed.total_seconds() * 1000)
-                    }
+            # Test basic connectivity over the shared pooled client
+            client = self.delivery_engine.client(verify_ssl)
+            response = await client.head(webhook_url, timeout=10)
+            if response.status_code == 405:  # Method not allowed
+                response = await client.get(webhook_url, timeout=10)
+            
+            return {
+                "healthy": response.status_code < 500,
+                "status": f"Endpoint reachable (HTTP {response.status_code})",
+                "details": {
+                    "webhook_url": webhook_url,
+                    "status_code": response.status_code,
+                    "circuit_state": circuit_breaker.state.value,
+                    "failure_count": circuit_breaker.failure_count,
+                    "response_time_ms": int(response.elapsed.total_seconds() * 1000)
                 }
+            }
                 
         except Exception as e:
             return {
@@ -516,6 +366,24 @@ class EnhancedWebhookHandler(ActionHandler):
                         "recovery_timeout": {"type": "integer", "default": 60}
                     }
                 },
+                "concurrency": {
+                    "type": "object",
+                    "description": "Adaptive limit of concurrent requests to the endpoint",
+                    "properties": {
+                        "initial": {"type": "integer", "default": 10},
+                        "min": {"type": "integer", "default": 1},
+                        "max": {"type": "integer", "default": 100}
+                    }
+                },
+                "batch": {
+                    "type": "object",
+                    "description": "Deliver several events per request as {batch, count, events}",
+                    "properties": {
+                        "enabled": {"type": "boolean", "default": True},
+                        "max_size": {"type": "integer", "default": 50},
+                        "max_wait_ms": {"type": "integer", "default": 50}
+                    }
+                },
                 "retry_config": {
                     "type": "object",
                     "properties": {
@@ -549,6 +417,7 @@ class EnhancedWebhookHandler(ActionHandler):
                 "response_headers": {"type": "object"},
                 "response_data": {"type": "object"},
                 "payload_size": {"type": "integer"},
+                "batch_size": {"type": "integer"},
                 "compressed": {"type": "boolean"},
                 "response_time_ms": {"type": "integer"}
             },
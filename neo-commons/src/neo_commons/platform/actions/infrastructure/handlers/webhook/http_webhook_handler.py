@@ -9,6 +9,7 @@ import httpx
 
 from ....application.handlers.action_handler import ActionHandler
 from ....application.protocols.action_executor import ExecutionContext, ExecutionResult
+from .webhook_delivery_engine import get_webhook_delivery_engine
 
 
 class HTTPWebhookHandler(ActionHandler):
@@ -101,7 +102,7 @@ class HTTPWebhookHandler(ActionHandler):
             # Prepare headers
             headers = {
                 "Content-Type": "application/json",
-                "User-Agent": "neo-commons-actions/1.0.0",
+                "User-Agent": f"neo-commons-actions/{self.handler_version}",
                 **custom_headers
             }
             
@@ -115,34 +116,35 @@ class HTTPWebhookHandler(ActionHandler):
                 headers[signature_header] = f"sha256={signature}"
             
             # Send webhook request
-            async with httpx.AsyncClient(verify=verify_ssl, timeout=timeout_seconds) as client:
-                response = await client.request(
-                    method=method,
-                    url=webhook_url,
-                    content=payload_json,
-                    headers=headers
-                )
-                
-                # Check response status
-                response.raise_for_status()
-                
-                # Try to parse response JSON
-                try:
-                    response_data = response.json()
-                except (json.JSONDecodeError, ValueError):
-                    response_data = {"raw_response": response.text}
-                
-                return ExecutionResult(
-                    success=True,
-                    output_data={
-                        "webhook_url": webhook_url,
-                        "method": method,
-                        "status_code": response.status_code,
-                        "response_headers": dict(response.headers),
-                        "response_data": response_data,
-                        "payload_size": len(payload_json)
-                    }
-                )
+            client = get_webhook_delivery_engine().client(verify_ssl)
+            response = await client.request(
+                method=method,
+                url=webhook_url,
+                content=payload_json,
+                headers=headers,
+                timeout=timeout_seconds
+            )
+            
+            # Check response status
+            response.raise_for_status()
+            
+            # Try to parse response JSON
+            try:
+                response_data = response.json()
+            except (json.JSONDecodeError, ValueError):
+                response_data = {"raw_response": response.text}
+            
+            return ExecutionResult(
+                success=True,
+                output_data={
+                    "webhook_url": webhook_url,
+                    "method": method,
+                    "status_code": response.status_code,
+                    "response_headers": dict(response.headers),
+                    "response_data": response_data,
+                    "payload_size": len(payload_json)
+                }
+            )
         
         except httpx.TimeoutException:
             return ExecutionResult(
@@ -0,0 +1,610 @@
+"""Shared webhook delivery engine.
+
+Handler instances are created per execution, so anything stored on them
+(HTTP clients, circuit breakers) is rebuilt for every webhook. The engine
+is process-wide instead:
+
+- One pooled ``httpx.AsyncClient`` per event loop and ``verify_ssl``
+  setting keeps connections to each host alive across deliveries. Clients
+  are bound to the loop they run on; a forked child starts without any.
+- Each endpoint URL has its own circuit breaker and an AIMD concurrency
+  limit: the limit grows by one per window of successful deliveries and
+  halves on timeouts, 429 and 5xx responses, so a struggling endpoint gets
+  fewer concurrent requests instead of a growing pile of timeouts.
+- HMAC keys are prepared once per secret, static auth headers are built
+  once per credential, and signatures of a payload are reused by retries.
+- Endpoints configured with ``batch`` receive several events per request as
+  ``{"batch": true, "count": n, "events": [...]}``.
+
+Usage::
+
+    engine = get_webhook_delivery_engine()
+    response = await engine.deliver(config, payload)
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import hmac
+import json
+import logging
+import os
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Responses that mean the endpoint is overloaded or down, not that the request was bad
+_RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class WebhookDeliveryError(Exception):
+    """A webhook delivery failed."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, response_text: str = ""):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response_text = response_text
+
+
+class CircuitOpenError(WebhookDeliveryError):
+    """The endpoint's circuit breaker rejected the delivery."""
+
+
+class CircuitBreaker:
+    """Circuit breaker implementation for webhook resilience."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: int = 60,
+        expected_exception: type = Exception
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.expected_exception = expected_exception
+
+        self.failure_count = 0
+        self.last_failure_time = None
+        self.state = CircuitState.CLOSED
+        self._probing = False
+
+    def call(self, func):
+        """Decorator for circuit breaker."""
+        async def wrapper(*args, **kwargs):
+            self.before_call()
+            try:
+                result = await func(*args, **kwargs)
+                self.record_success()
+                return result
+
+            except self.expected_exception:
+                self.record_failure()
+                raise
+
+        return wrapper
+
+    def before_call(self) -> None:
+        """Raise ``CircuitOpenError`` unless a call may go through now.
+
+        While half-open only a single probe call is let through.
+        """
+        if self.state == CircuitState.OPEN:
+            if not self._should_attempt_reset():
+                raise CircuitOpenError(f"Circuit breaker is OPEN. Last failure: {self.last_failure_time}")
+            self.state = CircuitState.HALF_OPEN
+            self._probing = False
+        if self.state == CircuitState.HALF_OPEN:
+            if self._probing:
+                raise CircuitOpenError("Circuit breaker is HALF_OPEN and a probe is in flight")
+            self._probing = True
+
+    def cancel_call(self) -> None:
+        """Forget a call admitted by ``before_call`` that never completed."""
+        self._probing = False
+
+    def _should_attempt_reset(self) -> bool:
+        """Check if circuit breaker should attempt to reset."""
+        return (
+            self.last_failure_time and
+            time.time() - self.last_failure_time >= self.recovery_timeout
+        )
+
+    def record_success(self):
+        """Handle successful call."""
+        self.failure_count = 0
+        self.state = CircuitState.CLOSED
+        self._probing = False
+
+    def record_failure(self):
+        """Handle failed call."""
+        self.failure_count += 1
+        self.last_failure_time = time.time()
+        self._probing = False
+
+        if self.state == CircuitState.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            self.state = CircuitState.OPEN
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on concurrent requests to one endpoint."""
+
+    def __init__(self, initial_limit: int = 10, min_limit: int = 1, max_limit: int = 100):
+        """Initialize limiter.
+
+        Args:
+            initial_limit: Concurrent requests allowed at start
+            min_limit: Lowest limit after repeated failures
+            max_limit: Highest limit after repeated successes
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> None:
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.in_flight -= 1
+                self._wake()
+            raise
+
+    def release(self, congested: bool) -> None:
+        """Free a slot and adjust the limit.
+
+        Args:
+            congested: Whether the request timed out or was rejected by an
+                overloaded endpoint
+        """
+        self.in_flight -= 1
+        if congested:
+            self.limit = max(float(self.min_limit), self.limit / 2)
+        else:
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            future = self._waiters.popleft()
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+
+class PayloadSigner:
+    """HMAC signing with prepared keys and reuse of recent signatures."""
+
+    _ALGORITHMS = {"sha256": hashlib.sha256, "sha512": hashlib.sha512}
+
+    def __init__(self, cache_size: int = 1024, max_cached_payload: int = 65536):
+        self.cache_size = cache_size
+        self.max_cached_payload = max_cached_payload
+        self._keys: Dict[Tuple[str, str], Any] = {}
+        self._signatures: "OrderedDict[Tuple[str, str, bytes], str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def sign(self, secret: str, algorithm: str, content: bytes) -> str:
+        """Hex HMAC of ``content``; unknown algorithms fall back to sha256."""
+        if algorithm not in self._ALGORITHMS:
+            algorithm = "sha256"
+
+        cacheable = len(content) <= self.max_cached_payload
+        if cacheable:
+            # Hashing the payload is much cheaper than the MAC, so retries and
+            # fan-out of an identical payload skip signing
+            key = (secret, algorithm, content)
+            signature = self._signatures.get(key)
+            if signature is not None:
+                self._signatures.move_to_end(key)
+                self.hits += 1
+                return signature
+
+        prepared = self._keys.get((secret, algorithm))
+        if prepared is None:
+            prepared = self._keys[(secret, algorithm)] = hmac.new(
+                secret.encode('utf-8'), digestmod=self._ALGORITHMS[algorithm]
+            )
+        mac = prepared.copy()
+        mac.update(content)
+        signature = mac.hexdigest()
+        self.misses += 1
+
+        if cacheable:
+            self._signatures[key] = signature
+            if len(self._signatures) > self.cache_size:
+                self._signatures.popitem(last=False)
+        return signature
+
+
+@dataclass
+class WebhookResponse:
+    """Outcome of a delivered webhook request."""
+
+    status_code: int
+    headers: Dict[str, str]
+    text: str
+    elapsed_ms: float
+    payload_size: int
+    batch_size: int = 1
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+@dataclass
+class _PendingBatch:
+    config: Dict[str, Any]
+    user_agent: Optional[str] = None
+    payloads: List[Any] = field(default_factory=list)
+    futures: List[asyncio.Future] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class EndpointState:
+    """Circuit breaker, concurrency limit, batch and statistics of one endpoint."""
+
+    def __init__(self, url: str, config: Dict[str, Any], default_concurrency: int, max_concurrency: int):
+        cb_config = config.get("circuit_breaker", {})
+        concurrency = config.get("concurrency", {})
+        self.url = url
+        self.circuit = CircuitBreaker(
+            failure_threshold=cb_config.get("failure_threshold", 5),
+            recovery_timeout=cb_config.get("recovery_timeout", 60),
+        )
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=concurrency.get("initial", default_concurrency),
+            min_limit=concurrency.get("min", 1),
+            max_limit=concurrency.get("max", max_concurrency),
+        )
+        self.batch: Optional[_PendingBatch] = None
+        self.latencies_ms: Deque[float] = deque(maxlen=1024)
+        self.delivered = 0
+        self.failed = 0
+        self.requests = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies_ms)
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))], 2)
+
+        return {
+            "circuit_state": self.circuit.state.value,
+            "failure_count": self.circuit.failure_count,
+            "concurrency_limit": int(self.limiter.limit),
+            "in_flight": self.limiter.in_flight,
+            "waiting": self.limiter.waiting,
+            "requests": self.requests,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "latency_p50_ms": percentile(0.50),
+            "latency_p99_ms": percentile(0.99),
+        }
+
+
+class WebhookDeliveryEngine:
+    """Process-wide webhook sender with per-endpoint resilience state."""
+
+    def __init__(
+        self,
+        max_connections: int = 200,
+        max_keepalive_connections: int = 100,
+        keepalive_expiry: float = 30.0,
+        default_concurrency: int = 10,
+        max_concurrency: int = 100,
+    ):
+        """Initialize delivery engine.
+
+        Args:
+            max_connections: Connection pool size across all hosts
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            default_concurrency: Initial concurrent requests per endpoint
+            max_concurrency: Upper bound of the adaptive per-endpoint limit
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.default_concurrency = default_concurrency
+        self.max_concurrency = max_concurrency
+        self.signer = PayloadSigner()
+
+        self._clients: Dict[asyncio.AbstractEventLoop, Dict[bool, httpx.AsyncClient]] = {}
+        self._pid = os.getpid()
+        self._batch_tasks: Set[asyncio.Task] = set()
+        self._endpoints: Dict[str, EndpointState] = {}
+        self._auth_headers: Dict[Tuple[str, ...], Dict[str, str]] = {}
+
+    def client(self, verify_ssl: bool = True) -> httpx.AsyncClient:
+        """Pooled client of the running event loop for the given TLS verification setting."""
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+
+        loop = asyncio.get_running_loop()
+        clients = self._clients.get(loop)
+        if clients is None:
+            # Clients of closed loops can neither be used nor closed any more
+            for closed in [other for other in self._clients if other.is_closed()]:
+                del self._clients[closed]
+            clients = self._clients[loop] = {}
+
+        client = clients.get(verify_ssl)
+        if client is None or client.is_closed:
+            client = clients[verify_ssl] = httpx.AsyncClient(verify=verify_ssl, limits=self.limits)
+        return client
+
+    def _reset_after_fork(self) -> None:
+        """Drop clients and batches copied from the parent process."""
+        self._pid = os.getpid()
+        self._clients = {}
+        self._batch_tasks = set()
+        for state in self._endpoints.values():
+            state.batch = None
+
+    def endpoint(self, url: str, config: Optional[Dict[str, Any]] = None) -> EndpointState:
+        """State of an endpoint, created from ``config`` on first use."""
+        state = self._endpoints.get(url)
+        if state is None:
+            state = self._endpoints[url] = EndpointState(
+                url, config or {}, self.default_concurrency, self.max_concurrency
+            )
+        return state
+
+    async def deliver(
+        self,
+        config: Dict[str, Any],
+        payload: Any,
+        user_agent: Optional[str] = None
+    ) -> WebhookResponse:
+        """Deliver a payload to the endpoint described by a webhook config.
+
+        Args:
+            config: Webhook handler configuration (``webhook_url``, ``method``,
+                ``headers``, ``auth_type``, ``auth_config``, ``timeout_seconds``,
+                ``verify_ssl``, ``payload_compression``, ``circuit_breaker``,
+                ``concurrency`` and ``batch``)
+            payload: JSON-serializable payload
+            user_agent: ``User-Agent`` header, e.g. with the sending handler's version
+
+        Returns:
+            Response of the request that carried the payload
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open
+            WebhookDeliveryError: On timeouts, transport errors and non-2xx responses
+        """
+        state = self.endpoint(config["webhook_url"], config)
+        batch_config = config.get("batch")
+        if batch_config and batch_config.get("enabled", True):
+            return await self._enqueue(state, config, batch_config, payload, user_agent)
+
+        content = json.dumps(payload, separators=(',', ':'), default=str).encode('utf-8')
+        return await self._send(state, config, content, 1, user_agent)
+
+    async def _enqueue(
+        self,
+        state: EndpointState,
+        config: Dict[str, Any],
+        batch_config: Dict[str, Any],
+        payload: Any,
+        user_agent: Optional[str]
+    ) -> WebhookResponse:
+        """Add a payload to the endpoint's pending batch and wait for its request."""
+        max_size = batch_config.get("max_size", 50)
+        max_wait = batch_config.get("max_wait_ms", 50) / 1000
+
+        batch = state.batch
+        if batch is None:
+            batch = state.batch = _PendingBatch(config, user_agent)
+            batch.timer = asyncio.get_running_loop().call_later(max_wait, self._flush_batch, state)
+
+        future = asyncio.get_running_loop().create_future()
+        batch.payloads.append(payload)
+        batch.futures.append(future)
+        if len(batch.payloads) >= max_size:
+            self._flush_batch(state)
+        return await future
+
+    def _flush_batch(self, state: EndpointState) -> None:
+        batch, state.batch = state.batch, None
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.create_task(self._send_batch(state, batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _send_batch(self, state: EndpointState, batch: _PendingBatch) -> None:
+        try:
+            content = json.dumps(
+                {"batch": True, "count": len(batch.payloads), "events": batch.payloads},
+                separators=(',', ':'),
+                default=str,
+            ).encode('utf-8')
+            response = await self._send(
+                state, batch.config, content, len(batch.payloads), batch.user_agent
+            )
+        except BaseException as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+        else:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_result(response)
+
+    async def _send(
+        self,
+        state: EndpointState,
+        config: Dict[str, Any],
+        content: bytes,
+        batch_size: int,
+        user_agent: Optional[str] = None
+    ) -> WebhookResponse:
+        url = config["webhook_url"]
+        method = config.get("method", "POST").upper()
+        timeout_seconds = config.get("timeout_seconds", 30)
+
+        headers = {"Content-Type": "application/json"}
+        if user_agent:
+            headers["User-Agent"] = user_agent
+        headers.update(config.get("headers", {}))
+        if config.get("payload_compression", False):
+            content = gzip.compress(content)
+            headers["Content-Encoding"] = "gzip"
+        self.apply_authentication(
+            headers, content, config.get("auth_type", "none"), config.get("auth_config", {})
+        )
+
+        state.circuit.before_call()
+        try:
+            await state.limiter.acquire()
+        except BaseException:
+            state.circuit.cancel_call()
+            raise
+        state.requests += 1
+        congested = False
+        started = time.perf_counter()
+        try:
+            response = await self.client(config.get("verify_ssl", True)).request(
+                method, url, content=content, headers=headers, timeout=timeout_seconds
+            )
+            if response.status_code >= 400:
+                congested = response.status_code in _RETRYABLE_STATUS
+                raise WebhookDeliveryError(
+                    f"HTTP {response.status_code}: {response.text[:500]}",
+                    status_code=response.status_code,
+                    response_text=response.text[:1000],
+                )
+        except httpx.TimeoutException:
+            congested = True
+            state.circuit.record_failure()
+            state.failed += batch_size
+            raise WebhookDeliveryError(f"Request timeout after {timeout_seconds}s")
+        except WebhookDeliveryError:
+            # Client errors mean the endpoint is up; only overload trips the circuit
+            if congested:
+                state.circuit.record_failure()
+            else:
+                state.circuit.record_success()
+            state.failed += batch_size
+            raise
+        except asyncio.CancelledError:
+            state.circuit.cancel_call()
+            raise
+        except Exception as e:
+            congested = True
+            state.circuit.record_failure()
+            state.failed += batch_size
+            raise WebhookDeliveryError(f"Request failed: {str(e)}") from e
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            state.latencies_ms.append(elapsed_ms)
+            state.limiter.release(congested)
+
+        state.circuit.record_success()
+        state.delivered += batch_size
+        return WebhookResponse(
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            text=response.text,
+            elapsed_ms=elapsed_ms,
+            payload_size=len(content),
+            batch_size=batch_size,
+        )
+
+    def apply_authentication(
+        self,
+        headers: Dict[str, str],
+        content: bytes,
+        auth_type: str,
+        auth_config: Dict[str, Any]
+    ) -> None:
+        """Add authentication headers for ``content`` to ``headers``."""
+        if auth_type == "hmac":
+            algorithm = auth_config.get("algorithm", "sha256")
+            header_name = auth_config.get("header_name", "X-HMAC-Signature")
+            signature = self.signer.sign(auth_config["secret"], algorithm, content)
+            headers[header_name] = f"{algorithm}={signature}"
+            return
+
+        if auth_type in (None, "none"):
+            return
+
+        # Static headers only depend on the credentials, so build them once
+        key = (auth_type,) + tuple(str(auth_config.get(k, "")) for k in ("username", "password", "token", "key", "value"))
+        static = self._auth_headers.get(key)
+        if static is None:
+            static = {}
+            if auth_type == "basic":
+                credentials = base64.b64encode(
+                    f"{auth_config['username']}:{auth_config['password']}".encode()
+                ).decode()
+                static["Authorization"] = f"Basic {credentials}"
+            elif auth_type in ("bearer", "jwt"):
+                static["Authorization"] = f"Bearer {auth_config['token']}"
+            elif auth_type == "api_key":
+                static[auth_config["key"]] = auth_config["value"]
+            self._auth_headers[key] = static
+        headers.update(static)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-endpoint delivery statistics."""
+        return {
+            "endpoints": {url: state.get_stats() for url, state in self._endpoints.items()},
+            "signature_cache_hits": self.signer.hits,
+            "signature_cache_misses": self.signer.misses,
+        }
+
+    async def close(self) -> None:
+        """Flush pending batches and close the pooled clients of the running loop."""
+        for state in self._endpoints.values():
+            self._flush_batch(state)
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        for client in self._clients.pop(asyncio.get_running_loop(), {}).values():
+            await client.aclose()
+
+
+_webhook_delivery_engine: Optional[WebhookDeliveryEngine] = None
+
+
+def get_webhook_delivery_engine() -> WebhookDeliveryEngine:
+    """Get the global webhook delivery engine instance."""
+    global _webhook_delivery_engine
+    if _webhook_delivery_engine is None:
+        _webhook_delivery_engine = WebhookDeliveryEngine()
+    return _webhook_delivery_engine
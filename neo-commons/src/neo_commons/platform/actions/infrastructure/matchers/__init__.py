@@ -7,6 +7,8 @@ from .pattern_matcher import (
     ConditionMatcher,
     EventActionMatcher,
 )
+from .subscription_index import SubscriptionIndex
+from .condition_compiler import compile_condition
 
 __all__ = [
     "PatternMatcher",
@@ -14,4 +16,6 @@ __all__ = [
     "RegexPatternMatcher",
     "ConditionMatcher",
     "EventActionMatcher",
+    "SubscriptionIndex",
+    "compile_condition",
 ]
\ No newline at end of file
@@ -0,0 +1,236 @@
+"""Compile subscription conditions into plain Python predicates.
+
+Conditions use the Mongo-style syntax understood by ``ConditionMatcher``:
+
+- ``{"user_type": "premium"}`` - exact match
+- ``{"age": {"$gte": 18}}`` - comparison operators
+- ``{"$and": [{"status": "active"}, {"verified": true}]}`` - logical operators
+- ``{"profile.country": "DE"}`` - dotted paths into nested data
+
+``compile_condition`` turns a condition into a closure once; field paths are
+pre-split and ``$regex`` patterns pre-compiled, so evaluating it is a few
+function calls with no dictionary interpretation. Compiled predicates are
+cached by a hash of the canonical JSON form of the condition, so
+subscriptions sharing a condition share one predicate.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+_MISSING = object()
+
+_cache: Dict[str, Predicate] = {}
+_CACHE_SIZE = 4096
+
+
+def _always_true(data: Dict[str, Any]) -> bool:
+    return True
+
+
+def _always_false(data: Dict[str, Any]) -> bool:
+    return False
+
+
+def condition_key(conditions: Any) -> Optional[str]:
+    """Hash of the canonical JSON form of a condition, or None if not serializable."""
+    try:
+        canonical = json.dumps(conditions, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def compile_condition(conditions: Optional[Dict[str, Any]]) -> Predicate:
+    """Compile a condition into a predicate over event data.
+
+    Evaluation errors (e.g. comparing incompatible types) make the
+    predicate return False, as does a malformed condition.
+
+    Args:
+        conditions: Condition dictionary; empty or None matches everything
+
+    Returns:
+        Function taking event data and returning whether it matches
+    """
+    if not conditions:
+        return _always_true
+
+    key = condition_key(conditions)
+    if key is not None:
+        cached = _cache.get(key)
+        if cached is not None:
+            return cached
+
+    try:
+        inner = _compile_condition(conditions)
+    except Exception as e:
+        logger.warning(f"Invalid condition {conditions!r}: {e}")
+        inner = _always_false
+
+    def predicate(data: Dict[str, Any]) -> bool:
+        try:
+            return inner(data)
+        except Exception:
+            return False
+
+    if key is not None:
+        if len(_cache) >= _CACHE_SIZE:
+            _cache.clear()
+        _cache[key] = predicate
+    return predicate
+
+
+def clear_condition_cache() -> None:
+    """Drop all cached predicates."""
+    _cache.clear()
+
+
+def _all(predicates: List[Predicate]) -> Predicate:
+    if not predicates:
+        return _always_true
+    if len(predicates) == 1:
+        return predicates[0]
+    if len(predicates) == 2:
+        first, second = predicates
+        return lambda data: first(data) and second(data)
+    predicates = tuple(predicates)
+    return lambda data: all(predicate(data) for predicate in predicates)
+
+
+def _any(predicates: List[Predicate]) -> Predicate:
+    if not predicates:
+        return _always_false
+    if len(predicates) == 1:
+        return predicates[0]
+    predicates = tuple(predicates)
+    return lambda data: any(predicate(data) for predicate in predicates)
+
+
+def _compile_condition(condition: Dict[str, Any]) -> Predicate:
+    if not isinstance(condition, dict):
+        raise TypeError(f"Condition must be an object, got {type(condition).__name__}")
+
+    predicates = []
+    for key, value in condition.items():
+        if key.startswith('$'):
+            predicates.append(_compile_logical_operator(key, value))
+        else:
+            predicates.append(_compile_field_condition(key, value))
+    return _all(predicates)
+
+
+def _compile_logical_operator(operator: str, value: Any) -> Predicate:
+    if operator == '$and':
+        if not isinstance(value, list):
+            return _always_false
+        return _all([_compile_condition(cond) for cond in value])
+
+    if operator == '$or':
+        if not isinstance(value, list):
+            return _always_false
+        return _any([_compile_condition(cond) for cond in value])
+
+    if operator == '$not':
+        inner = _compile_condition(value)
+        return lambda data: not inner(data)
+
+    return _always_false
+
+
+def _compile_getter(field_path: str) -> Callable[[Dict[str, Any]], Any]:
+    """Nested value lookup for a dotted path; missing values read as None."""
+    keys: Tuple[str, ...] = tuple(field_path.split('.'))
+
+    if len(keys) == 1:
+        key = keys[0]
+
+        def get_flat(data: Any) -> Any:
+            return data.get(key) if isinstance(data, dict) else None
+
+        return get_flat
+
+    def get_nested(data: Any) -> Any:
+        value = data
+        for key in keys:
+            if isinstance(value, dict):
+                value = value.get(key, _MISSING)
+                if value is _MISSING:
+                    return None
+            else:
+                return None
+        return value
+
+    return get_nested
+
+
+def _compile_field_condition(field_path: str, condition: Any) -> Predicate:
+    get = _compile_getter(field_path)
+
+    if isinstance(condition, dict) and any(k.startswith('$') for k in condition.keys()):
+        checks = [_compile_comparison(op, target) for op, target in condition.items()]
+        checks = [check for check in checks if check is not None]
+        if not checks:
+            return _always_true
+        if len(checks) == 1:
+            check = checks[0]
+            return lambda data: check(get(data))
+        checks = tuple(checks)
+
+        def check_all(data: Dict[str, Any]) -> bool:
+            value = get(data)
+            return all(check(value) for check in checks)
+
+        return check_all
+
+    return lambda data: get(data) == condition
+
+
+def _compile_comparison(op: str, target: Any) -> Optional[Callable[[Any], bool]]:
+    """Check for one comparison operator; None for operators that always pass."""
+    if op == '$eq':
+        return lambda value: value == target
+    if op == '$ne':
+        return lambda value: value != target
+    if op == '$gt':
+        return lambda value: value is not None and value > target
+    if op == '$gte':
+        return lambda value: value is not None and value >= target
+    if op == '$lt':
+        return lambda value: value is not None and value < target
+    if op == '$lte':
+        return lambda value: value is not None and value <= target
+    if op in ('$in', '$nin'):
+        if not isinstance(target, list):
+            return lambda value: False
+        try:
+            members = frozenset(target)
+        except TypeError:
+            members = target
+        if op == '$in':
+            return lambda value: _contains(members, target, value)
+        return lambda value: not _contains(members, target, value)
+    if op == '$exists':
+        expected = bool(target)
+        return lambda value: (value is not None) == expected
+    if op == '$regex':
+        try:
+            pattern = re.compile(target, re.IGNORECASE)
+        except (re.error, TypeError):
+            return lambda value: False
+        return lambda value: isinstance(value, str) and pattern.search(value) is not None
+    return None
+
+
+def _contains(members: Any, target: List[Any], value: Any) -> bool:
+    try:
+        return value in members
+    except TypeError:
+        # Unhashable value; fall back to list membership
+        return value in target
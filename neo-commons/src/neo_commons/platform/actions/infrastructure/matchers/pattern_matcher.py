@@ -2,9 +2,21 @@
 
 import re
 import fnmatch
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from abc import ABC, abstractmethod
 
+from .condition_compiler import Predicate, compile_condition
+from .subscription_index import SubscriptionIndex, is_regex_pattern
+
+# Rank of EventPriority values, so sorting does not compare names alphabetically
+_PRIORITY_RANK = {"low": 0, "normal": 1, "high": 2, "very_high": 3, "critical": 4}
+
+
+def action_priority_rank(action) -> int:
+    """Sort key ranking an action by its priority level."""
+    priority = getattr(action.priority, "value", action.priority)
+    return _PRIORITY_RANK.get(priority, _PRIORITY_RANK["normal"])
+
 
 class PatternMatcher(ABC):
     """Abstract base class for pattern matching."""
@@ -75,7 +87,32 @@ class RegexPatternMatcher(PatternMatcher):
 
 
 class ConditionMatcher:
-    """Matcher for JSONB conditions on event data."""
+    """Matcher for JSONB conditions on event data.
+    
+    Conditions are compiled into predicates by ``compile_condition`` and
+    cached, so repeated evaluations of the same condition skip parsing.
+    """
+    
+    def __init__(self):
+        # id(conditions) -> (conditions, predicate); skips re-hashing reused dicts
+        self._compiled: Dict[int, Tuple[Dict[str, Any], Predicate]] = {}
+    
+    def compile(self, conditions: Optional[Dict[str, Any]]) -> Predicate:
+        """Compile conditions into a reusable predicate over event data."""
+        return compile_condition(conditions)
+    
+    def evaluate(self, conditions: Optional[Dict[str, Any]], event_data: Dict[str, Any]) -> bool:
+        """Synchronously check if event data matches the given conditions."""
+        if not conditions:
+            return True
+        
+        entry = self._compiled.get(id(conditions))
+        if entry is None or entry[0] is not conditions:
+            if len(self._compiled) >= 4096:
+                self._compiled.clear()
+            entry = (conditions, compile_condition(conditions))
+            self._compiled[id(conditions)] = entry
+        return entry[1](event_data)
     
     async def matches(self, conditions: Optional[Dict[str, Any]], event_data: Dict[str, Any]) -> bool:
         """
@@ -86,126 +123,61 @@ class ConditionMatcher:
         - {"age": {"$gte": 18}} - comparison operators
         - {"$and": [{"status": "active"}, {"verified": true}]} - logical operators
         """
-        if not conditions:
-            return True
-        
-        try:
-            return await self._evaluate_condition(conditions, event_data)
-        except Exception:
-            return False
-    
-    async def _evaluate_condition(self, condition: Dict[str, Any], data: Dict[str, Any]) -> bool:
-        """Evaluate a single condition against data."""
-        for key, value in condition.items():
-            if key.startswith('$'):
-                # Logical operators
-                if not await self._evaluate_logical_operator(key, value, data):
-                    return False
-            else:
-                # Field conditions
-                if not await self._evaluate_field_condition(key, value, data):
-                    return False
-        
-        return True
-    
-    async def _evaluate_logical_operator(self, operator: str, value: Any, data: Dict[str, Any]) -> bool:
-        """Evaluate logical operators."""
-        if operator == '$and':
-            if not isinstance(value, list):
-                return False
-            return all(await self._evaluate_condition(cond, data) for cond in value)
-        
-        elif operator == '$or':
-            if not isinstance(value, list):
-                return False
-            return any(await self._evaluate_condition(cond, data) for cond in value)
-        
-        elif operator == '$not':
-            return not await self._evaluate_condition(value, data)
-        
-        return False
-    
-    async def _evaluate_field_condition(self, field: str, condition: Any, data: Dict[str, Any]) -> bool:
-        """Evaluate field-level conditions."""
-        # Get field value from data (support nested fields with dot notation)
-        field_value = self._get_nested_value(data, field)
-        
-        if isinstance(condition, dict) and any(k.startswith('$') for k in condition.keys()):
-            # Comparison operators
-            return await self._evaluate_comparison_operators(field_value, condition)
-        else:
-            # Exact match
-            return field_value == condition
-    
-    async def _evaluate_comparison_operators(self, field_value: Any, operators: Dict[str, Any]) -> bool:
-        """Evaluate comparison operators."""
-        for op, target_value in operators.items():
-            if op == '$eq':
-                if field_value != target_value:
-                    return False
-            elif op == '$ne':
-                if field_value == target_value:
-                    return False
-            elif op == '$gt':
-                if not (field_value is not None and field_value > target_value):
-                    return False
-            elif op == '$gte':
-                if not (field_value is not None and field_value >= target_value):
-                    return False
-            elif op == '$lt':
-                if not (field_value is not None and field_value < target_value):
-                    return False
-            elif op == '$lte':
-                if not (field_value is not None and field_value <= target_value):
-                    return False
-            elif op == '$in':
-                if not isinstance(target_value, list) or field_value not in target_value:
-                    return False
-            elif op == '$nin':
-                if not isinstance(target_value, list) or field_value in target_value:
-                    return False
-            elif op == '$exists':
-                if bool(field_value is not None) != bool(target_value):
-                    return False
-            elif op == '$regex':
-                if not isinstance(field_value, str):
-                    return False
-                try:
-                    if not re.search(target_value, field_value, re.IGNORECASE):
-                        return False
-                except re.error:
-                    return False
-        
-        return True
-    
-    def _get_nested_value(self, data: Dict[str, Any], field_path: str) -> Any:
-        """Get value from nested dictionary using dot notation."""
-        keys = field_path.split('.')
-        value = data
-        
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return None
-        
-        return value
+        return self.evaluate(conditions, event_data)
 
 
 class EventActionMatcher:
-    """Main event-action matching engine."""
+    """Main event-action matching engine.
+    
+    Subscriptions are compiled into a ``SubscriptionIndex``, so finding the
+    candidates for an event does not scan every subscription. Long-lived
+    callers should ``load`` subscriptions and actions once, keep them current
+    with the ``add_*``/``remove_*`` methods, and call ``find_matching_actions``
+    without lists.
+    """
     
     def __init__(self):
         self.glob_matcher = GlobPatternMatcher()
         self.regex_matcher = RegexPatternMatcher()
         self.condition_matcher = ConditionMatcher()
+        self.index = SubscriptionIndex()
+        self._action_map: Dict[Any, Any] = {}
+        # Subscription id -> (conditions the predicate was compiled from, predicate)
+        self._predicates: Dict[Any, Tuple[Any, Predicate]] = {}
+    
+    def load(self, subscriptions: List, actions: List) -> None:
+        """Replace indexed subscriptions and actions, re-indexing only changes."""
+        self._sync_subscriptions(subscriptions)
+        self._action_map = {action.id: action for action in actions}
+    
+    def add_subscription(self, subscription) -> None:
+        """Index a new or updated subscription."""
+        self.index.add(subscription)
+        self._predicate_for(subscription)
+    
+    def remove_subscription(self, subscription_id) -> bool:
+        """Remove a subscription from the index."""
+        self._predicates.pop(subscription_id, None)
+        return self.index.remove(subscription_id)
+    
+    def add_action(self, action) -> None:
+        """Register a new or updated action."""
+        self._action_map[action.id] = action
+    
+    def remove_action(self, action_id) -> bool:
+        """Unregister an action."""
+        return self._action_map.pop(action_id, None) is not None
+    
+    def match_subscriptions(self, event_type: str) -> List:
+        """Indexed subscriptions whose patterns match the event type."""
+        return self.index.match(event_type)
     
     async def find_matching_actions(
         self,
         event_type: str,
         event_data: Dict[str, Any],
-        subscriptions: List,
-        actions: List
+        subscriptions: Optional[List] = None,
+        actions: Optional[List] = None
     ) -> List:
         """
         Find actions that match an event based on subscriptions.
@@ -213,41 +185,66 @@ class EventActionMatcher:
         Args:
             event_type: Type of the event
             event_data: Event payload data
-            subscriptions: List of EventActionSubscription entities
-            actions: List of Action entities
+            subscriptions: List of EventActionSubscription entities; synced
+                into the index when given, otherwise the loaded ones are used
+            actions: List of Action entities; replaces the loaded actions
+                when given
             
         Returns:
             List of matching Action entities sorted by priority
         """
-        matching_actions = []
+        if subscriptions is not None:
+            self._sync_subscriptions(subscriptions)
+        if actions is not None:
+            self._action_map = {action.id: action for action in actions}
         
-        # Create lookup map for actions
-        action_map = {action.id: action for action in actions}
+        return self.match_actions(event_type, event_data)
+    
+    def match_actions(self, event_type: str, event_data: Dict[str, Any]) -> List:
+        """
+        Synchronously find loaded actions that match an event.
         
-        for subscription in subscriptions:
+        Args:
+            event_type: Type of the event
+            event_data: Event payload data
+            
+        Returns:
+            List of matching Action entities sorted by priority
+        """
+        matching_actions = []
+        action_map = self._action_map
+        
+        for subscription in self.index.match(event_type):
             # Check if action exists and is active
             action = action_map.get(subscription.action_id)
             if not action or not action.is_active or not action.is_healthy:
                 continue
             
-            # Check event pattern matching
-            pattern_matches = False
-            for pattern in subscription.event_patterns:
-                if await self._matches_pattern(pattern, event_type):
-                    pattern_matches = True
-                    break
-            
-            if not pattern_matches:
-                continue
-            
             # Check additional conditions
-            if not await self.condition_matcher.matches(subscription.conditions, event_data):
+            if not self._predicate_for(subscription)(event_data):
                 continue
             
             matching_actions.append(action)
         
         # Sort by priority (higher priority first)
-        return sorted(matching_actions, key=lambda a: a.priority, reverse=True)
+        return sorted(matching_actions, key=action_priority_rank, reverse=True)
+    
+    def _sync_subscriptions(self, subscriptions: List) -> None:
+        """Sync the index and compile conditions of new or changed subscriptions."""
+        if not self.index.sync(subscriptions):
+            return
+        for subscription_id in [sid for sid in self._predicates if sid not in self.index]:
+            del self._predicates[subscription_id]
+        for subscription in subscriptions:
+            self._predicate_for(subscription)
+    
+    def _predicate_for(self, subscription) -> Predicate:
+        """Compiled conditions of a subscription, recompiled when they are replaced."""
+        entry = self._predicates.get(subscription.id)
+        if entry is None or entry[0] is not subscription.conditions:
+            entry = (subscription.conditions, compile_condition(subscription.conditions))
+            self._predicates[subscription.id] = entry
+        return entry[1]
     
     async def _matches_pattern(self, pattern: str, event_type: str) -> bool:
         """Check if a pattern matches an event type."""
@@ -258,24 +255,5 @@ class EventActionMatcher:
             return await self.glob_matcher.matches(pattern, event_type)
     
     def _is_regex_pattern(self, pattern: str) -> bool:
-        """
-        Determine if a pattern is a regex pattern.
-        
-        Heuristics:
-        - Contains regex special characters (not covered by glob)
-        - Starts with ^ or ends with $
-        - Contains character classes like \d, \w, \s
-        """
-        regex_indicators = [
-            pattern.startswith('^'),
-            pattern.endswith('$'),
-            '\\d' in pattern,
-            '\\w' in pattern,
-            '\\s' in pattern,
-            '\\.' in pattern,
-            '+' in pattern,
-            '{' in pattern and '}' in pattern,
-            '(' in pattern and ')' in pattern
-        ]
-        
-        return any(regex_indicators)
\ No newline at end of file
+        """Determine if a pattern is a regex pattern."""
+        return is_regex_pattern(pattern)
@@ -0,0 +1,370 @@
+"""Compiled routing index from event types to subscriptions.
+
+Subscription patterns are compiled once, when a subscription is added, into
+one of three structures:
+
+- exact event types go into a hash map
+- dotted patterns whose wildcards are whole segments (``tenant.*.created``)
+  go into a segment trie
+- everything else (partial-segment globs, regexes) is compiled to a regex
+  and grouped into a bucket keyed by the pattern's first literal segment;
+  each bucket is pre-filtered with one merged alternation
+
+Lookups are synchronous and memoized per event type, so routing an event
+costs a dictionary hit once its type has been seen, regardless of the number
+of subscriptions. Any change to the index clears the memo.
+"""
+
+import fnmatch
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_GLOB_CHARS = frozenset("*?[")
+
+# Group references change meaning once patterns are merged into one alternation
+_GROUP_REFERENCE = re.compile(r"\\\d|\(\?P=")
+
+# Bucket for regex patterns and globs without a literal first segment
+_ANY_PREFIX = ""
+
+
+def is_regex_pattern(pattern: str) -> bool:
+    """
+    Determine if a pattern is a regex pattern.
+
+    Heuristics:
+    - Contains regex special characters (not covered by glob)
+    - Starts with ^ or ends with $
+    - Contains character classes like \\d, \\w, \\s
+    """
+    return (
+        pattern.startswith('^')
+        or pattern.endswith('$')
+        or '\\d' in pattern
+        or '\\w' in pattern
+        or '\\s' in pattern
+        or '\\.' in pattern
+        or '+' in pattern
+        or ('{' in pattern and '}' in pattern)
+        or ('(' in pattern and ')' in pattern)
+    )
+
+
+def subscription_patterns(subscription: Any) -> List[str]:
+    """Event patterns of a subscription (``event_patterns`` or ``event_pattern``)."""
+    patterns = getattr(subscription, "event_patterns", None)
+    if patterns:
+        return list(patterns)
+    pattern = getattr(subscription, "event_pattern", None)
+    return [pattern] if pattern else []
+
+
+def _has_glob(text: str) -> bool:
+    return not _GLOB_CHARS.isdisjoint(text)
+
+
+@dataclass
+class _TrieNode:
+    """Segment trie node; ``star`` matches one or more whole segments."""
+
+    children: Dict[str, "_TrieNode"] = field(default_factory=dict)
+    star: Optional["_TrieNode"] = None
+    terminal: Set[Any] = field(default_factory=set)
+
+    def is_empty(self) -> bool:
+        return not (self.children or self.star or self.terminal)
+
+
+@dataclass
+class _RegexBucket:
+    """Compiled regexes sharing a first segment, with a merged pre-filter."""
+
+    patterns: Dict[Tuple[Any, str], re.Pattern] = field(default_factory=dict)
+    merged: Optional[re.Pattern] = None
+    stale: bool = True
+
+    def prefilter(self) -> Optional[re.Pattern]:
+        if self.stale:
+            self.stale = False
+            self.merged = None
+            if any(_GROUP_REFERENCE.search(compiled.pattern) for compiled in self.patterns.values()):
+                return None
+            try:
+                self.merged = re.compile(
+                    "|".join(f"(?:{compiled.pattern})" for compiled in self.patterns.values())
+                )
+            except re.error:
+                # Patterns with global inline flags or duplicate group names cannot be merged
+                pass
+        return self.merged
+
+
+class SubscriptionIndex:
+    """Routing index over event subscriptions."""
+
+    def __init__(self, cache_size: int = 4096):
+        """Initialize subscription index.
+
+        Args:
+            cache_size: Maximum number of memoized event types
+        """
+        self.cache_size = cache_size
+
+        self._subscriptions: Dict[Any, Any] = {}
+        self._versions: Dict[Any, Tuple] = {}
+        self._order: Dict[Any, int] = {}
+        self._sequence = 0
+
+        self._exact: Dict[str, Set[Any]] = {}
+        self._trie = _TrieNode()
+        self._buckets: Dict[str, _RegexBucket] = {}
+        self._cache: Dict[str, Tuple[Any, ...]] = {}
+
+        # Statistics
+        self._lookups = 0
+        self._cache_hits = 0
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def __contains__(self, subscription_id: Any) -> bool:
+        return subscription_id in self._subscriptions
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def add(self, subscription: Any) -> None:
+        """Add or replace a subscription.
+
+        Inactive subscriptions are tracked but never matched.
+        """
+        subscription_id = subscription.id
+        if subscription_id in self._subscriptions:
+            self._unindex(subscription_id)
+
+        patterns = subscription_patterns(subscription)
+        self._subscriptions[subscription_id] = subscription
+        self._versions[subscription_id] = self._version_of(subscription, patterns)
+        self._sequence += 1
+        self._order[subscription_id] = self._sequence
+
+        if getattr(subscription, "is_active", True):
+            for pattern in patterns:
+                self._index_pattern(subscription_id, pattern)
+        self._cache.clear()
+
+    def remove(self, subscription_id: Any) -> bool:
+        """Remove a subscription.
+
+        Returns:
+            True if the subscription was indexed
+        """
+        if subscription_id not in self._subscriptions:
+            return False
+        self._unindex(subscription_id)
+        del self._subscriptions[subscription_id]
+        del self._versions[subscription_id]
+        del self._order[subscription_id]
+        self._cache.clear()
+        return True
+
+    def sync(self, subscriptions: Iterable[Any]) -> int:
+        """Bring the index in line with a full subscription list.
+
+        Only subscriptions that were added, removed or changed (patterns,
+        activity or ``updated_at``) are re-indexed.
+
+        Returns:
+            Number of subscriptions added, changed or removed
+        """
+        seen = set()
+        changes = 0
+        for subscription in subscriptions:
+            subscription_id = subscription.id
+            seen.add(subscription_id)
+            version = self._version_of(subscription, subscription_patterns(subscription))
+            if self._versions.get(subscription_id) != version:
+                self.add(subscription)
+                changes += 1
+            else:
+                # Same definition; keep the latest object for its other fields
+                self._subscriptions[subscription_id] = subscription
+
+        for subscription_id in [sid for sid in self._subscriptions if sid not in seen]:
+            self.remove(subscription_id)
+            changes += 1
+
+        if changes:
+            logger.debug(f"Subscription index synced: {changes} changes, {len(self)} subscriptions")
+        return changes
+
+    def clear(self) -> None:
+        """Remove all subscriptions."""
+        self._subscriptions.clear()
+        self._versions.clear()
+        self._order.clear()
+        self._exact.clear()
+        self._trie = _TrieNode()
+        self._buckets.clear()
+        self._cache.clear()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def match(self, event_type: str) -> List[Any]:
+        """Subscriptions whose patterns match ``event_type``, in insertion order."""
+        self._lookups += 1
+        key = event_type.lower()
+        ids = self._cache.get(key)
+        if ids is None:
+            ids = self._lookup(key)
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[key] = ids
+        else:
+            self._cache_hits += 1
+        subscriptions = self._subscriptions
+        return [subscriptions[subscription_id] for subscription_id in ids]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index size and cache statistics."""
+        return {
+            "subscriptions": len(self._subscriptions),
+            "exact_types": len(self._exact),
+            "regex_buckets": len(self._buckets),
+            "regex_patterns": sum(len(bucket.patterns) for bucket in self._buckets.values()),
+            "cached_types": len(self._cache),
+            "lookups": self._lookups,
+            "cache_hit_rate": self._cache_hits / self._lookups if self._lookups else 0.0,
+        }
+
+    def _lookup(self, event_type: str) -> Tuple[Any, ...]:
+        matched: Set[Any] = set(self._exact.get(event_type, ()))
+
+        segments = event_type.split(".")
+        self._match_trie(self._trie, segments, 0, matched)
+
+        for prefix in (segments[0], _ANY_PREFIX):
+            bucket = self._buckets.get(prefix)
+            if bucket is None:
+                continue
+            prefilter = bucket.prefilter()
+            if prefilter is not None and not prefilter.match(event_type):
+                continue
+            for (subscription_id, _), compiled in bucket.patterns.items():
+                if subscription_id not in matched and compiled.match(event_type):
+                    matched.add(subscription_id)
+
+        return tuple(sorted(matched, key=self._order.__getitem__))
+
+    def _match_trie(self, node: _TrieNode, segments: List[str], position: int, matched: Set[Any]) -> None:
+        if position == len(segments):
+            matched.update(node.terminal)
+            return
+
+        child = node.children.get(segments[position])
+        if child is not None:
+            self._match_trie(child, segments, position + 1, matched)
+
+        if node.star is not None:
+            # A '*' segment spans one or more segments, as fnmatch's '*' crosses dots
+            for end in range(position + 1, len(segments) + 1):
+                self._match_trie(node.star, segments, end, matched)
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _version_of(subscription: Any, patterns: List[str]) -> Tuple:
+        return (
+            tuple(patterns),
+            getattr(subscription, "is_active", True),
+            getattr(subscription, "updated_at", None),
+        )
+
+    def _index_pattern(self, subscription_id: Any, pattern: str) -> None:
+        if is_regex_pattern(pattern):
+            anchored = pattern if pattern.startswith('^') else '^' + pattern
+            anchored = anchored if anchored.endswith('$') else anchored + '$'
+            self._add_regex(subscription_id, pattern, _ANY_PREFIX, f"(?i:{anchored})")
+            return
+
+        lowered = pattern.lower()
+        if not _has_glob(lowered):
+            self._exact.setdefault(lowered, set()).add(subscription_id)
+            return
+
+        segments = lowered.split(".")
+        if all(segment == "*" or not _has_glob(segment) for segment in segments):
+            node = self._trie
+            for segment in segments:
+                if segment == "*":
+                    node.star = node.star or _TrieNode()
+                    node = node.star
+                else:
+                    node = node.children.setdefault(segment, _TrieNode())
+            node.terminal.add(subscription_id)
+            return
+
+        prefix = segments[0] if len(segments) > 1 and not _has_glob(segments[0]) else _ANY_PREFIX
+        self._add_regex(subscription_id, pattern, prefix, fnmatch.translate(lowered))
+
+    def _add_regex(self, subscription_id: Any, pattern: str, prefix: str, source: str) -> None:
+        try:
+            compiled = re.compile(source)
+        except re.error as e:
+            logger.warning(f"Ignoring invalid event pattern '{pattern}' for subscription {subscription_id}: {e}")
+            return
+        bucket = self._buckets.setdefault(prefix, _RegexBucket())
+        bucket.patterns[(subscription_id, pattern)] = compiled
+        bucket.stale = True
+
+    def _unindex(self, subscription_id: Any) -> None:
+        for pattern in self._versions[subscription_id][0]:
+            self._unindex_pattern(subscription_id, pattern)
+
+    def _unindex_pattern(self, subscription_id: Any, pattern: str) -> None:
+        lowered = pattern.lower()
+        if not is_regex_pattern(pattern) and not _has_glob(lowered):
+            ids = self._exact.get(lowered)
+            if ids is not None:
+                ids.discard(subscription_id)
+                if not ids:
+                    del self._exact[lowered]
+            return
+
+        segments = lowered.split(".")
+        if not is_regex_pattern(pattern) and all(segment == "*" or not _has_glob(segment) for segment in segments):
+            self._remove_from_trie(self._trie, segments, 0, subscription_id)
+            return
+
+        for prefix, bucket in list(self._buckets.items()):
+            if bucket.patterns.pop((subscription_id, pattern), None) is not None:
+                bucket.stale = True
+                if not bucket.patterns:
+                    del self._buckets[prefix]
+
+    def _remove_from_trie(self, node: _TrieNode, segments: List[str], position: int, subscription_id: Any) -> None:
+        if position == len(segments):
+            node.terminal.discard(subscription_id)
+            return
+
+        segment = segments[position]
+        if segment == "*":
+            if node.star is not None:
+                self._remove_from_trie(node.star, segments, position + 1, subscription_id)
+                if node.star.is_empty():
+                    node.star = None
+        else:
+            child = node.children.get(segment)
+            if child is not None:
+                self._remove_from_trie(child, segments, position + 1, subscription_id)
+                if child.is_empty():
+                    del node.children[segment]
@@ -3,9 +3,11 @@
 from .asyncpg_action_repository import AsyncPGActionRepository
 from .asyncpg_action_execution_repository import AsyncPGActionExecutionRepository
 from .asyncpg_event_action_subscription_repository import AsyncPGEventActionSubscriptionRepository
+from .buffered_action_execution_writer import BufferedActionExecutionWriter
 
 __all__ = [
     "AsyncPGActionRepository",
     "AsyncPGActionExecutionRepository", 
     "AsyncPGEventActionSubscriptionRepository",
+    "BufferedActionExecutionWriter",
 ]
\ No newline at end of file
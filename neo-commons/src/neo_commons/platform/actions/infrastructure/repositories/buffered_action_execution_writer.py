@@ -0,0 +1,562 @@
+"""Write-behind buffer for action execution state.
+
+Each execution normally costs four round trips to PostgreSQL (``save``,
+``mark_as_started``, ``mark_as_completed``/``mark_as_failed`` and
+``update_performance_metrics``). ``BufferedActionExecutionWriter`` keeps
+these writes in memory, coalesces every write for the same execution into
+one pending row, and flushes all pending rows of a schema with two
+statements: one multi-row upsert for new executions and one multi-row
+``UPDATE ... FROM unnest(...)`` for status transitions of executions that
+are already stored.
+
+Ordering guarantees:
+
+- Writes for one execution are applied in call order; later values win.
+- A ``save`` replaces everything buffered for that execution before it.
+- Within a flush, inserts run before updates, so a transition buffered in
+  the same interval as the ``save`` is never lost to a missing row.
+- Flushes are serialized; a failed flush puts its writes back in front of
+  writes buffered since, and the next flush retries them.
+
+Failed writes: when a schema's batch is rejected by PostgreSQL (a data or
+constraint error rather than a lost connection), its executions are
+written one by one so the good ones still land. An execution that keeps
+failing on its own is dropped with an error log after
+``max_write_attempts`` flushes, so one bad row cannot block the buffer.
+Connection errors requeue the whole batch without counting attempts.
+
+Start guard: as with the direct repository, ``mark_as_started`` only moves
+a ``pending`` execution to running. When the stored status is known to
+the buffer the call answers immediately; otherwise it returns True and the
+guard is applied by the flush, which skips the start (and the transitions
+buffered after it for that execution) if the row is no longer pending.
+Skipped transitions are counted in ``get_stats()["transitions_skipped"]``.
+
+Crash safety: buffered writes live only in process memory. A crash loses
+the writes of at most one flush interval (or ``max_batch_size`` writes,
+whichever comes first); ``stop()`` flushes everything on graceful
+shutdown. Use ``AsyncPGActionExecutionRepository`` directly where an
+execution record must exist before a side effect happens.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import asyncpg
+
+from ...domain.entities.action import ActionStatus
+from ...domain.entities.action_execution import ActionExecution
+from ...domain.value_objects.execution_id import ExecutionId
+
+logger = logging.getLogger(__name__)
+
+# Columns of a full execution row, in insert order, with their array types
+_ROW_COLUMNS = [
+    ("id", "uuid"),
+    ("event_id", "uuid"),
+    ("action_id", "uuid"),
+    ("execution_context", "jsonb"),
+    ("input_data", "jsonb"),
+    ("output_data", "jsonb"),
+    ("status", "text"),
+    ("queued_at", "timestamptz"),
+    ("started_at", "timestamptz"),
+    ("completed_at", "timestamptz"),
+    ("execution_duration_ms", "integer"),
+    ("attempt_number", "integer"),
+    ("is_retry", "boolean"),
+    ("parent_execution_id", "uuid"),
+    ("error_message", "text"),
+    ("error_details", "jsonb"),
+    ("error_stack_trace", "text"),
+    ("queue_message_id", "text"),
+    ("worker_id", "text"),
+    ("memory_usage_mb", "integer"),
+    ("cpu_time_ms", "integer"),
+    ("created_at", "timestamptz"),
+    ("updated_at", "timestamptz"),
+]
+
+# Columns a status transition may change; NULL keeps the stored value
+_UPDATE_COLUMNS = [
+    ("status", "text"),
+    ("started_at", "timestamptz"),
+    ("completed_at", "timestamptz"),
+    ("execution_duration_ms", "integer"),
+    ("worker_id", "text"),
+    ("output_data", "jsonb"),
+    ("error_message", "text"),
+    ("error_details", "jsonb"),
+    ("error_stack_trace", "text"),
+    ("memory_usage_mb", "integer"),
+    ("cpu_time_ms", "integer"),
+    ("updated_at", "timestamptz"),
+]
+
+# Columns a re-saved execution overwrites on conflict
+_UPSERT_COLUMNS = _UPDATE_COLUMNS + [("attempt_number", "integer")]
+
+# Update-array flag set for coalesced changes that begin with a start transition
+_START_GUARD = ("requires_pending", "boolean")
+
+_JSON_COLUMNS = {"execution_context", "input_data", "output_data", "error_details"}
+
+_TERMINAL_STATUSES = {
+    ActionStatus.COMPLETED,
+    ActionStatus.FAILED,
+    ActionStatus.CANCELLED,
+    ActionStatus.TIMEOUT,
+}
+
+
+def _column_value(name: str, value: Any) -> Any:
+    """Convert a buffered value to what asyncpg expects for a column."""
+    if value is None:
+        return None
+    if name in _JSON_COLUMNS:
+        return json.dumps(value)
+    if name == "status":
+        return value.value if isinstance(value, ActionStatus) else value
+    return value
+
+
+def _execution_row(execution: ActionExecution) -> Dict[str, Any]:
+    return {
+        "id": execution.id.value,
+        "event_id": execution.event_id.value,
+        "action_id": execution.action_id.value,
+        "execution_context": execution.execution_context,
+        "input_data": execution.input_data,
+        "output_data": execution.output_data,
+        "status": execution.status,
+        "queued_at": execution.queued_at,
+        "started_at": execution.started_at,
+        "completed_at": execution.completed_at,
+        "execution_duration_ms": execution.execution_duration_ms,
+        "attempt_number": execution.attempt_number,
+        "is_retry": execution.is_retry,
+        "parent_execution_id": execution.parent_execution_id.value if execution.parent_execution_id else None,
+        "error_message": execution.error_message,
+        "error_details": execution.error_details or None,
+        "error_stack_trace": execution.error_stack_trace,
+        "queue_message_id": execution.queue_message_id,
+        "worker_id": execution.worker_id,
+        "memory_usage_mb": execution.memory_usage_mb,
+        "cpu_time_ms": execution.cpu_time_ms,
+        "created_at": execution.created_at,
+        "updated_at": execution.updated_at,
+    }
+
+
+class _PendingWrite:
+    """Coalesced writes for one execution: a full row and/or column changes."""
+
+    __slots__ = ("row", "changes", "failures")
+
+    def __init__(self):
+        self.row: Optional[Dict[str, Any]] = None
+        self.changes: Dict[str, Any] = {}
+        # Flushes in which this execution failed on its own
+        self.failures = 0
+
+    def save(self, row: Dict[str, Any]) -> None:
+        self.row = row
+        self.changes = {}
+
+    def update(self, changes: Dict[str, Any]) -> None:
+        if self.row is not None:
+            self.row.update(changes)
+        else:
+            self.changes.update(changes)
+
+    def merge_newer(self, newer: "_PendingWrite") -> None:
+        """Apply writes buffered after this one on top of it."""
+        if newer.row is not None:
+            self.save(newer.row)
+        else:
+            self.update(newer.changes)
+
+
+class BufferedActionExecutionWriter:
+    """Coalescing write-behind buffer in front of the action_executions tables."""
+
+    def __init__(
+        self,
+        connection_pool: asyncpg.Pool,
+        flush_interval: float = 0.2,
+        max_batch_size: int = 500,
+        max_pending: int = 10000,
+        max_write_attempts: int = 5,
+    ):
+        """Initialize buffered writer.
+
+        Args:
+            connection_pool: Database connection pool
+            flush_interval: Maximum seconds a write stays buffered
+            max_batch_size: Pending executions that trigger an early flush
+            max_pending: Pending executions at which writers wait for a
+                flush instead of growing the buffer
+            max_write_attempts: Flushes in which an execution may be rejected
+                by the database before its writes are dropped
+        """
+        self.connection_pool = connection_pool
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.max_pending = max_pending
+        self.max_write_attempts = max_write_attempts
+
+        self._buffer: Dict[str, Dict[Any, _PendingWrite]] = {}
+        self._pending = 0
+        self._flush_lock = asyncio.Lock()
+        self._flush_requested = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+        # Statistics
+        self._writes = 0
+        self._flushes = 0
+        self._rows_inserted = 0
+        self._rows_updated = 0
+        self._transitions_skipped = 0
+        self._failed_flushes = 0
+        self._writes_dropped = 0
+        self._last_flush_ms = 0.0
+
+    # Buffered writes
+
+    async def save(self, execution: ActionExecution, schema: str) -> ActionExecution:
+        """Buffer an insert (or full overwrite) of an execution."""
+        self._pending_for(schema, execution.id.value).save(_execution_row(execution))
+        await self._after_write()
+        return execution
+
+    async def mark_as_started(self, execution_id: ExecutionId, worker_id: str, schema: str) -> bool:
+        """Buffer the transition to running, guarded on the execution being pending.
+
+        Returns:
+            False when the buffered status is not pending; True otherwise,
+            with the guard checked against the stored row at flush time
+        """
+        pending = self._pending_for(schema, execution_id.value)
+        status = pending.row["status"] if pending.row is not None else pending.changes.get("status")
+        if status is not None and status != ActionStatus.PENDING:
+            return False
+
+        now = datetime.now()
+        changes = {
+            "status": ActionStatus.RUNNING,
+            "started_at": now,
+            "worker_id": worker_id,
+            "updated_at": now,
+        }
+        if pending.row is None:
+            changes[_START_GUARD[0]] = True
+        return await self._update(schema, execution_id, changes)
+
+    async def mark_as_completed(
+        self,
+        execution_id: ExecutionId,
+        output_data: Dict[str, Any],
+        execution_duration_ms: int,
+        schema: str
+    ) -> bool:
+        """Buffer the transition to completed."""
+        now = datetime.now()
+        return await self._update(schema, execution_id, {
+            "status": ActionStatus.COMPLETED,
+            "output_data": output_data,
+            "execution_duration_ms": execution_duration_ms,
+            "completed_at": now,
+            "updated_at": now,
+        })
+
+    async def mark_as_failed(
+        self,
+        execution_id: ExecutionId,
+        error_message: str,
+        error_details: Dict[str, Any],
+        error_stack_trace: Optional[str],
+        execution_duration_ms: Optional[int],
+        schema: str
+    ) -> bool:
+        """Buffer the transition to failed."""
+        now = datetime.now()
+        changes = {
+            "status": ActionStatus.FAILED,
+            "error_message": error_message,
+            "error_details": error_details,
+            "error_stack_trace": error_stack_trace,
+            "completed_at": now,
+            "updated_at": now,
+        }
+        if execution_duration_ms is not None:
+            changes["execution_duration_ms"] = execution_duration_ms
+        return await self._update(schema, execution_id, changes)
+
+    async def update_status(
+        self,
+        execution_id: ExecutionId,
+        status: ActionStatus,
+        schema: str,
+        error_message: Optional[str] = None,
+        error_details: Optional[Dict[str, Any]] = None,
+        output_data: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Buffer a status change and related fields."""
+        now = datetime.now()
+        changes: Dict[str, Any] = {"status": status, "updated_at": now}
+        if error_message is not None:
+            changes["error_message"] = error_message
+        if error_details is not None:
+            changes["error_details"] = error_details
+        if output_data is not None:
+            changes["output_data"] = output_data
+        if status in _TERMINAL_STATUSES:
+            changes["completed_at"] = now
+        return await self._update(schema, execution_id, changes)
+
+    async def update_performance_metrics(
+        self,
+        execution_id: ExecutionId,
+        memory_usage_mb: Optional[int],
+        cpu_time_ms: Optional[int],
+        schema: str
+    ) -> bool:
+        """Buffer execution performance metrics."""
+        changes: Dict[str, Any] = {}
+        if memory_usage_mb is not None:
+            changes["memory_usage_mb"] = memory_usage_mb
+        if cpu_time_ms is not None:
+            changes["cpu_time_ms"] = cpu_time_ms
+        if not changes:
+            return True
+        changes["updated_at"] = datetime.now()
+        return await self._update(schema, execution_id, changes)
+
+    def _pending_for(self, schema: str, execution_id: Any) -> _PendingWrite:
+        writes = self._buffer.setdefault(schema, {})
+        pending = writes.get(execution_id)
+        if pending is None:
+            pending = writes[execution_id] = _PendingWrite()
+            self._pending += 1
+        return pending
+
+    async def _update(self, schema: str, execution_id: ExecutionId, changes: Dict[str, Any]) -> bool:
+        self._pending_for(schema, execution_id.value).update(changes)
+        await self._after_write()
+        return True
+
+    async def _after_write(self) -> None:
+        self._writes += 1
+        if self._pending >= self.max_pending:
+            # Backpressure: wait for the buffer to drain instead of growing it
+            await self.flush()
+        elif self._pending >= self.max_batch_size:
+            self._flush_requested.set()
+
+    # Flushing
+
+    def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None or self._task.done():
+            self._running = True
+            self._task = asyncio.create_task(self._run())
+            logger.info("Started buffered action execution writer")
+
+    async def stop(self) -> None:
+        """Stop the flush loop and flush everything still buffered."""
+        self._running = False
+        self._flush_requested.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+        logger.info("Stopped buffered action execution writer")
+
+    async def _run(self) -> None:
+        while self._running:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush action executions: {e}")
+
+    async def flush(self) -> int:
+        """Write all buffered executions to the database.
+
+        Returns:
+            Number of executions written
+
+        Raises:
+            Exception: Database errors; the failed writes stay buffered
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            batch, self._buffer, self._pending = self._buffer, {}, 0
+            started = asyncio.get_running_loop().time()
+            written = 0
+            try:
+                for schema in list(batch):
+                    writes = batch[schema]
+                    try:
+                        written += await self._flush_schema(schema, writes)
+                        writes.clear()
+                    except asyncpg.PostgresError as e:
+                        if isinstance(e, asyncpg.PostgresConnectionError):
+                            raise
+                        logger.warning(
+                            f"Batch of {len(writes)} action executions rejected in {schema}, "
+                            f"writing them one by one: {e}"
+                        )
+                        written += await self._flush_each(schema, writes)
+                    if not writes:
+                        del batch[schema]
+            except Exception:
+                self._failed_flushes += 1
+                self._requeue(batch)
+                raise
+
+            if batch:
+                # Executions rejected on their own are retried by the next flush
+                self._failed_flushes += 1
+                self._requeue(batch)
+
+            self._flushes += 1
+            self._last_flush_ms = (asyncio.get_running_loop().time() - started) * 1000
+            return written
+
+    async def _flush_schema(self, schema: str, writes: Dict[Any, _PendingWrite]) -> int:
+        rows = [write.row for write in writes.values() if write.row is not None]
+        changes = [(execution_id, write.changes) for execution_id, write in writes.items() if write.row is None]
+
+        async with self.connection_pool.acquire() as conn:
+            async with conn.transaction():
+                if rows:
+                    await conn.execute(self._upsert_query(schema), *self._row_arrays(rows))
+                updated = 0
+                if changes:
+                    result = await conn.execute(
+                        self._update_query(schema), *self._update_arrays(changes)
+                    )
+                    updated = int(result.split()[-1])
+
+        if updated < len(changes):
+            self._transitions_skipped += len(changes) - updated
+            logger.info(
+                f"Skipped {len(changes) - updated} action execution transitions in {schema} "
+                f"(not pending when started, or not stored)"
+            )
+        self._rows_inserted += len(rows)
+        self._rows_updated += updated
+        return len(writes)
+
+    async def _flush_each(self, schema: str, writes: Dict[Any, _PendingWrite]) -> int:
+        """Write executions one at a time; rejected ones stay in ``writes``."""
+        written = 0
+        for execution_id, write in list(writes.items()):
+            try:
+                written += await self._flush_schema(schema, {execution_id: write})
+                del writes[execution_id]
+            except asyncpg.PostgresError as e:
+                if isinstance(e, asyncpg.PostgresConnectionError):
+                    raise
+                write.failures += 1
+                if write.failures >= self.max_write_attempts:
+                    del writes[execution_id]
+                    self._writes_dropped += 1
+                    logger.error(
+                        f"Dropped buffered writes of action execution {execution_id} in {schema} "
+                        f"after {write.failures} failed flushes: {e}"
+                    )
+        return written
+
+    def _requeue(self, batch: Dict[str, Dict[Any, _PendingWrite]]) -> None:
+        """Put unflushed writes back in front of writes buffered since."""
+        for schema, writes in batch.items():
+            newer = self._buffer.get(schema, {})
+            for execution_id, write in newer.items():
+                if execution_id in writes:
+                    writes[execution_id].merge_newer(write)
+                    self._pending -= 1
+                else:
+                    writes[execution_id] = write
+            self._buffer[schema] = writes
+            self._pending += len(writes)
+
+    @staticmethod
+    def _upsert_query(schema: str) -> str:
+        columns = ", ".join(name for name, _ in _ROW_COLUMNS)
+        arrays = ", ".join(f"${i}::{sql_type}[]" for i, (_, sql_type) in enumerate(_ROW_COLUMNS, 1))
+        selected = ", ".join(
+            f"{name}::platform_common.action_status" if name == "status" else name
+            for name, _ in _ROW_COLUMNS
+        )
+        updated = ",\n                ".join(
+            f"{name} = EXCLUDED.{name}" for name, _ in _UPSERT_COLUMNS
+        )
+        return f"""
+            INSERT INTO {schema}.action_executions ({columns})
+            SELECT {selected}
+            FROM unnest({arrays}) AS u({columns})
+            ON CONFLICT (id) DO UPDATE SET
+                {updated}
+        """
+
+    @staticmethod
+    def _update_query(schema: str) -> str:
+        array_columns = [("id", "uuid")] + _UPDATE_COLUMNS + [_START_GUARD]
+        columns = ", ".join(name for name, _ in array_columns)
+        arrays = ", ".join(
+            f"${i}::{sql_type}[]" for i, (_, sql_type) in enumerate(array_columns, 1)
+        )
+        assignments = ",\n                ".join(
+            f"{name} = COALESCE(u.{name}::platform_common.action_status, e.{name})" if name == "status"
+            else f"{name} = COALESCE(u.{name}, e.{name})"
+            for name, _ in _UPDATE_COLUMNS
+        )
+        return f"""
+            UPDATE {schema}.action_executions AS e SET
+                {assignments}
+            FROM unnest({arrays}) AS u({columns})
+            WHERE e.id = u.id
+              AND (NOT u.{_START_GUARD[0]} OR e.status = 'pending')
+        """
+
+    @staticmethod
+    def _row_arrays(rows: List[Dict[str, Any]]) -> List[List[Any]]:
+        return [[_column_value(name, row[name]) for row in rows] for name, _ in _ROW_COLUMNS]
+
+    @staticmethod
+    def _update_arrays(changes: List[Any]) -> List[List[Any]]:
+        arrays = [[execution_id for execution_id, _ in changes]]
+        for name, _ in _UPDATE_COLUMNS:
+            arrays.append([_column_value(name, values.get(name)) for _, values in changes])
+        arrays.append([bool(values.get(_START_GUARD[0])) for _, values in changes])
+        return arrays
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer statistics."""
+        return {
+            "pending": self._pending,
+            "writes": self._writes,
+            "flushes": self._flushes,
+            "failed_flushes": self._failed_flushes,
+            "writes_dropped": self._writes_dropped,
+            "rows_inserted": self._rows_inserted,
+            "rows_updated": self._rows_updated,
+            "transitions_skipped": self._transitions_skipped,
+            "coalesced_writes": (
+                self._writes - self._rows_inserted - self._rows_updated
+                - self._transitions_skipped - self._writes_dropped - self._pending
+            ),
+            "last_flush_ms": round(self._last_flush_ms, 2),
+        }
@@ -7,6 +7,7 @@ from .retry_policy import (
     ErrorClassifier,
     DEFAULT_RETRY_POLICIES,
 )
+from .durable_retry_scheduler import DurableRetryScheduler
 
 __all__ = [
     "BackoffType",
@@ -14,4 +15,5 @@ __all__ = [
     "RetryScheduler",
     "ErrorClassifier",
     "DEFAULT_RETRY_POLICIES",
+    "DurableRetryScheduler",
 ]
\ No newline at end of file
@@ -0,0 +1,338 @@
+"""Durable retry scheduler backed by a Redis sorted set.
+
+Pending retries are stored in Redis instead of as sleeping tasks: a sorted
+set scored by the due time (``next_retry_at`` in epoch milliseconds) and a
+hash with the JSON payload of each retry. A single timer loop claims due
+retries in batches and hands them to registered callbacks, so process
+memory stays flat however many retries are pending, and pending retries
+survive restarts.
+
+Claiming a retry moves its due time forward by ``lease_ms`` instead of
+deleting it; the retry is only removed once its callback finished. A worker
+that dies mid-retry therefore leaves the retry to be claimed again after the
+lease expires (at-least-once).
+
+Callbacks are registered by name because closures cannot be persisted::
+
+    scheduler = DurableRetryScheduler(redis_client)
+    scheduler.register_handler("action_retry", executor.run_retry)
+    scheduler.start()
+
+    await scheduler.schedule_retry(
+        execution_id, retry_policy, attempt_number, executor.run_retry, payload=payload
+    )
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from .retry_policy import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+RetryCallback = Callable[..., Awaitable[Any]]
+
+# Claim up to ARGV[2] retries due at ARGV[1]; push their due time to ARGV[3]
+_CLAIM_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+local claimed = {}
+for _, id in ipairs(due) do
+    redis.call('ZADD', KEYS[1], ARGV[3], id)
+    claimed[#claimed + 1] = id
+    claimed[#claimed + 1] = redis.call('HGET', KEYS[2], id)
+end
+return claimed
+"""
+
+# Remove a claimed retry unless it was rescheduled in the meantime
+_ACK_SCRIPT = """
+local score = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if score and tonumber(score) == tonumber(ARGV[2]) then
+    redis.call('ZREM', KEYS[1], ARGV[1])
+    redis.call('HDEL', KEYS[2], ARGV[1])
+    return 1
+end
+return 0
+"""
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class DurableRetryScheduler:
+    """Persistent delay queue for action retries."""
+
+    def __init__(
+        self,
+        redis_client,
+        key_prefix: str = "actions:retries",
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        lease_ms: int = 300000,
+        max_concurrency: int = 50,
+    ):
+        """Initialize durable retry scheduler.
+
+        Args:
+            redis_client: Redis client instance (redis.asyncio)
+            key_prefix: Prefix of the schedule and payload keys
+            batch_size: Maximum retries claimed per timer tick
+            poll_interval: Maximum seconds between timer ticks
+            lease_ms: Time after which a claimed but unfinished retry is
+                claimed again
+            max_concurrency: Maximum retry callbacks running at once
+        """
+        self.redis = redis_client
+        self.schedule_key = f"{key_prefix}:schedule"
+        self.payload_key = f"{key_prefix}:payloads"
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_ms = lease_ms
+
+        self._claim = redis_client.register_script(_CLAIM_SCRIPT)
+        self._ack = redis_client.register_script(_ACK_SCRIPT)
+
+        self._handlers: Dict[str, RetryCallback] = {}
+        self._handler_names: Dict[RetryCallback, str] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._in_flight: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._running = False
+
+        # Statistics
+        self._scheduled_count = 0
+        self._scheduled = 0
+        self._dispatched = 0
+        self._failed = 0
+
+    def register_handler(self, name: str, callback: RetryCallback) -> None:
+        """Register the callback run for retries scheduled under ``name``.
+
+        Args:
+            name: Stable name stored with each retry
+            callback: Coroutine function receiving the scheduled arguments
+        """
+        self._handlers[name] = callback
+        self._handler_names[callback] = name
+
+    async def schedule(
+        self,
+        execution_id: str,
+        handler: str,
+        delay_ms: int,
+        *callback_args,
+        **callback_kwargs
+    ) -> None:
+        """Schedule a registered handler to run after a delay.
+
+        Scheduling an execution again replaces its pending retry.
+
+        Args:
+            execution_id: Unique execution identifier
+            handler: Registered handler name
+            delay_ms: Delay in milliseconds
+            *callback_args: JSON-serializable arguments for the handler
+            **callback_kwargs: JSON-serializable keyword arguments
+        """
+        if handler not in self._handlers:
+            raise ValueError(f"Retry handler '{handler}' is not registered")
+
+        payload = json.dumps(
+            {"handler": handler, "args": callback_args, "kwargs": callback_kwargs},
+            default=str,
+        )
+        due_ms = _now_ms() + max(0, int(delay_ms))
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hset(self.payload_key, execution_id, payload)
+        pipe.zadd(self.schedule_key, {execution_id: due_ms})
+        await pipe.execute()
+
+        self._scheduled += 1
+        if delay_ms <= self.poll_interval * 1000:
+            self._wakeup.set()
+
+    async def schedule_retry(
+        self,
+        execution_id: str,
+        retry_policy: RetryPolicy,
+        attempt_number: int,
+        retry_callback: RetryCallback,
+        *callback_args,
+        **callback_kwargs
+    ) -> bool:
+        """
+        Schedule a retry for an execution.
+
+        Same contract as ``RetryScheduler.schedule_retry``, except that
+        ``retry_callback`` must be registered and its arguments must be
+        JSON-serializable.
+
+        Args:
+            execution_id: Unique execution identifier
+            retry_policy: Retry policy to follow
+            attempt_number: Current attempt number (1-based)
+            retry_callback: Registered function to call for retry
+            *callback_args: Arguments for retry callback
+            **callback_kwargs: Keyword arguments for retry callback
+
+        Returns:
+            True if retry was scheduled, False if no more retries
+        """
+        error_type = callback_kwargs.pop("error_type", "handler_error")
+
+        if not retry_policy.should_retry(attempt_number, error_type):
+            return False
+
+        handler = self._handler_names.get(retry_callback)
+        if handler is None:
+            raise ValueError(f"Retry callback {retry_callback!r} is not registered")
+
+        delay_ms = retry_policy.calculate_delay(attempt_number)
+        await self.schedule(execution_id, handler, delay_ms, *callback_args, **callback_kwargs)
+        return True
+
+    async def cancel_retry(self, execution_id: str) -> bool:
+        """
+        Cancel a scheduled retry.
+
+        Args:
+            execution_id: Execution ID to cancel
+
+        Returns:
+            True if retry was cancelled, False if no retry was scheduled
+        """
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zrem(self.schedule_key, execution_id)
+        pipe.hdel(self.payload_key, execution_id)
+        removed, _ = await pipe.execute()
+        return bool(removed)
+
+    async def count_scheduled(self) -> int:
+        """Number of pending retries, including claimed ones."""
+        self._scheduled_count = await self.redis.zcard(self.schedule_key)
+        return self._scheduled_count
+
+    def get_scheduled_count(self) -> int:
+        """Number of pending retries as of the last timer tick."""
+        return self._scheduled_count
+
+    def get_scheduled_executions(self) -> List[str]:
+        """Execution IDs whose retries are running in this process."""
+        return list(self._in_flight)
+
+    def start(self) -> None:
+        """Start the timer loop."""
+        if self._task is None or self._task.done():
+            self._running = True
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Started durable retry scheduler on {self.schedule_key}")
+
+    async def shutdown(self) -> None:
+        """Stop the timer loop and wait for running retries.
+
+        Pending retries stay in Redis and run after the next start.
+        """
+        self._running = False
+        self._wakeup.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info(f"Stopped durable retry scheduler on {self.schedule_key}")
+
+    async def run_due(self) -> int:
+        """Claim and start one batch of due retries.
+
+        Returns:
+            Number of retries claimed
+        """
+        now = _now_ms()
+        lease_until = now + self.lease_ms
+        claimed = await self._claim(
+            keys=[self.schedule_key, self.payload_key],
+            args=[now, self.batch_size, lease_until],
+        )
+
+        for i in range(0, len(claimed), 2):
+            execution_id = claimed[i]
+            if isinstance(execution_id, bytes):
+                execution_id = execution_id.decode()
+            await self._semaphore.acquire()
+            task = asyncio.create_task(self._dispatch(execution_id, claimed[i + 1], lease_until))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        return len(claimed) // 2
+
+    async def _run(self) -> None:
+        """Timer loop: claim due retries, then sleep until the next one is due."""
+        while self._running:
+            try:
+                if await self.run_due() >= self.batch_size:
+                    continue
+                delay = await self._next_delay()
+            except Exception as e:
+                logger.error(f"Retry scheduler tick failed: {e}")
+                delay = self.poll_interval
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _next_delay(self) -> float:
+        """Seconds until the earliest pending retry, capped at ``poll_interval``."""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zrange(self.schedule_key, 0, 0, withscores=True)
+        pipe.zcard(self.schedule_key)
+        earliest, self._scheduled_count = await pipe.execute()
+        if not earliest:
+            return self.poll_interval
+        return min(self.poll_interval, max(0.0, (earliest[0][1] - _now_ms()) / 1000))
+
+    async def _dispatch(self, execution_id: str, payload: Optional[bytes], lease_until: int) -> None:
+        """Run one claimed retry and remove it once finished."""
+        self._in_flight.add(execution_id)
+        try:
+            if payload is None:
+                logger.warning(f"Dropping retry {execution_id} without payload")
+            else:
+                data = json.loads(payload)
+                callback = self._handlers.get(data["handler"])
+                if callback is None:
+                    # Leave it for a process that has the handler registered
+                    logger.error(f"No handler '{data['handler']}' registered for retry {execution_id}")
+                    return
+                try:
+                    await callback(*data["args"], **data["kwargs"])
+                    self._dispatched += 1
+                except Exception as e:
+                    self._failed += 1
+                    logger.error(f"Retry {execution_id} failed: {e}")
+
+            await self._ack(keys=[self.schedule_key, self.payload_key], args=[execution_id, lease_until])
+        except Exception as e:
+            logger.error(f"Failed to complete retry {execution_id}: {e}")
+        finally:
+            self._in_flight.discard(execution_id)
+            self._semaphore.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics."""
+        return {
+            "pending": self._scheduled_count,
+            "in_flight": len(self._in_flight),
+            "scheduled": self._scheduled,
+            "dispatched": self._dispatched,
+            "failed": self._failed,
+            "handlers": list(self._handlers),
+        }
@@ -25,6 +25,7 @@ class RetryPolicy:
     initial_delay_ms: int
     max_delay_ms: int = 60000  # 1 minute max
     jitter: bool = True
+    jitter_ratio: float = 0.1  # Spread of the jitter as a fraction of the delay
     retry_on_timeout: bool = True
     retry_on_handler_error: bool = True
     retry_on_system_error: bool = False  # Network, DB issues
@@ -37,6 +38,8 @@ class RetryPolicy:
             raise ValueError("initial_delay_ms must be non-negative")
         if self.max_delay_ms < self.initial_delay_ms:
             raise ValueError("max_delay_ms must be >= initial_delay_ms")
+        if not 0 <= self.jitter_ratio <= 1:
+            raise ValueError("jitter_ratio must be between 0 and 1")
     
     def calculate_delay(self, attempt: int) -> int:
         """
@@ -63,7 +66,7 @@ class RetryPolicy:
         
         # Add jitter to prevent thundering herd
         if self.jitter and delay > 0:
-            jitter_range = int(delay * 0.1)  # 10% jitter
+            jitter_range = int(delay * self.jitter_ratio)
             delay += random.randint(-jitter_range, jitter_range)
             delay = max(0, delay)  # Ensure non-negative
         
@@ -107,6 +110,7 @@ class RetryPolicy:
             initial_delay_ms=data.get("initial_delay_ms", 1000),
             max_delay_ms=data.get("max_delay_ms", 60000),
             jitter=data.get("jitter", True),
+            jitter_ratio=data.get("jitter_ratio", 0.1),
             retry_on_timeout=data.get("retry_on_timeout", True),
             retry_on_handler_error=data.get("retry_on_handler_error", True),
             retry_on_system_error=data.get("retry_on_system_error", False)
@@ -120,6 +124,7 @@ class RetryPolicy:
             "initial_delay_ms": self.initial_delay_ms,
             "max_delay_ms": self.max_delay_ms,
             "jitter": self.jitter,
+            "jitter_ratio": self.jitter_ratio,
             "retry_on_timeout": self.retry_on_timeout,
             "retry_on_handler_error": self.retry_on_handler_error,
             "retry_on_system_error": self.retry_on_system_error
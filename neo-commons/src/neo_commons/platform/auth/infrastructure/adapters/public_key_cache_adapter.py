@@ -80,14 +80,14 @@ class PublicKeyCacheAdapter:
         cache_key = self._make_cache_key(realm_id, key_id)
         
         try:
-            logger.debug(f"Getting public key from cache: {cache_key}")
+            logger.debug("Getting public key from cache: %s", cache_key)
             
             # Get cached data
             cached_data = await self.cache_client.get(cache_key)
             
             if cached_data is None:
                 self._misses += 1
-                logger.debug(f"Public key cache miss: {cache_key}")
+                logger.debug("Public key cache miss: %s", cache_key)
                 return None
             
             # Parse cached data
@@ -99,7 +99,7 @@ class PublicKeyCacheAdapter:
             if "expires_at" in cached_data:
                 expires_at = datetime.fromisoformat(cached_data["expires_at"])
                 if expires_at <= datetime.now(timezone.utc):
-                    logger.debug(f"Cached public key expired: {cache_key}")
+                    logger.debug("Cached public key expired: %s", cache_key)
                     await self.invalidate_public_key(realm_id, key_id)
                     self._misses += 1
                     return None
@@ -112,7 +112,7 @@ class PublicKeyCacheAdapter:
             )
             
             self._hits += 1
-            logger.debug(f"Public key cache hit: {cache_key}")
+            logger.debug("Public key cache hit: %s", cache_key)
             return public_key
             
         except Exception as e:
@@ -139,7 +139,7 @@ class PublicKeyCacheAdapter:
         ttl = ttl_seconds or self.default_ttl_seconds
         
         try:
-            logger.debug(f"Storing public key in cache: {cache_key} with TTL {ttl}s")
+            logger.debug("Storing public key in cache: %s with TTL %ss", cache_key, ttl)
             
             # Prepare cache data
             cache_data = {
@@ -160,7 +160,7 @@ class PublicKeyCacheAdapter:
                 ttl=ttl
             )
             
-            logger.debug(f"Successfully stored public key in cache: {cache_key}")
+            logger.debug("Successfully stored public key in cache: %s", cache_key)
             
         except Exception as e:
             logger.error(f"Failed to store public key in cache {cache_key}: {e}")
@@ -190,15 +190,15 @@ class PublicKeyCacheAdapter:
         cache_key = self._make_cache_key(realm_id, key_id)
         
         try:
-            logger.debug(f"Invalidating public key in cache: {cache_key}")
+            logger.debug("Invalidating public key in cache: %s", cache_key)
             
             result = await self.cache_client.delete(cache_key)
             
             if result:
-                logger.debug(f"Successfully invalidated public key: {cache_key}")
+                logger.debug("Successfully invalidated public key: %s", cache_key)
                 self._evictions += 1
             else:
-                logger.debug(f"Public key not found for invalidation: {cache_key}")
+                logger.debug("Public key not found for invalidation: %s", cache_key)
             
             return bool(result)
             
@@ -219,7 +219,7 @@ class PublicKeyCacheAdapter:
             Number of keys invalidated
         """
         try:
-            logger.info(f"Invalidating all public keys for realm: {realm_id.value}")
+            logger.info("Invalidating all public keys for realm: %s", realm_id.value)
             
             # Get all keys for this realm
             pattern = f"{self.key_prefix}:{realm_id.value}:*"
@@ -247,7 +247,7 @@ class PublicKeyCacheAdapter:
                     logger.warning(f"Failed to delete key {key}: {e}")
                     continue
             
-            logger.info(f"Invalidated {deleted_count} public keys for realm: {realm_id.value}")
+            logger.info("Invalidated %s public keys for realm: %s", deleted_count, realm_id.value)
             self._evictions += deleted_count
             return deleted_count
             
@@ -277,7 +277,7 @@ class PublicKeyCacheAdapter:
             PublicKeyError: If refresh fails
         """
         try:
-            logger.debug(f"Refreshing public key for realm: {realm_id.value}")
+            logger.debug("Refreshing public key for realm: %s", realm_id.value)
             
             # Get fresh key from provider
             if callable(key_provider):
@@ -309,7 +309,7 @@ class PublicKeyCacheAdapter:
             # Store refreshed key in cache
             await self.store_public_key(realm_id, public_key, key_id, ttl_seconds)
             
-            logger.debug(f"Successfully refreshed public key for realm: {realm_id.value}")
+            logger.debug("Successfully refreshed public key for realm: %s", realm_id.value)
             return public_key
             
         except PublicKeyError:
@@ -343,7 +343,7 @@ class PublicKeyCacheAdapter:
         cached_count = 0
         
         try:
-            logger.info(f"Warming public key cache with {len(realm_keys)} realms")
+            logger.info("Warming public key cache with %s realms", len(realm_keys))
             
             for realm_id, key_data in realm_keys.items():
                 try:
@@ -368,7 +368,7 @@ class PublicKeyCacheAdapter:
                     logger.warning(f"Failed to warm cache for realm {realm_id.value}: {e}")
                     continue
             
-            logger.info(f"Successfully warmed cache with {cached_count} public keys")
+            logger.info("Successfully warmed cache with %s public keys", cached_count)
             return cached_count
             
         except Exception as e:
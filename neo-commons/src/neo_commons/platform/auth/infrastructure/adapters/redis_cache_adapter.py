@@ -115,16 +115,16 @@ class RedisCacheAdapter:
         
         try:
             self._operations += 1
-            logger.debug(f"Getting value from Redis cache: {cache_key}")
+            logger.debug("Getting value from Redis cache: %s", cache_key)
             
             data = await self.redis_client.get(cache_key)
             
             if data is None:
-                logger.debug(f"Cache miss: {cache_key}")
+                logger.debug("Cache miss: %s", cache_key)
                 return None
             
             value = self._deserialize_value(data)
-            logger.debug(f"Cache hit: {cache_key}")
+            logger.debug("Cache hit: %s", cache_key)
             return value
             
         except Exception as e:
@@ -153,7 +153,7 @@ class RedisCacheAdapter:
         
         try:
             self._operations += 1
-            logger.debug(f"Setting value in Redis cache: {cache_key} with TTL {ttl}s")
+            logger.debug("Setting value in Redis cache: %s with TTL %ss", cache_key, ttl)
             
             serialized_data = self._serialize_value(value)
             
@@ -162,7 +162,7 @@ class RedisCacheAdapter:
             else:
                 result = await self.redis_client.set(cache_key, serialized_data)
             
-            logger.debug(f"Successfully set cache value: {cache_key}")
+            logger.debug("Successfully set cache value: %s", cache_key)
             return True
             
         except CacheError:
@@ -189,14 +189,14 @@ class RedisCacheAdapter:
         
         try:
             self._operations += 1
-            logger.debug(f"Deleting value from Redis cache: {cache_key}")
+            logger.debug("Deleting value from Redis cache: %s", cache_key)
             
             result = await self.redis_client.delete(cache_key)
             
             if result:
-                logger.debug(f"Successfully deleted cache value: {cache_key}")
+                logger.debug("Successfully deleted cache value: %s", cache_key)
             else:
-                logger.debug(f"Cache value not found for deletion: {cache_key}")
+                logger.debug("Cache value not found for deletion: %s", cache_key)
             
             return bool(result)
             
@@ -240,14 +240,14 @@ class RedisCacheAdapter:
         
         try:
             self._operations += 1
-            logger.debug(f"Setting TTL for cache key: {cache_key} to {ttl}s")
+            logger.debug("Setting TTL for cache key: %s to %ss", cache_key, ttl)
             
             result = await self.redis_client.expire(cache_key, ttl)
             
             if result:
-                logger.debug(f"Successfully set TTL for cache key: {cache_key}")
+                logger.debug("Successfully set TTL for cache key: %s", cache_key)
             else:
-                logger.debug(f"Cache key not found for TTL setting: {cache_key}")
+                logger.debug("Cache key not found for TTL setting: %s", cache_key)
             
             return bool(result)
             
@@ -291,11 +291,11 @@ class RedisCacheAdapter:
         
         try:
             self._operations += 1
-            logger.debug(f"Incrementing cache value: {cache_key} by {amount}")
+            logger.debug("Incrementing cache value: %s by %s", cache_key, amount)
             
             result = await self.redis_client.incrby(cache_key, amount)
             
-            logger.debug(f"Successfully incremented cache value: {cache_key} to {result}")
+            logger.debug("Successfully incremented cache value: %s to %s", cache_key, result)
             return result
             
         except Exception as e:
@@ -334,7 +334,7 @@ class RedisCacheAdapter:
         
         try:
             self._operations += 1
-            logger.debug(f"Getting multiple values from Redis cache: {len(keys)} keys")
+            logger.debug("Getting multiple values from Redis cache: %s keys", len(keys))
             
             values = await self.redis_client.mget(*cache_keys)
             
@@ -347,7 +347,7 @@ class RedisCacheAdapter:
                         logger.warning(f"Failed to deserialize cached value for {original_key}: {e}")
                         continue
             
-            logger.debug(f"Successfully retrieved {len(result)} values from cache")
+            logger.debug("Successfully retrieved %s values from cache", len(result))
             return result
             
         except Exception as e:
@@ -376,7 +376,7 @@ class RedisCacheAdapter:
         
         try:
             self._operations += 1
-            logger.debug(f"Setting multiple values in Redis cache: {len(items)} items with TTL {ttl}s")
+            logger.debug("Setting multiple values in Redis cache: %s items with TTL %ss", len(items), ttl)
             
             # Use pipeline for atomic operations
             pipe = self.redis_client.pipeline()
@@ -392,7 +392,7 @@ class RedisCacheAdapter:
             
             await pipe.execute()
             
-            logger.debug(f"Successfully set {len(items)} cache values")
+            logger.debug("Successfully set %s cache values", len(items))
             return True
             
         except Exception as e:
@@ -419,11 +419,11 @@ class RedisCacheAdapter:
         
         try:
             self._operations += 1
-            logger.debug(f"Deleting multiple values from Redis cache: {len(keys)} keys")
+            logger.debug("Deleting multiple values from Redis cache: %s keys", len(keys))
             
             result = await self.redis_client.delete(*cache_keys)
             
-            logger.debug(f"Successfully deleted {result} cache values")
+            logger.debug("Successfully deleted %s cache values", result)
             return result
             
         except Exception as e:
@@ -496,7 +496,7 @@ class RedisCacheAdapter:
         
         try:
             self._operations += 1
-            logger.debug(f"Getting cache keys matching pattern: {full_pattern}")
+            logger.debug("Getting cache keys matching pattern: %s", full_pattern)
             
             keys = []
             prefix_len = len(self.key_prefix) + 1  # +1 for the colon separator
@@ -508,7 +508,7 @@ class RedisCacheAdapter:
                     original_key = key_str[prefix_len:]
                     keys.append(original_key)
             
-            logger.debug(f"Found {len(keys)} cache keys matching pattern: {pattern}")
+            logger.debug("Found %s cache keys matching pattern: %s", len(keys), pattern)
             return keys
             
         except Exception as e:
@@ -234,7 +234,7 @@ class MemoryTokenCache:
             # Perform eviction if needed
             await self._evict_if_needed()
             
-            logger.debug(f"Cached token validation: {cache_key}")
+            logger.debug("Cached token validation: %s", cache_key)
     
     async def get_token_validation(
         self,
@@ -271,7 +271,7 @@ class MemoryTokenCache:
             self._cache.move_to_end(cache_key)
             self._hits += 1
             
-            logger.debug(f"Token validation cache hit: {cache_key}")
+            logger.debug("Token validation cache hit: %s", cache_key)
             return entry.data
     
     async def put_public_key(
@@ -321,7 +321,7 @@ class MemoryTokenCache:
             
             await self._evict_if_needed()
             
-            logger.debug(f"Cached public key: {cache_key}")
+            logger.debug("Cached public key: %s", cache_key)
     
     async def get_public_key(
         self,
@@ -362,7 +362,7 @@ class MemoryTokenCache:
                 algorithm=key_data.get("algorithm")
             )
             
-            logger.debug(f"Public key cache hit: {cache_key}")
+            logger.debug("Public key cache hit: %s", cache_key)
             return public_key
     
     async def invalidate_user_tokens(self, user_id: UserId) -> int:
@@ -390,7 +390,7 @@ class MemoryTokenCache:
             
             del self._user_tokens[user_key]
             
-            logger.debug(f"Invalidated {count} tokens for user {user_id.value}")
+            logger.debug("Invalidated %s tokens for user %s", count, user_id.value)
             return count
     
     async def invalidate_tenant_tokens(self, tenant_id: TenantId) -> int:
@@ -418,7 +418,7 @@ class MemoryTokenCache:
             
             del self._tenant_tokens[tenant_key]
             
-            logger.debug(f"Invalidated {count} tokens for tenant {tenant_id.value}")
+            logger.debug("Invalidated %s tokens for tenant %s", count, tenant_id.value)
             return count
     
     async def clear(self) -> None:
@@ -476,7 +476,7 @@ class MemoryTokenCache:
                 await self._remove_entry(key)
             
             if expired_keys:
-                logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
+                logger.debug("Cleaned up %s expired cache entries", len(expired_keys))
             
             return len(expired_keys)
     
@@ -504,7 +504,7 @@ class MemoryTokenCache:
             self._evictions += 1
         
         if evicted > 0:
-            logger.debug(f"Evicted {evicted} cache entries due to size/memory limits")
+            logger.debug("Evicted %s cache entries due to size/memory limits", evicted)
         
         return evicted
     
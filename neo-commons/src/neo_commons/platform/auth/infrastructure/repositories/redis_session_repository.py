@@ -2,8 +2,14 @@
 
 import json
 import logging
+import time
 from typing import Dict, List, Optional, Any, Set
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 from .....core.value_objects.identifiers import UserId, TenantId
 from ...core.value_objects import SessionId
@@ -13,90 +19,210 @@ from ...core.exceptions import SessionInvalid, AuthenticationFailed
 logger = logging.getLogger(__name__)
 
 
+# Encoded session payloads start with a 2-byte codec marker; legacy JSON
+# objects (written before the compact format) start with "{".
+_MSGPACK_V1 = b"M1"
+_JSON_V1 = b"J1"
+
+# Index maintenance: add a member scored by expiry, trim expired members and
+# keep the index TTL aligned with its longest-lived member.
+# KEYS = index keys, ARGV[1] = expiry score ("+inf" for no expiry),
+# ARGV[2] = now (epoch seconds), ARGV[2 + i] = member for KEYS[i]
+_INDEX_ADD_SCRIPT = """
+for i, key in ipairs(KEYS) do
+  redis.call('ZREMRANGEBYSCORE', key, '-inf', ARGV[2])
+  redis.call('ZADD', key, ARGV[1], ARGV[i + 2])
+  local last = redis.call('ZRANGE', key, -1, -1, 'WITHSCORES')
+  if last[2] == 'inf' then
+    redis.call('PERSIST', key)
+  else
+    redis.call('EXPIREAT', key, math.ceil(tonumber(last[2])) + 1)
+  end
+end
+return #KEYS
+"""
+
+# Sorted-set indexes live under their own key names: the original indexes were
+# plain sets under the suffix-less names (tenant members without the user ID)
+_INDEX_SUFFIX = ":z"
+
+
+def _to_epoch_ms(value: Optional[datetime]) -> Optional[int]:
+    """Convert datetime to integer epoch milliseconds."""
+    return int(value.timestamp() * 1000) if value else None
+
+
+def _from_epoch_ms(value: Optional[int]) -> Optional[datetime]:
+    """Convert integer epoch milliseconds to UTC datetime."""
+    return datetime.fromtimestamp(value / 1000, tz=timezone.utc) if value is not None else None
+
+
 class RedisSessionRepository:
     """Redis session repository following maximum separation principle.
     
     Handles ONLY Redis session storage operations for authentication platform.
     Does not handle session validation logic, user management, or token operations.
+    
+    Storage layout:
+    - ``{prefix}:{session_id}``: compact encoded session with the session TTL
+    - ``{prefix}:user:{user_id}:{scope}:z``: sorted set of session IDs scored by expiry
+    - ``{prefix}:tenant:{tenant_id}:z``: sorted set of ``{user_id}:{session_id}`` scored by expiry
+    
+    Scoring indexes by expiry lets stale members be trimmed with
+    ZREMRANGEBYSCORE instead of reading the sessions they point to.
+    
+    Indexes written in the original set format (same names without ``:z``)
+    are migrated into the sorted sets when read, and by
+    ``cleanup_expired_sessions``.
     """
     
     def __init__(self, redis_client, key_prefix: str = "auth_session"):
         """Initialize Redis session repository.
         
         Args:
-            redis_client: Redis client instance
+            redis_client: Redis client instance (binary responses, i.e. decode_responses=False)
             key_prefix: Prefix for session keys in Redis
         """
         if not redis_client:
             raise ValueError("Redis client is required")
+        pool = getattr(redis_client, "connection_pool", None)
+        if getattr(pool, "connection_kwargs", {}).get("decode_responses"):
+            # Sessions are stored as binary msgpack, which a text-mode client cannot read back
+            raise ValueError("Redis client must be created with decode_responses=False")
         self.redis = redis_client
         self.key_prefix = key_prefix
+        self._index_add = redis_client.register_script(_INDEX_ADD_SCRIPT)
     
     def _make_session_key(self, session_id: SessionId) -> str:
         """Create Redis key for session.
         
         Args:
             session_id: Session identifier
-            
+        
         Returns:
             Redis key string
         """
         return f"{self.key_prefix}:{session_id.value}"
     
     def _make_user_sessions_key(self, user_id: UserId, tenant_id: Optional[TenantId] = None) -> str:
-        """Create Redis key for user sessions set.
+        """Create Redis key for user sessions index.
         
         Args:
             user_id: User identifier
             tenant_id: Optional tenant identifier for scoping
-            
+        
         Returns:
             Redis key string
         """
         if tenant_id:
-            return f"{self.key_prefix}:user:{user_id.value}:tenant:{tenant_id.value}"
+            return f"{self.key_prefix}:user:{user_id.value}:tenant:{tenant_id.value}{_INDEX_SUFFIX}"
         else:
-            return f"{self.key_prefix}:user:{user_id.value}:global"
+            return f"{self.key_prefix}:user:{user_id.value}:global{_INDEX_SUFFIX}"
     
     def _make_tenant_sessions_key(self, tenant_id: TenantId) -> str:
-        """Create Redis key for tenant sessions set.
+        """Create Redis key for tenant sessions index.
         
         Args:
             tenant_id: Tenant identifier
-            
+        
         Returns:
             Redis key string
         """
-        return f"{self.key_prefix}:tenant:{tenant_id.value}"
+        return f"{self.key_prefix}:tenant:{tenant_id.value}{_INDEX_SUFFIX}"
     
-    def _serialize_session(self, session: AuthSession) -> str:
-        """Serialize session to JSON string for Redis storage.
+    @staticmethod
+    def _legacy_index_key(index_key: str) -> str:
+        """Name of the set-format index replaced by ``index_key``."""
+        return index_key[:-len(_INDEX_SUFFIX)]
+    
+    async def _migrate_legacy_index(self, index_key: str) -> int:
+        """Move a set-format index into its sorted-set replacement.
+        
+        Members are scored by the remaining TTL of their session key; members
+        whose session is gone are dropped. Tenant index members are rewritten
+        to ``{user_id}:{session_id}``.
+        
+        Args:
+            index_key: Sorted-set index key (the legacy key is its name without ``:z``)
+        
+        Returns:
+            Number of members migrated (0 if there was no legacy set)
+        """
+        legacy_key = self._legacy_index_key(index_key)
+        if self._decode(await self.redis.type(legacy_key)) != "set":
+            return 0
+        
+        session_ids = [self._decode(sid) for sid in await self.redis.smembers(legacy_key)]
+        tenant_index = legacy_key.startswith(f"{self.key_prefix}:tenant:")
+        
+        pipe = self.redis.pipeline(transaction=False)
+        for sid in session_ids:
+            pipe.pttl(f"{self.key_prefix}:{sid}")
+            if tenant_index:
+                pipe.get(f"{self.key_prefix}:{sid}")
+        results = await pipe.execute()
+        
+        now = time.time()
+        step = 2 if tenant_index else 1
+        migrated = 0
+        pipe = self.redis.pipeline(transaction=False)
+        for i, sid in enumerate(session_ids):
+            pttl = results[i * step]
+            if pttl == -2:
+                continue
+            member = sid
+            if tenant_index:
+                try:
+                    session = self._deserialize_session(results[i * step + 1])
+                except SessionInvalid:
+                    continue
+                member = f"{session.user_id.value}:{sid}"
+            score = str(now + pttl / 1000) if pttl >= 0 else "+inf"
+            await self._index_add(keys=[index_key], args=[score, now, member], client=pipe)
+            migrated += 1
+        pipe.delete(legacy_key)
+        await pipe.execute()
+        
+        logger.info(f"Migrated {migrated} session index entries from {legacy_key}")
+        return migrated
+    
+    @staticmethod
+    def _decode(value: Any) -> str:
+        """Decode a Redis response value to str."""
+        return value.decode() if isinstance(value, bytes) else value
+    
+    def _serialize_session(self, session: AuthSession) -> bytes:
+        """Serialize session to the compact positional encoding.
         
         Args:
             session: Auth session to serialize
-            
+        
         Returns:
-            JSON string representation
+            Encoded bytes (msgpack when available, JSON array otherwise)
         """
         try:
-            session_data = {
-                "session_id": str(session.session_id.value),
-                "user_id": str(session.user_id.value),
-                "tenant_id": str(session.tenant_id.value) if session.tenant_id else None,
-                "realm_id": str(session.realm_id.value) if session.realm_id else None,
-                "ip_address": session.ip_address,
-                "user_agent": session.user_agent,
-                "device_info": session.device_info or {},
-                "created_at": session.created_at.isoformat(),
-                "last_activity_at": session.last_activity_at.isoformat(),
-                "expires_at": session.expires_at.isoformat() if session.expires_at else None,
-                "risk_score": session.risk_score,
-                "mfa_verified": session.mfa_verified,
-                "mfa_verified_at": session.mfa_verified_at.isoformat() if session.mfa_verified_at else None,
-                "metadata": session.metadata or {},
-                "revoked_at": session.revoked_at.isoformat() if session.revoked_at else None
-            }
-            return json.dumps(session_data, default=str)
+            fields = [
+                session.session_id.value,
+                str(session.user_id.value),
+                str(session.tenant_id.value) if session.tenant_id else None,
+                _to_epoch_ms(session.created_at),
+                _to_epoch_ms(session.expires_at),
+                _to_epoch_ms(session.last_activity_at),
+                session.is_active,
+                _to_epoch_ms(session.revoked_at),
+                session.revoke_reason,
+                session.ip_address,
+                session.user_agent,
+                session.device_info or None,
+                session.authentication_method,
+                session.mfa_verified,
+                session.risk_score,
+                session.session_data or None,
+                sorted(session.tags) if session.tags else None,
+            ]
+            if msgpack is not None:
+                return _MSGPACK_V1 + msgpack.packb(fields, use_bin_type=True, default=str)
+            return _JSON_V1 + json.dumps(fields, separators=(",", ":"), default=str).encode()
         except Exception as e:
             logger.error(f"Failed to serialize session {session.session_id.value}: {e}")
             raise SessionInvalid(
@@ -104,51 +230,57 @@ class RedisSessionRepository:
                 context={"session_id": str(session.session_id.value), "error": str(e)}
             )
     
-    def _deserialize_session(self, session_data: str) -> AuthSession:
-        """Deserialize session from JSON string.
+    def _deserialize_session(self, session_data: bytes) -> AuthSession:
+        """Deserialize session from its stored encoding.
         
         Args:
-            session_data: JSON string representation
-            
+            session_data: Stored bytes (compact or legacy JSON object)
+        
         Returns:
             Auth session object
         """
         try:
-            data = json.loads(session_data)
-            
-            # Parse timestamps
-            created_at = datetime.fromisoformat(data["created_at"].replace('Z', '+00:00'))
-            last_activity_at = datetime.fromisoformat(data["last_activity_at"].replace('Z', '+00:00'))
-            expires_at = None
-            if data.get("expires_at"):
-                expires_at = datetime.fromisoformat(data["expires_at"].replace('Z', '+00:00'))
-            
-            mfa_verified_at = None
-            if data.get("mfa_verified_at"):
-                mfa_verified_at = datetime.fromisoformat(data["mfa_verified_at"].replace('Z', '+00:00'))
+            if isinstance(session_data, str):
+                session_data = session_data.encode()
+            
+            marker = session_data[:2]
+            if marker == _MSGPACK_V1:
+                if msgpack is None:
+                    raise SessionInvalid("msgpack is required to decode stored session")
+                fields = msgpack.unpackb(session_data[2:], raw=False)
+            elif marker == _JSON_V1:
+                fields = json.loads(session_data[2:])
+            else:
+                return self._deserialize_legacy_session(session_data)
             
-            revoked_at = None
-            if data.get("revoked_at"):
-                revoked_at = datetime.fromisoformat(data["revoked_at"].replace('Z', '+00:00'))
+            (
+                session_id, user_id, tenant_id, created_at, expires_at, last_activity_at,
+                is_active, revoked_at, revoke_reason, ip_address, user_agent, device_info,
+                authentication_method, mfa_verified, risk_score, session_data_map, tags,
+            ) = fields
             
             return AuthSession(
-                session_id=SessionId(data["session_id"]),
-                user_id=UserId(data["user_id"]),
-                tenant_id=TenantId(data["tenant_id"]) if data.get("tenant_id") else None,
-                realm_id=data.get("realm_id"),
-                ip_address=data.get("ip_address"),
-                user_agent=data.get("user_agent"),
-                device_info=data.get("device_info", {}),
-                created_at=created_at,
-                last_activity_at=last_activity_at,
-                expires_at=expires_at,
-                risk_score=data.get("risk_score", 0.0),
-                mfa_verified=data.get("mfa_verified", False),
-                mfa_verified_at=mfa_verified_at,
-                metadata=data.get("metadata", {}),
-                revoked_at=revoked_at
+                session_id=SessionId(session_id),
+                user_id=UserId(user_id),
+                tenant_id=TenantId(tenant_id) if tenant_id else None,
+                created_at=_from_epoch_ms(created_at),
+                expires_at=_from_epoch_ms(expires_at),
+                last_activity_at=_from_epoch_ms(last_activity_at),
+                is_active=is_active,
+                revoked_at=_from_epoch_ms(revoked_at),
+                revoke_reason=revoke_reason,
+                ip_address=ip_address,
+                user_agent=user_agent,
+                device_info=device_info or {},
+                authentication_method=authentication_method,
+                mfa_verified=mfa_verified,
+                risk_score=risk_score,
+                session_data=session_data_map or {},
+                tags=set(tags or ()),
             )
-            
+        
+        except SessionInvalid:
+            raise
         except Exception as e:
             logger.error(f"Failed to deserialize session data: {e}")
             raise SessionInvalid(
@@ -156,12 +288,35 @@ class RedisSessionRepository:
                 context={"error": str(e)}
             )
     
+    def _deserialize_legacy_session(self, session_data: bytes) -> AuthSession:
+        """Deserialize a session stored in the original JSON object format."""
+        data = json.loads(session_data)
+        
+        def parse_ts(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')) if value else None
+        
+        return AuthSession(
+            session_id=SessionId(data["session_id"]),
+            user_id=UserId(data["user_id"]),
+            tenant_id=TenantId(data["tenant_id"]) if data.get("tenant_id") else None,
+            ip_address=data.get("ip_address"),
+            user_agent=data.get("user_agent"),
+            device_info=data.get("device_info", {}),
+            created_at=parse_ts(data["created_at"]),
+            last_activity_at=parse_ts(data["last_activity_at"]),
+            expires_at=parse_ts(data.get("expires_at")),
+            risk_score=data.get("risk_score", 0.0),
+            mfa_verified=data.get("mfa_verified", False),
+            session_data=data.get("metadata", {}),
+            revoked_at=parse_ts(data.get("revoked_at")),
+        )
+    
     async def store_session(
         self,
         session: AuthSession,
         ttl_seconds: Optional[int] = None
     ) -> None:
-        """Store session in Redis.
+        """Store session in Redis and add it to the user/tenant indexes.
         
         Args:
             session: Auth session to store
@@ -169,43 +324,48 @@ class RedisSessionRepository:
         """
         session_key = self._make_session_key(session.session_id)
         user_sessions_key = self._make_user_sessions_key(session.user_id, session.tenant_id)
+        session_id = session.session_id.value
         
         try:
             # Serialize session
             session_data = self._serialize_session(session)
             
             # Calculate TTL
+            now = time.time()
             if ttl_seconds is None and session.expires_at:
-                ttl_seconds = max(1, int((session.expires_at - datetime.now(timezone.utc)).total_seconds()))
+                ttl_seconds = max(1, int(session.expires_at.timestamp() - now))
             
-            # Store session data with pipeline for atomic operations
-            pipe = self.redis.pipeline()
+            expiry_score = str(now + ttl_seconds) if ttl_seconds and ttl_seconds > 0 else "+inf"
+            
+            index_keys = [user_sessions_key]
+            index_members = [session_id]
+            if session.tenant_id:
+                index_keys.append(self._make_tenant_sessions_key(session.tenant_id))
+                index_members.append(f"{session.user_id.value}:{session_id}")
+            
+            # Store session and maintain indexes in one round trip
+            pipe = self.redis.pipeline(transaction=False)
             
             if ttl_seconds and ttl_seconds > 0:
                 pipe.setex(session_key, ttl_seconds, session_data)
-                # Add to user sessions set with same TTL
-                pipe.sadd(user_sessions_key, str(session.session_id.value))
-                pipe.expire(user_sessions_key, ttl_seconds)
             else:
                 pipe.set(session_key, session_data)
-                pipe.sadd(user_sessions_key, str(session.session_id.value))
             
-            # Add to tenant sessions if tenant_id exists
-            if session.tenant_id:
-                tenant_sessions_key = self._make_tenant_sessions_key(session.tenant_id)
-                pipe.sadd(tenant_sessions_key, str(session.session_id.value))
-                if ttl_seconds and ttl_seconds > 0:
-                    pipe.expire(tenant_sessions_key, ttl_seconds)
+            await self._index_add(
+                keys=index_keys,
+                args=[expiry_score, now, *index_members],
+                client=pipe,
+            )
             
             await pipe.execute()
             
-            logger.debug(f"Stored session {session.session_id.value} with TTL {ttl_seconds}")
-            
+            logger.debug(f"Stored session {session_id} with TTL {ttl_seconds}")
+        
         except Exception as e:
-            logger.error(f"Failed to store session {session.session_id.value}: {e}")
+            logger.error(f"Failed to store session {session_id}: {e}")
             raise SessionInvalid(
                 "Session storage failed",
-                context={"session_id": str(session.session_id.value), "error": str(e)}
+                context={"session_id": str(session_id), "error": str(e)}
             )
     
     async def get_session(self, session_id: SessionId) -> Optional[AuthSession]:
@@ -213,7 +373,7 @@ class RedisSessionRepository:
         
         Args:
             session_id: Session identifier
-            
+        
         Returns:
             Auth session or None if not found
         """
@@ -225,7 +385,7 @@ class RedisSessionRepository:
                 return None
             
             return self._deserialize_session(session_data)
-            
+        
         except Exception as e:
             logger.error(f"Failed to get session {session_id.value}: {e}")
             return None
@@ -244,28 +404,21 @@ class RedisSessionRepository:
         session_key = self._make_session_key(session.session_id)
         
         try:
-            # Get current TTL if preserving
-            current_ttl = None
+            session_data = self._serialize_session(session)
+            
             if preserve_ttl:
-                current_ttl = await self.redis.ttl(session_key)
-                if current_ttl == -1:  # No expiration
-                    current_ttl = None
-                elif current_ttl == -2:  # Key doesn't exist
+                # Overwrite only if the session still exists, keeping its TTL
+                updated = await self.redis.set(session_key, session_data, xx=True, keepttl=True)
+                if not updated:
                     raise SessionInvalid(
                         "Session not found for update",
                         context={"session_id": str(session.session_id.value)}
                     )
-            
-            # Serialize and store updated session
-            session_data = self._serialize_session(session)
-            
-            if current_ttl and current_ttl > 0:
-                await self.redis.setex(session_key, current_ttl, session_data)
             else:
                 await self.redis.set(session_key, session_data)
             
             logger.debug(f"Updated session {session.session_id.value}")
-            
+        
         except SessionInvalid:
             # Re-raise session invalid exceptions
             raise
@@ -281,7 +434,7 @@ class RedisSessionRepository:
         
         Args:
             session_id: Session identifier
-            
+        
         Returns:
             True if session was deleted, False if not found
         """
@@ -291,17 +444,17 @@ class RedisSessionRepository:
             if not session:
                 return False
             
-            # Delete from all relevant sets
+            # Delete from all relevant indexes
             session_key = self._make_session_key(session_id)
             user_sessions_key = self._make_user_sessions_key(session.user_id, session.tenant_id)
             
-            pipe = self.redis.pipeline()
+            pipe = self.redis.pipeline(transaction=False)
             pipe.delete(session_key)
-            pipe.srem(user_sessions_key, str(session_id.value))
+            pipe.zrem(user_sessions_key, session_id.value)
             
             if session.tenant_id:
                 tenant_sessions_key = self._make_tenant_sessions_key(session.tenant_id)
-                pipe.srem(tenant_sessions_key, str(session_id.value))
+                pipe.zrem(tenant_sessions_key, f"{session.user_id.value}:{session_id.value}")
             
             results = await pipe.execute()
             deleted = results[0] > 0
@@ -310,7 +463,7 @@ class RedisSessionRepository:
                 logger.debug(f"Deleted session {session_id.value}")
             
             return deleted
-            
+        
         except Exception as e:
             logger.error(f"Failed to delete session {session_id.value}: {e}")
             return False
@@ -327,27 +480,34 @@ class RedisSessionRepository:
             user_id: User identifier
             tenant_id: Optional tenant identifier for scoping
             active_only: Whether to return only active sessions
-            
+        
         Returns:
             List of user sessions
         """
         user_sessions_key = self._make_user_sessions_key(user_id, tenant_id)
         
         try:
-            # Get session IDs from set
-            session_ids = await self.redis.smembers(user_sessions_key)
+            # Trim expired members and read the live ones in one round trip
+            now = time.time()
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.exists(self._legacy_index_key(user_sessions_key))
+            pipe.zremrangebyscore(user_sessions_key, "-inf", now)
+            pipe.zrange(user_sessions_key, 0, -1)
+            legacy, _, session_ids = await pipe.execute()
+            
+            if legacy and await self._migrate_legacy_index(user_sessions_key):
+                session_ids = await self.redis.zrange(user_sessions_key, 0, -1)
             
             if not session_ids:
                 return []
             
-            # Get all sessions in parallel
-            session_keys = [self._make_session_key(SessionId(sid.decode())) for sid in session_ids]
-            session_data_list = await self.redis.mget(*session_keys)
+            session_keys = [f"{self.key_prefix}:{self._decode(sid)}" for sid in session_ids]
+            session_data_list = await self.redis.mget(session_keys)
             
             sessions = []
             current_time = datetime.now(timezone.utc)
             
-            for i, session_data in enumerate(session_data_list):
+            for session_data in session_data_list:
                 if not session_data:
                     continue
                 
@@ -362,68 +522,168 @@ class RedisSessionRepository:
                             continue
                     
                     sessions.append(session)
-                    
+                
                 except Exception as e:
                     logger.warning(f"Failed to deserialize session data for user {user_id.value}: {e}")
                     continue
             
             return sessions
-            
+        
         except Exception as e:
             logger.error(f"Failed to get user sessions for {user_id.value}: {e}")
             return []
     
-    async def cleanup_expired_sessions(self, batch_size: int = 100) -> int:
-        """Clean up expired sessions from Redis.
+    async def revoke_user_sessions(
+        self,
+        user_id: UserId,
+        tenant_id: Optional[TenantId] = None,
+        batch_size: int = 5000
+    ) -> int:
+        """Delete every session of a user in the given scope.
         
         Args:
-            batch_size: Number of sessions to process per batch
-            
+            user_id: User identifier
+            tenant_id: Optional tenant identifier for scoping
+            batch_size: Sessions deleted per round trip
+        
         Returns:
-            Number of sessions cleaned up
+            Number of sessions deleted
         """
+        user_sessions_key = self._make_user_sessions_key(user_id, tenant_id)
+        tenant_sessions_key = self._make_tenant_sessions_key(tenant_id) if tenant_id else None
+        
         try:
-            # Get all session keys
-            pattern = f"{self.key_prefix}:*"
-            session_keys = []
-            
-            async for key in self.redis.scan_iter(match=pattern, count=batch_size):
-                if key.decode().count(':') == 2:  # session keys have format prefix:session_id
-                    session_keys.append(key.decode())
+            revoked = 0
+            await self._migrate_legacy_index(user_sessions_key)
+            session_ids = await self.redis.zrange(user_sessions_key, 0, batch_size - 1)
             
-            if not session_keys:
-                return 0
+            while session_ids:
+                session_ids = [self._decode(sid) for sid in session_ids]
+                
+                # Delete this batch and fetch the next one in a single round trip
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.unlink(*[f"{self.key_prefix}:{sid}" for sid in session_ids])
+                pipe.zrem(user_sessions_key, *session_ids)
+                if tenant_sessions_key:
+                    pipe.zrem(
+                        tenant_sessions_key, *[f"{user_id.value}:{sid}" for sid in session_ids]
+                    )
+                pipe.zrange(user_sessions_key, 0, batch_size - 1)
+                results = await pipe.execute()
+                
+                revoked += results[0]
+                session_ids = results[-1]
             
-            cleaned_count = 0
-            current_time = datetime.now(timezone.utc)
+            logger.info(f"Revoked {revoked} sessions for user {user_id.value}")
+            return revoked
+        
+        except Exception as e:
+            logger.error(f"Failed to revoke sessions for user {user_id.value}: {e}")
+            raise SessionInvalid(
+                "User session revocation failed",
+                context={"user_id": str(user_id.value), "error": str(e)}
+            )
+    
+    async def revoke_tenant_sessions(self, tenant_id: TenantId, batch_size: int = 10000) -> int:
+        """Delete every session of a tenant.
+        
+        Each round trip deletes one batch of sessions, removes them from the
+        owning user indexes and fetches the next batch, so revoking 100k
+        sessions takes about ``100k / batch_size`` round trips.
+        
+        Args:
+            tenant_id: Tenant identifier
+            batch_size: Sessions deleted per round trip
+        
+        Returns:
+            Number of sessions deleted
+        """
+        tenant_sessions_key = self._make_tenant_sessions_key(tenant_id)
+        
+        try:
+            revoked = 0
+            await self._migrate_legacy_index(tenant_sessions_key)
+            members = await self.redis.zrange(tenant_sessions_key, 0, batch_size - 1)
             
-            for i in range(0, len(session_keys), batch_size):
-                batch_keys = session_keys[i:i + batch_size]
+            while members:
+                members = [self._decode(member) for member in members]
                 
-                # Get session data for batch
-                session_data_list = await self.redis.mget(*batch_keys)
+                # Group session IDs by owning user index
+                by_user: Dict[str, List[str]] = {}
+                for member in members:
+                    user_id, _, session_id = member.partition(":")
+                    by_user.setdefault(user_id, []).append(session_id)
+                
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.unlink(*[
+                    f"{self.key_prefix}:{sid}" for sids in by_user.values() for sid in sids
+                ])
+                for user_id, session_ids in by_user.items():
+                    pipe.zrem(
+                        f"{self.key_prefix}:user:{user_id}:tenant:{tenant_id.value}{_INDEX_SUFFIX}",
+                        *session_ids
+                    )
+                pipe.zrem(tenant_sessions_key, *members)
+                pipe.zrange(tenant_sessions_key, 0, batch_size - 1)
+                results = await pipe.execute()
                 
-                for j, session_data in enumerate(session_data_list):
-                    if not session_data:
-                        continue
+                revoked += results[0]
+                members = results[-1]
+            
+            logger.info(f"Revoked {revoked} sessions for tenant {tenant_id.value}")
+            return revoked
+        
+        except Exception as e:
+            logger.error(f"Failed to revoke sessions for tenant {tenant_id.value}: {e}")
+            raise SessionInvalid(
+                "Tenant session revocation failed",
+                context={"tenant_id": str(tenant_id.value), "error": str(e)}
+            )
+    
+    async def cleanup_expired_sessions(self, batch_size: int = 100) -> int:
+        """Trim expired members from the user and tenant session indexes.
+        
+        Session keys expire on their own through their TTL; this sweeps the
+        indexes with SCAN and removes members whose expiry score has passed,
+        one pipelined ZREMRANGEBYSCORE round trip per scanned batch. Indexes
+        still in the original set format are migrated on the way.
+        
+        Args:
+            batch_size: Number of index keys to process per batch
+        
+        Returns:
+            Number of expired index entries removed
+        """
+        try:
+            cleaned_count = 0
+            
+            for pattern in (f"{self.key_prefix}:user:*", f"{self.key_prefix}:tenant:*"):
+                cursor = 0
+                while True:
+                    cursor, keys = await self.redis.scan(cursor, match=pattern, count=batch_size)
                     
-                    try:
-                        session = self._deserialize_session(session_data)
-                        
-                        # Check if session is expired
-                        if session.expires_at and session.expires_at <= current_time:
-                            await self.delete_session(session.session_id)
-                            cleaned_count += 1
-                            
-                    except Exception as e:
-                        logger.warning(f"Failed to process session during cleanup: {e}")
-                        continue
+                    keys = [self._decode(key) for key in keys]
+                    index_keys = [key for key in keys if key.endswith(_INDEX_SUFFIX)]
+                    
+                    if index_keys:
+                        now = time.time()
+                        pipe = self.redis.pipeline(transaction=False)
+                        for key in index_keys:
+                            pipe.zremrangebyscore(key, "-inf", now)
+                        cleaned_count += sum(await pipe.execute())
+                    
+                    for key in keys:
+                        if not key.endswith(_INDEX_SUFFIX):
+                            await self._migrate_legacy_index(key + _INDEX_SUFFIX)
+                    
+                    if cursor == 0:
+                        break
             
             if cleaned_count > 0:
-                logger.info(f"Cleaned up {cleaned_count} expired sessions")
+                logger.info(f"Cleaned up {cleaned_count} expired session index entries")
             
             return cleaned_count
-            
+        
         except Exception as e:
             logger.error(f"Failed to cleanup expired sessions: {e}")
             return 0
@@ -433,30 +693,39 @@ class RedisSessionRepository:
         user_id: Optional[UserId] = None,
         tenant_id: Optional[TenantId] = None
     ) -> int:
-        """Get count of sessions.
+        """Get count of live sessions.
         
         Args:
             user_id: Optional user ID to filter by
             tenant_id: Optional tenant ID to filter by
-            
+        
         Returns:
             Number of sessions
         """
         try:
-            if user_id:
-                user_sessions_key = self._make_user_sessions_key(user_id, tenant_id)
-                return await self.redis.scard(user_sessions_key)
-            elif tenant_id:
-                tenant_sessions_key = self._make_tenant_sessions_key(tenant_id)
-                return await self.redis.scard(tenant_sessions_key)
+            if user_id or tenant_id:
+                if user_id:
+                    index_key = self._make_user_sessions_key(user_id, tenant_id)
+                else:
+                    index_key = self._make_tenant_sessions_key(tenant_id)
+                
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.exists(self._legacy_index_key(index_key))
+                pipe.zcount(index_key, f"({time.time()}", "+inf")
+                legacy, count = await pipe.execute()
+                
+                if legacy and await self._migrate_legacy_index(index_key):
+                    count = await self.redis.zcount(index_key, f"({time.time()}", "+inf")
+                return count
             else:
-                # Count all session keys
-                pattern = f"{self.key_prefix}:*"
+                # Count session keys, skipping the index keys
+                index_prefixes = (f"{self.key_prefix}:user:", f"{self.key_prefix}:tenant:")
                 count = 0
-                async for _ in self.redis.scan_iter(match=pattern):
-                    count += 1
+                async for key in self.redis.scan_iter(match=f"{self.key_prefix}:*", count=1000):
+                    if not self._decode(key).startswith(index_prefixes):
+                        count += 1
                 return count
-                
+        
         except Exception as e:
             logger.error(f"Failed to get session count: {e}")
-            return 0
\ No newline at end of file
+            return 0
@@ -15,6 +15,7 @@ from ...core.protocols.invalidation_service import InvalidationService
 from ...core.protocols.distribution_service import DistributionService
 from ..commands.set_cache_entry import SetCacheEntryCommand, SetCacheEntryData, SetCacheEntryResult
 from ..queries.get_cache_entry import GetCacheEntryQuery, GetCacheEntryData, GetCacheEntryResult
+from .....infrastructure.tracing import SpanKind, current_span, traced
 
 
 class CacheManager:
@@ -57,6 +58,7 @@ class CacheManager:
     
     # Main high-level API for business features
     
+    @traced("cache.get", SpanKind.CLIENT)
     async def get(
         self,
         key: str,
@@ -89,12 +91,14 @@ class CacheManager:
             )
             
             result = await self._get_query.execute(data)
+            current_span().set_attribute("cache.hit", result.found)
             return result.value if result.found else None
             
         except Exception:
             # Graceful degradation - return None on any error
             return None
     
+    @traced("cache.set", SpanKind.CLIENT)
     async def set(
         self,
         key: str,
@@ -142,6 +146,7 @@ class CacheManager:
             # Graceful degradation - return False on any error
             return False
     
+    @traced("cache.delete", SpanKind.CLIENT)
     async def delete(
         self,
         key: str,
@@ -177,6 +182,7 @@ class CacheManager:
         except Exception:
             return False
     
+    @traced("cache.exists", SpanKind.CLIENT)
     async def exists(
         self,
         key: str,
@@ -214,6 +220,7 @@ class CacheManager:
     
     # Convenience methods with common patterns
     
+    @traced("cache.get_or_set")
     async def get_or_set(
         self,
         key: str,
@@ -266,6 +273,7 @@ class CacheManager:
             # Return None if factory fails
             return None
     
+    @traced("cache.get_many", SpanKind.CLIENT)
     async def get_many(
         self,
         keys: List[str],
@@ -291,6 +299,7 @@ class CacheManager:
         
         return result
     
+    @traced("cache.set_many", SpanKind.CLIENT)
     async def set_many(
         self,
         items: Dict[str, Any],
@@ -361,6 +370,7 @@ class CacheManager:
     
     # Management and monitoring
     
+    @traced("cache.flush_namespace", SpanKind.CLIENT)
     async def flush_namespace(
         self,
         namespace: str,
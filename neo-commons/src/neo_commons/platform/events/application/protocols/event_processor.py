@@ -6,6 +6,8 @@ from typing import AsyncIterator, List, Optional, Callable, Awaitable, Dict, Any
 from ...domain.entities.event import Event
 
 
+# Handlers receive the full Event entity and the queue name; processors may
+# offer lighter read-only event views as an explicit opt-in
 EventHandler = Callable[[Event, str], Awaitable[None]]
 
 
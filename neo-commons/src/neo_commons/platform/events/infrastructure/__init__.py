@@ -8,9 +8,16 @@ single-purpose modules.
 from .repositories.asyncpg_event_repository import AsyncPGEventRepository
 from .publishers.redis_event_publisher import RedisEventPublisher
 from .processors.redis_event_processor import RedisEventProcessor
+from .serializers.event_wire_format import LazyEvent, decode_event, encode_event
+from .outbox import EventOutbox, OutboxRelay
 
 __all__ = [
     "AsyncPGEventRepository",
     "RedisEventPublisher", 
     "RedisEventProcessor",
+    "LazyEvent",
+    "decode_event",
+    "encode_event",
+    "EventOutbox",
+    "OutboxRelay",
 ]
\ No newline at end of file
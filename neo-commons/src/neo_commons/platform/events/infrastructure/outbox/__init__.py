@@ -0,0 +1,15 @@
+"""Transactional event outbox.
+
+This module contains the outbox writer that stores events in the caller's
+database transaction and the relay that publishes them to Redis streams.
+"""
+
+from .event_outbox import EventOutbox, decode_outbox_payload, encode_outbox_payload
+from .outbox_relay import OutboxRelay
+
+__all__ = [
+    "EventOutbox",
+    "OutboxRelay",
+    "decode_outbox_payload",
+    "encode_outbox_payload",
+]
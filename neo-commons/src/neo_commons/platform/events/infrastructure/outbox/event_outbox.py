@@ -0,0 +1,160 @@
+"""Transactional outbox writer for events.
+
+Events are stored together with the business change that produced them:
+the event row and an outbox row holding the ready-to-publish stream entry
+are inserted on the caller's connection, inside the caller's transaction.
+``OutboxRelay`` later moves committed outbox rows to Redis streams.
+
+Example:
+    async with database_service.transaction("admin") as conn:
+        await conn.execute("UPDATE admin.tenants SET ...", ...)
+        await outbox.add(conn, event, schema="admin")
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from ....domain.entities.event import Event
+from ..publishers.redis_event_publisher import RedisEventPublisher
+from ..queries.event_queries import EVENT_INSERT
+from ..queries.outbox_queries import OUTBOX_INSERT_BATCH
+from ..repositories.asyncpg_event_repository import AsyncPGEventRepository
+from ..serializers.event_wire_format import WIRE_FIELD
+from .....core.exceptions import DatabaseError
+from .....infrastructure.tracing import TRACEPARENT
+
+logger = logging.getLogger(__name__)
+
+# Prefix of compact payloads stored with a trace context; never starts JSON
+# or the compact wire format
+_TRACED_MARKER = b"T"
+_TRACEPARENT_LENGTH = 55
+
+# Length of event_outbox.stream_name and events.queue_name
+MAX_STREAM_NAME_LENGTH = 100
+
+
+def encode_outbox_payload(fields: Dict[str, Any]) -> bytes:
+    """Store a stream entry compactly: the raw compact payload, or JSON fields.
+
+    A compact payload carrying a trace context is stored behind a
+    ``_TRACED_MARKER`` and its fixed-length ``traceparent`` value.
+    """
+    payload = fields.get(WIRE_FIELD)
+    if isinstance(payload, bytes):
+        if len(fields) == 1:
+            return payload
+        traceparent = fields.get(TRACEPARENT)
+        if len(fields) == 2 and isinstance(traceparent, str) and len(traceparent) == _TRACEPARENT_LENGTH:
+            return _TRACED_MARKER + traceparent.encode() + payload
+    return json.dumps(fields, separators=(",", ":")).encode()
+
+
+def decode_outbox_payload(payload: bytes) -> Dict[str, Any]:
+    """Rebuild the stream entry fields stored by ``encode_outbox_payload``."""
+    payload = bytes(payload)
+    if payload[:1] == b"{":
+        return json.loads(payload)
+    if payload[:1] == _TRACED_MARKER:
+        end = 1 + _TRACEPARENT_LENGTH
+        return {WIRE_FIELD: payload[end:], TRACEPARENT: payload[1:end].decode()}
+    return {WIRE_FIELD: payload}
+
+
+class EventOutbox:
+    """Write events and their outbox entries in the caller's transaction."""
+
+    def __init__(self, publisher: RedisEventPublisher):
+        """Initialize event outbox.
+
+        Args:
+            publisher: Publisher used to build stream names, partition keys
+                and the encoded stream entries
+        """
+        self._publisher = publisher
+
+    async def add(
+        self,
+        connection,
+        event: Event,
+        schema: str,
+        queue_name: Optional[str] = None,
+        partition_key: Optional[str] = None,
+    ) -> None:
+        """Store one event for publishing once the transaction commits.
+
+        Args:
+            connection: asyncpg connection inside an open transaction
+            event: Event to store
+            schema: Database schema holding the events and outbox tables
+            queue_name: Optional specific queue name override
+            partition_key: Optional partition key override
+        """
+        await self.add_batch(connection, [event], schema, queue_name, partition_key)
+
+    async def add_batch(
+        self,
+        connection,
+        events: List[Event],
+        schema: str,
+        queue_name: Optional[str] = None,
+        partition_key: Optional[str] = None,
+    ) -> None:
+        """Store events for publishing once the transaction commits.
+
+        Uses one ``executemany`` for the event rows and one ``unnest``
+        insert for the outbox rows, regardless of the number of events.
+
+        Args:
+            connection: asyncpg connection inside an open transaction
+            events: Events to store
+            schema: Database schema holding the events and outbox tables
+            queue_name: Optional specific queue name override
+            partition_key: Optional partition key override
+
+        Raises:
+            ValueError: If a stream name is longer than ``MAX_STREAM_NAME_LENGTH``
+            DatabaseError: If the rows cannot be written
+        """
+        if not events:
+            return
+
+        event_ids, aggregate_ids, streams, partitions, payloads = [], [], [], [], []
+        for event in events:
+            stream_name, partition, fields = self._publisher.encode_entry(
+                event, schema, queue_name, partition_key
+            )
+            # Checked here: the relay copies it to events.queue_name only after publishing
+            if len(stream_name) > MAX_STREAM_NAME_LENGTH:
+                raise ValueError(
+                    f"Stream name '{stream_name}' exceeds {MAX_STREAM_NAME_LENGTH} characters"
+                )
+            event.queue_name = stream_name
+            event.partition_key = partition
+
+            event_ids.append(UUID(str(event.id.value)))
+            aggregate_ids.append(UUID(str(event.aggregate_reference.aggregate_id)))
+            streams.append(stream_name)
+            partitions.append(partition)
+            payloads.append(encode_outbox_payload(fields))
+
+        try:
+            await connection.executemany(
+                EVENT_INSERT.format(schema=schema),
+                [AsyncPGEventRepository.insert_params(event) for event in events],
+            )
+            await connection.execute(
+                OUTBOX_INSERT_BATCH.format(schema=schema),
+                event_ids,
+                aggregate_ids,
+                streams,
+                partitions,
+                payloads,
+            )
+        except Exception as e:
+            logger.error(f"Failed to write {len(events)} events to outbox in schema '{schema}': {e}")
+            raise DatabaseError(f"Failed to write events to outbox: {e}")
+
+        logger.debug(f"Stored {len(events)} events in outbox of schema '{schema}'")
@@ -0,0 +1,211 @@
+"""Relay committed outbox rows from Postgres to Redis streams.
+
+Each cycle claims a batch of unpublished rows with ``FOR UPDATE SKIP
+LOCKED``, appends them to their streams in one pipelined round trip and
+marks the whole batch published, all inside one transaction. Several relays
+can run against the same schema; locked rows are skipped, so a batch is
+only ever published by one relay. Publishing is at-least-once: if the
+commit fails after the pipeline ran, the batch is published again.
+
+Relays sharing a schema without sharding may publish neighbouring batches
+concurrently. Give every relay its own ``shard_index`` (with the same
+``shard_count``) when per-aggregate stream order must be kept.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from ..publishers.redis_event_publisher import RedisEventPublisher
+from ..queries.outbox_queries import (
+    OUTBOX_BACKLOG,
+    OUTBOX_CLAIM_BATCH,
+    OUTBOX_MARK_PUBLISHED,
+    OUTBOX_PURGE_PUBLISHED,
+    OUTBOX_SHARD_FILTER,
+)
+from .event_outbox import decode_outbox_payload
+
+logger = logging.getLogger(__name__)
+
+# Number of recent relay lag samples kept for percentiles
+_LAG_SAMPLES = 1024
+
+
+class OutboxRelay:
+    """Background relay for one schema's event outbox."""
+
+    def __init__(
+        self,
+        database_service,
+        publisher: RedisEventPublisher,
+        connection_name: str,
+        schema: str,
+        batch_size: int = 500,
+        poll_interval: float = 0.5,
+        max_backoff: float = 30.0,
+        shard_index: int = 0,
+        shard_count: int = 1,
+        retention_seconds: float = 3600.0,
+        purge_interval: float = 60.0,
+    ):
+        """Initialize outbox relay.
+
+        Args:
+            database_service: DatabaseService providing ``transaction``
+            publisher: Publisher whose Redis client receives the entries
+            connection_name: Database connection holding the schema
+            schema: Schema with the events and event_outbox tables
+            batch_size: Maximum rows claimed per cycle
+            poll_interval: Seconds to wait when the outbox is drained
+            max_backoff: Maximum seconds to wait after consecutive failures
+            shard_index: Shard of aggregates handled by this relay
+            shard_count: Total number of shards (1 disables sharding)
+            retention_seconds: Published rows older than this are purged
+            purge_interval: Seconds between purges of published rows
+        """
+        if not 0 <= shard_index < shard_count:
+            raise ValueError(f"Invalid shard {shard_index} of {shard_count}")
+
+        self._db = database_service
+        self._publisher = publisher
+        self.connection_name = connection_name
+        self.schema = schema
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self.retention_seconds = retention_seconds
+        self.purge_interval = purge_interval
+
+        shard_filter = ""
+        if shard_count > 1:
+            shard_filter = OUTBOX_SHARD_FILTER.format(shard_count=shard_count, shard_index=shard_index)
+        self._claim_query = OUTBOX_CLAIM_BATCH.format(schema=schema, shard_filter=shard_filter)
+        self._mark_query = OUTBOX_MARK_PUBLISHED.format(schema=schema)
+        self._purge_query = OUTBOX_PURGE_PUBLISHED.format(schema=schema)
+        self._backlog_query = OUTBOX_BACKLOG.format(schema=schema)
+
+        self._task: Optional[asyncio.Task] = None
+        self._stop = asyncio.Event()
+        self._last_purge = time.monotonic()
+
+        # Statistics
+        self._published = 0
+        self._batches = 0
+        self._failures = 0
+        self._purged = 0
+        self._lags: deque = deque(maxlen=_LAG_SAMPLES)
+        self._max_lag = 0.0
+        self._started_at = time.monotonic()
+
+    async def relay_once(self) -> int:
+        """Claim, publish and mark one batch.
+
+        Returns:
+            Number of events published
+        """
+        async with self._db.transaction(self.connection_name) as conn:
+            rows = await conn.fetch(self._claim_query, self.batch_size)
+            if not rows:
+                return 0
+
+            message_ids = await self._publisher.publish_entries(
+                [(row["stream_name"], decode_outbox_payload(row["payload"])) for row in rows]
+            )
+            await conn.execute(self._mark_query, [row["id"] for row in rows], message_ids)
+
+        # Relay lag: time from outbox insert (commit of the business change) to publish
+        lag = float(rows[0]["age_seconds"])
+        self._lags.append(lag)
+        self._max_lag = max(self._max_lag, lag)
+        self._published += len(rows)
+        self._batches += 1
+        return len(rows)
+
+    async def purge_published(self) -> int:
+        """Delete published rows past the retention period.
+
+        Returns:
+            Number of rows deleted
+        """
+        async with self._db.transaction(self.connection_name) as conn:
+            status = await conn.execute(self._purge_query, self.retention_seconds, self.batch_size * 10)
+        purged = int(status.split()[-1]) if status else 0
+        self._purged += purged
+        return purged
+
+    async def get_backlog(self) -> Dict[str, Any]:
+        """Unpublished rows and the age of the oldest one."""
+        async with self._db.transaction(self.connection_name) as conn:
+            row = await conn.fetchrow(self._backlog_query)
+        return {
+            "pending": row["pending"],
+            "oldest_age_seconds": float(row["oldest_age_seconds"]),
+        }
+
+    def start(self) -> None:
+        """Start relaying in the background."""
+        if self._task is None or self._task.done():
+            self._stop.clear()
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Started outbox relay for {self.connection_name}:{self.schema}")
+
+    async def stop(self) -> None:
+        """Stop relaying after the current batch."""
+        if self._task is None:
+            return
+        self._stop.set()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        logger.info(f"Stopped outbox relay for {self.connection_name}:{self.schema}")
+
+    async def _run(self) -> None:
+        """Relay until stopped, draining full batches back to back."""
+        failures = 0
+        while not self._stop.is_set():
+            try:
+                published = await self.relay_once()
+                failures = 0
+
+                if time.monotonic() - self._last_purge >= self.purge_interval:
+                    self._last_purge = time.monotonic()
+                    await self.purge_published()
+
+                if published >= self.batch_size:
+                    continue
+                delay = self.poll_interval
+            except Exception as e:
+                failures += 1
+                self._failures += 1
+                delay = min(self.max_backoff, self.poll_interval * (2 ** failures))
+                logger.error(f"Outbox relay for {self.connection_name}:{self.schema} failed: {e}")
+
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get relay throughput and lag statistics."""
+        lags = sorted(self._lags)
+
+        def percentile(p: float) -> float:
+            if not lags:
+                return 0.0
+            return lags[min(len(lags) - 1, int(p * len(lags)))] * 1000
+
+        elapsed = time.monotonic() - self._started_at
+        return {
+            "schema": self.schema,
+            "published": self._published,
+            "batches": self._batches,
+            "failures": self._failures,
+            "purged": self._purged,
+            "events_per_second": self._published / elapsed if elapsed > 0 else 0.0,
+            "avg_batch_size": self._published / self._batches if self._batches else 0.0,
+            "p50_lag_ms": percentile(0.50),
+            "p95_lag_ms": percentile(0.95),
+            "max_lag_ms": self._max_lag * 1000,
+        }
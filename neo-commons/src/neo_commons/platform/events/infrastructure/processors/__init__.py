@@ -4,8 +4,12 @@ This module contains concrete implementations of event processors
 for consuming and handling events from message queues.
 """
 
+from .partitioned_dispatcher import PartitionedDispatcher
+from .pending_reclaimer import PendingReclaimer
 from .redis_event_processor import RedisEventProcessor
 
 __all__ = [
+    "PartitionedDispatcher",
+    "PendingReclaimer",
     "RedisEventProcessor",
 ]
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""Bounded worker pool that preserves ordering per partition key.
+
+Used by the Redis event processor to run events for different aggregates
+in parallel while events of the same aggregate are handled one at a time,
+in the order they were read from the stream.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionedDispatcher:
+    """Dispatch items to a fixed pool of workers, serialized per partition.
+
+    At most one item per partition is processed at any time; partitions
+    that have work queued are served round-robin. ``max_buffered`` bounds the
+    number of admitted but unfinished items, so ``submit`` blocks (applying
+    backpressure to the reader) when handlers fall behind.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[Any], Awaitable[None]],
+        concurrency: int = 8,
+        max_buffered: Optional[int] = None,
+    ):
+        """Initialize dispatcher.
+
+        Args:
+            process: Coroutine function called for every item; must not raise
+            concurrency: Number of workers, i.e. partitions processed in parallel
+            max_buffered: Maximum admitted but unfinished items (default: 4 x concurrency)
+        """
+        if concurrency <= 0:
+            raise ValueError("Concurrency must be positive")
+
+        self._process = process
+        self.concurrency = concurrency
+        self.max_buffered = max_buffered or concurrency * 4
+
+        self._capacity = asyncio.Semaphore(self.max_buffered)
+        self._partitions: Dict[Hashable, Deque[Any]] = {}
+        self._ready: asyncio.Queue = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._unfinished = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+        # Statistics
+        self._processed = 0
+        self._max_partition_depth = 0
+
+    @property
+    def available(self) -> int:
+        """Number of items that can be submitted without blocking."""
+        return self.max_buffered - self._unfinished
+
+    @property
+    def in_flight(self) -> int:
+        """Number of admitted items that have not finished processing."""
+        return self._unfinished
+
+    def start(self) -> None:
+        """Start the worker tasks."""
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self.concurrency)
+            ]
+
+    async def submit(self, partition: Hashable, item: Any) -> None:
+        """Queue an item behind earlier items of the same partition.
+
+        Blocks while ``max_buffered`` items are unfinished.
+        """
+        await self._capacity.acquire()
+        self._unfinished += 1
+        self._idle.clear()
+
+        queue = self._partitions.get(partition)
+        if queue is None:
+            self._partitions[partition] = deque((item,))
+            self._ready.put_nowait(partition)
+        else:
+            queue.append(item)
+            self._max_partition_depth = max(self._max_partition_depth, len(queue))
+
+    async def wait_for_capacity(self) -> None:
+        """Wait until at least one more item can be submitted."""
+        await self._capacity.acquire()
+        self._capacity.release()
+
+    async def drain(self) -> None:
+        """Wait until every submitted item has been processed."""
+        await self._idle.wait()
+
+    async def stop(self) -> None:
+        """Finish queued work and stop the workers."""
+        await self.drain()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _worker(self) -> None:
+        """Take the next ready partition and process its head item."""
+        while True:
+            partition = await self._ready.get()
+            queue = self._partitions[partition]
+            item = queue.popleft()
+
+            try:
+                await self._process(item)
+            except Exception as e:
+                logger.error(f"Unhandled error processing item of partition {partition}: {e}")
+            finally:
+                if queue:
+                    # Re-queue at the tail so busy partitions do not starve others
+                    self._ready.put_nowait(partition)
+                else:
+                    del self._partitions[partition]
+
+                self._processed += 1
+                self._unfinished -= 1
+                self._capacity.release()
+                if self._unfinished == 0:
+                    self._idle.set()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get dispatcher statistics."""
+        return {
+            "concurrency": self.concurrency,
+            "max_buffered": self.max_buffered,
+            "in_flight": self._unfinished,
+            "active_partitions": len(self._partitions),
+            "processed": self._processed,
+            "max_partition_depth": self._max_partition_depth,
+        }
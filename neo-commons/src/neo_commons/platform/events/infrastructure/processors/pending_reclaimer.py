@@ -0,0 +1,174 @@
+"""Reclaim stuck pending entries of a Redis Streams consumer group.
+
+Messages delivered to a consumer that crashed (or was restarted under a new
+name) stay in the group's pending entries list until another consumer claims
+them. The reclaimer takes over entries idle longer than a threshold with
+XAUTOCLAIM and reports how often each one has been delivered, so callers can
+dead-letter poison messages instead of redelivering them forever.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (message_id, fields, times_delivered)
+ClaimedMessage = Tuple[str, Dict, int]
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+class PendingReclaimer:
+    """Claim idle pending entries of a consumer group for one consumer."""
+
+    def __init__(
+        self,
+        redis_client,
+        queue_name: str,
+        consumer_group: str,
+        consumer_name: str,
+        min_idle_ms: int = 60000,
+        dead_consumer_idle_ms: int = 3600000,
+    ):
+        """Initialize reclaimer.
+
+        Args:
+            redis_client: Async Redis client
+            queue_name: Stream name
+            consumer_group: Consumer group whose pending list is scanned
+            consumer_name: Consumer that takes ownership of claimed entries
+            min_idle_ms: Only claim entries not delivered for this long
+            dead_consumer_idle_ms: Remove consumers idle this long with nothing pending
+        """
+        self._redis = redis_client
+        self.queue_name = queue_name
+        self.consumer_group = consumer_group
+        self.consumer_name = consumer_name
+        self.min_idle_ms = min_idle_ms
+        self.dead_consumer_idle_ms = dead_consumer_idle_ms
+
+        self._cursor = "0-0"
+
+        # Statistics
+        self._scans = 0
+        self._claimed = 0
+        self._deleted = 0
+        self._consumers_removed = 0
+
+    async def claim(self, count: int) -> List[ClaimedMessage]:
+        """Claim up to ``count`` idle entries, continuing the previous scan.
+
+        Entries whose stream record was trimmed are dropped from the pending
+        list and are not returned.
+
+        Returns:
+            Claimed messages with their delivery count (including this delivery)
+        """
+        result = await self._redis.xautoclaim(
+            self.queue_name,
+            self.consumer_group,
+            self.consumer_name,
+            min_idle_time=self.min_idle_ms,
+            start_id=self._cursor,
+            count=count,
+        )
+        self._scans += 1
+
+        # Redis >= 7 also returns the IDs of deleted entries
+        next_id, messages = result[0], result[1]
+        deleted = result[2] if len(result) > 2 else []
+        self._cursor = _decode(next_id)
+        self._deleted += len(deleted)
+
+        # Redis 6.2 returns trimmed entries without fields and keeps them pending
+        trimmed = [message_id for message_id, fields in messages if not fields]
+        if trimmed:
+            await self._redis.xack(self.queue_name, self.consumer_group, *trimmed)
+            self._deleted += len(trimmed)
+
+        claimed = [(_decode(message_id), fields) for message_id, fields in messages if fields]
+        if not claimed:
+            return []
+
+        self._claimed += len(claimed)
+        deliveries = await self.delivery_counts([message_id for message_id, _ in claimed])
+        return [(message_id, fields, deliveries.get(message_id, 1)) for message_id, fields in claimed]
+
+    @property
+    def scan_complete(self) -> bool:
+        """True when the last claim reached the end of the pending list."""
+        return self._cursor == "0-0"
+
+    async def delivery_counts(self, message_ids: List[str]) -> Dict[str, int]:
+        """Look up delivery counts of entries now owned by this consumer."""
+        pipe = self._redis.pipeline(transaction=False)
+        for message_id in message_ids:
+            pipe.xpending_range(
+                self.queue_name,
+                self.consumer_group,
+                min=message_id,
+                max=message_id,
+                count=1,
+                consumername=self.consumer_name,
+            )
+
+        counts = {}
+        for entries in await pipe.execute():
+            for entry in entries:
+                counts[_decode(entry["message_id"])] = int(entry["times_delivered"])
+        return counts
+
+    async def remove_dead_consumers(self) -> int:
+        """Delete consumers that own no pending entries and have been idle too long.
+
+        Keeps ``XINFO CONSUMERS`` from growing with every restart of
+        consumers that were not given a stable name.
+        """
+        removed = 0
+        for consumer in await self._redis.xinfo_consumers(self.queue_name, self.consumer_group):
+            name = _decode(consumer.get("name"))
+            if (
+                name != self.consumer_name
+                and int(consumer.get("pending", 0)) == 0
+                and int(consumer.get("idle", 0)) >= self.dead_consumer_idle_ms
+            ):
+                await self._redis.xgroup_delconsumer(self.queue_name, self.consumer_group, name)
+                removed += 1
+
+        if removed:
+            self._consumers_removed += removed
+            logger.info(f"Removed {removed} idle consumers from {self.queue_name}:{self.consumer_group}")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get reclaimer statistics."""
+        return {
+            "reclaim_scans": self._scans,
+            "reclaimed": self._claimed,
+            "reclaim_deleted_entries": self._deleted,
+            "consumers_removed": self._consumers_removed,
+        }
+
+
+async def pending_summary(redis_client, queue_name: str, consumer_group: str) -> Dict[str, Any]:
+    """Summarize a group's pending entries list.
+
+    Returns:
+        Pending count, per-consumer pending counts and the idle time of the
+        oldest pending entry
+    """
+    summary = await redis_client.xpending(queue_name, consumer_group)
+    oldest: Optional[List[Dict]] = None
+    if summary.get("pending"):
+        oldest = await redis_client.xpending_range(queue_name, consumer_group, min="-", max="+", count=1)
+
+    return {
+        "pending": summary.get("pending", 0),
+        "pending_by_consumer": {
+            _decode(consumer["name"]): int(consumer["pending"])
+            for consumer in summary.get("consumers") or []
+        },
+        "oldest_pending_idle_ms": oldest[0]["time_since_delivered"] if oldest else 0,
+    }
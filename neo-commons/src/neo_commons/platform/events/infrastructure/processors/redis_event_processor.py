@@ -5,25 +5,310 @@ using Redis Streams with consumer groups for scalable event handling.
 Supports high-throughput event processing with proper acknowledgment.
 """
 
-import json
 import logging
 import asyncio
-from typing import Optional, Dict, Any, List, AsyncIterator
+import os
+import socket
+import time
+from typing import Optional, Dict, Any, List, AsyncIterator, Set
 from datetime import datetime, timezone
-from uuid import UUID
 
 from ....application.protocols.event_processor import EventProcessorProtocol, EventHandler
-from ....domain.entities.event import Event, EventStatus, EventPriority
-from ....domain.value_objects.event_id import EventId
-from ....domain.value_objects.event_type import EventType
-from ....domain.value_objects.aggregate_reference import AggregateReference
-from ....domain.value_objects.correlation_id import CorrelationId
+from ....domain.entities.event import Event, EventStatus
 from .....core.exceptions import EventHandlingError
+from ..serializers.event_wire_format import LazyEvent, decode_event, is_text_client
+from .partitioned_dispatcher import PartitionedDispatcher
+from .pending_reclaimer import PendingReclaimer, pending_summary
+from .....infrastructure.tracing import SpanKind, extract, get_tracer
 
 
 logger = logging.getLogger(__name__)
 
 
+class _StreamConsumer:
+    """Consumer state for one stream and consumer group.
+    
+    Reads with XREADGROUP, dispatches messages to a partition-ordered worker
+    pool, tracks the messages it has been delivered but not yet acknowledged
+    and acknowledges completed messages in batches with a single XACK.
+    
+    A background task reclaims entries other consumers of the group left
+    pending, and messages delivered more than ``max_deliveries`` times are
+    moved to the dead-letter stream instead of being processed again.
+    """
+    
+    def __init__(
+        self,
+        processor: "RedisEventProcessor",
+        queue_name: str,
+        consumer_group: str,
+        consumer_name: str,
+        handler: EventHandler,
+        concurrency: int = 8,
+        max_buffered: Optional[int] = None,
+        ack_batch_size: int = 100,
+        ack_interval: float = 0.05,
+        max_deliveries: int = 3,
+        reclaimer: Optional[PendingReclaimer] = None,
+        reclaim_interval: float = 30.0,
+    ):
+        self.processor = processor
+        self.queue_name = queue_name
+        self.consumer_group = consumer_group
+        self.consumer_name = consumer_name
+        self.handler = handler
+        self.ack_batch_size = ack_batch_size
+        self.ack_interval = ack_interval
+        self.max_deliveries = max_deliveries
+        self.reclaimer = reclaimer
+        self.reclaim_interval = reclaim_interval
+        
+        self.dispatcher = PartitionedDispatcher(self._handle, concurrency, max_buffered)
+        
+        # Message IDs delivered to this consumer and not yet acknowledged
+        self._pending: Set[str] = set()
+        self._ack_buffer: List[str] = []
+        self._ack_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._reclaim_task: Optional[asyncio.Task] = None
+        self._recovered = False
+        
+        # Statistics
+        self._read_calls = 0
+        self._messages_read = 0
+        self._acked = 0
+        self._ack_calls = 0
+        self._redelivered = 0
+        self._started_at = time.monotonic()
+    
+    def start(self) -> None:
+        """Start workers, the periodic ack flusher and the reclaimer."""
+        self.dispatcher.start()
+        if self._ack_task is None:
+            self._ack_task = asyncio.create_task(self._ack_loop())
+        if self.reclaimer is not None and self._reclaim_task is None:
+            self._reclaim_task = asyncio.create_task(self._reclaim_loop())
+    
+    async def stop(self) -> None:
+        """Finish in-flight messages, flush acks and stop background tasks."""
+        if self._reclaim_task is not None:
+            self._reclaim_task.cancel()
+            await asyncio.gather(self._reclaim_task, return_exceptions=True)
+            self._reclaim_task = None
+        await self.dispatcher.stop()
+        if self._ack_task is not None:
+            self._ack_task.cancel()
+            await asyncio.gather(self._ack_task, return_exceptions=True)
+            self._ack_task = None
+        if self._flush_task is not None:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush_acks()
+    
+    async def read_once(self, count: int, block_ms: int) -> int:
+        """Read up to ``count`` messages and dispatch them.
+        
+        The consumer's own pending entries are recovered once on the first
+        call; afterwards only new messages are read. Blocks while the
+        dispatcher has no capacity (backpressure).
+        
+        Returns:
+            Number of messages dispatched
+        """
+        await self.dispatcher.wait_for_capacity()
+        
+        if not self._recovered:
+            dispatched = await self._recover_pending()
+            self._recovered = True
+            if dispatched:
+                return dispatched
+        
+        count = max(1, min(count, self.dispatcher.available))
+        streams = await self.processor._redis.xreadgroup(
+            self.consumer_group,
+            self.consumer_name,
+            {self.queue_name: ">"},
+            count=count,
+            block=block_ms,
+        )
+        self._read_calls += 1
+        return await self._dispatch(streams)
+    
+    async def _recover_pending(self) -> int:
+        """Re-dispatch messages delivered to this consumer name but never acknowledged."""
+        dispatched = 0
+        last_id = "0"
+        while True:
+            streams = await self.processor._redis.xreadgroup(
+                self.consumer_group,
+                self.consumer_name,
+                {self.queue_name: last_id},
+                count=self.dispatcher.max_buffered,
+            )
+            self._read_calls += 1
+            messages = [m for _, stream_messages in streams or [] for m in stream_messages]
+            if not messages:
+                return dispatched
+            
+            last_id = messages[-1][0]
+            deliveries = None
+            if self.reclaimer is not None:
+                # Re-reading history counts as a delivery; a message that keeps
+                # crashing the process must not be recovered forever
+                deliveries = await self.reclaimer.delivery_counts(
+                    [m[0].decode() if isinstance(m[0], bytes) else str(m[0]) for m in messages]
+                )
+            dispatched += await self._dispatch(streams, deliveries)
+    
+    async def reclaim_once(self) -> int:
+        """Claim entries left idle by other consumers and dispatch them.
+        
+        Returns:
+            Number of reclaimed messages dispatched
+        """
+        dispatched = 0
+        while True:
+            await self.dispatcher.wait_for_capacity()
+            claimed = await self.reclaimer.claim(self.dispatcher.available)
+            if claimed:
+                dispatched += await self._dispatch(
+                    [(self.queue_name, [(message_id, fields) for message_id, fields, _ in claimed])],
+                    {message_id: deliveries for message_id, _, deliveries in claimed},
+                )
+            if self.reclaimer.scan_complete:
+                return dispatched
+    
+    async def _reclaim_loop(self) -> None:
+        """Periodically reclaim idle entries and remove dead consumers."""
+        while True:
+            await asyncio.sleep(self.reclaim_interval)
+            try:
+                reclaimed = await self.reclaim_once()
+                if reclaimed:
+                    logger.info("Reclaimed %s idle messages on %s:%s", reclaimed, self.queue_name, self.consumer_group)
+                await self.reclaimer.remove_dead_consumers()
+            except Exception as e:
+                logger.error(f"Failed to reclaim pending messages on '{self.queue_name}': {e}")
+    
+    async def _dispatch(self, streams, deliveries: Optional[Dict[str, int]] = None) -> int:
+        """Submit read messages to the dispatcher, keyed by partition.
+        
+        Args:
+            streams: XREADGROUP-style result
+            deliveries: Delivery counts of redelivered messages by message ID
+        """
+        dispatched = 0
+        for _, messages in streams or []:
+            for message_id, fields in messages:
+                message_id = message_id.decode() if isinstance(message_id, bytes) else str(message_id)
+                if not fields:
+                    # Entry was trimmed from the stream while pending
+                    self._ack(message_id)
+                    continue
+                if message_id in self._pending:
+                    continue
+                
+                times_delivered = deliveries.get(message_id, 1) if deliveries else 1
+                if times_delivered > self.max_deliveries:
+                    if await self.processor._dead_letter(
+                        self.queue_name,
+                        self.consumer_group,
+                        message_id,
+                        fields,
+                        reason=f"Delivered {times_delivered} times without acknowledgment",
+                        deliveries=times_delivered,
+                    ):
+                        self._ack(message_id)
+                    continue
+                if times_delivered > 1:
+                    self._redelivered += 1
+                
+                # Decode once; the event is handed to the worker with the message
+                try:
+                    event = self.processor._deserialize_event(fields)
+                except Exception:
+                    event = None
+                
+                self._pending.add(message_id)
+                self._messages_read += 1
+                dispatched += 1
+                await self.dispatcher.submit(
+                    self._partition_of(event, message_id), (message_id, fields, event)
+                )
+        return dispatched
+    
+    @staticmethod
+    def _partition_of(event: Optional[LazyEvent], message_id: str) -> Any:
+        """Ordering key for a message.
+        
+        Events are ordered per aggregate. The publisher's ``partition_key`` is
+        per tenant, which would serialize a whole tenant, so it is not used.
+        Messages that cannot be decoded are not ordered.
+        """
+        if event is None:
+            return message_id
+        return event.aggregate_key
+    
+    async def _handle(self, item) -> None:
+        """Process one message and queue its acknowledgment."""
+        message_id, fields, event = item
+        if await self.processor._process_message(
+            self.queue_name, message_id, fields, self.handler, self.consumer_group, self.consumer_name, event
+        ):
+            self._ack(message_id)
+        else:
+            # Left pending in Redis; the reclaimer redelivers it once idle
+            self._pending.discard(message_id)
+    
+    def _ack(self, message_id: str) -> None:
+        """Buffer an acknowledgment, flushing early once the batch is full."""
+        self._ack_buffer.append(message_id)
+        if len(self._ack_buffer) >= self.ack_batch_size and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.create_task(self.flush_acks())
+    
+    async def flush_acks(self) -> None:
+        """Acknowledge all buffered message IDs with one XACK."""
+        if not self._ack_buffer:
+            return
+        
+        message_ids, self._ack_buffer = self._ack_buffer, []
+        try:
+            await self.processor._redis.xack(self.queue_name, self.consumer_group, *message_ids)
+        except Exception as e:
+            logger.error(f"Failed to acknowledge {len(message_ids)} messages on '{self.queue_name}': {e}")
+            self._ack_buffer[:0] = message_ids
+            return
+        
+        self._pending.difference_update(message_ids)
+        self._acked += len(message_ids)
+        self._ack_calls += 1
+    
+    async def _ack_loop(self) -> None:
+        """Flush acknowledgments periodically."""
+        while True:
+            await asyncio.sleep(self.ack_interval)
+            await self.flush_acks()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get local consumer statistics."""
+        elapsed = time.monotonic() - self._started_at
+        return {
+            "consumer_name": self.consumer_name,
+            "read_calls": self._read_calls,
+            "messages_read": self._messages_read,
+            "acked": self._acked,
+            "ack_calls": self._ack_calls,
+            "redelivered": self._redelivered,
+            "dead_lettered": self.processor._dead_letter_counts.get(
+                f"{self.queue_name}:{self.consumer_group}", 0
+            ),
+            "pending_local": len(self._pending),
+            "events_per_second": self._acked / elapsed if elapsed > 0 else 0.0,
+            **self.dispatcher.get_stats(),
+            **(self.reclaimer.get_stats() if self.reclaimer else {}),
+        }
+
+
 class RedisEventProcessor(EventProcessorProtocol):
     """Redis Streams-based event processor implementation.
     
@@ -32,21 +317,76 @@ class RedisEventProcessor(EventProcessorProtocol):
     - Consumer Groups for concurrent processing
     - Acknowledgment and retry logic
     - High-performance concurrent event handling
+    
+    Events of the same aggregate are handled in stream order; different
+    aggregates are handled in parallel by a bounded worker pool.
+    
+    Entries left pending by crashed consumers are reclaimed with XAUTOCLAIM
+    once idle for ``claim_min_idle_ms``. Events that exhaust their retries,
+    cannot be deserialized or were delivered more than ``max_retries`` times
+    are moved to a per-stream dead-letter stream (``<stream>:dead-letter``).
     """
     
-    def __init__(self, redis_client, max_retries: int = 3, retry_delay: float = 1.0):
+    def __init__(
+        self,
+        redis_client,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        concurrency: int = 8,
+        max_buffered: Optional[int] = None,
+        ack_batch_size: int = 100,
+        ack_interval: float = 0.05,
+        consumer_name: Optional[str] = None,
+        claim_min_idle_ms: int = 60000,
+        reclaim_interval: float = 30.0,
+        dead_letter_maxlen: Optional[int] = 100000,
+        lazy_events: bool = False,
+    ):
         """Initialize Redis event processor.
         
         Args:
-            redis_client: Async Redis client (e.g., aioredis.Redis)
+            redis_client: Async Redis client with binary responses
+                (``decode_responses=False``); compact entries are not text
             max_retries: Maximum retry attempts for failed events
             retry_delay: Delay between retry attempts in seconds
+            concurrency: Partitions handled in parallel per consumer
+            max_buffered: Read-ahead limit per consumer (default: 4 x concurrency)
+            ack_batch_size: Acknowledgments buffered before an early XACK flush
+            ack_interval: Maximum seconds an acknowledgment stays buffered
+            consumer_name: Stable consumer name, e.g. a pod or host name, so a
+                restarted process resumes its own pending messages. Must be
+                unique among live processors of a group (default: host-pid)
+            claim_min_idle_ms: Reclaim pending entries idle for this long; must
+                exceed the longest expected handler run time
+            reclaim_interval: Seconds between reclaim scans
+            dead_letter_maxlen: Approximate maximum length of dead-letter streams
+            lazy_events: Pass handlers the decoded ``LazyEvent`` instead of a full
+                ``Event``. It skips building value objects that are never read but
+                lacks the ``Event`` methods; opt in only for handlers that read
+                attributes
+        
+        Raises:
+            ValueError: If the client decodes responses to str
         """
+        if is_text_client(redis_client):
+            raise ValueError("RedisEventProcessor requires a Redis client with decode_responses=False")
+        
         self._redis = redis_client
         self._max_retries = max_retries
         self._retry_delay = retry_delay
+        self._concurrency = concurrency
+        self._max_buffered = max_buffered
+        self._ack_batch_size = ack_batch_size
+        self._ack_interval = ack_interval
+        self._consumer_name = consumer_name or f"{socket.gethostname()}-{os.getpid()}"
+        self._claim_min_idle_ms = claim_min_idle_ms
+        self._reclaim_interval = reclaim_interval
+        self._dead_letter_maxlen = dead_letter_maxlen
+        self._lazy_events = lazy_events
+        self._dead_letter_counts: Dict[str, int] = {}
         self._consumers = {}  # Track running consumers
         self._stop_flags = {}  # Stop flags for consumers
+        self._stream_consumers: Dict[str, _StreamConsumer] = {}
     
     async def consume(
         self,
@@ -69,40 +409,14 @@ class RedisEventProcessor(EventProcessorProtocol):
             # Ensure consumer group exists
             await self._ensure_consumer_group(queue_name, consumer_group)
             
-            # Create unique consumer name
-            consumer_name = f"{consumer_group}-{id(self)}"
-            
-            # Read pending messages first (unacknowledged)
-            pending_messages = await self._redis.xreadgroup(
-                consumer_group,
-                consumer_name,
-                {queue_name: "0"},
-                count=max_events,
-                block=0
-            )
-            
-            # Process pending messages
-            for stream, messages in pending_messages:
-                for message_id, fields in messages:
-                    await self._process_message(
-                        queue_name, message_id, fields, handler, consumer_group, consumer_name
-                    )
-            
-            # Read new messages
-            new_messages = await self._redis.xreadgroup(
-                consumer_group,
-                consumer_name,
-                {queue_name: ">"},
-                count=max_events,
-                block=timeout_ms
-            )
-            
-            # Process new messages
-            for stream, messages in new_messages:
-                for message_id, fields in messages:
-                    await self._process_message(
-                        queue_name, message_id, fields, handler, consumer_group, consumer_name
-                    )
+            # Pending messages are recovered on the first call only
+            consumer = self._get_stream_consumer(queue_name, consumer_group, handler)
+            consumer.handler = handler
+            consumer.start()
+            try:
+                await consumer.read_once(max_events, timeout_ms)
+            finally:
+                await consumer.stop()
                     
         except Exception as e:
             logger.error(f"Failed to consume events from '{queue_name}': {e}")
@@ -130,7 +444,7 @@ class RedisEventProcessor(EventProcessorProtocol):
             await self._ensure_consumer_group(queue_name, consumer_group)
             
             # Create unique consumer name
-            consumer_name = f"{consumer_group}-batch-{id(self)}"
+            consumer_name = f"{consumer_group}-batch-{self._consumer_name}"
             
             # Read messages from stream
             messages = await self._redis.xreadgroup(
@@ -156,19 +470,24 @@ class RedisEventProcessor(EventProcessorProtocol):
                         message_ids.append(message_id)
                     except Exception as e:
                         logger.error(f"Failed to deserialize event {message_id}: {e}")
-                        # Acknowledge malformed message to remove from queue
-                        await self._redis.xack(queue_name, consumer_group, message_id)
+                        # Dead-letter malformed message, then remove it from the queue
+                        if await self._dead_letter(
+                            queue_name, consumer_group, message_id, fields, str(e)
+                        ):
+                            await self._redis.xack(queue_name, consumer_group, message_id)
             
             if events:
                 try:
                     # Process batch with handler
+                    if not self._lazy_events:
+                        events = [event.to_event() for event in events]
                     await batch_handler(events, queue_name)
                     
                     # Acknowledge all successful messages
                     if message_ids:
                         await self._redis.xack(queue_name, consumer_group, *message_ids)
                     
-                    logger.info(f"Successfully processed batch of {len(events)} events")
+                    logger.info("Successfully processed batch of %s events", len(events))
                     
                 except Exception as e:
                     logger.error(f"Batch handler failed for {len(events)} events: {e}")
@@ -198,7 +517,7 @@ class RedisEventProcessor(EventProcessorProtocol):
             result = await self._redis.xack(queue_name, consumer_group, message_id)
             
             if result:
-                logger.debug(f"Acknowledged event {event.id} with message_id {message_id}")
+                logger.debug("Acknowledged event %s with message_id %s", event.id, message_id)
             else:
                 logger.warning(f"Failed to acknowledge message {message_id} - may already be acked")
                 
@@ -233,7 +552,7 @@ class RedisEventProcessor(EventProcessorProtocol):
                 delay = self._retry_delay * (2 ** (event.retry_count - 1))
                 await asyncio.sleep(delay)
                 
-                logger.info(f"Retrying event {event.id} (attempt {event.retry_count}/{event.max_retries})")
+                logger.info("Retrying event %s (attempt %s/%s)", event.id, event.retry_count, event.max_retries)
                 
                 # Event will remain in pending list for next consumer read
                 
@@ -242,10 +561,15 @@ class RedisEventProcessor(EventProcessorProtocol):
                 event.status = EventStatus.FAILED
                 event.error_message = error_message
                 
-                # Acknowledge to remove from queue (move to dead letter or log)
+                # Move to the dead-letter stream, then acknowledge to remove from queue
                 queue_name = event.queue_name
                 if queue_name:
                     consumer_group = self._extract_consumer_group(event)
+                    entries = await self._redis.xrange(queue_name, message_id, message_id)
+                    if entries:
+                        await self._dead_letter(
+                            queue_name, consumer_group, message_id, entries[0][1], error_message
+                        )
                     await self._redis.xack(queue_name, consumer_group, message_id)
                     
                 logger.error(f"Event {event.id} failed permanently: {error_message}")
@@ -286,7 +610,7 @@ class RedisEventProcessor(EventProcessorProtocol):
         
         self._consumers[consumer_key] = consumer_task
         
-        logger.info(f"Started consumer for {consumer_key}")
+        logger.info("Started consumer for %s", consumer_key)
     
     async def stop_consumer(self, queue_name: str, consumer_group: str) -> None:
         """Stop a running consumer.
@@ -320,7 +644,7 @@ class RedisEventProcessor(EventProcessorProtocol):
         if consumer_key in self._stop_flags:
             del self._stop_flags[consumer_key]
         
-        logger.info(f"Stopped consumer for {consumer_key}")
+        logger.info("Stopped consumer for %s", consumer_key)
     
     async def get_consumer_stats(
         self,
@@ -355,15 +679,25 @@ class RedisEventProcessor(EventProcessorProtocol):
                     group_stats = group
                     break
             
+            try:
+                pending = await pending_summary(self._redis, queue_name, consumer_group)
+            except Exception:
+                pending = {}
+            
             return {
                 "queue_name": queue_name,
                 "consumer_group": consumer_group,
                 "stream_length": stream_info.get("length", 0),
                 "consumers_count": len(consumer_info),
                 "pending_messages": group_stats.get("pending", 0) if group_stats else 0,
+                "pending_by_consumer": pending.get("pending_by_consumer", {}),
+                "oldest_pending_idle_ms": pending.get("oldest_pending_idle_ms", 0),
+                "lag": group_stats.get("lag") if group_stats else None,
                 "last_delivered_id": group_stats.get("last-delivered-id") if group_stats else None,
+                "dead_letter_length": await self._redis.xlen(self.dead_letter_stream(queue_name)),
                 "consumer_details": consumer_info,
-                "is_running": f"{queue_name}:{consumer_group}" in self._consumers
+                "is_running": f"{queue_name}:{consumer_group}" in self._consumers,
+                "local": self._local_stats(queue_name, consumer_group),
             }
             
         except Exception as e:
@@ -396,7 +730,7 @@ class RedisEventProcessor(EventProcessorProtocol):
         try:
             # Try to create consumer group (will fail if already exists)
             await self._redis.xgroup_create(stream_name, group_name, id="0", mkstream=True)
-            logger.info(f"Created consumer group '{group_name}' for stream '{stream_name}'")
+            logger.info("Created consumer group '%s' for stream '%s'", group_name, stream_name)
         except Exception as e:
             # Consumer group likely already exists, which is fine
             if "BUSYGROUP" not in str(e):
@@ -409,91 +743,183 @@ class RedisEventProcessor(EventProcessorProtocol):
         fields: Dict,
         handler: EventHandler,
         consumer_group: str,
-        consumer_name: str
-    ) -> None:
-        """Process a single message from Redis stream."""
+        consumer_name: str,
+        event: Optional[LazyEvent] = None
+    ) -> bool:
+        """Process a single message from Redis stream.
+        
+        Failed events are retried in place with exponential backoff, which keeps
+        later events of the same partition waiting behind them.
+        
+        Args:
+            event: Already decoded event, if available
+        
+        Returns:
+            True when the message is done and can be acknowledged; False when
+            it could not be dead-lettered and must stay pending
+        """
         try:
             # Deserialize event from Redis fields
-            event = self._deserialize_event(fields)
-            
-            # Set queue context
-            event.queue_name = queue_name
-            event.message_id = str(message_id)
-            
-            # Process event with handler
-            await handler(event, queue_name)
-            
-            # Acknowledge successful processing
-            await self._redis.xack(queue_name, consumer_group, message_id)
-            
-            logger.debug(f"Successfully processed event {event.id}")
-            
+            if event is None:
+                event = self._deserialize_event(fields)
         except Exception as e:
-            logger.error(f"Failed to process message {message_id}: {e}")
-            
-            # Try to deserialize event for nack handling
+            # Dead-letter to prevent infinite retry of malformed message
+            logger.error(f"Failed to deserialize message {message_id}: {e}")
+            return await self._dead_letter(queue_name, consumer_group, message_id, fields, str(e))
+        
+        # Set queue context
+        event.queue_name = queue_name
+        event.message_id = str(message_id)
+        
+        # Continue the publisher's trace, if the entry carries one
+        span_attributes = {
+            "messaging.system": "redis",
+            "messaging.destination": queue_name,
+            "messaging.message_id": str(message_id),
+        }
+        with get_tracer().start_as_current_span(
+            "event.process", SpanKind.CONSUMER, span_attributes, parent=extract(fields)
+        ):
+            return await self._handle_with_retries(
+                queue_name, message_id, fields, handler, consumer_group, event
+            )
+    
+    async def _handle_with_retries(
+        self,
+        queue_name: str,
+        message_id: str,
+        fields: Dict,
+        handler: EventHandler,
+        consumer_group: str,
+        event: LazyEvent
+    ) -> bool:
+        """Run the handler, retrying with backoff and dead-lettering on exhaustion."""
+        handled = event if self._lazy_events else event.to_event()
+        while True:
             try:
-                event = self._deserialize_event(fields)
-                await self.nack(event, str(message_id), str(e))
-            except Exception as nack_error:
-                logger.error(f"Failed to handle processing error: {nack_error}")
-                # Acknowledge to prevent infinite retry of malformed message
-                await self._redis.xack(queue_name, consumer_group, message_id)
-    
-    def _deserialize_event(self, fields: Dict) -> Event:
-        """Deserialize event from Redis stream fields."""
-        try:
-            # Convert bytes to strings if needed
-            if isinstance(fields, dict):
-                fields = {k.decode() if isinstance(k, bytes) else k: 
-                         v.decode() if isinstance(v, bytes) else v 
-                         for k, v in fields.items()}
-            
-            # Parse event data
-            event_data = json.loads(fields.get("event_data", "{}"))
-            event_metadata = json.loads(fields.get("event_metadata", "{}"))
-            
-            # Create aggregate reference
-            aggregate_ref = AggregateReference(
-                aggregate_id=fields["aggregate_id"],
-                aggregate_type=fields["aggregate_type"]
+                # Process event with handler
+                handled.retry_count = event.retry_count
+                await handler(handled, queue_name)
+                logger.debug("Successfully processed event %s", event.event_id_value)
+                return True
+            
+            except Exception as e:
+                logger.warning(f"Processing failed for event {event.event_id_value}: {e}")
+                
+                if event.retry_count >= event.max_retries:
+                    event.status = EventStatus.FAILED
+                    event.error_message = str(e)
+                    logger.error(f"Event {event.event_id_value} failed permanently: {e}")
+                    return await self._dead_letter(
+                        queue_name, consumer_group, message_id, fields, str(e), event.retry_count + 1
+                    )
+                
+                # Exponential backoff before retrying
+                event.retry_count += 1
+                delay = self._retry_delay * (2 ** (event.retry_count - 1))
+                logger.info(
+                    "Retrying event %s (attempt %s/%s)", event.event_id_value, event.retry_count, event.max_retries
+                )
+                await asyncio.sleep(delay)
+    
+    def _get_stream_consumer(
+        self,
+        queue_name: str,
+        consumer_group: str,
+        handler: EventHandler,
+        **kwargs
+    ) -> _StreamConsumer:
+        """Get or create the consumer state for a stream and group."""
+        consumer_key = f"{queue_name}:{consumer_group}"
+        consumer = self._stream_consumers.get(consumer_key)
+        if consumer is None:
+            consumer_name = f"{consumer_group}-{self._consumer_name}"
+            consumer = _StreamConsumer(
+                self,
+                queue_name,
+                consumer_group,
+                consumer_name=consumer_name,
+                handler=handler,
+                concurrency=kwargs.get("concurrency", self._concurrency),
+                max_buffered=kwargs.get("max_buffered", self._max_buffered),
+                ack_batch_size=kwargs.get("ack_batch_size", self._ack_batch_size),
+                ack_interval=kwargs.get("ack_interval", self._ack_interval),
+                max_deliveries=max(1, self._max_retries),
+                reclaimer=PendingReclaimer(
+                    self._redis,
+                    queue_name,
+                    consumer_group,
+                    consumer_name,
+                    min_idle_ms=kwargs.get("claim_min_idle_ms", self._claim_min_idle_ms),
+                ),
+                reclaim_interval=kwargs.get("reclaim_interval", self._reclaim_interval),
             )
-            
-            # Parse optional fields
-            correlation_id = CorrelationId(fields["correlation_id"]) if fields.get("correlation_id") else None
-            causation_id = CorrelationId(fields["causation_id"]) if fields.get("causation_id") else None
-            
-            # Parse timestamps
-            created_at = datetime.fromisoformat(fields["created_at"])
-            scheduled_at = datetime.fromisoformat(fields["scheduled_at"]) if fields.get("scheduled_at") else None
-            
-            # Create event entity
-            event = Event(
-                id=EventId(fields["event_id"]),
-                event_type=EventType(fields["event_type"]),
-                aggregate_reference=aggregate_ref,
-                event_data=event_data,
-                event_metadata=event_metadata,
-                created_at=created_at,
-                scheduled_at=scheduled_at,
-                status=EventStatus(fields["status"]),
-                priority=EventPriority(fields["priority"]),
-                retry_count=int(fields.get("retry_count", 0)),
-                max_retries=int(fields.get("max_retries", 3)),
-                correlation_id=correlation_id,
-                causation_id=causation_id,
-                tenant_id=UUID(fields["tenant_id"]) if fields.get("tenant_id") else None,
-                organization_id=UUID(fields["organization_id"]) if fields.get("organization_id") else None,
-                user_id=UUID(fields["user_id"]) if fields.get("user_id") else None,
-                source_service=fields.get("source_service") or None,
-                source_version=fields.get("source_version") or None,
+            self._stream_consumers[consumer_key] = consumer
+        return consumer
+    
+    @staticmethod
+    def dead_letter_stream(queue_name: str) -> str:
+        """Name of the dead-letter stream for a queue."""
+        return f"{queue_name}:dead-letter"
+    
+    async def _dead_letter(
+        self,
+        queue_name: str,
+        consumer_group: str,
+        message_id: str,
+        fields: Dict,
+        reason: str,
+        deliveries: Optional[int] = None
+    ) -> bool:
+        """Copy a message to the queue's dead-letter stream.
+        
+        The original fields are kept so the event can be inspected and
+        replayed; ``dlq_*`` fields record where and why it failed.
+        
+        Returns:
+            True when the message was dead-lettered and can be acknowledged
+        """
+        if isinstance(message_id, bytes):
+            message_id = message_id.decode()
+        entry = dict(fields)
+        entry.update({
+            "dlq_source_stream": queue_name,
+            "dlq_source_id": str(message_id),
+            "dlq_consumer_group": consumer_group,
+            "dlq_reason": reason[:1000],
+            "dlq_deliveries": deliveries if deliveries is not None else "",
+            "dlq_failed_at": datetime.now(timezone.utc).isoformat(),
+        })
+        
+        try:
+            await self._redis.xadd(
+                self.dead_letter_stream(queue_name),
+                entry,
+                maxlen=self._dead_letter_maxlen,
+                approximate=True,
             )
-            
-            # Set partition key
-            event.partition_key = fields.get("partition_key")
-            
-            return event
-            
+        except Exception as e:
+            logger.error(f"Failed to dead-letter message {message_id} from '{queue_name}': {e}")
+            return False
+        
+        consumer_key = f"{queue_name}:{consumer_group}"
+        self._dead_letter_counts[consumer_key] = self._dead_letter_counts.get(consumer_key, 0) + 1
+        logger.warning(f"Dead-lettered message {message_id} from '{queue_name}': {reason}")
+        return True
+    
+    def _local_stats(self, queue_name: str, consumer_group: str) -> Optional[Dict[str, Any]]:
+        """Statistics of this process's consumer for a stream and group."""
+        consumer = self._stream_consumers.get(f"{queue_name}:{consumer_group}")
+        return consumer.get_stats() if consumer else None
+    
+    def _deserialize_event(self, fields: Dict) -> LazyEvent:
+        """Deserialize event from Redis stream fields.
+        
+        Reads both the compact single-field encoding and the original
+        one-field-per-attribute format; value objects are built lazily.
+        """
+        try:
+            return decode_event(fields)
         except Exception as e:
             raise EventHandlingError(f"Failed to deserialize event: {e}")
     
@@ -517,23 +943,23 @@ class RedisEventProcessor(EventProcessorProtocol):
         **kwargs
     ) -> None:
         """Run long-running consumer loop."""
-        logger.info(f"Starting consumer loop for {queue_name}:{consumer_group}")
+        logger.info("Starting consumer loop for %s:%s", queue_name, consumer_group)
         
         # Extract configuration
         batch_size = kwargs.get("batch_size", 10)
         timeout_ms = kwargs.get("timeout_ms", 5000)
         
+        consumer = None
         try:
+            await self._ensure_consumer_group(queue_name, consumer_group)
+            consumer = self._get_stream_consumer(queue_name, consumer_group, handler, **kwargs)
+            consumer.handler = handler
+            consumer.start()
+            
             while not stop_flag.is_set():
                 try:
-                    # Consume batch of events
-                    await self.consume(
-                        queue_name=queue_name,
-                        consumer_group=consumer_group,
-                        handler=handler,
-                        max_events=batch_size,
-                        timeout_ms=timeout_ms
-                    )
+                    # Read and dispatch; blocks while workers are saturated
+                    await consumer.read_once(batch_size, timeout_ms)
                     
                 except asyncio.TimeoutError:
                     # Normal timeout, continue loop
@@ -545,8 +971,10 @@ class RedisEventProcessor(EventProcessorProtocol):
                     await asyncio.sleep(1.0)
                     
         except asyncio.CancelledError:
-            logger.info(f"Consumer loop cancelled for {queue_name}:{consumer_group}")
+            logger.info("Consumer loop cancelled for %s:%s", queue_name, consumer_group)
         except Exception as e:
             logger.error(f"Consumer loop failed for {queue_name}:{consumer_group}: {e}")
         finally:
-            logger.info(f"Consumer loop ended for {queue_name}:{consumer_group}")
\ No newline at end of file
+            if consumer is not None:
+                await consumer.stop()
+            logger.info("Consumer loop ended for %s:%s", queue_name, consumer_group)
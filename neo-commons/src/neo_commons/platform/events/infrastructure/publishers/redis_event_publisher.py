@@ -7,12 +7,15 @@ with partitioning and consumer groups.
 
 import json
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 from ....application.protocols.event_publisher import EventPublisherProtocol
 from ....domain.entities.event import Event
+from ....domain.entities.event_metadata import EventMetadata
 from .....core.exceptions import EventPublishingError
+from ..serializers.event_wire_format import encode_event, is_compact_available, is_text_client
+from .....infrastructure.tracing import SpanKind, get_tracer, inject
 
 
 logger = logging.getLogger(__name__)
@@ -26,17 +29,42 @@ class RedisEventPublisher(EventPublisherProtocol):
     - Partitioning by tenant/event type
     - Consumer Groups for multiple workers
     - High performance with 50K+ events/second capability
+    
+    Events are written in the compact single-field wire format by default,
+    which needs a Redis client with ``decode_responses=False``. Use
+    ``wire_format="fields"`` while consumers running an older version of this
+    library still read the stream.
     """
     
-    def __init__(self, redis_client, max_len: int = 100000):
+    WIRE_FORMATS = ("compact", "fields")
+    
+    def __init__(self, redis_client, max_len: int = 100000, wire_format: str = "compact"):
         """Initialize Redis event publisher.
         
         Args:
             redis_client: Async Redis client (e.g., aioredis.Redis)
             max_len: Maximum stream length for memory management
+            wire_format: "compact" (msgpack) or "fields" (one field per attribute)
+        
+        Raises:
+            ValueError: If the wire format is unknown, or compact is selected
+                without msgpack or with a ``decode_responses=True`` client
         """
+        if wire_format not in self.WIRE_FORMATS:
+            raise ValueError(f"Unknown wire format '{wire_format}', expected one of {self.WIRE_FORMATS}")
+        if wire_format == "compact":
+            if not is_compact_available():
+                raise ValueError(
+                    "The compact wire format requires msgpack; install it or use wire_format='fields'"
+                )
+            if is_text_client(redis_client):
+                raise ValueError(
+                    "The compact wire format requires a Redis client with decode_responses=False"
+                )
+        
         self._redis = redis_client
         self._max_len = max_len
+        self._compact = wire_format == "compact"
     
     async def publish(
         self, 
@@ -66,16 +94,18 @@ class RedisEventPublisher(EventPublisherProtocol):
             # Build partition key for stream distribution
             partition = self._build_partition_key(event, schema, partition_key)
             
-            # Prepare event payload for Redis stream
-            payload = self._serialize_event(event, schema, partition)
-            
-            # Publish to Redis stream with MAXLEN for memory management
-            message_id = await self._redis.xadd(
-                stream_name,
-                payload,
-                maxlen=self._max_len,
-                approximate=True
-            )
+            span_attributes = {"messaging.system": "redis", "messaging.destination": stream_name}
+            with get_tracer().start_as_current_span("event.publish", SpanKind.PRODUCER, span_attributes):
+                # Prepare event payload for Redis stream
+                payload = self._encode(event, schema, partition)
+                
+                # Publish to Redis stream with MAXLEN for memory management
+                message_id = await self._redis.xadd(
+                    stream_name,
+                    payload,
+                    maxlen=self._max_len,
+                    approximate=True
+                )
             
             # Update event with queue information
             event.queue_name = stream_name
@@ -116,36 +146,20 @@ class RedisEventPublisher(EventPublisherProtocol):
             return []
         
         try:
-            # Use Redis pipeline for batch efficiency
-            pipeline = self._redis.pipeline()
-            message_ids = []
-            
+            entries = []
             for event in events:
-                # Build stream name for each event
-                stream_name = self._build_stream_name(event, schema, queue_name)
-                partition = self._build_partition_key(event, schema)
-                payload = self._serialize_event(event, schema, partition)
-                
-                # Add to pipeline
-                pipeline.xadd(
-                    stream_name,
-                    payload,
-                    maxlen=self._max_len,
-                    approximate=True
-                )
+                stream_name, partition, payload = self.encode_entry(event, schema, queue_name)
+                entries.append((stream_name, payload))
                 
                 # Update event with queue information
                 event.queue_name = stream_name
                 event.partition_key = partition
             
-            # Execute pipeline batch
-            results = await pipeline.execute()
+            message_ids = await self.publish_entries(entries)
             
-            # Extract message IDs and update events
-            for i, (event, result) in enumerate(zip(events, results)):
-                message_id = str(result)
+            # Update events with their message IDs
+            for event, message_id in zip(events, message_ids):
                 event.message_id = message_id
-                message_ids.append(message_id)
             
             logger.info(f"Published batch of {len(events)} events to Redis streams")
             return message_ids
@@ -154,6 +168,53 @@ class RedisEventPublisher(EventPublisherProtocol):
             logger.error(f"Failed to publish event batch to Redis: {e}")
             raise PublishError(f"Failed to publish event batch: {e}")
     
+    def encode_entry(
+        self,
+        event: Event,
+        schema: str,
+        queue_name: Optional[str] = None,
+        partition_key: Optional[str] = None
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """Build the stream entry for an event without publishing it.
+        
+        Args:
+            event: Event entity to encode
+            schema: Database schema context for routing
+            queue_name: Optional specific queue name override
+            partition_key: Optional partition key override
+            
+        Returns:
+            Tuple of (stream name, partition key, stream entry fields)
+        """
+        stream_name = self._build_stream_name(event, schema, queue_name)
+        partition = self._build_partition_key(event, schema, partition_key)
+        return stream_name, partition, self._encode(event, schema, partition)
+    
+    async def publish_entries(self, entries: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Append already encoded stream entries in one pipelined round trip.
+        
+        Args:
+            entries: List of (stream name, stream entry fields)
+            
+        Returns:
+            List of stream message IDs, in the order of ``entries``
+        """
+        if not entries:
+            return []
+        
+        # Entries of one stream keep their order; no MULTI/EXEC is needed for that
+        pipeline = self._redis.pipeline(transaction=False)
+        for stream_name, payload in entries:
+            pipeline.xadd(
+                stream_name,
+                payload,
+                maxlen=self._max_len,
+                approximate=True
+            )
+        
+        results = await pipeline.execute()
+        return [result.decode() if isinstance(result, bytes) else str(result) for result in results]
+    
     async def get_queue_stats(self, queue_name: str) -> Dict[str, Any]:
         """Get Redis stream statistics for monitoring.
         
@@ -264,8 +325,18 @@ class RedisEventPublisher(EventPublisherProtocol):
         # Default to schema-based partitioning
         return f"{schema}:system"
     
+    def _encode(self, event: Event, schema: str, partition_key: str) -> Dict[str, Any]:
+        """Encode event in the configured wire format.
+        
+        The current trace context is added as a ``traceparent`` field so
+        consumers continue the trace.
+        """
+        if self._compact:
+            return inject(encode_event(event, schema, partition_key))
+        return inject(self._serialize_event(event, schema, partition_key))
+    
     def _serialize_event(self, event: Event, schema: str, partition_key: str) -> Dict[str, str]:
-        """Serialize event for Redis stream storage.
+        """Serialize event in the one-field-per-attribute format.
         
         Args:
             event: Event entity to serialize
@@ -286,7 +357,9 @@ class RedisEventPublisher(EventPublisherProtocol):
             
             # Event content
             "event_data": json.dumps(event.event_data),
-            "event_metadata": json.dumps(event.event_metadata),
+            "event_metadata": json.dumps(
+                event.event_metadata.to_dict() if isinstance(event.event_metadata, EventMetadata) else event.event_metadata
+            ),
             
             # Processing information
             "status": event.status.value,
@@ -1,6 +1,7 @@
 """SQL queries for events infrastructure."""
 
 from .event_queries import *
+from .outbox_queries import *
 
 __all__ = [
     # Insert queries
@@ -23,4 +24,12 @@ __all__ = [
     
     # Utility queries
     "EVENT_EXISTS_BY_ID",
+    
+    # Outbox queries
+    "OUTBOX_INSERT_BATCH",
+    "OUTBOX_CLAIM_BATCH",
+    "OUTBOX_SHARD_FILTER",
+    "OUTBOX_MARK_PUBLISHED",
+    "OUTBOX_PURGE_PUBLISHED",
+    "OUTBOX_BACKLOG",
 ]
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""SQL queries for the transactional event outbox."""
+
+# ============================================================================
+# OUTBOX INSERT QUERIES
+# ============================================================================
+
+OUTBOX_INSERT_BATCH = """
+    INSERT INTO {schema}.event_outbox (
+        event_id, aggregate_id, stream_name, partition_key, payload
+    )
+    SELECT * FROM unnest($1::uuid[], $2::uuid[], $3::text[], $4::text[], $5::bytea[])
+"""
+
+# ============================================================================
+# OUTBOX RELAY QUERIES
+# ============================================================================
+
+# Rows locked by another relay are skipped, so relays never publish the same
+# batch twice; {shard_filter} restricts a relay to its share of aggregates
+OUTBOX_CLAIM_BATCH = """
+    SELECT
+        id,
+        stream_name,
+        payload,
+        EXTRACT(EPOCH FROM (clock_timestamp() - created_at)) AS age_seconds
+    FROM {schema}.event_outbox
+    WHERE published_at IS NULL
+    {shard_filter}
+    ORDER BY id
+    LIMIT $1
+    FOR UPDATE SKIP LOCKED
+"""
+
+OUTBOX_SHARD_FILTER = "AND (hashtext(aggregate_id::text) & 2147483647) % {shard_count} = {shard_index}"
+
+OUTBOX_MARK_PUBLISHED = """
+    WITH published AS (
+        UPDATE {schema}.event_outbox AS o
+        SET published_at = NOW(), message_id = p.message_id
+        FROM unnest($1::bigint[], $2::text[]) AS p(id, message_id)
+        WHERE o.id = p.id
+        RETURNING o.event_id, o.stream_name, o.message_id
+    )
+    UPDATE {schema}.events AS e
+    SET queue_name = published.stream_name, message_id = published.message_id
+    FROM published
+    WHERE e.id = published.event_id
+"""
+
+OUTBOX_PURGE_PUBLISHED = """
+    DELETE FROM {schema}.event_outbox
+    WHERE id IN (
+        SELECT id FROM {schema}.event_outbox
+        WHERE published_at < NOW() - make_interval(secs => $1)
+        LIMIT $2
+    )
+"""
+
+# ============================================================================
+# OUTBOX MONITORING QUERIES
+# ============================================================================
+
+OUTBOX_BACKLOG = """
+    SELECT
+        COUNT(*) AS pending,
+        COALESCE(EXTRACT(EPOCH FROM (NOW() - MIN(created_at))), 0) AS oldest_age_seconds
+    FROM {schema}.event_outbox
+    WHERE published_at IS NULL
+"""
@@ -13,6 +13,7 @@ from ....core.value_objects import EventId
 from ....core.exceptions import EntityNotFoundError, DatabaseError
 from ....features.database.entities.protocols import DatabaseRepository
 from ....domain.entities.event import Event, EventStatus, EventPriority
+from ....domain.entities.event_metadata import EventMetadata
 from ....application.protocols.event_repository import EventRepositoryProtocol
 from ..queries.event_queries import (
     EVENT_INSERT,
@@ -52,29 +53,7 @@ class AsyncPGEventRepository(EventRepositoryProtocol):
         """Save event to database in the specified schema."""
         try:
             query = EVENT_INSERT.format(schema=schema)
-            
-            # Prepare parameters matching the table structure
-            params = [
-                str(event.id.value),                           # id
-                event.event_type.value,                        # event_type
-                str(event.aggregate_reference.aggregate_id),   # aggregate_id
-                event.aggregate_reference.aggregate_type,      # aggregate_type
-                event.event_version,                           # event_version
-                str(event.correlation_id) if event.correlation_id else None,  # correlation_id
-                str(event.causation_id) if event.causation_id else None,      # causation_id
-                json.dumps(event.event_data),                  # event_data
-                json.dumps(event.event_metadata),              # event_metadata
-                event.status.value,                            # status
-                event.priority.value,                          # priority
-                event.scheduled_at,                            # scheduled_at
-                event.retry_count,                             # retry_count
-                event.max_retries,                             # max_retries
-                event.queue_name,                              # queue_name
-                event.message_id,                              # message_id
-                event.partition_key,                           # partition_key
-                event.created_at,                              # created_at
-                event.updated_at                               # updated_at
-            ]
+            params = self.insert_params(event)
             
             result = await self._db.execute_query(query, params)
             if result:
@@ -87,6 +66,36 @@ class AsyncPGEventRepository(EventRepositoryProtocol):
             logger.error(f"Failed to save event {event.id} in schema '{schema}': {e}")
             raise DatabaseError(f"Failed to save event: {e}")
     
+    @staticmethod
+    def insert_params(event: Event) -> List[Any]:
+        """Build EVENT_INSERT parameters for an event."""
+        metadata = event.event_metadata
+        if isinstance(metadata, EventMetadata):
+            metadata = metadata.to_dict()
+        
+        # Parameters matching the table structure
+        return [
+            str(event.id.value),                           # id
+            event.event_type.value,                        # event_type
+            str(event.aggregate_reference.aggregate_id),   # aggregate_id
+            event.aggregate_reference.aggregate_type,      # aggregate_type
+            event.event_version,                           # event_version
+            str(event.correlation_id) if event.correlation_id else None,  # correlation_id
+            str(event.causation_id.value) if event.causation_id else None,  # causation_id
+            json.dumps(event.event_data),                  # event_data
+            json.dumps(metadata),                          # event_metadata
+            event.status.value,                            # status
+            event.priority.value,                          # priority
+            event.scheduled_at,                            # scheduled_at
+            event.retry_count,                             # retry_count
+            event.max_retries,                             # max_retries
+            event.queue_name,                              # queue_name
+            event.message_id,                              # message_id
+            event.partition_key,                           # partition_key
+            event.created_at,                              # created_at
+            event.updated_at                               # updated_at
+        ]
+    
     async def get_by_id(self, event_id: EventId, schema: str) -> Optional[Event]:
         """Get event by ID from the specified schema."""
         try:
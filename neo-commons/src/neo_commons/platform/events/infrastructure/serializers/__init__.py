@@ -0,0 +1,21 @@
+"""Event serializers.
+
+This module contains the wire formats used to store events in
+message queues.
+"""
+
+from .event_wire_format import (
+    LazyEvent,
+    decode_event,
+    encode_event,
+    is_compact_available,
+    is_text_client,
+)
+
+__all__ = [
+    "LazyEvent",
+    "decode_event",
+    "encode_event",
+    "is_compact_available",
+    "is_text_client",
+]
@@ -0,0 +1,406 @@
+"""Compact wire format for events on Redis streams.
+
+An event is written as a single stream field holding a 2-byte version
+marker followed by a msgpack array: UUIDs as 16 raw bytes, timestamps as
+integer epoch milliseconds and payloads as native msgpack maps. Stream
+entries written in the original one-field-per-attribute format are still
+read.
+
+Decoding yields a ``LazyEvent``: scalar fields are available immediately,
+value objects (ids, event type, aggregate reference, timestamps) are only
+built when first accessed, so consumers that route on raw values never pay
+for them. Event and aggregate type strings are interned and ``EventType``
+value objects are shared between events of the same type.
+
+Redis clients used with this format must return binary responses
+(``decode_responses=False``).
+"""
+
+import json
+import sys
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from ...domain.entities.event import Event, EventStatus, EventPriority
+from ...domain.entities.event_metadata import EventMetadata
+from ...domain.value_objects.event_id import EventId
+from ...domain.value_objects.event_type import EventType
+from ...domain.value_objects.aggregate_reference import AggregateReference
+from ...domain.value_objects.correlation_id import CorrelationId
+
+# Stream field holding the encoded event
+WIRE_FIELD = "e"
+_WIRE_FIELD_BYTES = WIRE_FIELD.encode()
+
+# Version marker of the msgpack positional encoding below
+_MSGPACK_V1 = b"E1"
+
+# Interned EventType value objects by type string; event types are a small,
+# fixed vocabulary, the bound only guards against unbounded garbage input
+_EVENT_TYPES: Dict[str, EventType] = {}
+_MAX_INTERNED_TYPES = 4096
+
+_STATUSES = {status.value: status for status in EventStatus}
+_PRIORITIES = {priority.value: priority for priority in EventPriority}
+
+
+def is_compact_available() -> bool:
+    """Whether the compact encoding can be written (msgpack installed)."""
+    return msgpack is not None
+
+
+def is_text_client(redis_client) -> bool:
+    """Whether a Redis client decodes responses to str (``decode_responses=True``)."""
+    pool = getattr(redis_client, "connection_pool", None)
+    return bool(getattr(pool, "connection_kwargs", {}).get("decode_responses"))
+
+
+def _uuid_bytes(value: Any) -> Optional[bytes]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, UUID):
+        return value.bytes
+    if hasattr(value, "value"):
+        return _uuid_bytes(value.value)
+    return UUID(str(value)).bytes
+
+
+def _uuid(raw: Any) -> Optional[UUID]:
+    if raw is None or raw == "" or raw == b"":
+        return None
+    if isinstance(raw, bytes):
+        return UUID(bytes=raw)
+    return UUID(raw)
+
+
+def _epoch_ms(value: Optional[datetime]) -> Optional[int]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+def _datetime(raw: Any) -> Optional[datetime]:
+    if raw is None or raw == "":
+        return None
+    if isinstance(raw, int):
+        return datetime.fromtimestamp(raw / 1000, tz=timezone.utc)
+    return datetime.fromisoformat(raw)
+
+
+def _event_type(value: str) -> EventType:
+    event_type = _EVENT_TYPES.get(value)
+    if event_type is None:
+        event_type = EventType(value)
+        if len(_EVENT_TYPES) < _MAX_INTERNED_TYPES:
+            _EVENT_TYPES[value] = event_type
+    return event_type
+
+
+def _metadata_dict(metadata: Any) -> Optional[Dict[str, Any]]:
+    if not metadata:
+        return None
+    if isinstance(metadata, dict):
+        return metadata
+    return metadata.to_dict() or None
+
+
+def encode_event(event: Event, schema: str, partition_key: str) -> Dict[str, bytes]:
+    """Encode an event as a single-field stream entry.
+
+    Args:
+        event: Event entity to encode
+        schema: Database schema context
+        partition_key: Partition key for the event
+
+    Returns:
+        Dictionary suitable for Redis XADD
+
+    Raises:
+        RuntimeError: If msgpack is not installed
+    """
+    if msgpack is None:
+        raise RuntimeError("msgpack is required for the compact event wire format")
+
+    fields = [
+        _uuid_bytes(event.id),
+        event.event_type.value,
+        _uuid_bytes(event.aggregate_reference.aggregate_id),
+        event.aggregate_reference.aggregate_type,
+        schema,
+        partition_key,
+        event.event_data or None,
+        _metadata_dict(event.event_metadata),
+        event.status.value,
+        event.priority.value,
+        event.retry_count,
+        event.max_retries,
+        _uuid_bytes(event.correlation_id),
+        _uuid_bytes(event.causation_id),
+        _uuid_bytes(event.tenant_id),
+        _uuid_bytes(event.organization_id),
+        _uuid_bytes(event.user_id),
+        event.source_service,
+        event.source_version,
+        _epoch_ms(event.created_at),
+        _epoch_ms(event.scheduled_at),
+        _epoch_ms(datetime.now(timezone.utc)),
+        event.event_version,
+    ]
+    return {WIRE_FIELD: _MSGPACK_V1 + msgpack.packb(fields, use_bin_type=True, default=str)}
+
+
+def decode_event(fields: Dict) -> "LazyEvent":
+    """Decode a stream entry in either the compact or the legacy field format.
+
+    Args:
+        fields: Stream entry fields as returned by XREADGROUP
+
+    Returns:
+        Lazily materialized event
+
+    Raises:
+        ValueError: If the entry is not a decodable event
+    """
+    payload = fields.get(_WIRE_FIELD_BYTES)
+    if payload is None:
+        payload = fields.get(WIRE_FIELD)
+    if payload is None:
+        return _decode_legacy(fields)
+
+    marker = payload[:2]
+    if marker != _MSGPACK_V1:
+        raise ValueError(f"Unknown event wire format version: {marker!r}")
+    if msgpack is None:
+        raise ValueError("msgpack is required to decode compact events")
+
+    return LazyEvent(*msgpack.unpackb(payload[2:], raw=False))
+
+
+def _decode_legacy(fields: Dict) -> "LazyEvent":
+    """Decode the original one-field-per-attribute format."""
+    fields = {
+        k.decode() if isinstance(k, bytes) else k: v.decode() if isinstance(v, bytes) else v
+        for k, v in fields.items()
+    }
+    if "event_id" not in fields:
+        raise ValueError("Stream entry is not an event")
+
+    return LazyEvent(
+        event_id=fields["event_id"],
+        event_type=fields["event_type"],
+        aggregate_id=fields["aggregate_id"],
+        aggregate_type=fields["aggregate_type"],
+        schema=fields.get("schema"),
+        partition_key=fields.get("partition_key"),
+        # JSON payloads are parsed on first access
+        event_data=fields.get("event_data") or "{}",
+        event_metadata=fields.get("event_metadata") or None,
+        status=fields.get("status") or EventStatus.PENDING.value,
+        priority=fields.get("priority") or EventPriority.NORMAL.value,
+        retry_count=int(fields.get("retry_count") or 0),
+        max_retries=int(fields.get("max_retries") or 3),
+        correlation_id=fields.get("correlation_id"),
+        causation_id=fields.get("causation_id"),
+        tenant_id=fields.get("tenant_id"),
+        organization_id=fields.get("organization_id"),
+        user_id=fields.get("user_id"),
+        source_service=fields.get("source_service") or None,
+        source_version=fields.get("source_version") or None,
+        created_at=fields.get("created_at"),
+        scheduled_at=fields.get("scheduled_at"),
+        published_at=fields.get("published_at"),
+        event_version=1,
+    )
+
+
+class LazyEvent:
+    """Event read from a stream, with value objects built on first access.
+
+    Exposes the attributes of ``Event`` that consumers use. Raw values
+    (``event_id_value``, ``event_type_value``, ``aggregate_key``...) are
+    cheap to read; the corresponding value objects are constructed once,
+    when first accessed. ``to_event()`` materializes a full ``Event``.
+    It has none of the ``Event`` methods; ``RedisEventProcessor`` hands it
+    to handlers only when created with ``lazy_events=True``.
+
+    Constructor arguments follow the positional order of the compact encoding.
+    """
+
+    def __init__(
+        self,
+        event_id: Any,
+        event_type: str,
+        aggregate_id: Any,
+        aggregate_type: str,
+        schema: Optional[str],
+        partition_key: Optional[str],
+        event_data: Any,
+        event_metadata: Any,
+        status: str,
+        priority: str,
+        retry_count: int,
+        max_retries: int,
+        correlation_id: Any,
+        causation_id: Any,
+        tenant_id: Any,
+        organization_id: Any,
+        user_id: Any,
+        source_service: Optional[str],
+        source_version: Optional[str],
+        created_at: Any,
+        scheduled_at: Any,
+        published_at: Any,
+        event_version: int = 1,
+    ):
+        self._event_id = event_id
+        self._aggregate_id = aggregate_id
+        self._event_data = event_data
+        self._event_metadata = event_metadata
+        self._correlation_id = correlation_id
+        self._causation_id = causation_id
+        self._tenant_id = tenant_id
+        self._organization_id = organization_id
+        self._user_id = user_id
+        self._created_at = created_at
+        self._scheduled_at = scheduled_at
+        self._published_at = published_at
+
+        self.event_type_value = sys.intern(event_type)
+        self.aggregate_type = sys.intern(aggregate_type)
+        self.schema = schema
+        self.event_version = event_version
+        self.source_service = source_service
+        self.source_version = source_version
+
+        # Processing state (mutable, as on Event)
+        self.status = _STATUSES[status]
+        self.priority = _PRIORITIES[priority]
+        self.retry_count = retry_count
+        self.max_retries = max_retries
+        self.error_message: Optional[str] = None
+        self.error_details: Dict[str, Any] = {}
+        self.processing_started_at: Optional[datetime] = None
+        self.processing_completed_at: Optional[datetime] = None
+        self.processing_duration_ms: Optional[int] = None
+        self.queue_name: Optional[str] = None
+        self.message_id: Optional[str] = None
+        self.partition_key = partition_key
+
+    # Raw values
+
+    @cached_property
+    def event_id_value(self) -> str:
+        """Event ID as a string, without building the value object."""
+        raw = self._event_id
+        return str(UUID(bytes=raw)) if isinstance(raw, bytes) else raw
+
+    @property
+    def aggregate_key(self) -> Tuple[str, str]:
+        """(aggregate type, 32-char hex aggregate id) for ordering and routing."""
+        raw = self._aggregate_id
+        hex_id = raw.hex() if isinstance(raw, bytes) else raw.replace("-", "").lower()
+        return self.aggregate_type, hex_id
+
+    # Value objects, built on first access
+
+    @cached_property
+    def id(self) -> EventId:
+        return EventId(_uuid(self._event_id))
+
+    @cached_property
+    def event_type(self) -> EventType:
+        return _event_type(self.event_type_value)
+
+    @cached_property
+    def aggregate_reference(self) -> AggregateReference:
+        return AggregateReference(aggregate_id=_uuid(self._aggregate_id), aggregate_type=self.aggregate_type)
+
+    @cached_property
+    def event_data(self) -> Dict[str, Any]:
+        raw = self._event_data
+        return json.loads(raw) if isinstance(raw, str) else raw
+
+    @cached_property
+    def event_metadata(self) -> EventMetadata:
+        raw = self._event_metadata
+        if isinstance(raw, str):
+            raw = json.loads(raw)
+        return EventMetadata.from_dict(dict(raw)) if raw else EventMetadata.create_empty()
+
+    @cached_property
+    def correlation_id(self) -> Optional[CorrelationId]:
+        value = _uuid(self._correlation_id)
+        return CorrelationId(value) if value else None
+
+    @cached_property
+    def causation_id(self) -> Optional[EventId]:
+        value = _uuid(self._causation_id)
+        return EventId(value) if value else None
+
+    @cached_property
+    def tenant_id(self) -> Optional[UUID]:
+        return _uuid(self._tenant_id)
+
+    @cached_property
+    def organization_id(self) -> Optional[UUID]:
+        return _uuid(self._organization_id)
+
+    @cached_property
+    def user_id(self) -> Optional[UUID]:
+        return _uuid(self._user_id)
+
+    @cached_property
+    def created_at(self) -> Optional[datetime]:
+        return _datetime(self._created_at)
+
+    @cached_property
+    def scheduled_at(self) -> Optional[datetime]:
+        return _datetime(self._scheduled_at)
+
+    @cached_property
+    def published_at(self) -> Optional[datetime]:
+        return _datetime(self._published_at)
+
+    def to_event(self) -> Event:
+        """Materialize a full ``Event`` entity."""
+        event = Event(
+            id=self.id,
+            event_type=self.event_type,
+            aggregate_reference=self.aggregate_reference,
+            event_version=self.event_version,
+            correlation_id=self.correlation_id,
+            causation_id=self.causation_id,
+            event_data=self.event_data,
+            event_metadata=self.event_metadata,
+            status=self.status,
+            priority=self.priority,
+            retry_count=self.retry_count,
+            max_retries=self.max_retries,
+            error_message=self.error_message,
+            error_details=self.error_details,
+            tenant_id=self.tenant_id,
+            organization_id=self.organization_id,
+            user_id=self.user_id,
+            source_service=self.source_service,
+            source_version=self.source_version,
+            queue_name=self.queue_name,
+            message_id=self.message_id,
+            partition_key=self.partition_key,
+        )
+        if self.created_at:
+            event.created_at = self.created_at
+        if self.scheduled_at:
+            event.scheduled_at = self.scheduled_at
+        return event
+
+    def __str__(self) -> str:
+        return f"Event(id={self.event_id_value}, type={self.event_type_value}, status={self.status.value})"
@@ -0,0 +1,97 @@
+"""Tests for AuthContextRefresher rich permission metadata."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+
+from neo_commons.core.value_objects.identifiers import KeycloakUserId, RealmId, UserId
+from neo_commons.features.auth.entities.auth_context import AuthContext
+from neo_commons.features.auth.services.auth_context_refresher import AuthContextRefresher
+from neo_commons.features.auth.services.jwt_validator import JWTValidator
+
+USER_UUID = uuid4()
+
+PERMISSION = {
+    "resource": "users",
+    "scope_level": "platform",
+    "is_dangerous": False,
+    "requires_mfa": False,
+    "requires_approval": False,
+    "permission_config": None,
+}
+ROLE_PERMISSION_ROWS = [
+    {**PERMISSION, "user_id": USER_UUID, "code": "users:read", "action": "read",
+     "role_name": "Viewer", "role_code": "viewer"},
+    {**PERMISSION, "user_id": USER_UUID, "code": "roles:read", "action": "read",
+     "resource": "roles", "role_name": "Viewer", "role_code": "viewer"},
+    {**PERMISSION, "user_id": USER_UUID, "code": "users:read", "action": "read",
+     "role_name": "Admin", "role_code": "admin"},
+]
+DIRECT_PERMISSION_ROWS = [
+    {**PERMISSION, "user_id": USER_UUID, "code": "users:delete", "action": "delete",
+     "is_dangerous": True},
+]
+
+
+class FakeConnection:
+    """Answers the RBAC queries of both the checker and the refresher."""
+    
+    async def fetch(self, query, *args):
+        if "role_name" in query:
+            return ROLE_PERMISSION_ROWS
+        if "user_permissions up" in query:
+            return DIRECT_PERMISSION_ROWS
+        return []
+
+
+class FakeDatabaseService:
+    @asynccontextmanager
+    async def get_connection(self, name):
+        yield FakeConnection()
+
+
+class FakeAuthCache:
+    def __init__(self, auth_context):
+        self.auth_context = auth_context
+    
+    async def set_user_roles(self, user_id, tenant_id, roles):
+        pass
+    
+    async def set_user_permissions(self, user_id, tenant_id, permissions):
+        pass
+    
+    async def get_auth_context(self, user_id, tenant_id):
+        return self.auth_context
+    
+    async def set_auth_context(self, auth_context):
+        self.auth_context = auth_context
+
+
+@pytest.mark.unit
+def test_refreshed_rich_permissions_match_the_validator_shape():
+    database_service = FakeDatabaseService()
+    validator = JWTValidator(realm_manager=None, user_mapper=None, database_service=database_service)
+    user_id = UserId(str(USER_UUID))
+
+    async def main():
+        _, _, validator_metadata = await validator._load_database_permissions(user_id, None)
+        assert len(validator_metadata) == 3
+        
+        cache = FakeAuthCache(AuthContext(
+            user_id=user_id,
+            keycloak_user_id=KeycloakUserId(str(uuid4())),
+            tenant_id=None,
+            realm_id=RealmId("platform-admin"),
+            metadata={"rich_permissions": []},
+        ))
+        refresher = AuthContextRefresher(database_service, cache)
+        
+        assert await refresher.refresh_users([USER_UUID]) == 1
+        assert cache.auth_context.metadata["rich_permissions"] == validator_metadata
+        assert {p.value for p in cache.auth_context.permissions} == {
+            "users:read", "roles:read", "users:delete"
+        }
+
+    asyncio.run(main())
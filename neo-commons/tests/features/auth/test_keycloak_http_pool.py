@@ -0,0 +1,150 @@
+"""Tests for KeycloakHttpPool against a local HTTP stub server."""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+from keycloak.connection import ConnectionManager
+
+from neo_commons.features.auth.adapters import keycloak_http_pool
+from neo_commons.features.auth.adapters.keycloak_http_pool import KeycloakHttpPool
+
+
+class StubKeycloak(BaseHTTPRequestHandler):
+    """Keep-alive HTTP/1.1 server answering token and admin requests."""
+
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, body, status=200):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.requests.append(("POST", self.path))
+        self._reply({"access_token": f"token-{len(self.requests)}", "expires_in": 300})
+
+    def do_GET(self):
+        self.requests.append(("GET", self.path))
+        self._reply({"realm": "master"})
+
+
+@pytest.fixture
+def server_url():
+    StubKeycloak.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubKeycloak)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.unit
+def test_requests_reuse_pooled_connections(server_url):
+    pool = KeycloakHttpPool(http2=False)
+
+    async def main():
+        client = pool.get_client(f"{server_url}/auth/")
+        assert pool.get_client(server_url) is client
+        for _ in range(5):
+            response = await client.get(f"{server_url}/admin/realms/master")
+            assert response.status_code == 200
+        await pool.aclose()
+
+    asyncio.run(main())
+
+    stats = pool.get_stats()["servers"][server_url]
+    assert stats["requests"] == 5
+    assert stats["connections_opened"] == 1
+    assert stats["connection_reuse_rate"] == pytest.approx(0.8)
+    assert stats["max_latency_ms"] > 0
+
+
+@pytest.mark.unit
+def test_admin_token_is_cached_and_refreshed_before_expiry(server_url, monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        keycloak_http_pool,
+        "time",
+        SimpleNamespace(monotonic=lambda: clock.now, perf_counter=time.perf_counter),
+    )
+    pool = KeycloakHttpPool(http2=False, token_refresh_margin=30.0)
+    credentials = dict(realm_name="master", client_id="admin-cli", username="admin", password="pw")
+
+    async def main():
+        first, fresh = await pool.get_admin_token(server_url, **credentials)
+        assert fresh and first["expires_in"] == 300
+
+        clock.now += 200
+        cached, fresh = await pool.get_admin_token(server_url, **credentials)
+        assert not fresh
+        assert cached["access_token"] == first["access_token"]
+        assert cached["expires_in"] == 100
+
+        # Inside the refresh margin the token is replaced before it expires
+        clock.now += 75
+        refreshed, fresh = await pool.get_admin_token(server_url, **credentials)
+        assert fresh
+        assert refreshed["access_token"] != first["access_token"]
+        await pool.aclose()
+
+    asyncio.run(main())
+
+    assert [method for method, _ in StubKeycloak.requests] == ["POST", "POST"]
+    stats = pool.get_stats()
+    assert stats["token_requests"] == 2
+    assert stats["token_cache_hits"] == 1
+    assert stats["servers"][server_url]["connections_opened"] == 1
+
+
+@pytest.mark.unit
+def test_attached_connection_cannot_close_the_shared_client(server_url):
+    pool = KeycloakHttpPool(http2=False)
+
+    async def main():
+        connection = ConnectionManager(base_url=server_url, timeout=5, verify=False)
+        pool.attach(connection, server_url)
+        shared = pool.get_client(server_url, verify=False)
+        assert connection.async_s is shared
+
+        response = await connection.a_raw_get("admin/realms/master")
+        assert response.status_code == 200
+
+        await connection.aclose()
+        assert not shared.is_closed
+        response = await shared.get(f"{server_url}/admin/realms/master")
+        assert response.status_code == 200
+        await pool.aclose()
+
+    asyncio.run(main())
+
+
+@pytest.mark.unit
+def test_proxies_are_carried_into_the_pooled_client(server_url):
+    pool = KeycloakHttpPool(http2=False)
+
+    async def main():
+        # The stub acts as a forward proxy for an unresolvable Keycloak host
+        client = pool.get_client("http://keycloak.invalid", proxies={"http": server_url})
+        assert client is not pool.get_client("http://keycloak.invalid")
+
+        response = await client.get("http://keycloak.invalid/admin/realms/master")
+        assert response.status_code == 200
+        await pool.aclose()
+
+    asyncio.run(main())
+
+    assert StubKeycloak.requests == [("GET", "http://keycloak.invalid/admin/realms/master")]
@@ -0,0 +1,137 @@
+"""Tests for SQL fingerprinting and per-template query statistics."""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from neo_commons.features.database.repositories.query_observer import QueryObserver
+from neo_commons.features.database.utils.query_fingerprint import fingerprint_id, fingerprint_query
+
+
+def logged(query, elapsed, args=(), exception=None):
+    """Minimal stand-in for asyncpg's LoggedQuery."""
+    return SimpleNamespace(query=query, args=args, elapsed=elapsed, exception=exception)
+
+
+@pytest.mark.unit
+def test_fingerprint_is_shared_across_tenant_schemas_and_values():
+    first = fingerprint_query(
+        "SELECT * FROM tenant_acme.users WHERE id = $1 AND status IN ('active', 'invited') -- by id"
+    )
+    second = fingerprint_query(
+        'select *\n  from "tenant_globex".users where id=42 and status in (\'locked\')'
+    )
+
+    assert first == second == "select * from {tenant}.users where id = ? and status in (?)"
+    assert fingerprint_id(first) == fingerprint_id(second)
+    assert fingerprint_query("SELECT * FROM admin.users WHERE id = $1") != first
+
+
+@pytest.mark.unit
+def test_observer_aggregates_by_template_and_ranks_by_total_time():
+    observer = QueryObserver("admin", slow_query_threshold_ms=1000)
+
+    for schema in ("tenant_a", "tenant_b", "tenant_c"):
+        observer.observe(logged(f"SELECT name FROM {schema}.users WHERE id = $1", 0.02, (1,)))
+    observer.observe(logged("UPDATE admin.users SET name = $1 WHERE id = $2", 0.005))
+    observer.observe(logged("UPDATE admin.users SET name = $1 WHERE id = $2", 0.001, exception=ValueError()))
+    observer.record_rows("SELECT name FROM tenant_z.users WHERE id = $1", 1)
+
+    slowest, update = observer.top(10)
+    assert slowest["fingerprint"] == "select name from {tenant}.users where id = ?"
+    assert slowest["calls"] == 3
+    assert slowest["total_time_ms"] == pytest.approx(60.0)
+    assert slowest["rows"] == 1
+    assert slowest["slow_calls"] == 0
+    assert update["calls"] == 2 and update["errors"] == 1
+
+    stats = observer.get_stats()
+    assert stats["queries"] == 5
+    assert stats["templates"] == 2
+    assert observer.get_template(update["id"])["fingerprint"] == update["fingerprint"]
+
+
+class FakeConnection:
+    def __init__(self):
+        self.statements = []
+        self.rolled_back = False
+
+    def transaction(self):
+        connection = self
+
+        class Transaction:
+            async def start(self):
+                pass
+
+            async def rollback(self):
+                connection.rolled_back = True
+
+        return Transaction()
+
+    async def execute(self, query, *args):
+        self.statements.append(query)
+
+    async def fetchval(self, query, *args):
+        self.statements.append(query)
+        return json.dumps([{"Plan": {"Node Type": "Seq Scan"}, "Planning Time": 0.1, "Execution Time": 250.0}])
+
+
+@pytest.mark.unit
+def test_slow_query_plan_is_captured_once_per_interval():
+    connection = FakeConnection()
+
+    @asynccontextmanager
+    async def spare_connection():
+        yield connection
+
+    observer = QueryObserver("admin", slow_query_threshold_ms=100, explain_connection=spare_connection)
+
+    async def main():
+        observer.observe(logged("SELECT * FROM tenant_a.orders WHERE total > $1", 0.25, (10,)))
+        await asyncio.sleep(0)
+        await asyncio.gather(*observer._tasks)
+        observer.observe(logged("SELECT * FROM tenant_b.orders WHERE total > $1", 0.3, (20,)))
+        await asyncio.gather(*observer._tasks)
+
+    asyncio.run(main())
+
+    assert observer.explains == 1
+    assert connection.rolled_back
+    assert connection.statements[-1].startswith("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT")
+
+    template, = observer.top(1)
+    assert template["slow_calls"] == 2
+    sample, = template["explain_samples"]
+    assert sample["analyzed"] and sample["execution_time_ms"] == 250.0
+    assert sample["plan"] == {"Node Type": "Seq Scan"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("query", [
+    "SELECT * FROM tenant_a.orders WHERE id = $1 FOR UPDATE",
+    "SELECT * FROM tenant_a.orders WHERE id = $1 FOR NO KEY UPDATE SKIP LOCKED",
+    "SELECT id FROM tenant_a.orders WHERE id = $1 FOR KEY SHARE",
+    "SELECT nextval('tenant_a.order_number_seq')",
+])
+def test_locking_and_side_effecting_reads_get_the_estimated_plan(query):
+    connection = FakeConnection()
+
+    @asynccontextmanager
+    async def spare_connection():
+        yield connection
+
+    observer = QueryObserver("admin", slow_query_threshold_ms=100, explain_connection=spare_connection)
+
+    async def main():
+        observer.observe(logged(query, 0.25, (1,)))
+        await asyncio.sleep(0)
+        await asyncio.gather(*observer._tasks)
+
+    asyncio.run(main())
+
+    assert connection.statements[-1].startswith("EXPLAIN (FORMAT JSON) SELECT")
+    sample, = observer.top(1)[0]["explain_samples"]
+    assert not sample["analyzed"]
@@ -0,0 +1 @@
+"""Tests for neo-commons infrastructure."""
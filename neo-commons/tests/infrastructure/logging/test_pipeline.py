@@ -0,0 +1,140 @@
+"""Tests for the async logging pipeline, sampling and redaction."""
+
+import io
+import json
+import logging
+import os
+import sys
+
+import pytest
+
+from neo_commons.infrastructure.logging import (
+    AsyncLogWriter,
+    JSONLogFormatter,
+    QueueLogHandler,
+    Redactor,
+    SamplingFilter,
+    configure_async_logging,
+    lazy,
+    shutdown_async_logging,
+)
+
+
+def make_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.handlers[:] = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+@pytest.mark.unit
+def test_queue_handler_formats_and_writes_on_writer_thread():
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    target.setFormatter(JSONLogFormatter(redactor=Redactor()))
+    writer = AsyncLogWriter()
+    logger = make_logger("tests.logging.pipeline", QueueLogHandler(target, writer))
+
+    calls = []
+
+    def body():
+        calls.append(1)
+        return {"user": "ann", "password": "hunter2-secret"}
+
+    logger.info("user %s logged in with token=abc123", "ann", extra={"structured_data": {"body": lazy(body)}})
+    # Nothing is formatted or written until the writer runs
+    assert stream.getvalue() == ""
+    assert calls == []
+
+    writer.start()
+    writer.stop()
+    entry = json.loads(stream.getvalue())
+    assert entry["message"] == "user ann logged in with token=***"
+    assert entry["body"] == {"user": "ann", "password": "hun***et"}
+    assert entry["level"] == "INFO"
+    assert writer.get_stats()["written"] == 1
+
+
+@pytest.mark.unit
+def test_full_queue_drops_instead_of_blocking():
+    writer = AsyncLogWriter(queue_size=2)
+    logger = make_logger("tests.logging.full", QueueLogHandler(logging.NullHandler(), writer))
+    for i in range(5):
+        logger.warning("message %d", i)
+
+    assert writer.get_stats()["dropped"] == 3
+
+
+@pytest.mark.unit
+def test_sampling_keeps_one_in_n_per_logger_and_all_warnings():
+    sampling = SamplingFilter.from_string("hot=0.25,hot.quiet=0")
+
+    def kept(name, level=logging.DEBUG, count=8):
+        record = logging.LogRecord(name, level, __file__, 1, "msg", None, None)
+        return sum(bool(sampling.filter(record)) for _ in range(count))
+
+    assert kept("hot.path") == 2
+    assert kept("hot.quiet") == 0
+    assert kept("hot.quiet", logging.WARNING) == 8
+    assert kept("cold") == 8
+
+
+@pytest.mark.unit
+def test_redactor_masks_headers_nested_fields_and_non_json_bodies():
+    redactor = Redactor()
+
+    assert redactor.redact_headers({"Authorization": "Bearer abcdefghijkl", "Accept": "*/*"}) == {
+        "Authorization": "Bear***ijkl",
+        "Accept": "*/*",
+    }
+    assert redactor.redact({"items": [{"api_key": "x"}], "name": "n"}) == {"items": [{"api_key": "***"}], "name": "n"}
+    assert redactor.redact_body('{"secret": "s"}') == {"secret": "***"}
+    assert redactor.redact_body("password=abc&user=x") == "password=***&user=x"
+
+
+@pytest.mark.unit
+def test_configured_writer_starts_with_the_first_record():
+    stream = io.StringIO()
+    logger = make_logger("tests.logging.lazy", logging.StreamHandler(stream))
+
+    writer = configure_async_logging(loggers=["tests.logging.lazy"])
+    try:
+        assert not writer.running
+        logger.warning("first")
+        assert writer.running
+    finally:
+        shutdown_async_logging()
+
+    assert stream.getvalue() == "first\n"
+    assert logger.handlers[0].stream is stream
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_forked_child_restarts_the_writer(tmp_path):
+    path = tmp_path / "child.log"
+    logger = make_logger("tests.logging.fork", logging.FileHandler(path))
+
+    writer = configure_async_logging(loggers=["tests.logging.fork"])
+    try:
+        logger.warning("parent")
+        pid = os.fork()
+        if pid == 0:
+            # Child: the writer thread is gone until the next record restarts it
+            code = 1
+            try:
+                running_after_fork = writer.running
+                logger.warning("child")
+                shutdown_async_logging()
+                code = 0 if not running_after_fork else 2
+            finally:
+                sys.stdout.flush()
+                os._exit(code)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+    finally:
+        shutdown_async_logging()
+
+    lines = path.read_text().splitlines()
+    assert sorted(lines) == ["child", "parent"]
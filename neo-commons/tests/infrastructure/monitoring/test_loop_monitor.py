@@ -0,0 +1,73 @@
+"""Tests for event-loop lag measurement and blocking-call detection."""
+
+import asyncio
+import time
+
+import pytest
+
+from neo_commons.infrastructure.monitoring import EventLoopMonitor, MetricsRegistry, PerformanceMonitor
+
+
+def blocking_call(seconds: float) -> None:
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        pass
+
+
+@pytest.mark.unit
+def test_blocked_loop_is_reported_with_the_blocking_stack():
+    performance_monitor = PerformanceMonitor()
+    monitor = EventLoopMonitor(
+        interval=0.01,
+        block_threshold=0.05,
+        sample_interval=0.005,
+        performance_monitor=performance_monitor,
+        metrics_registry=MetricsRegistry(),
+    )
+
+    async def main():
+        monitor.start()
+        await asyncio.sleep(0.05)
+        blocking_call(0.2)
+        await asyncio.sleep(0.05)
+
+    try:
+        asyncio.run(main())
+    finally:
+        monitor.stop()
+
+    assert monitor.checks > 2
+    assert monitor.blocks == 1
+    assert monitor.max_lag_ms >= 150
+
+    report, = monitor.get_reports()
+    assert report["samples"] > 0
+    assert "blocking_call" in next(iter(report["stacks"]))
+
+    stats = performance_monitor.get_stats("event_loop.lag")
+    assert stats.call_count == monitor.checks
+    assert stats.max_time_ms == pytest.approx(monitor.max_lag_ms)
+
+
+@pytest.mark.unit
+def test_idle_loop_reports_no_blocks():
+    monitor = EventLoopMonitor(
+        interval=0.01,
+        block_threshold=0.05,
+        performance_monitor=PerformanceMonitor(),
+        metrics_registry=MetricsRegistry(),
+    )
+
+    async def main():
+        monitor.start()
+        monitor.start()
+        await asyncio.sleep(0.1)
+
+    try:
+        asyncio.run(main())
+    finally:
+        monitor.stop()
+
+    assert monitor.checks > 2
+    assert monitor.blocks == 0
+    assert monitor.get_reports() == []
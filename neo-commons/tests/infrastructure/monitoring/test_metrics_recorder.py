@@ -0,0 +1,86 @@
+"""Tests for bounded metric recording and quantile sketches."""
+
+import random
+
+import pytest
+
+from neo_commons.infrastructure.monitoring import (
+    PerformanceLevel,
+    PerformanceMonitor,
+    QuantileSketch,
+    performance_monitor,
+)
+
+
+@pytest.fixture
+def monitor():
+    return PerformanceMonitor(recent_capacity=16)
+
+
+@pytest.mark.unit
+def test_sketch_quantiles_within_relative_accuracy():
+    rng = random.Random(7)
+    values = sorted(rng.lognormvariate(0, 1) for _ in range(20000))
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    for q in (0.5, 0.95, 0.99, 0.999):
+        expected = values[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(expected, rel=0.011)
+
+
+@pytest.mark.unit
+def test_merged_sketches_match_single_sketch():
+    values = [i / 10 for i in range(1, 5000)]
+    whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for i, value in enumerate(values):
+        whole.add(value)
+        (left if i % 2 else right).add(value)
+
+    left.merge(right)
+    assert left.quantiles([0.5, 0.99]) == whole.quantiles([0.5, 0.99])
+    assert QuantileSketch.from_dict(left.to_dict()).quantile(0.9) == whole.quantile(0.9)
+
+
+@pytest.mark.unit
+def test_recent_samples_are_bounded(monitor):
+    func = performance_monitor("bounded", PerformanceLevel.CRITICAL, monitor=monitor)(lambda x: x)
+    for i in range(100):
+        func(i)
+
+    stats = monitor.get_stats("bounded")
+    assert stats.call_count == 100
+    assert stats.p50_time_ms <= stats.p99_time_ms <= stats.max_time_ms
+    assert len(monitor.get_metrics("bounded", limit=1000)) == 16
+
+
+@pytest.mark.unit
+def test_low_level_calls_are_sampled_but_errors_counted(monitor):
+    @performance_monitor("sampled", PerformanceLevel.LOW, monitor=monitor)
+    def fail():
+        raise ValueError("boom")
+
+    for _ in range(200):
+        with pytest.raises(ValueError):
+            fail()
+
+    stats = monitor.get_stats("sampled")
+    assert stats.call_count == 200
+    assert stats.error_count == 200
+    assert stats.sampled_count == 2
+
+
+@pytest.mark.unit
+def test_snapshot_returns_only_new_samples(monitor):
+    recorder = monitor.recorder("snap", PerformanceLevel.CRITICAL)
+    for value in (1.0, 2.0, 3.0):
+        recorder.should_sample()
+        recorder.record(value)
+
+    metrics, stats, partials = monitor.snapshot()
+    assert [m.execution_time_ms for m in metrics] == [1.0, 2.0, 3.0]
+    assert stats["snap"].call_count == 3
+    assert partials == []
+    assert monitor.snapshot()[0] == []
+
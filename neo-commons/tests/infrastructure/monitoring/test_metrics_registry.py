@@ -0,0 +1,99 @@
+"""Tests for the metrics registry and its Prometheus exposition."""
+
+from types import SimpleNamespace
+
+import pytest
+from prometheus_client.parser import text_string_to_metric_families
+
+from neo_commons.infrastructure.monitoring import (
+    MetricsRegistry,
+    register_cache_repository,
+    register_connection_pools,
+)
+
+
+def parse(payload: bytes):
+    return {family.name: family for family in text_string_to_metric_families(payload.decode())}
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry(max_series_per_metric=10, cache_ttl_seconds=0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_histogram_classic_buckets_are_cumulative(registry):
+    histogram = registry.histogram("neo_test_seconds", "test", ["route"])
+    for value in (0.001, 0.003, 0.003, 0.5):
+        histogram.labels("/a").observe(value)
+
+    payload, content_type = await registry.render()
+    assert content_type.startswith("text/plain")
+    buckets = {
+        sample.labels["le"]: sample.value
+        for sample in parse(payload)["neo_test_seconds"].samples
+        if sample.name.endswith("_bucket")
+    }
+    assert buckets["0.0009765625"] == 0
+    assert buckets["0.001953125"] == 1
+    assert buckets["0.00390625"] == 3
+    assert buckets["0.5"] == 4
+    assert buckets["+Inf"] == 4
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_native_histogram_only_for_openmetrics_2(registry):
+    registry.histogram("neo_test_seconds", "test").observe(0.25)
+
+    payload, content_type = await registry.render("application/openmetrics-text; version=2.0.0")
+    assert "version=2.0.0" in content_type
+    assert "schema:3" in payload.decode()
+
+    payload, _ = await registry.render("application/openmetrics-text; version=1.0.0")
+    assert "schema:3" not in payload.decode()
+
+
+@pytest.mark.unit
+def test_label_sets_beyond_limit_share_overflow_series(registry):
+    counter = registry.counter("neo_test", "test", ["tenant"])
+    for tenant in range(25):
+        counter.labels(f"tenant_{tenant}").inc()
+
+    assert registry.get_stats()["series"] == 11
+    assert counter._children[("__overflow__",)].value == 15
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_collector_output_is_bounded_and_merged(registry):
+    class Manager:
+        async def get_all_pool_metrics(self):
+            return {f"tenant_{i}": SimpleNamespace(total_connections=5, total_queries=i) for i in range(100)}
+
+    class Cache:
+        def get_stats(self):
+            return {"hits": 3, "hit_rate": 75.0, "backend": "memory"}
+
+    register_connection_pools(registry, Manager())
+    register_cache_repository(registry, Cache(), "a")
+    register_cache_repository(registry, Cache(), "b")
+
+    families = parse((await registry.render())[0])
+    assert len(families["neo_db_pool_connections"].samples) == 10
+    assert {s.labels["cache"] for s in families["neo_cache_hits"].samples} == {"a", "b"}
+    assert "neo_cache_backend" not in families
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_rendering_is_cached_within_ttl():
+    registry = MetricsRegistry(cache_ttl_seconds=60)
+    counter = registry.counter("neo_test", "test")
+    counter.inc()
+    first, _ = await registry.render()
+    counter.inc()
+    second, _ = await registry.render()
+
+    assert first == second
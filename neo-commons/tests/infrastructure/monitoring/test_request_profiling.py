@@ -0,0 +1,53 @@
+"""Tests for process resource sampling and slow-request profiling."""
+
+import asyncio
+import time
+
+import pytest
+
+from neo_commons.infrastructure.monitoring import ProcessResourceSampler, SlowRequestProfiler
+
+
+def busy_wait(seconds: float) -> None:
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        pass
+
+
+@pytest.mark.unit
+def test_resource_sampler_tracks_latest_and_peak():
+    sampler = ProcessResourceSampler(interval=60)
+    sampler.sample()
+
+    stats = sampler.get_stats()
+    assert stats["memory_mb"] > 0
+    assert stats["peak_memory_mb"] >= stats["memory_mb"]
+    assert stats["samples"] == 1
+
+
+@pytest.mark.unit
+def test_profiler_samples_only_slow_requests():
+    profiler = SlowRequestProfiler(slow_threshold=0.05, interval=0.005)
+
+    async def handle(name: str, blocking: float, waiting: float):
+        token = profiler.begin(name)
+        started = time.perf_counter()
+        await asyncio.sleep(waiting)
+        busy_wait(blocking)
+        return profiler.end(token, time.perf_counter() - started)
+
+    async def main():
+        return await handle("fast", 0, 0), await handle("slow", 0.15, 0.1)
+
+    try:
+        fast, slow = asyncio.run(main())
+    finally:
+        profiler.stop()
+
+    assert fast is None
+    assert slow["name"] == "slow"
+    assert slow["samples"] > 0
+    stacks = "\n".join(slow["stacks"])
+    assert "busy_wait" in stacks
+    assert "sleep" in stacks
+    assert profiler.get_profiles() == [slow]
@@ -0,0 +1,157 @@
+"""Tests for time-bucketed rollups and background metrics persistence."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from neo_commons.infrastructure.monitoring import (
+    BackgroundMetricsPersister,
+    MetricsRollup,
+    PerformanceLevel,
+    PerformanceMetric,
+    PerformanceMonitor,
+)
+
+START = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def metric(name="op", seconds=0, ms=10.0, weight=1, error=False, exceeded=False):
+    return PerformanceMetric(
+        operation_name=name,
+        execution_time_ms=ms,
+        level=PerformanceLevel.HIGH,
+        timestamp=START + timedelta(seconds=seconds),
+        exceeded_threshold=exceeded,
+        error_occurred=error,
+        sample_weight=weight,
+    )
+
+
+class FakeStorage:
+    def __init__(self):
+        self.rollups = []
+        self.samples = []
+        self.stats = []
+        self.fail = False
+
+    async def store_rollups(self, buckets):
+        if self.fail:
+            return False
+        self.rollups.extend(buckets)
+        return True
+
+    async def store_metrics(self, metrics):
+        if self.fail:
+            return False
+        self.samples.extend(metrics)
+        return True
+
+    async def store_stats(self, stats):
+        self.stats.append(stats)
+        return True
+
+
+@pytest.mark.unit
+def test_rollup_buckets_by_minute_and_operation():
+    rollup = MetricsRollup(bucket_seconds=60)
+    rollup.add_many([metric(seconds=1), metric(seconds=59), metric(seconds=61), metric("other", seconds=2)])
+
+    assert len(rollup) == 3
+    closed = rollup.drain(now=START + timedelta(seconds=70))
+    assert {(b.operation_name, b.bucket_start, b.call_count) for b in closed} == {
+        ("op", START, 2),
+        ("other", START, 1),
+    }
+    # The bucket still being filled stays until it closes or is forced out
+    assert len(rollup) == 1
+    assert rollup.drain(include_open=True)[0].bucket_start == START + timedelta(minutes=1)
+
+
+@pytest.mark.unit
+def test_rollup_weights_sampled_metrics_and_merges_partials():
+    rollup = MetricsRollup()
+    rollup.add(metric(ms=4.0, weight=10, error=True))
+    rollup.add(metric(ms=8.0, weight=10))
+    bucket = rollup.drain(include_open=True)[0]
+
+    assert bucket.call_count == 20
+    assert bucket.error_count == 10
+    assert bucket.avg_time_ms == pytest.approx(6.0)
+
+    other = MetricsRollup()
+    other.add(metric(ms=100.0))
+    partial = other.drain(include_open=True)[0]
+    rollup.restore([bucket, partial])
+    merged = rollup.drain(include_open=True)
+
+    assert len(merged) == 1
+    assert merged[0].call_count == 21
+    assert merged[0].max_time_ms == 100.0
+    assert merged[0].sketch.count == 3
+
+
+@pytest.mark.unit
+def test_persister_flushes_rollups_and_only_notable_samples():
+    storage = FakeStorage()
+    metrics = [metric(seconds=i % 60, ms=1.0) for i in range(1000)]
+    metrics.append(metric(ms=500.0, exceeded=True))
+    persister = BackgroundMetricsPersister(
+        storage, snapshot_provider=lambda: (metrics, {"op": "stats"}, [])
+    )
+
+    asyncio.run(persister._flush_all())
+
+    assert len(storage.rollups) == 1
+    assert storage.rollups[0].call_count == 1001
+    assert [m.execution_time_ms for m in storage.samples] == [500.0]
+    assert storage.stats == [{"op": "stats"}]
+    assert persister.get_stats()["open_buckets"] == 0
+
+
+@pytest.mark.unit
+def test_persister_keeps_aggregates_when_storage_fails():
+    storage = FakeStorage()
+    storage.fail = True
+    persister = BackgroundMetricsPersister(storage, max_pending_samples=3)
+    persister._running = True
+    for i in range(10):
+        persister.queue_metric(metric(seconds=i, error=True))
+
+    asyncio.run(persister._flush_all(include_open=True))
+    assert storage.rollups == []
+    assert persister.get_stats()["pending_samples"] == 3
+
+    storage.fail = False
+    asyncio.run(persister._flush_all(include_open=True))
+    assert len(storage.rollups) == 1
+    assert storage.rollups[0].call_count == 10
+    assert len(storage.samples) == 3
+
+
+@pytest.mark.unit
+def test_rollups_count_samples_overwritten_between_flushes():
+    monitor = PerformanceMonitor(recent_capacity=256)
+    recorder = monitor.recorder("busy", PerformanceLevel.CRITICAL)
+    storage = FakeStorage()
+    persister = BackgroundMetricsPersister(storage, snapshot_provider=monitor.snapshot)
+
+    timestamp = START.timestamp()
+    for i in range(10000):
+        recorder.should_sample()
+        recorder.record(1.0 + i % 100, error_occurred=i % 10 == 0, timestamp=timestamp)
+    asyncio.run(persister._flush_all(include_open=True))
+    for _ in range(100):
+        recorder.should_sample()
+        recorder.record(5.0, timestamp=timestamp + 60)
+    asyncio.run(persister._flush_all(include_open=True))
+
+    first, second = storage.rollups
+    assert (first.call_count, first.error_count, first.sketch.count) == (10000, 1000, 10000)
+    assert first.total_time_ms == pytest.approx(sum(1.0 + i % 100 for i in range(10000)))
+    assert first.min_time_ms == 1.0
+    assert first.max_time_ms == pytest.approx(100.0, rel=0.01)
+    assert first.sketch.quantile(0.5) == pytest.approx(50.0, rel=0.02)
+    # Only what was recorded since the previous flush
+    assert (second.bucket_start, second.call_count) == (START + timedelta(minutes=1), 100)
+    assert monitor.get_summary()["samples_overwritten"] == 10000 - 256
@@ -0,0 +1,134 @@
+"""Tests for spans, trace context propagation and exporters."""
+
+import asyncio
+
+import pytest
+
+from neo_commons.infrastructure.tracing import (
+    InMemorySpanExporter,
+    SpanContext,
+    Tracer,
+    current_span,
+    extract,
+    format_traceparent,
+    get_tracer,
+    inject,
+    parse_traceparent,
+    set_tracer,
+    traced,
+)
+from neo_commons.platform.events.infrastructure.outbox.event_outbox import (
+    decode_outbox_payload,
+    encode_outbox_payload,
+)
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    set_tracer(Tracer(exporter))
+    yield exporter
+    set_tracer(Tracer())
+
+
+@pytest.mark.unit
+def test_traceparent_round_trip_and_invalid_values():
+    context = SpanContext(0x4BF92F3577B34DA6A3CE929D0E0E4736, 0x00F067AA0BA902B7, True)
+    value = format_traceparent(context)
+
+    assert value == "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+    assert parse_traceparent(value) == context
+    assert extract({b"traceparent": value.encode()}) == context
+
+    for invalid in (
+        None,
+        "",
+        "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7",
+        "ff-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01",
+        "00-00000000000000000000000000000000-00f067aa0ba902b7-01",
+        "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01-extra",
+        "00-zzf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01",
+    ):
+        assert parse_traceparent(invalid) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_child_spans_follow_the_current_span(exporter):
+    @traced("child")
+    async def child():
+        await asyncio.sleep(0)
+        return current_span().context
+
+    parent = SpanContext(0x1234, 0x5678, True)
+    with get_tracer().start_as_current_span("root", parent=parent) as root:
+        child_context = await asyncio.create_task(child())
+        carrier = inject({})
+
+    assert current_span().context is None
+    root_span, = exporter.get_finished_spans("root")
+    child_span, = exporter.get_finished_spans("child")
+    assert root_span.context.trace_id == parent.trace_id
+    assert root_span.parent_id == parent.span_id
+    assert child_span.parent_id == root.context.span_id
+    assert child_span.context == child_context
+    assert extract(carrier) == root.context
+
+
+@pytest.mark.unit
+def test_exceptions_are_recorded_on_the_span(exporter):
+    tracer = Tracer(exporter)
+    with pytest.raises(ValueError):
+        with tracer.start_as_current_span("failing"):
+            raise ValueError("boom")
+
+    span, = exporter.get_finished_spans()
+    assert span.error == "ValueError: boom"
+
+
+@pytest.mark.unit
+def test_disabled_tracer_passes_incoming_context_through():
+    tracer = Tracer()
+    incoming = SpanContext(0xABC, 0xDEF, True)
+
+    with tracer.start_as_current_span("request", parent=incoming) as span:
+        assert not span.recording
+        assert extract(inject({})) == incoming
+
+    assert not tracer.start_span("background").recording
+    assert inject({}) == {}
+
+
+@pytest.mark.unit
+def test_record_span_only_under_a_recording_parent(exporter):
+    tracer = Tracer(exporter)
+    tracer.record_span("db.query", 1_000, 2_000)
+    assert exporter.get_finished_spans() == []
+
+    with tracer.start_as_current_span("request") as request:
+        tracer.record_span("db.query", 1_000, 3_000, attributes={"db.system": "postgresql"})
+
+    query, = exporter.get_finished_spans("db.query")
+    assert query.parent_id == request.context.span_id
+    assert query.duration_ms == pytest.approx(0.002)
+
+
+@pytest.mark.unit
+def test_unsampled_traces_propagate_without_recording():
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporter, sample_rate=0.0)
+
+    with tracer.start_as_current_span("request", parent=SpanContext(1, 2, False)) as span:
+        assert not span.recording
+        assert parse_traceparent(inject({})["traceparent"]).sampled is False
+
+    assert exporter.get_finished_spans() == []
+
+
+@pytest.mark.unit
+def test_outbox_payload_keeps_trace_context():
+    traceparent = format_traceparent(SpanContext(0x1234, 0x5678, True))
+    fields = {"e": b"E1\x93\x01\x02\x03", "traceparent": traceparent}
+
+    assert decode_outbox_payload(encode_outbox_payload(fields)) == fields
+    assert decode_outbox_payload(encode_outbox_payload({"e": b"E1\x90"})) == {"e": b"E1\x90"}
@@ -0,0 +1 @@
+"""Tests for the actions platform module."""
@@ -0,0 +1,272 @@
+"""Tests for BufferedActionExecutionWriter flush ordering and coalescing."""
+
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import uuid4
+
+import asyncpg
+import pytest
+
+from neo_commons.platform.actions.domain.entities.action import ActionStatus
+from neo_commons.platform.actions.domain.entities.action_execution import ActionExecution
+from neo_commons.platform.actions.domain.value_objects.action_id import ActionId
+from neo_commons.platform.actions.domain.value_objects.execution_id import ExecutionId
+from neo_commons.platform.actions.infrastructure.repositories.buffered_action_execution_writer import (
+    BufferedActionExecutionWriter,
+    _ROW_COLUMNS,
+    _UPDATE_COLUMNS,
+)
+
+ROW_COLUMNS = [name for name, _ in _ROW_COLUMNS]
+UPDATE_COLUMNS = ["id"] + [name for name, _ in _UPDATE_COLUMNS] + ["requires_pending"]
+
+
+class RecordingConnection:
+    """Connection double recording statements and their array parameters."""
+
+    def __init__(self, fail: bool = False):
+        self.statements = []
+        self.queries = []
+        self.fail = fail
+        # Execution ids whose rows the database rejects
+        self.rejected = set()
+        # Rows an UPDATE reports as changed; None reports every row
+        self.updated_rows = None
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, query, *params):
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        if self.rejected.intersection(params[0]):
+            raise asyncpg.exceptions.DataError("invalid input value")
+        kind = "insert" if query.lstrip().startswith("INSERT") else "update"
+        schema = query.split(".action_executions")[0].split()[-1]
+        self.statements.append((kind, schema, params))
+        self.queries.append(query)
+        if kind == "update" and self.updated_rows is not None:
+            return f"UPDATE {self.updated_rows}"
+        return f"{kind.upper()} {len(params[0])}"
+
+
+class RecordingPool:
+    def __init__(self):
+        self.connection = RecordingConnection()
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.connection
+
+
+def make_execution() -> ActionExecution:
+    return ActionExecution(
+        id=ExecutionId(uuid4()),
+        # The writer only reads ``.value`` of the event id
+        event_id=SimpleNamespace(value=uuid4()),
+        action_id=ActionId(uuid4()),
+        input_data={"user_id": "123"},
+    )
+
+
+@pytest.fixture
+def pool():
+    return RecordingPool()
+
+
+@pytest.fixture
+def writer(pool):
+    return BufferedActionExecutionWriter(pool, max_batch_size=100, max_pending=1000)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_save_and_transitions_coalesce_into_one_insert(writer, pool):
+    execution = make_execution()
+
+    await writer.save(execution, "admin")
+    await writer.mark_as_started(execution.id, "worker-1", "admin")
+    await writer.mark_as_completed(execution.id, {"sent": True}, 42, "admin")
+
+    assert await writer.flush() == 1
+    assert [kind for kind, _, _ in pool.connection.statements] == ["insert"]
+
+    _, _, params = pool.connection.statements[0]
+    row = dict(zip(ROW_COLUMNS, (values[0] for values in params)))
+    assert row["id"] == execution.id.value
+    assert row["status"] == ActionStatus.COMPLETED.value
+    assert row["worker_id"] == "worker-1"
+    assert row["execution_duration_ms"] == 42
+    assert json.loads(row["output_data"]) == {"sent": True}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_inserts_flush_before_updates(writer, pool):
+    stored = make_execution()
+    await writer.save(stored, "admin")
+    await writer.flush()
+    pool.connection.statements.clear()
+
+    new = make_execution()
+    await writer.mark_as_started(stored.id, "worker-1", "admin")
+    await writer.save(new, "admin")
+
+    assert await writer.flush() == 2
+    assert [kind for kind, _, _ in pool.connection.statements] == ["insert", "update"]
+    assert pool.connection.statements[1][2][0] == [stored.id.value]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_later_transitions_win(writer, pool):
+    execution = make_execution()
+    await writer.save(execution, "admin")
+    await writer.flush()
+    pool.connection.statements.clear()
+
+    await writer.mark_as_started(execution.id, "worker-1", "admin")
+    await writer.mark_as_failed(execution.id, "boom", {"code": 1}, None, 10, "admin")
+    await writer.update_performance_metrics(execution.id, 64, 5, "admin")
+    await writer.flush()
+
+    (kind, _, params), = pool.connection.statements
+    assert kind == "update"
+    values = dict(zip(UPDATE_COLUMNS, (column[0] for column in params)))
+    assert values["status"] == ActionStatus.FAILED.value
+    assert values["worker_id"] == "worker-1"
+    assert values["error_message"] == "boom"
+    assert values["memory_usage_mb"] == 64
+    assert values["error_stack_trace"] is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_schemas_flush_separately(writer, pool):
+    await writer.save(make_execution(), "admin")
+    await writer.save(make_execution(), "tenant_acme")
+
+    assert await writer.flush() == 2
+    assert sorted(schema for _, schema, _ in pool.connection.statements) == ["admin", "tenant_acme"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_writes_ahead_of_newer_ones(writer, pool):
+    execution = make_execution()
+    await writer.save(execution, "admin")
+
+    pool.connection.fail = True
+    with pytest.raises(ConnectionError):
+        await writer.flush()
+    assert writer.get_stats()["pending"] == 1
+
+    await writer.mark_as_completed(execution.id, {}, 7, "admin")
+    pool.connection.fail = False
+    assert await writer.flush() == 1
+
+    (kind, _, params), = pool.connection.statements
+    assert kind == "insert"
+    assert ActionStatus.COMPLETED.value in [column[0] for column in params]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_writes(writer, pool):
+    writer.start()
+    await writer.save(make_execution(), "admin")
+    await writer.stop()
+
+    assert writer.get_stats()["pending"] == 0
+    assert len(pool.connection.statements) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_backpressure_flushes_when_buffer_is_full(pool):
+    writer = BufferedActionExecutionWriter(pool, max_batch_size=2, max_pending=3)
+
+    for _ in range(3):
+        await writer.save(make_execution(), "admin")
+
+    assert writer.get_stats()["pending"] == 0
+    assert len(pool.connection.statements[0][2][0]) == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_start_is_guarded_on_pending_status(writer, pool):
+    execution = make_execution()
+    await writer.save(execution, "admin")
+    assert await writer.mark_as_started(execution.id, "worker-1", "admin")
+    # Already running in the buffer
+    assert not await writer.mark_as_started(execution.id, "worker-2", "admin")
+    await writer.flush()
+
+    (_, _, params), = pool.connection.statements
+    row = dict(zip(ROW_COLUMNS, (values[0] for values in params)))
+    assert row["worker_id"] == "worker-1"
+
+    # Stored row: the flush applies the start only while the row is pending
+    pool.connection.statements.clear()
+    pool.connection.updated_rows = 0
+    assert await writer.mark_as_started(execution.id, "worker-3", "admin")
+    await writer.mark_as_completed(execution.id, {}, 5, "admin")
+    await writer.flush()
+
+    (kind, _, params), = pool.connection.statements
+    values = dict(zip(UPDATE_COLUMNS, (column[0] for column in params)))
+    assert kind == "update"
+    assert values["requires_pending"] is True
+    assert "e.status = 'pending'" in pool.connection.queries[-1]
+    stats = writer.get_stats()
+    assert stats["transitions_skipped"] == 1
+    assert stats["rows_updated"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_transitions_without_start_are_not_guarded(writer, pool):
+    execution = make_execution()
+    await writer.save(execution, "admin")
+    await writer.flush()
+    pool.connection.statements.clear()
+
+    await writer.mark_as_completed(execution.id, {}, 5, "admin")
+    await writer.flush()
+
+    (_, _, params), = pool.connection.statements
+    values = dict(zip(UPDATE_COLUMNS, (column[0] for column in params)))
+    assert values["requires_pending"] is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_rejected_rows_are_isolated_and_eventually_dropped(pool):
+    writer = BufferedActionExecutionWriter(pool, max_write_attempts=2)
+    good, bad = make_execution(), make_execution()
+    pool.connection.rejected.add(bad.id.value)
+
+    await writer.save(good, "admin")
+    await writer.save(bad, "admin")
+
+    # The good row lands although the batch was rejected
+    assert await writer.flush() == 1
+    inserted = [params[0] for kind, _, params in pool.connection.statements]
+    assert inserted == [[good.id.value]]
+    assert writer.get_stats()["pending"] == 1
+
+    # The bad row is dropped after max_write_attempts flushes
+    assert await writer.flush() == 0
+    stats = writer.get_stats()
+    assert stats["pending"] == 0
+    assert stats["writes_dropped"] == 1
+    assert await writer.flush() == 0
+
+
+@pytest.mark.unit
+def test_resaved_executions_overwrite_attempt_number():
+    query = BufferedActionExecutionWriter._upsert_query("admin")
+    assert "attempt_number = EXCLUDED.attempt_number" in query
@@ -0,0 +1,179 @@
+"""Tests for DurableRetryScheduler leases and EnhancedActionExecutor retries."""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis.aioredis")
+pytest.importorskip("lupa")
+
+from neo_commons.platform.actions.infrastructure.executors import enhanced_action_executor
+from neo_commons.platform.actions.infrastructure.executors.enhanced_action_executor import (
+    EnhancedActionExecutor,
+)
+from neo_commons.platform.actions.infrastructure.retry.durable_retry_scheduler import (
+    DurableRetryScheduler,
+)
+
+
+class Executor(EnhancedActionExecutor):
+    """Fills in the protocol methods the retry path does not use."""
+
+    validate_action = prepare_execution = cleanup_execution = None
+    get_execution_timeout = get_supported_action_types = None
+
+
+def make_scheduler(**kwargs) -> DurableRetryScheduler:
+    return DurableRetryScheduler(fakeredis.FakeRedis(), key_prefix="test:retries", **kwargs)
+
+
+async def drain(scheduler: DurableRetryScheduler) -> None:
+    """Wait for the retries started by ``run_due``."""
+    await asyncio.gather(*scheduler._tasks)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_due_retries_run_once_and_are_removed():
+    scheduler = make_scheduler()
+    calls = []
+
+    async def handler(*args, **kwargs):
+        calls.append((args, kwargs))
+
+    scheduler.register_handler("retry", handler)
+    await scheduler.schedule("exec-1", "retry", 0, "a", key="b")
+    await scheduler.schedule("exec-2", "retry", 60000, "later")
+
+    assert await scheduler.run_due() == 1
+    await drain(scheduler)
+
+    assert calls == [(("a",), {"key": "b"})]
+    assert await scheduler.count_scheduled() == 1
+    assert await scheduler.redis.hkeys(scheduler.payload_key) == [b"exec-2"]
+    assert await scheduler.run_due() == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_claimed_retries_are_leased_until_acknowledged():
+    scheduler = make_scheduler(lease_ms=50)
+    release = asyncio.Event()
+    runs = []
+
+    async def handler():
+        runs.append(len(runs) + 1)
+        await release.wait()
+
+    scheduler.register_handler("retry", handler)
+    await scheduler.schedule("exec-1", "retry", 0)
+
+    # The first claim leases the retry; it is not handed out again meanwhile
+    assert await scheduler.run_due() == 1
+    assert await scheduler.run_due() == 0
+
+    # A worker that never finishes loses the lease and the retry runs again
+    await asyncio.sleep(0.08)
+    assert await scheduler.run_due() == 1
+    await asyncio.sleep(0)
+    assert runs == [1, 2]
+
+    # Only the holder of the current lease removes the retry
+    release.set()
+    await drain(scheduler)
+    assert await scheduler.count_scheduled() == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_retry_rescheduled_by_its_callback_is_kept():
+    scheduler = make_scheduler()
+    runs = []
+
+    async def handler():
+        runs.append(1)
+        await scheduler.schedule("exec-1", "retry", 60000)
+
+    scheduler.register_handler("retry", handler)
+    await scheduler.schedule("exec-1", "retry", 0)
+
+    assert await scheduler.run_due() == 1
+    await drain(scheduler)
+
+    assert runs == [1]
+    assert await scheduler.count_scheduled() == 1
+    assert await scheduler.redis.hexists(scheduler.payload_key, "exec-1")
+    assert await scheduler.run_due() == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_callbacks_are_dropped_and_unknown_handlers_kept():
+    scheduler = make_scheduler()
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    scheduler.register_handler("retry", failing)
+    await scheduler.schedule("exec-1", "retry", 0)
+    await scheduler.redis.hset(
+        scheduler.payload_key, "exec-2", '{"handler": "gone", "args": [], "kwargs": {}}'
+    )
+    await scheduler.redis.zadd(scheduler.schedule_key, {"exec-2": 0})
+
+    assert await scheduler.run_due() == 2
+    await drain(scheduler)
+
+    assert scheduler.get_stats()["failed"] == 1
+    assert await scheduler.redis.zrange(scheduler.schedule_key, 0, -1) == [b"exec-2"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_executor_resolves_the_action_when_the_retry_runs(monkeypatch):
+    # Retry contexts carry event/input fields the ExecutionContext dataclass lacks
+    monkeypatch.setattr(enhanced_action_executor, "ExecutionContext", SimpleNamespace)
+    scheduler = make_scheduler()
+    action_id = str(uuid4())
+    current = SimpleNamespace(id=action_id, config={"version": 2}, is_active=True)
+    loads = []
+
+    async def load_action(action_id, schema):
+        loads.append((action_id, schema))
+        return current
+
+    executor = Executor(retry_scheduler=scheduler, action_loader=load_action)
+    executed = []
+
+    async def execute(action, execution_context):
+        executed.append((action, execution_context))
+
+    executor.execute = execute
+    payload = {
+        "action_id": action_id,
+        "schema": "admin",
+        "event_id": str(uuid4()),
+        "input_data": {},
+        "context_data": {"retry_attempt": 2},
+        "tenant_id": None,
+        "organization_id": None,
+    }
+
+    await executor.run_retry(payload)
+    assert loads == [(action_id, "admin")]
+    (action, execution_context), = executed
+    assert action is current
+    assert execution_context.context_data == {"retry_attempt": 2}
+
+    # A deactivated action is not retried
+    current.is_active = False
+    await executor.run_retry(payload)
+    assert len(executed) == 1
+
+
+@pytest.mark.unit
+def test_durable_scheduler_requires_an_action_loader():
+    with pytest.raises(ValueError, match="action_loader"):
+        Executor(retry_scheduler=make_scheduler())
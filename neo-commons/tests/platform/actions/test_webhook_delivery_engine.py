@@ -0,0 +1,100 @@
+"""Tests for WebhookDeliveryEngine clients and headers against a local HTTP stub server."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from neo_commons.platform.actions.infrastructure.handlers.webhook.webhook_delivery_engine import (
+    WebhookDeliveryEngine,
+)
+
+
+class StubEndpoint(BaseHTTPRequestHandler):
+    """Keep-alive HTTP/1.1 webhook endpoint recording request headers and bodies."""
+
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.requests.append((dict(self.headers), json.loads(body)))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+@pytest.fixture
+def webhook_url():
+    StubEndpoint.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubEndpoint)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/hook"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.unit
+def test_user_agent_is_sent_per_delivery(webhook_url):
+    engine = WebhookDeliveryEngine()
+    batched = {"webhook_url": webhook_url, "batch": {"max_size": 2, "max_wait_ms": 1000}}
+
+    async def main():
+        await engine.deliver(
+            {"webhook_url": webhook_url}, {"n": 1}, user_agent="neo-commons-actions/2.1.0"
+        )
+        user_agent = "neo-commons-actions/3.0.0"
+        await asyncio.gather(*(
+            engine.deliver(batched, {"n": n}, user_agent=user_agent) for n in (2, 3)
+        ))
+        await engine.close()
+
+    asyncio.run(main())
+    (single_headers, single), (batch_headers, batch) = StubEndpoint.requests
+    assert single_headers["User-Agent"] == "neo-commons-actions/2.1.0"
+    assert single == {"n": 1}
+    assert batch_headers["User-Agent"] == "neo-commons-actions/3.0.0"
+    assert batch["count"] == 2
+
+
+@pytest.mark.unit
+def test_each_event_loop_gets_its_own_client(webhook_url):
+    engine = WebhookDeliveryEngine()
+    clients = []
+
+    async def main():
+        clients.append(engine.client())
+        assert engine.client() is clients[-1]
+        await engine.deliver({"webhook_url": webhook_url}, {})
+
+    # The first loop is closed without closing the engine
+    asyncio.run(main())
+    asyncio.run(main())
+
+    assert clients[0] is not clients[1]
+    assert len(StubEndpoint.requests) == 2
+    assert len(engine._clients) == 1
+
+
+@pytest.mark.unit
+def test_forked_child_does_not_reuse_parent_clients(webhook_url):
+    engine = WebhookDeliveryEngine()
+
+    async def main():
+        parent = engine.client()
+        # As seen from a child process after fork
+        engine._pid = -1
+        child = engine.client()
+        assert child is not parent
+        await engine.deliver({"webhook_url": webhook_url}, {})
+        await engine.close()
+        await parent.aclose()
+
+    asyncio.run(main())
+    assert len(StubEndpoint.requests) == 1
@@ -0,0 +1,128 @@
+"""Tests for RedisSessionRepository index migration from the original set format."""
+
+import asyncio
+import json
+import secrets
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis.aioredis")
+
+from neo_commons.core.value_objects.identifiers import TenantId, UserId
+from neo_commons.platform.auth.core.entities import AuthSession
+from neo_commons.platform.auth.core.value_objects import SessionId
+from neo_commons.platform.auth.infrastructure.repositories.redis_session_repository import (
+    RedisSessionRepository,
+)
+
+PREFIX = "auth_session"
+
+
+def make_session(user_id: UserId, tenant_id: TenantId) -> AuthSession:
+    return AuthSession(
+        session_id=SessionId(secrets.token_urlsafe(24)),
+        user_id=user_id,
+        tenant_id=tenant_id,
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+
+
+async def store_baseline_session(redis, session: AuthSession, ttl_seconds: int) -> None:
+    """Write a session the way the set-indexed repository did."""
+    session_id = session.session_id.value
+    user_key = f"{PREFIX}:user:{session.user_id.value}:tenant:{session.tenant_id.value}"
+    tenant_key = f"{PREFIX}:tenant:{session.tenant_id.value}"
+    data = {
+        "session_id": session_id,
+        "user_id": str(session.user_id.value),
+        "tenant_id": str(session.tenant_id.value),
+        "created_at": session.created_at.isoformat(),
+        "last_activity_at": session.last_activity_at.isoformat(),
+        "expires_at": session.expires_at.isoformat(),
+    }
+    await redis.setex(f"{PREFIX}:{session_id}", ttl_seconds, json.dumps(data))
+    await redis.sadd(user_key, session_id)
+    await redis.expire(user_key, 3600)
+    await redis.sadd(tenant_key, session_id)
+    await redis.expire(tenant_key, 3600)
+
+
+@pytest.mark.unit
+def test_set_indexes_are_migrated_when_read():
+    redis = fakeredis.FakeRedis()
+    repository = RedisSessionRepository(redis, key_prefix=PREFIX)
+    user_id, tenant_id = UserId(str(uuid4())), TenantId(str(uuid4()))
+    legacy_session = make_session(user_id, tenant_id)
+    new_session = make_session(user_id, tenant_id)
+
+    async def main():
+        await store_baseline_session(redis, legacy_session, 3600)
+        # Writing next to a set-format index must not hit WRONGTYPE
+        await repository.store_session(new_session)
+
+        sessions = await repository.get_user_sessions(user_id, tenant_id)
+        assert {s.session_id for s in sessions} == {
+            legacy_session.session_id, new_session.session_id
+        }
+        assert await redis.exists(f"{PREFIX}:user:{user_id.value}:tenant:{tenant_id.value}") == 0
+
+        assert await repository.get_session_count(tenant_id=tenant_id) == 2
+        assert await redis.exists(f"{PREFIX}:tenant:{tenant_id.value}") == 0
+        members = await redis.zrange(f"{PREFIX}:tenant:{tenant_id.value}:z", 0, -1)
+        assert f"{user_id.value}:{legacy_session.session_id.value}".encode() in members
+
+        assert await repository.revoke_tenant_sessions(tenant_id) == 2
+        assert await repository.get_user_sessions(user_id, tenant_id) == []
+
+    asyncio.run(main())
+
+
+@pytest.mark.unit
+def test_cleanup_migrates_set_indexes_and_drops_missing_sessions():
+    redis = fakeredis.FakeRedis()
+    repository = RedisSessionRepository(redis, key_prefix=PREFIX)
+    user_id, tenant_id = UserId(str(uuid4())), TenantId(str(uuid4()))
+    live, gone = make_session(user_id, tenant_id), make_session(user_id, tenant_id)
+
+    async def main():
+        await store_baseline_session(redis, live, 3600)
+        await store_baseline_session(redis, gone, 3600)
+        await redis.delete(f"{PREFIX}:{gone.session_id.value}")
+
+        await repository.cleanup_expired_sessions()
+
+        assert await redis.type(f"{PREFIX}:user:{user_id.value}:tenant:{tenant_id.value}") == b"none"
+        assert await redis.type(f"{PREFIX}:tenant:{tenant_id.value}") == b"none"
+        assert await repository.get_session_count(user_id=user_id, tenant_id=tenant_id) == 1
+        assert await repository.revoke_user_sessions(user_id, tenant_id) == 1
+        assert await repository.get_session_count(tenant_id=tenant_id) == 0
+
+    asyncio.run(main())
+
+
+@pytest.mark.unit
+def test_text_mode_client_is_rejected():
+    with pytest.raises(ValueError, match="decode_responses"):
+        RedisSessionRepository(fakeredis.FakeRedis(decode_responses=True), key_prefix=PREFIX)
+
+
+@pytest.mark.unit
+def test_update_without_preserve_ttl_overwrites_like_a_plain_set():
+    redis = fakeredis.FakeRedis()
+    repository = RedisSessionRepository(redis, key_prefix=PREFIX)
+    session = make_session(UserId(str(uuid4())), TenantId(str(uuid4())))
+    session_key = f"{PREFIX}:{session.session_id.value}"
+
+    async def main():
+        # A missing session is written rather than rejected
+        await repository.update_session(session, preserve_ttl=False)
+        assert (await repository.get_session(session.session_id)).session_id == session.session_id
+        assert await redis.ttl(session_key) == -1
+
+        await redis.expire(session_key, 600)
+        await repository.update_session(session)
+        assert 0 < await redis.ttl(session_key) <= 600
+
+    asyncio.run(main())
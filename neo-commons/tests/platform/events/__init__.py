@@ -0,0 +1 @@
+"""Tests for the events platform module."""
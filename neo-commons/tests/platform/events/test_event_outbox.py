@@ -0,0 +1,101 @@
+"""Tests for the transactional event outbox and its relay."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis.aioredis")
+
+from neo_commons.platform.events.domain.entities.event import Event
+from neo_commons.platform.events.infrastructure.outbox import EventOutbox, OutboxRelay
+from neo_commons.platform.events.infrastructure.processors.redis_event_processor import (
+    RedisEventProcessor,
+)
+from neo_commons.platform.events.infrastructure.publishers.redis_event_publisher import (
+    RedisEventPublisher,
+)
+
+
+class FakeOutboxConnection:
+    """Keeps outbox rows in memory and answers the relay's queries."""
+
+    def __init__(self):
+        self.event_rows = []
+        self.outbox_rows = []
+        self.published = {}
+
+    async def executemany(self, query, params):
+        self.event_rows.extend(params)
+
+    async def execute(self, query, *args):
+        if "INSERT INTO" in query:
+            for event_id, aggregate_id, stream, partition, payload in zip(*args):
+                self.outbox_rows.append({
+                    "id": len(self.outbox_rows) + 1,
+                    "event_id": event_id,
+                    "stream_name": stream,
+                    "payload": payload,
+                    "age_seconds": 0.01,
+                })
+            return f"INSERT 0 {len(args[0])}"
+        ids, message_ids = args
+        self.published.update(zip(ids, message_ids))
+        return f"UPDATE {len(ids)}"
+
+    async def fetch(self, query, limit):
+        return [row for row in self.outbox_rows if row["id"] not in self.published][:limit]
+
+
+class FakeDatabaseService:
+    def __init__(self, connection):
+        self.connection = connection
+
+    @asynccontextmanager
+    async def transaction(self, connection_name):
+        yield self.connection
+
+
+def make_event() -> Event:
+    return Event.create("users.created", uuid4(), "user", {"email": "jane@example.com"})
+
+
+@pytest.mark.unit
+def test_enqueued_events_are_relayed_once():
+    redis = fakeredis.FakeRedis()
+    publisher = RedisEventPublisher(redis)
+    connection = FakeOutboxConnection()
+    relay = OutboxRelay(FakeDatabaseService(connection), publisher, "admin", "admin")
+    events = [make_event() for _ in range(3)]
+    received = []
+
+    async def handler(event, queue_name):
+        received.append(event)
+
+    async def main():
+        await EventOutbox(publisher).add_batch(connection, events, "admin")
+        assert len(connection.event_rows) == len(connection.outbox_rows) == 3
+
+        assert await relay.relay_once() == 3
+        assert await relay.relay_once() == 0
+        assert set(connection.published) == {1, 2, 3}
+
+        stream_name = connection.outbox_rows[0]["stream_name"]
+        processor = RedisEventProcessor(redis)
+        while len(received) < 3:
+            await processor.consume(stream_name, "workers", handler, max_events=3, timeout_ms=1)
+
+    asyncio.run(main())
+    assert [event.id for event in received] == [event.id for event in events]
+    assert relay.get_stats()["published"] == 3
+
+
+@pytest.mark.unit
+def test_stream_names_longer_than_the_queue_name_column_are_rejected():
+    connection = FakeOutboxConnection()
+    outbox = EventOutbox(RedisEventPublisher(fakeredis.FakeRedis()))
+
+    with pytest.raises(ValueError, match="exceeds 100 characters"):
+        asyncio.run(outbox.add(connection, make_event(), "admin", queue_name="events:" + "x" * 100))
+    assert connection.event_rows == connection.outbox_rows == []
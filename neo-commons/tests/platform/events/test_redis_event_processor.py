@@ -0,0 +1,108 @@
+"""Tests for what RedisEventProcessor hands to event handlers."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis.aioredis")
+
+from neo_commons.platform.events.domain.entities.event import Event
+from neo_commons.platform.events.infrastructure.processors.redis_event_processor import (
+    RedisEventProcessor,
+)
+from neo_commons.platform.events.infrastructure.publishers.redis_event_publisher import (
+    RedisEventPublisher,
+)
+from neo_commons.platform.events.infrastructure.serializers import LazyEvent
+
+QUEUE = "events:test"
+
+
+def consume_one(lazy_events: bool):
+    """Publish one event and return what the handler received."""
+    redis = fakeredis.FakeRedis()
+    published = Event.create(
+        "users.created", uuid4(), "user", {"email": "jane@example.com"}, tenant_id=uuid4()
+    )
+    received = []
+
+    async def handler(event, queue_name):
+        received.append((event, queue_name))
+
+    async def main():
+        await RedisEventPublisher(redis).publish(published, "admin", queue_name=QUEUE)
+        processor = RedisEventProcessor(redis, lazy_events=lazy_events)
+        while not received:
+            await processor.consume(QUEUE, "workers", handler, max_events=1, timeout_ms=1)
+
+    asyncio.run(main())
+    (event, queue_name), = received
+    assert queue_name == QUEUE
+    return published, event
+
+
+@pytest.mark.unit
+def test_handlers_receive_full_events_by_default():
+    published, event = consume_one(lazy_events=False)
+
+    assert isinstance(event, Event)
+    assert event.id == published.id
+    assert event.event_data == published.event_data
+    assert event.queue_name == QUEUE
+    event.start_processing()
+    event.complete_processing()
+    assert event.to_dict()["status"] == "completed"
+
+
+@pytest.mark.unit
+def test_lazy_events_are_opt_in():
+    published, event = consume_one(lazy_events=True)
+
+    assert isinstance(event, LazyEvent)
+    assert event.event_id_value == str(published.id.value)
+    assert event.to_event().event_data == published.event_data
+
+
+@pytest.mark.unit
+def test_consume_batch_dead_letters_malformed_entries():
+    redis = fakeredis.FakeRedis()
+    published = [
+        Event.create("users.created", uuid4(), "user", {"n": n}, tenant_id=uuid4())
+        for n in range(2)
+    ]
+    batches = []
+
+    async def batch_handler(events, queue_name):
+        batches.append(events)
+
+    async def main():
+        publisher = RedisEventPublisher(redis)
+        await publisher.publish(published[0], "admin", queue_name=QUEUE)
+        malformed_id = await redis.xadd(QUEUE, {"garbage": "not an event"})
+        await publisher.publish(published[1], "admin", queue_name=QUEUE)
+
+        processor = RedisEventProcessor(redis)
+        await processor.consume_batch(QUEUE, "workers", batch_handler, batch_size=10, timeout_ms=1)
+
+        (events,) = batches
+        assert [event.id for event in events] == [event.id for event in published]
+
+        (dead_id, dead_fields), = await redis.xrange(processor.dead_letter_stream(QUEUE))
+        assert dead_fields[b"garbage"] == b"not an event"
+        assert dead_fields[b"dlq_source_id"] == malformed_id
+        assert (await redis.xpending(QUEUE, "workers"))["pending"] == 0
+
+    asyncio.run(main())
+
+
+@pytest.mark.unit
+def test_text_mode_clients_are_rejected_for_compact_streams():
+    redis = fakeredis.FakeRedis(decode_responses=True)
+
+    with pytest.raises(ValueError, match="decode_responses"):
+        RedisEventPublisher(redis)
+    with pytest.raises(ValueError, match="decode_responses"):
+        RedisEventProcessor(redis)
+    # The field format stays usable for producers on text-mode clients
+    RedisEventPublisher(redis, wire_format="fields")